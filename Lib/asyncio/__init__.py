@@ -9,8 +9,10 @@
 from .coroutines import *
 from .events import *
 from .exceptions import *
+from .files import *
 from .futures import *
 from .locks import *
+from .metrics import *
 from .protocols import *
 from .runners import *
 from .queues import *
@@ -26,8 +28,10 @@
            coroutines.__all__ +
            events.__all__ +
            exceptions.__all__ +
+           files.__all__ +
            futures.__all__ +
            locks.__all__ +
+           metrics.__all__ +
            protocols.__all__ +
            runners.__all__ +
            queues.__all__ +
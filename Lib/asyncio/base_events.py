@@ -39,11 +39,14 @@
 from . import coroutines
 from . import events
 from . import exceptions
+from . import files
 from . import futures
+from . import metrics
 from . import protocols
 from . import sslproto
 from . import staggered
 from . import tasks
+from . import timerwheel
 from . import transports
 from . import trsock
 from .log import logger
@@ -392,7 +395,12 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        # TimerWheel holding the scheduled handles instead of the
+        # _scheduled heap, see set_timer_wheel().
+        self._timer_wheel = None
         self._default_executor = None
+        # Thread pool running the operations of asyncio file objects.
+        self._file_io_pool = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
         # event loop is not running
@@ -405,6 +413,7 @@ def __init__(self):
         self.slow_callback_duration = 0.1
         self._current_handle = None
         self._task_factory = None
+        self._metrics = None
         self._coroutine_origin_tracking_enabled = False
         self._coroutine_origin_tracking_saved_depth = None
 
@@ -465,6 +474,55 @@ def get_task_factory(self):
         """Return a task factory, or None if the default one is in use."""
         return self._task_factory
 
+    def set_timer_wheel(self, enabled):
+        """Select the data structure holding call_at()/call_later() timers.
+
+        If enabled is true, scheduled handles are kept in a hierarchical
+        timing wheel, which makes scheduling and cancelling a timer O(1).
+        This pays off when many timers are created and cancelled before
+        they expire, e.g. connection timeouts.  Otherwise a binary heap
+        is used, which is the default.
+
+        Timers already scheduled are moved to the new data structure.
+        """
+        if enabled:
+            if self._timer_wheel is not None:
+                return
+            wheel = timerwheel.TimerWheel(self.time())
+            for handle in self._scheduled:
+                if handle._cancelled:
+                    handle._scheduled = False
+                else:
+                    wheel.add(handle)
+            self._scheduled.clear()
+            self._timer_cancelled_count = 0
+            self._timer_wheel = wheel
+        else:
+            if self._timer_wheel is None:
+                return
+            self._scheduled.extend(self._timer_wheel)
+            heapq.heapify(self._scheduled)
+            self._timer_wheel = None
+
+    def get_timer_wheel(self):
+        """Return True if timers are kept in a timing wheel."""
+        return self._timer_wheel is not None
+
+    def set_metrics(self, loop_metrics):
+        """Set a LoopMetrics object to be updated by the event loop.
+
+        If loop_metrics is None, metrics collection is disabled.
+        """
+        if (loop_metrics is not None and
+                not isinstance(loop_metrics, metrics.LoopMetrics)):
+            raise TypeError('loop_metrics must be a LoopMetrics '
+                            'instance or None')
+        self._metrics = loop_metrics
+
+    def get_metrics(self):
+        """Return the LoopMetrics object in use, or None."""
+        return self._metrics
+
     def _make_socket_transport(self, sock, protocol, waiter=None, *,
                                extra=None, server=None):
         """Create socket transport."""
@@ -564,12 +622,14 @@ async def shutdown_asyncgens(self):
     async def shutdown_default_executor(self, timeout=None):
         """Schedule the shutdown of the default executor.
 
+        The thread pool of the asyncio file objects is shut down as well.
+
         The timeout parameter specifies the amount of time the executor will
         be given to finish joining. The default value is None, which means
         that the executor will be given an unlimited amount of time.
         """
         self._executor_shutdown_called = True
-        if self._default_executor is None:
+        if self._default_executor is None and self._file_io_pool is None:
             return
         future = self.create_future()
         thread = threading.Thread(target=self._do_shutdown, args=(future,))
@@ -583,11 +643,17 @@ async def shutdown_default_executor(self, timeout=None):
             warnings.warn("The executor did not finishing joining "
                              f"its threads within {timeout} seconds.",
                              RuntimeWarning, stacklevel=2)
-            self._default_executor.shutdown(wait=False)
+            if self._default_executor is not None:
+                self._default_executor.shutdown(wait=False)
+            if self._file_io_pool is not None:
+                self._file_io_pool.shutdown(wait=False)
 
     def _do_shutdown(self, future):
         try:
-            self._default_executor.shutdown(wait=True)
+            if self._default_executor is not None:
+                self._default_executor.shutdown(wait=True)
+            if self._file_io_pool is not None:
+                self._file_io_pool.shutdown(wait=True)
             if not self.is_closed():
                 self.call_soon_threadsafe(future.set_result, None)
         except Exception as ex:
@@ -688,11 +754,17 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.clear()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
             self._default_executor = None
             executor.shutdown(wait=False)
+        pool = self._file_io_pool
+        if pool is not None:
+            self._file_io_pool = None
+            pool.shutdown(wait=False)
 
     def is_closed(self):
         """Returns True if the event loop was closed."""
@@ -755,7 +827,10 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is not None:
+            self._timer_wheel.add(timer)
+        else:
+            heapq.heappush(self._scheduled, timer)
         timer._scheduled = True
         return timer
 
@@ -839,6 +914,18 @@ def run_in_executor(self, executor, func, *args):
         return futures.wrap_future(
             executor.submit(func, *args), loop=self)
 
+    def _get_file_io_pool(self):
+        # Return the thread pool of the asyncio file objects, see
+        # asyncio.files.
+        pool = self._file_io_pool
+        if pool is None:
+            self._check_closed()
+            self._check_default_executor()
+            executor = concurrent.futures.ThreadPoolExecutor(
+                files._MAX_WORKERS, thread_name_prefix='asyncio-file')
+            pool = self._file_io_pool = files._FileIOPool(self, executor)
+        return pool
+
     def set_default_executor(self, executor):
         if not isinstance(executor, concurrent.futures.ThreadPoolExecutor):
             raise TypeError('executor must be ThreadPoolExecutor instance')
@@ -1869,7 +1956,13 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if self._timer_wheel is not None:
+                # The wheel removes timers right away, there is no need
+                # to wait for them to reach the head of a heap.
+                self._timer_wheel.discard(handle)
+                handle._scheduled = False
+            else:
+                self._timer_cancelled_count += 1
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1905,18 +1998,33 @@ def _run_once(self):
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
+        elif self._timer_wheel is not None:
+            when = self._timer_wheel.next_deadline()
+            if when is not None:
+                timeout = min(max(0, when - self.time()),
+                              MAXIMUM_SELECT_TIMEOUT)
         elif self._scheduled:
             # Compute the desired timeout.
             when = self._scheduled[0]._when
             timeout = min(max(0, when - self.time()), MAXIMUM_SELECT_TIMEOUT)
 
-        event_list = self._selector.select(timeout)
+        loop_metrics = self._metrics
+        if loop_metrics is not None:
+            t0 = time.perf_counter()
+            event_list = self._selector.select(timeout)
+            select_time = time.perf_counter() - t0
+        else:
+            event_list = self._selector.select(timeout)
         self._process_events(event_list)
         # Needed to break cycles when an exception occurs.
         event_list = None
 
         # Handle 'later' callbacks that are ready.
         end_time = self.time() + self._clock_resolution
+        if self._timer_wheel is not None:
+            for handle in self._timer_wheel.pop_expired(end_time):
+                handle._scheduled = False
+                self._ready.append(handle)
         while self._scheduled:
             handle = self._scheduled[0]
             if handle._when >= end_time:
@@ -1932,6 +2040,8 @@ def _run_once(self):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
+        if loop_metrics is not None:
+            loop_metrics._record_iteration(select_time, ntodo)
         for i in range(ntodo):
             handle = self._ready.popleft()
             if handle._cancelled:
@@ -1940,15 +2050,20 @@ def _run_once(self):
                 try:
                     self._current_handle = handle
                     t0 = self.time()
-                    handle._run()
+                    if loop_metrics is None:
+                        handle._run()
+                    else:
+                        loop_metrics._run_handle(handle)
                     dt = self.time() - t0
                     if dt >= self.slow_callback_duration:
                         logger.warning('Executing %s took %.3f seconds',
                                        _format_handle(handle), dt)
                 finally:
                     self._current_handle = None
-            else:
+            elif loop_metrics is None:
                 handle._run()
+            else:
+                loop_metrics._run_handle(handle)
         handle = None  # Needed to break cycles when an exception occurs.
 
     def _set_coroutine_origin_tracking(self, enabled):
@@ -0,0 +1,377 @@
+"""Asynchronous file objects."""
+
+__all__ = ('AsyncFile', 'open_file')
+
+import io
+
+from . import events
+from . import locks
+from . import mixins
+from . import tasks
+
+
+_MAX_WORKERS = 4
+_READ_AHEAD = 2 ** 16  # 64 KiB
+
+
+async def open_file(file, mode='r', buffering=-1, encoding=None,
+                    errors=None, newline=None, closefd=True, opener=None, *,
+                    read_ahead=None):
+    """Open a file and return an AsyncFile wrapping it.
+
+    The arguments are the same as for the built-in open() function; the
+    file is opened in the file I/O thread pool of the running loop.
+    read_ahead is passed to AsyncFile.
+    """
+    loop = events.get_running_loop()
+    f = await _get_pool(loop).submit(
+        None, open, file, mode, buffering, encoding, errors, newline,
+        closefd, opener)
+    try:
+        return AsyncFile(f, read_ahead=read_ahead)
+    except BaseException:
+        f.close()
+        raise
+
+
+class AsyncFile(mixins._LoopBoundMixin):
+    """Asynchronous wrapper around a file object.
+
+    The methods of the file object are run in a thread pool dedicated to
+    file I/O, so that they don't block the event loop.  The operations
+    started during a loop iteration are submitted to the pool together,
+    and the operations on the same file run in the order in which they
+    were started.
+
+    If read_ahead is a positive number, sequential reads are served from
+    a buffer that is refilled in chunks of read_ahead bytes: while the
+    caller processes a chunk, the next one is already being read.  This
+    is only supported for binary files opened for reading only, and is
+    the default for them (read_ahead=None); read_ahead=0 disables it.
+    """
+
+    def __init__(self, file, *, read_ahead=None):
+        if read_ahead is None:
+            read_ahead = _READ_AHEAD if _is_read_only_binary(file) else 0
+        elif read_ahead < 0:
+            raise ValueError('read_ahead must be a non-negative number')
+        elif read_ahead and not _is_read_only_binary(file):
+            raise ValueError('read-ahead requires a binary file opened '
+                             'for reading only')
+        self._file = file
+        self._pool = None
+        self._read_ahead = read_ahead
+        # read1() doesn't wait for a full chunk on pipes and sockets.
+        self._read_chunk = getattr(file, 'read1', file.read)
+        self._buffer = bytearray()
+        # Future of the read of the next chunk, or None.
+        self._prefetch = None
+        self._lock = locks.Lock()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self._file!r}>'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        line = await self.readline()
+        if not line:
+            raise StopAsyncIteration
+        return line
+
+    @property
+    def name(self):
+        return self._file.name
+
+    @property
+    def mode(self):
+        return self._file.mode
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    @property
+    def read_ahead(self):
+        return self._read_ahead
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def _submit(self, func, *args):
+        pool = self._pool
+        if pool is None:
+            pool = self._pool = _get_pool(self._get_loop())
+        return pool.submit(self._file, func, *args)
+
+    async def _fill(self):
+        # Append the next chunk to the read-ahead buffer and start reading
+        # the one after it.  Return False at the end of the file.
+        fut = self._prefetch
+        if fut is None:
+            fut = self._prefetch = self._submit(self._read_chunk,
+                                                self._read_ahead)
+        if not fut.done():
+            # Don't lose the chunk if the caller is cancelled.
+            await tasks.shield(fut)
+        self._prefetch = None
+        chunk = fut.result()
+        if not chunk:
+            # Don't read further: the file may still grow.
+            return False
+        self._buffer += chunk
+        self._prefetch = self._submit(self._read_chunk, self._read_ahead)
+        return True
+
+    async def _settle(self):
+        # Wait for the read of the next chunk and add it to the buffer.
+        fut = self._prefetch
+        if fut is not None:
+            if not fut.done():
+                await tasks.shield(fut)
+            self._prefetch = None
+            if fut.exception() is None:
+                self._buffer += fut.result()
+
+    async def _rewind(self, func, *args):
+        # Call func(*args) after moving the file position back to the
+        # data not consumed from the read-ahead buffer yet.
+        await self._settle()
+        fut = self._submit(_seek_back, self._file, len(self._buffer),
+                           func, *args)
+        self._buffer.clear()
+        return await fut
+
+    async def read(self, size=-1):
+        """Read and return up to size bytes or characters.
+
+        If size is omitted, None or negative, read until the end of the
+        file.
+        """
+        if not self._read_ahead:
+            return await self._submit(self._file.read, size)
+        async with self._lock:
+            buffer = self._buffer
+            if size is None or size < 0:
+                await self._settle()
+                rest = await self._submit(self._file.read)
+                data = bytes(buffer) + rest
+                buffer.clear()
+                return data
+            while len(buffer) < size and await self._fill():
+                pass
+            data = bytes(buffer[:size])
+            del buffer[:size]
+            return data
+
+    async def readinto(self, b):
+        """Read bytes into the pre-allocated writable buffer b.
+
+        Return the number of bytes read, 0 at the end of the file.
+        """
+        if not self._read_ahead:
+            return await self._submit(self._file.readinto, b)
+        async with self._lock:
+            buffer = self._buffer
+            with memoryview(b) as view, view.cast('B') as view:
+                n = len(view)
+                while len(buffer) < n and await self._fill():
+                    pass
+                n = min(n, len(buffer))
+                view[:n] = buffer[:n]
+            del buffer[:n]
+            return n
+
+    async def readline(self, size=-1):
+        """Read and return one line.
+
+        If size is specified and non-negative, at most size bytes or
+        characters are read.
+        """
+        if not self._read_ahead:
+            return await self._submit(self._file.readline, size)
+        if size is None:
+            size = -1
+        async with self._lock:
+            buffer = self._buffer
+            start = 0
+            while True:
+                end = buffer.find(b'\n', start) + 1
+                if end or 0 <= size <= len(buffer):
+                    break
+                start = len(buffer)
+                if not await self._fill():
+                    break
+            if not end:
+                end = len(buffer)
+            if 0 <= size < end:
+                end = size
+            line = bytes(buffer[:end])
+            del buffer[:end]
+            return line
+
+    async def write(self, data):
+        """Write data and return the number of bytes or characters
+        written."""
+        return await self._submit(self._file.write, data)
+
+    async def writelines(self, lines):
+        """Write a list of lines."""
+        return await self._submit(self._file.writelines, lines)
+
+    async def flush(self):
+        """Flush the write buffers of the file."""
+        return await self._submit(self._file.flush)
+
+    async def seek(self, offset, whence=io.SEEK_SET):
+        """Change the file position and return the new absolute
+        position."""
+        if not self._read_ahead:
+            return await self._submit(self._file.seek, offset, whence)
+        async with self._lock:
+            return await self._rewind(self._file.seek, offset, whence)
+
+    async def tell(self):
+        """Return the current file position."""
+        if not self._read_ahead:
+            return await self._submit(self._file.tell)
+        async with self._lock:
+            return await self._rewind(self._file.tell)
+
+    async def truncate(self, size=None):
+        """Resize the file to size bytes, the current position by
+        default."""
+        return await self._submit(self._file.truncate, size)
+
+    async def close(self):
+        """Flush and close the file."""
+        async with self._lock:
+            await self._settle()
+            self._buffer.clear()
+            await self._submit(self._file.close)
+
+
+def _is_read_only_binary(file):
+    return (not isinstance(file, io.TextIOBase)
+            and file.readable() and not file.writable())
+
+
+def _seek_back(file, offset, func, *args):
+    if offset:
+        file.seek(-offset, io.SEEK_CUR)
+    return func(*args)
+
+
+class _FileIOPool:
+    """Thread pool running the operations of the AsyncFile objects of an
+    event loop.
+
+    The operations submitted during a loop iteration are handed over to
+    the threads together: the operations on the same file run in order
+    in a single job, and each job reports all its results with a single
+    call_soon_threadsafe() call.  The operations submitted while a job
+    of the same file is running wait for it to complete.
+
+    If executor is None, the jobs are run by loop.run_in_executor().
+    """
+
+    def __init__(self, loop, executor=None):
+        self._loop = loop
+        self._executor = executor
+        # key -> list of (future, func, args) to run in a single job
+        self._pending = {}
+        # key -> list of (future, func, args) to run once the running job
+        # of the key completes
+        self._running = {}
+
+    def submit(self, key, func, *args):
+        """Schedule func(*args) and return a future for its result.
+
+        The operations submitted with the same key run in order; if key
+        is None, the operation runs on its own.
+        """
+        loop = self._loop
+        fut = loop.create_future()
+        if not self._pending:
+            loop.call_soon(self._flush)
+        if key is None:
+            key = fut
+        try:
+            self._pending[key].append((fut, func, args))
+        except KeyError:
+            self._pending[key] = [(fut, func, args)]
+        return fut
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def _flush(self):
+        pending = self._pending
+        self._pending = {}
+        for key, ops in pending.items():
+            waiting = self._running.get(key)
+            if waiting is not None:
+                waiting.extend(ops)
+            else:
+                self._start(key, ops)
+
+    def _start(self, key, ops):
+        self._running[key] = []
+        try:
+            if self._executor is None:
+                self._loop.run_in_executor(None, self._run, key, ops)
+            else:
+                self._executor.submit(self._run, key, ops)
+        except RuntimeError as exc:
+            # The executor was shut down.
+            del self._running[key]
+            for fut, func, args in ops:
+                if not fut.done():
+                    fut.set_exception(exc)
+
+    def _run(self, key, ops):
+        # Run in a worker thread.
+        results = []
+        for fut, func, args in ops:
+            if fut.cancelled():
+                # Skip the operations cancelled before they started.
+                continue
+            try:
+                results.append((fut, func(*args), None))
+            except BaseException as exc:
+                results.append((fut, None, exc))
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, key, results)
+        except RuntimeError:
+            # The event loop is closed.
+            pass
+
+    def _deliver(self, key, results):
+        for fut, result, exc in results:
+            if fut.cancelled():
+                continue
+            if exc is not None:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(result)
+        waiting = self._running.pop(key)
+        if waiting:
+            self._start(key, waiting)
+
+
+def _get_pool(loop):
+    try:
+        get_file_io_pool = loop._get_file_io_pool
+    except AttributeError:
+        # Event loops not based on BaseEventLoop don't have a dedicated
+        # pool: use their default executor.
+        return _FileIOPool(loop)
+    return get_file_io_pool()
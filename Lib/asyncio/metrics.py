@@ -0,0 +1,125 @@
+"""Event loop instrumentation."""
+
+__all__ = ('Histogram', 'LoopMetrics')
+
+import time
+import weakref
+from concurrent.futures._base import _Histogram
+
+from . import tasks
+
+
+class Histogram(_Histogram):
+    """Histogram with power-of-two bucket boundaries.
+
+    Bucket 0 counts the values below *unit*, bucket i counts the values
+    in [unit * 2**(i-1), unit * 2**i) and the last bucket also counts all
+    larger values.  Adding a value is O(1).
+
+    This is the histogram of concurrent.futures.ExecutorStats, with a
+    given unit.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, unit, nbuckets=32):
+        super().__init__(unit, nbuckets)
+
+
+class LoopMetrics:
+    """Counters and histograms describing event loop iterations.
+
+    Install an instance with loop.set_metrics().  Durations are measured
+    in seconds with time.perf_counter(), and task CPU time with
+    time.thread_time().  Unlike debug mode, collecting metrics does not
+    change how callbacks run.
+
+    Attributes, which can be read at any time from the loop thread:
+
+    iterations: number of loop iterations.
+    select_time: Histogram of the time spent waiting for I/O.
+    ready_depth: Histogram of the number of callbacks run per iteration.
+    callback_time: Histogram of the duration of callbacks.
+    task_cpu_time: Histogram of the CPU time used by each finished task.
+    slow_callbacks: number of callbacks that took longer than
+        slow_callback_duration seconds.
+    slowest_callback: (duration, description) of the slowest callback,
+        or None.
+    """
+
+    def __init__(self, *, slow_callback_duration=0.1):
+        self.slow_callback_duration = slow_callback_duration
+        self.select_time = Histogram(1e-6)
+        self.ready_depth = Histogram(1)
+        self.callback_time = Histogram(1e-6)
+        self.task_cpu_time = Histogram(1e-6)
+        self._task_cpu = weakref.WeakKeyDictionary()
+        self.clear()
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} iterations={self.iterations} '
+                f'callbacks={self.callback_time.count} '
+                f'slow_callbacks={self.slow_callbacks}>')
+
+    def clear(self):
+        """Reset all counters and histograms."""
+        self.iterations = 0
+        self.slow_callbacks = 0
+        self.slowest_callback = None
+        self.select_time.clear()
+        self.ready_depth.clear()
+        self.callback_time.clear()
+        self.task_cpu_time.clear()
+        self._task_cpu.clear()
+
+    def task_cpu_times(self):
+        """Return a dict mapping unfinished tasks to their CPU time so far."""
+        return dict(self._task_cpu)
+
+    def snapshot(self):
+        """Return the metrics as a dict of plain Python objects.
+
+        The result can be serialized, e.g. with json (after replacing
+        the infinite bucket bounds) or pickle, to export it.
+        """
+        return {
+            'iterations': self.iterations,
+            'select_time': self.select_time.snapshot(),
+            'ready_depth': self.ready_depth.snapshot(),
+            'callback_time': self.callback_time.snapshot(),
+            'task_cpu_time': self.task_cpu_time.snapshot(),
+            'tasks_running': len(self._task_cpu),
+            'slow_callbacks': self.slow_callbacks,
+            'slowest_callback': self.slowest_callback,
+        }
+
+    def _record_iteration(self, select_time, ready_depth):
+        self.iterations += 1
+        self.select_time.add(select_time)
+        self.ready_depth.add(ready_depth)
+
+    def _run_handle(self, handle):
+        task = getattr(handle._callback, '__self__', None)
+        if isinstance(task, _TASK_TYPES):
+            cpu0 = time.thread_time()
+            t0 = time.perf_counter()
+            handle._run()
+            dt = time.perf_counter() - t0
+            cpu = self._task_cpu.pop(task, 0) + time.thread_time() - cpu0
+            if task.done():
+                self.task_cpu_time.add(cpu)
+            else:
+                self._task_cpu[task] = cpu
+        else:
+            t0 = time.perf_counter()
+            handle._run()
+            dt = time.perf_counter() - t0
+
+        self.callback_time.add(dt)
+        if dt >= self.slow_callback_duration:
+            self.slow_callbacks += 1
+        if self.slowest_callback is None or dt > self.slowest_callback[0]:
+            self.slowest_callback = (dt, repr(handle))
+
+
+_TASK_TYPES = (tasks.Task, tasks._PyTask)
@@ -37,6 +37,9 @@ def __init__(self, maxsize=0):
         self._getters = collections.deque()
         # Futures.
         self._putters = collections.deque()
+        # (count, future) pairs of get_many() calls waiting for a batch
+        # to fill up.
+        self._batch_getters = []
         self._unfinished_tasks = 0
         self._finished = locks.Event()
         self._finished.set()
@@ -63,6 +66,21 @@ def _wakeup_next(self, waiters):
                 waiter.set_result(None)
                 break
 
+    def _wakeup_many(self, waiters, count):
+        # Wake up the next count waiters that aren't cancelled.
+        while count and waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
+    def _wakeup_batch_getters(self):
+        # Wake up the get_many() calls whose batch is complete.
+        size = self.qsize()
+        for count, waiter in self._batch_getters:
+            if size >= count and not waiter.done():
+                waiter.set_result(None)
+
     def __repr__(self):
         return f'<{type(self).__name__} at {id(self):#x} {self._format()}>'
 
@@ -145,6 +163,69 @@ def put_nowait(self, item):
         self._unfinished_tasks += 1
         self._finished.clear()
         self._wakeup_next(self._getters)
+        if self._batch_getters:
+            self._wakeup_batch_getters()
+
+    async def put_many(self, items):
+        """Put all items of an iterable into the queue.
+
+        Items are added in batches as large as the free space allows, and
+        each batch wakes up at most one waiting consumer per item, so a
+        consumer blocked in get_many() is woken up once per batch.  If the
+        queue is full, wait until free slots are available before adding
+        the remaining items.
+        """
+        items = list(items)
+        start = 0
+        while start < len(items):
+            while self.full():
+                putter = self._get_loop().create_future()
+                self._putters.append(putter)
+                try:
+                    await putter
+                except:
+                    putter.cancel()  # Just in case putter is not done yet.
+                    try:
+                        # Clean self._putters from canceled putters.
+                        self._putters.remove(putter)
+                    except ValueError:
+                        # The putter could be removed from self._putters by
+                        # a previous get_nowait call.
+                        pass
+                    if not self.full() and not putter.cancelled():
+                        # We were woken up by get_nowait(), but can't take
+                        # the call.  Wake up the next in line.
+                        self._wakeup_next(self._putters)
+                    raise
+            start += self._put_batch(items, start)
+
+    def put_many_nowait(self, items):
+        """Put all items of an iterable into the queue without blocking.
+
+        Either all items are added or, if there are not enough free slots
+        for all of them, none is and QueueFull is raised.
+        """
+        items = list(items)
+        if 0 < self._maxsize < self.qsize() + len(items):
+            raise QueueFull
+        self._put_batch(items, 0)
+
+    def _put_batch(self, items, start):
+        # Add as many items as possible from items[start:], return the
+        # number of items added.
+        count = len(items) - start
+        if self._maxsize > 0:
+            count = min(count, self._maxsize - self.qsize())
+        if count <= 0:
+            return 0
+        for i in range(start, start + count):
+            self._put(items[i])
+        self._unfinished_tasks += count
+        self._finished.clear()
+        self._wakeup_many(self._getters, count)
+        if self._batch_getters:
+            self._wakeup_batch_getters()
+        return count
 
     async def get(self):
         """Remove and return an item from the queue.
@@ -183,6 +264,100 @@ def get_nowait(self):
         self._wakeup_next(self._putters)
         return item
 
+    async def get_many(self, max_items=None, timeout=None):
+        """Remove and return a list of items from the queue.
+
+        Wait until at least one item is available, then return up to
+        max_items items, or all available items if max_items is None.
+
+        If timeout is not None, wait at most timeout seconds.  The time left
+        once an item is available is used to let the batch fill up: the
+        call returns as soon as max_items items are available or when the
+        timeout expires.  The list is empty if no item was available in
+        time.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError('max_items must be None or a positive integer')
+        loop = self._get_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            while self.empty():
+                if deadline is not None and loop.time() >= deadline:
+                    return []
+                getter = loop.create_future()
+                self._getters.append(getter)
+                timer = None
+                if deadline is not None:
+                    timer = loop.call_at(deadline, _release_waiter, getter)
+                try:
+                    await getter
+                except:
+                    getter.cancel()  # Just in case getter is not done yet.
+                    try:
+                        # Clean self._getters from canceled getters.
+                        self._getters.remove(getter)
+                    except ValueError:
+                        # The getter could be removed from self._getters by
+                        # a previous put_nowait call.
+                        pass
+                    if not self.empty() and not getter.cancelled():
+                        # We were woken up by put_nowait(), but can't take
+                        # the call.  Wake up the next in line.
+                        self._wakeup_next(self._getters)
+                    raise
+                finally:
+                    if timer is not None:
+                        timer.cancel()
+                if timer is not None and self.empty():
+                    # Woken up by the timer rather than by a put.
+                    try:
+                        self._getters.remove(getter)
+                    except ValueError:
+                        pass
+
+            if deadline is not None and max_items is not None:
+                while self.qsize() < max_items and loop.time() < deadline:
+                    waiter = loop.create_future()
+                    entry = (max_items, waiter)
+                    self._batch_getters.append(entry)
+                    timer = loop.call_at(deadline, _release_waiter, waiter)
+                    try:
+                        await waiter
+                    except:
+                        if not self.empty():
+                            # The items that woke us up are left in the
+                            # queue: wake up the next getter in line.
+                            self._wakeup_next(self._getters)
+                        raise
+                    finally:
+                        timer.cancel()
+                        self._batch_getters.remove(entry)
+            if not self.empty():
+                return self._get_batch(max_items)
+            # Other consumers took the items while the batch was filling
+            # up: wait again until the deadline.
+
+    def get_many_nowait(self, max_items=None):
+        """Remove and return a list of items from the queue.
+
+        Return up to max_items items, or all items if max_items is None,
+        if at least one item is immediately available, else raise
+        QueueEmpty.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError('max_items must be None or a positive integer')
+        if self.empty():
+            raise QueueEmpty
+        return self._get_batch(max_items)
+
+    def _get_batch(self, max_items):
+        count = self.qsize()
+        if max_items is not None:
+            count = min(count, max_items)
+        items = [self._get() for _ in range(count)]
+        self._wakeup_many(self._putters, count)
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
@@ -215,6 +390,11 @@ async def join(self):
             await self._finished.wait()
 
 
+def _release_waiter(waiter):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class PriorityQueue(Queue):
     """A subclass of Queue; retrieves entries in priority order (lowest first).
 
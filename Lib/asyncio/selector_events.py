@@ -39,6 +39,20 @@
         # Fallback to send
         _HAS_SENDMSG = False
 
+def _as_send_buffer(data):
+    """Return data as a flat memoryview of bytes suitable for queueing.
+
+    Slicing the view after a partial send does not copy.  Mutable data is
+    copied since the caller is free to reuse it once write() returns.
+    """
+    view = memoryview(data)
+    if not view.readonly or not view.c_contiguous:
+        return memoryview(bytes(view))
+    if view.ndim != 1 or view.format != 'B':
+        return view.cast('B')
+    return view
+
+
 def _test_selector_event(selector, fd, event):
     # Test if the selector is monitoring 'event' events
     # for the file descriptor 'fd'.
@@ -873,6 +887,7 @@ def _force_close(self, exc):
             return
         if self._buffer:
             self._buffer.clear()
+            self._buffer_size = 0
             self._loop._remove_writer(self._sock_fd)
         if not self._closing:
             self._closing = True
@@ -914,6 +929,7 @@ def __init__(self, loop, sock, protocol, waiter=None,
 
         self._read_ready_cb = None
         super().__init__(loop, sock, protocol, extra, server)
+        self._buffer_size = 0
         self._eof = False
         self._paused = False
         self._empty_waiter = None
@@ -943,6 +959,9 @@ def set_protocol(self, protocol):
 
         super().set_protocol(protocol)
 
+    def get_write_buffer_size(self):
+        return self._buffer_size
+
     def is_reading(self):
         return not self._paused and not self._closing
 
@@ -1084,7 +1103,9 @@ def write(self, data):
             self._loop._add_writer(self._sock_fd, self._write_ready)
 
         # Add it to the buffer.
+        data = _as_send_buffer(data)
         self._buffer.append(data)
+        self._buffer_size += len(data)
         self._maybe_pause_protocol()
 
     def _get_sendmsg_buffer(self):
@@ -1104,6 +1125,7 @@ def _write_sendmsg(self):
         except BaseException as exc:
             self._loop._remove_writer(self._sock_fd)
             self._buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
                 self._empty_waiter.set_exception(exc)
@@ -1120,6 +1142,7 @@ def _write_sendmsg(self):
 
     def _adjust_leftover_buffer(self, nbytes: int) -> None:
         buffer = self._buffer
+        self._buffer_size -= nbytes
         while nbytes:
             b = buffer.popleft()
             b_len = len(b)
@@ -1134,11 +1157,9 @@ def _write_send(self):
         if self._conn_lost:
             return
         try:
-            buffer = self._buffer.popleft()
-            n = self._sock.send(buffer)
-            if n != len(buffer):
-                # Not all data was written
-                self._buffer.appendleft(buffer[n:])
+            # Leave the data in the buffer until it is known to be sent.
+            n = self._sock.send(self._buffer[0])
+            self._adjust_leftover_buffer(n)
         except (BlockingIOError, InterruptedError):
             pass
         except (SystemExit, KeyboardInterrupt):
@@ -1146,6 +1167,7 @@ def _write_send(self):
         except BaseException as exc:
             self._loop._remove_writer(self._sock_fd)
             self._buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
                 self._empty_waiter.set_exception(exc)
@@ -1172,10 +1194,24 @@ def writelines(self, list_of_data):
             raise RuntimeError('Cannot call writelines() after write_eof()')
         if self._empty_waiter is not None:
             raise RuntimeError('unable to writelines; sendfile is in progress')
-        if not list_of_data:
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
             return
-        self._buffer.extend([memoryview(data) for data in list_of_data])
+
+        buffers = [_as_send_buffer(data) for data in list_of_data]
+        buffers = [data for data in buffers if data]
+        if not buffers:
+            return
+        self._buffer.extend(buffers)
+        self._buffer_size += sum(map(len, buffers))
+        # Send as much as possible with a single call, then wait for the
+        # socket to become writable for the rest.
         self._write_ready()
+        if self._buffer:
+            self._loop._add_writer(self._sock_fd, self._write_ready)
+            self._maybe_pause_protocol()
 
     def can_write_eof(self):
         return True
@@ -20,10 +20,11 @@
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_READ_BUFFER_SIZE = 2 ** 16  # 64 KiB
 
 
 async def open_connection(host=None, port=None, *,
-                          limit=_DEFAULT_LIMIT, **kwds):
+                          limit=_DEFAULT_LIMIT, zero_copy=False, **kwds):
     """A wrapper for create_connection() returning a (reader, writer) pair.
 
     The reader returned is a StreamReader instance; the writer is a
@@ -34,16 +35,17 @@ async def open_connection(host=None, port=None, *,
     with various optional keyword arguments following.
 
     Additional optional keyword arguments are loop (to set the event loop
-    instance to use) and limit (to set the buffer limit passed to the
-    StreamReader).
+    instance to use), limit (to set the buffer limit passed to the
+    StreamReader) and zero_copy (to make the StreamReader return
+    memoryview objects instead of bytes).
 
     (If you want to customize the StreamReader and/or
     StreamReaderProtocol classes, just copy the code -- there's
     really nothing special here except some convenience.)
     """
     loop = events.get_running_loop()
-    reader = StreamReader(limit=limit, loop=loop)
-    protocol = StreamReaderProtocol(reader, loop=loop)
+    reader = StreamReader(limit=limit, loop=loop, zero_copy=zero_copy)
+    protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
     transport, _ = await loop.create_connection(
         lambda: protocol, host, port, **kwds)
     writer = StreamWriter(transport, protocol, reader, loop)
@@ -51,7 +53,7 @@ async def open_connection(host=None, port=None, *,
 
 
 async def start_server(client_connected_cb, host=None, port=None, *,
-                       limit=_DEFAULT_LIMIT, **kwds):
+                       limit=_DEFAULT_LIMIT, zero_copy=False, **kwds):
     """Start a socket server, call back for each client connected.
 
     The first parameter, `client_connected_cb`, takes two parameters:
@@ -67,8 +69,9 @@ async def start_server(client_connected_cb, host=None, port=None, *,
     following.  The return value is the same as loop.create_server().
 
     Additional optional keyword arguments are loop (to set the event loop
-    instance to use) and limit (to set the buffer limit passed to the
-    StreamReader).
+    instance to use), limit (to set the buffer limit passed to the
+    StreamReader) and zero_copy (to make the StreamReader return
+    memoryview objects instead of bytes).
 
     The return value is the same as loop.create_server(), i.e. a
     Server object which can be used to stop the service.
@@ -76,9 +79,9 @@ async def start_server(client_connected_cb, host=None, port=None, *,
     loop = events.get_running_loop()
 
     def factory():
-        reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                        loop=loop)
+        reader = StreamReader(limit=limit, loop=loop, zero_copy=zero_copy)
+        protocol = _BufferedStreamReaderProtocol(reader, client_connected_cb,
+                                                 loop=loop)
         return protocol
 
     return await loop.create_server(factory, host, port, **kwds)
@@ -88,26 +91,29 @@ def factory():
     # UNIX Domain Sockets are supported on this platform
 
     async def open_unix_connection(path=None, *,
-                                   limit=_DEFAULT_LIMIT, **kwds):
+                                   limit=_DEFAULT_LIMIT, zero_copy=False,
+                                   **kwds):
         """Similar to `open_connection` but works with UNIX Domain Sockets."""
         loop = events.get_running_loop()
 
-        reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, loop=loop)
+        reader = StreamReader(limit=limit, loop=loop, zero_copy=zero_copy)
+        protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
         transport, _ = await loop.create_unix_connection(
             lambda: protocol, path, **kwds)
         writer = StreamWriter(transport, protocol, reader, loop)
         return reader, writer
 
     async def start_unix_server(client_connected_cb, path=None, *,
-                                limit=_DEFAULT_LIMIT, **kwds):
+                                limit=_DEFAULT_LIMIT, zero_copy=False,
+                                **kwds):
         """Similar to `start_server` but works with UNIX Domain Sockets."""
         loop = events.get_running_loop()
 
         def factory():
-            reader = StreamReader(limit=limit, loop=loop)
-            protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                            loop=loop)
+            reader = StreamReader(limit=limit, loop=loop,
+                                  zero_copy=zero_copy)
+            protocol = _BufferedStreamReaderProtocol(
+                reader, client_connected_cb, loop=loop)
             return protocol
 
         return await loop.create_unix_server(factory, path, **kwds)
@@ -297,6 +303,32 @@ def __del__(self):
                 closed.exception()
 
 
+class _BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                    protocols.BufferedProtocol):
+    """StreamReaderProtocol which lets the transport receive into the reader.
+
+    Transports call get_buffer() and buffer_updated() instead of
+    data_received(), so no bytes object is allocated per received packet.
+    """
+
+    _discard_buffer = None
+
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is None:
+            # Like data_received(), drop data if the reader is gone.
+            if self._discard_buffer is None:
+                self._discard_buffer = memoryview(
+                    bytearray(_READ_BUFFER_SIZE))
+            return self._discard_buffer
+        return reader._get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        reader = self._stream_reader
+        if reader is not None:
+            reader._buffer_updated(nbytes)
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -393,11 +425,163 @@ async def start_tls(self, sslcontext, *,
         protocol._replace_writer(self)
 
 
+class _ChunkBuffer:
+    """FIFO byte buffer made of the chunks fed to it, without joining them.
+
+    Each chunk is kept as a (data, start, end) triple.  The storage a
+    chunk refers to is never written to again, so the memoryview objects
+    returned by take() stay valid after the buffer moves past them.
+
+    Only the subset of the bytearray API used by StreamReader is provided.
+    """
+
+    def __init__(self):
+        self._chunks = collections.deque()
+        self._size = 0
+        # Receive arena handed out by get_buffer().  Committed bytes are
+        # never overwritten: a new arena is allocated once it is full.
+        self._arena = None
+        self._arena_pos = 0
+
+    def __len__(self):
+        return self._size
+
+    def __bytes__(self):
+        return b''.join([memoryview(data)[start:end]
+                         for data, start, end in self._chunks])
+
+    def __delitem__(self, key):
+        if (not isinstance(key, slice) or key.start is not None or
+                key.step is not None or key.stop is None or key.stop < 0):
+            raise TypeError('only prefix slices can be deleted')
+        self._skip(key.stop)
+
+    def append(self, data, start, end):
+        """Add data[start:end] without copying it."""
+        if start < end:
+            self._chunks.append((data, start, end))
+            self._size += end - start
+
+    def extend(self, data):
+        if not isinstance(data, bytes):
+            # The caller may reuse a mutable buffer: take a private copy.
+            data = bytes(data)
+        self.append(data, 0, len(data))
+
+    def get_buffer(self, sizehint):
+        """Return a writable view of free space in the receive arena."""
+        arena = self._arena
+        # Rather than receiving into a small leftover, start a new arena.
+        wanted = max(sizehint, _READ_BUFFER_SIZE // 16)
+        if arena is None or len(arena) - self._arena_pos < wanted:
+            self._arena = arena = bytearray(
+                max(sizehint, _READ_BUFFER_SIZE))
+            self._arena_pos = 0
+        return memoryview(arena)[self._arena_pos:]
+
+    def buffer_updated(self, nbytes):
+        """Append the nbytes written to the view from get_buffer()."""
+        start = self._arena_pos
+        self._arena_pos += nbytes
+        self.append(self._arena, start, self._arena_pos)
+
+    def clear(self):
+        self._chunks.clear()
+        self._size = 0
+
+    def find(self, sub, start=0):
+        seplen = len(sub)
+        # Tail of the previous chunks, used to find a match which spans
+        # chunk boundaries.
+        tail = b''
+        pos = 0
+        for data, cstart, cend in self._chunks:
+            size = cend - cstart
+            if pos + size > start:
+                if tail:
+                    seam = tail + data[cstart:cstart + seplen - 1]
+                    tailpos = pos - len(tail)
+                    i = seam.find(sub, max(start - tailpos, 0))
+                    if i != -1:
+                        return tailpos + i
+                i = data.find(sub, cstart + max(start - pos, 0), cend)
+                if i != -1:
+                    return pos + i - cstart
+            if seplen > 1:
+                tail = (tail + data[max(cstart, cend - seplen + 1):cend])
+                tail = tail[-(seplen - 1):]
+            pos += size
+        return -1
+
+    def startswith(self, prefix, start=0):
+        return self.find(prefix, start) == start
+
+    def take(self, n, partial=False):
+        """Remove the first n bytes and return them as a memoryview.
+
+        No data is copied if the bytes are held by a single chunk.  If
+        partial is true, never copy and return at most the rest of the
+        first chunk.
+        """
+        chunks = self._chunks
+        n = min(n, self._size)
+        if not n:
+            return memoryview(b'')
+        data, start, end = chunks[0]
+        if partial:
+            n = min(n, end - start)
+        if end - start > n:
+            chunks[0] = (data, start + n, end)
+            self._size -= n
+            return memoryview(data)[start:start + n].toreadonly()
+        if end - start == n:
+            chunks.popleft()
+            self._size -= n
+            return memoryview(data)[start:end].toreadonly()
+        parts = []
+        remaining = n
+        while remaining:
+            data, start, end = chunks[0]
+            size = min(end - start, remaining)
+            parts.append(memoryview(data)[start:start + size])
+            self._skip(size)
+            remaining -= size
+        return memoryview(b''.join(parts))
+
+    def readinto(self, buffer):
+        """Move as many bytes as fit into the writable buffer.
+
+        Return the number of bytes copied.
+        """
+        chunks = self._chunks
+        nbytes = min(len(buffer), self._size)
+        pos = 0
+        while pos < nbytes:
+            data, start, end = chunks[0]
+            size = min(end - start, nbytes - pos)
+            buffer[pos:pos + size] = memoryview(data)[start:start + size]
+            self._skip(size)
+            pos += size
+        return nbytes
+
+    def _skip(self, n):
+        chunks = self._chunks
+        n = min(n, self._size)
+        self._size -= n
+        while n:
+            data, start, end = chunks[0]
+            if end - start > n:
+                chunks[0] = (data, start + n, end)
+                return
+            chunks.popleft()
+            n -= end - start
+
+
 class StreamReader:
 
     _source_traceback = None
 
-    def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
+    def __init__(self, limit=_DEFAULT_LIMIT, loop=None, *, zero_copy=False):
         # The line length limit is  a security feature;
         # it also doubles as half the buffer limit.
 
@@ -409,7 +593,15 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
             self._loop = events.get_event_loop()
         else:
             self._loop = loop
-        self._buffer = bytearray()
+        # In zero-copy mode the received chunks are kept as they are and
+        # the read*() methods return memoryview slices of them.
+        self._zero_copy = zero_copy
+        if zero_copy:
+            self._buffer = _ChunkBuffer()
+        else:
+            self._buffer = bytearray()
+        # Allocated on first use by _get_buffer().
+        self._read_buffer = None
         self._eof = False    # Whether we're done.
         self._waiter = None  # A future used by _wait_for_data()
         self._exception = None
@@ -427,6 +619,8 @@ def __repr__(self):
             info.append('eof')
         if self._limit != _DEFAULT_LIMIT:
             info.append(f'limit={self._limit}')
+        if self._zero_copy:
+            info.append('zero_copy')
         if self._waiter:
             info.append(f'waiter={self._waiter!r}')
         if self._exception:
@@ -461,6 +655,23 @@ def set_transport(self, transport):
         assert self._transport is None, 'Transport already set'
         self._transport = transport
 
+    def _consume(self, n):
+        """Remove up to n bytes from the head of the buffer and return them.
+
+        The data is returned as a memoryview in zero-copy mode and as bytes
+        otherwise.
+        """
+        buffer = self._buffer
+        if self._zero_copy:
+            return buffer.take(n)
+        if len(buffer) <= n:
+            data = bytes(buffer)
+            buffer.clear()
+        else:
+            data = bytes(memoryview(buffer)[:n])
+            del buffer[:n]
+        return data
+
     def _maybe_resume_transport(self):
         if self._paused and len(self._buffer) <= self._limit:
             self._paused = False
@@ -482,7 +693,33 @@ def feed_data(self, data):
 
         self._buffer.extend(data)
         self._wakeup_waiter()
+        self._maybe_pause_transport()
+
+    def _get_buffer(self, sizehint):
+        """Return a writable buffer for the transport to receive into.
+
+        The transport must then call _buffer_updated() with the number
+        of bytes it wrote to the start of the buffer.
+        """
+        if self._zero_copy:
+            # Receive straight into the storage that read*() hands out.
+            return self._buffer.get_buffer(sizehint)
+        if self._read_buffer is None:
+            self._read_buffer = memoryview(bytearray(_READ_BUFFER_SIZE))
+        return self._read_buffer
+
+    def _buffer_updated(self, nbytes):
+        if not nbytes:
+            return
+
+        if self._zero_copy:
+            self._buffer.buffer_updated(nbytes)
+        else:
+            self._buffer += self._read_buffer[:nbytes]
+        self._wakeup_waiter()
+        self._maybe_pause_transport()
 
+    def _maybe_pause_transport(self):
         if (self._transport is not None and
                 not self._paused and
                 len(self._buffer) > 2 * self._limit):
@@ -630,8 +867,7 @@ async def readuntil(self, separator=b'\n'):
             # adds data which makes separator be found. That's why we check for
             # EOF *ater* inspecting the buffer.
             if self._eof:
-                chunk = bytes(self._buffer)
-                self._buffer.clear()
+                chunk = self._consume(len(self._buffer))
                 raise exceptions.IncompleteReadError(chunk, None)
 
             # _wait_for_data() will resume reading if stream was paused.
@@ -641,10 +877,9 @@ async def readuntil(self, separator=b'\n'):
             raise exceptions.LimitOverrunError(
                 'Separator is found, but chunk is longer than limit', isep)
 
-        chunk = self._buffer[:isep + seplen]
-        del self._buffer[:isep + seplen]
+        chunk = self._consume(isep + seplen)
         self._maybe_resume_transport()
-        return bytes(chunk)
+        return chunk
 
     async def read(self, n=-1):
         """Read up to `n` bytes from the stream.
@@ -672,7 +907,7 @@ async def read(self, n=-1):
             raise self._exception
 
         if n == 0:
-            return b''
+            return memoryview(b'') if self._zero_copy else b''
 
         if n < 0:
             # This used to just loop creating a new waiter hoping to
@@ -685,14 +920,20 @@ async def read(self, n=-1):
                 if not block:
                     break
                 blocks.append(block)
-            return b''.join(blocks)
+            data = b''.join(blocks)
+            if self._zero_copy:
+                return memoryview(data)
+            return data
 
         if not self._buffer and not self._eof:
             await self._wait_for_data('read')
 
         # This will work right even if buffer is less than n bytes
-        data = bytes(memoryview(self._buffer)[:n])
-        del self._buffer[:n]
+        if self._zero_copy:
+            # Only return what the first chunk holds rather than copying.
+            data = self._buffer.take(n, partial=True)
+        else:
+            data = self._consume(n)
 
         self._maybe_resume_transport()
         return data
@@ -719,25 +960,53 @@ async def readexactly(self, n):
             raise self._exception
 
         if n == 0:
-            return b''
+            return memoryview(b'') if self._zero_copy else b''
 
         while len(self._buffer) < n:
             if self._eof:
-                incomplete = bytes(self._buffer)
-                self._buffer.clear()
+                incomplete = self._consume(len(self._buffer))
                 raise exceptions.IncompleteReadError(incomplete, n)
 
             await self._wait_for_data('readexactly')
 
-        if len(self._buffer) == n:
-            data = bytes(self._buffer)
-            self._buffer.clear()
-        else:
-            data = bytes(memoryview(self._buffer)[:n])
-            del self._buffer[:n]
+        data = self._consume(n)
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read up to len(buffer) bytes from the stream into buffer.
+
+        Return the number of bytes read, which is 0 if EOF was received and
+        the internal buffer is empty.  Like read(n), this returns as soon as
+        at least 1 byte is available in the internal buffer.
+
+        The data is copied once, straight from the internal buffer into
+        the given writable bytes-like object.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        view = memoryview(buffer).cast('B')
+        if not view:
+            return 0
+
+        if not self._buffer and not self._eof:
+            await self._wait_for_data('readinto')
+
+        if self._zero_copy:
+            nbytes = self._buffer.readinto(view)
+        else:
+            nbytes = min(len(view), len(self._buffer))
+            with memoryview(self._buffer) as data:
+                view[:nbytes] = data[:nbytes]
+            del self._buffer[:nbytes]
+
+        self._maybe_resume_transport()
+        return nbytes
+
     def __aiter__(self):
         return self
 
@@ -0,0 +1,229 @@
+"""Hierarchical timing wheel for scheduled callbacks.
+
+This is an alternative to the binary heap that BaseEventLoop uses for
+call_at() and call_later() handles.  Inserting and cancelling a timer
+are O(1); expiring timers costs O(1) per timer plus an occasional
+"cascade" that moves the timers of a coarse slot into finer ones.
+
+Time is divided into ticks of a fixed resolution.  Level 0 has one slot
+per tick for the current block of _SLOTS ticks, level 1 has one slot
+per block of _SLOTS ticks, and so on.  A timer is stored in the lowest
+level whose current block contains its expiration tick.  When the
+current tick enters the range of a slot on a higher level, the timers of
+that slot are redistributed to the lower levels.  Timers that are
+further away than the top level can represent are kept in an overflow
+slot.
+"""
+
+__all__ = ()
+
+import math
+
+
+_BITS = 8
+_SLOTS = 1 << _BITS
+_MASK = _SLOTS - 1
+_LEVELS = 4
+
+
+class TimerWheel:
+    """Timing wheel holding TimerHandle objects.
+
+    Handles are looked up by identity: TimerHandle compares and hashes by
+    its scheduled time, so distinct handles may compare equal.
+    """
+
+    def __init__(self, now, resolution=0.001):
+        if resolution <= 0:
+            raise ValueError('resolution must be a positive number')
+        self._resolution = resolution
+        self._now = self._tick_of(now)
+        self._wheels = [[{} for _ in range(_SLOTS)] for _ in range(_LEVELS)]
+        # Level _LEVELS is the overflow slot.
+        self._overflow = {}
+        self._counts = [0] * (_LEVELS + 1)
+        # id(handle) -> (level, slot) where the handle is stored.
+        self._where = {}
+
+    def __len__(self):
+        return len(self._where)
+
+    def __bool__(self):
+        return bool(self._where)
+
+    def __iter__(self):
+        for wheel in self._wheels:
+            for slot in wheel:
+                yield from slot.values()
+        yield from self._overflow.values()
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    def _tick_of(self, when):
+        return int(when // self._resolution)
+
+    def _place(self, handle, key):
+        now = self._now
+        try:
+            tick = int(handle._when // self._resolution)
+        except (OverflowError, ValueError):
+            # inf or nan
+            level = _LEVELS
+            slot = self._overflow
+        else:
+            if tick < now:
+                tick = now
+            diff = tick ^ now
+            if diff < _SLOTS:
+                level = 0
+                slot = self._wheels[0][tick & _MASK]
+            else:
+                level = (diff.bit_length() - 1) // _BITS
+                if level >= _LEVELS:
+                    level = _LEVELS
+                    slot = self._overflow
+                else:
+                    slot = self._wheels[level][(tick >> (level * _BITS)) & _MASK]
+        slot[key] = handle
+        self._counts[level] += 1
+        self._where[key] = (level, slot)
+
+    def add(self, handle):
+        """Add a TimerHandle to the wheel."""
+        key = id(handle)
+        if key in self._where:
+            raise ValueError(f'{handle!r} is already scheduled')
+        self._place(handle, key)
+
+    def discard(self, handle):
+        """Remove a TimerHandle from the wheel if it is present."""
+        key = id(handle)
+        location = self._where.pop(key, None)
+        if location is not None:
+            level, slot = location
+            del slot[key]
+            self._counts[level] -= 1
+
+    def clear(self):
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+        self._overflow.clear()
+        self._counts = [0] * (_LEVELS + 1)
+        self._where.clear()
+
+    def _take(self, level, slot):
+        handles = list(slot.values())
+        slot.clear()
+        self._counts[level] -= len(handles)
+        where = self._where
+        for handle in handles:
+            del where[id(handle)]
+        return handles
+
+    def _cascade(self):
+        # Redistribute the slots that the current tick has just entered,
+        # coarsest level first so that its timers can land in the slots
+        # of the finer levels that are cascaded next.
+        now = self._now
+        if self._counts[_LEVELS] and not now & ((1 << (_LEVELS * _BITS)) - 1):
+            for handle in self._take(_LEVELS, self._overflow):
+                self._place(handle, id(handle))
+        for level in range(_LEVELS - 1, 0, -1):
+            shift = level * _BITS
+            if now & ((1 << shift) - 1):
+                continue
+            if not self._counts[level]:
+                continue
+            slot = self._wheels[level][(now >> shift) & _MASK]
+            if slot:
+                for handle in self._take(level, slot):
+                    self._place(handle, id(handle))
+
+    def _next_event(self):
+        # Return (tick, level) for the first slot that needs attention,
+        # either because it holds expiring timers (level 0) or because it
+        # has to be cascaded, or None if the wheel is empty.
+        #
+        # All timers on level L are in the current block of level L + 1,
+        # in slots after the current one (or at it for level 0), so the
+        # lowest non-empty level holds the earliest event.
+        now = self._now
+        for level in range(_LEVELS):
+            if not self._counts[level]:
+                continue
+            shift = level * _BITS
+            base = now >> shift
+            index = base & _MASK
+            wheel = self._wheels[level]
+            for i in range(index if level == 0 else index + 1, _SLOTS):
+                if wheel[i]:
+                    return (base - index + i) << shift, level
+            raise AssertionError('timer wheel level count is out of sync')
+        if self._counts[_LEVELS]:
+            # Jump straight to the block of the earliest overflow timer
+            # rather than cascading every empty block in between.
+            whens = [h._when for h in self._overflow.values()
+                     if math.isfinite(h._when)]
+            if whens:
+                shift = _LEVELS * _BITS
+                return (self._tick_of(min(whens)) >> shift) << shift, _LEVELS
+        return None
+
+    def next_deadline(self):
+        """Return the time at which the loop must wake up next.
+
+        This is the earliest expiration time if it is known, or the
+        start of the next slot to cascade, which is never later than
+        the earliest expiration time.  Return None if the wheel is empty.
+        """
+        event = self._next_event()
+        if event is None:
+            return None
+        tick, level = event
+        if level == 0:
+            slot = self._wheels[0][tick & _MASK]
+            return min(h._when for h in slot.values())
+        return tick * self._resolution
+
+    def pop_expired(self, end_time):
+        """Remove and return the handles scheduled before end_time.
+
+        The handles are returned sorted by their scheduled time.
+        """
+        end_tick = self._tick_of(end_time) if math.isfinite(end_time) else None
+        expired = []
+        while end_tick is not None and self._now < end_tick:
+            event = self._next_event()
+            if event is None or event[0] > end_tick:
+                self._now = end_tick
+                break
+            tick = event[0]
+            if tick > self._now:
+                self._now = tick
+                self._cascade()
+                if tick == end_tick:
+                    break
+            slot = self._wheels[0][tick & _MASK]
+            if slot:
+                expired.extend(self._take(0, slot))
+            self._now = tick + 1
+            self._cascade()
+
+        # The slot of the current tick may hold timers on both sides of
+        # end_time.
+        slot = self._wheels[0][self._now & _MASK]
+        if slot:
+            for handle in [h for h in slot.values() if h._when < end_time]:
+                self.discard(handle)
+                expired.append(handle)
+
+        if len(expired) > 1:
+            expired.sort(key=_when)
+        return expired
+
+
+def _when(handle):
+    return handle._when
@@ -1,6 +1,7 @@
 """Selector event loop for Unix with signal handling."""
 
 import errno
+import functools
 import io
 import itertools
 import os
@@ -12,6 +13,7 @@
 import sys
 import threading
 import warnings
+import weakref
 
 from . import base_events
 from . import base_subprocess
@@ -27,7 +29,7 @@
 
 
 __all__ = (
-    'SelectorEventLoop',
+    'SelectorEventLoop', 'IoUringEventLoop',
     'AbstractChildWatcher', 'SafeChildWatcher',
     'FastChildWatcher', 'PidfdChildWatcher',
     'MultiLoopChildWatcher', 'ThreadedChildWatcher',
@@ -458,6 +460,289 @@ def cb(fut):
         fut.add_done_callback(cb)
 
 
+class IoUringEventLoop(_UnixSelectorEventLoop):
+    """Unix event loop using io_uring on Linux.
+
+    I/O readiness is waited for with selectors.IoUringSelector.  When
+    sock_recv(), sock_recv_into(), sock_sendall() and sock_accept() can't
+    complete immediately, they are carried out as io_uring operations
+    instead of waiting for readiness and retrying the system call;
+    sock_sendfile() reads the file with io_uring operations.  The
+    operations started during a loop iteration are submitted together,
+    in a single system call.
+
+    If io_uring is not available, the loop falls back to the default
+    selector and to non-blocking system calls.
+    """
+
+    def __init__(self, selector=None):
+        if selector is None:
+            selector = _io_uring_selector()
+        super().__init__(selector)
+        self._io_uring = (hasattr(selectors, 'IoUringSelector') and
+                          isinstance(self._selector, selectors.IoUringSelector))
+        # socket -> bytearray of the data received by cancelled recv
+        # operations, returned by the next receive calls
+        self._io_uring_unread = weakref.WeakKeyDictionary()
+        # socket -> [count of the cancelled recv operations not completed
+        #            yet, future done when they are all completed]
+        self._io_uring_recv_cancelled = weakref.WeakKeyDictionary()
+
+    def _io_uring_submit(self, operation, *args, cancelled=None, **kwargs):
+        # Return a future for the result of an io_uring operation.
+        # Cancelling the future cancels the operation; if the operation
+        # completed in the kernel first, cancelled(result) is called to
+        # clean up.
+        fut = self.create_future()
+        user_data = self._selector._submit(
+            operation, functools.partial(self._io_uring_done, fut, cancelled),
+            *args, **kwargs)
+        fut.add_done_callback(
+            functools.partial(self._io_uring_cancel, user_data, cancelled))
+        return fut
+
+    def _io_uring_done(self, fut, cancelled, result):
+        if fut.done():
+            # Cancelled, but completed before the cancellation reached
+            # the kernel.
+            if cancelled is not None:
+                cancelled(result)
+            return
+        if result < 0:
+            fut.set_exception(OSError(-result, os.strerror(-result)))
+        else:
+            fut.set_result(result)
+
+    def _io_uring_cancel(self, user_data, cancelled, fut):
+        if fut.cancelled() and not self.is_closed():
+            self._selector._cancel(user_data, cancelled)
+
+    def _io_uring_recv(self, sock, buf):
+        # Receive into buf with an io_uring operation.  If it is cancelled
+        # after receiving data, the data is kept for the next receive
+        # calls on sock.
+        fut = self._io_uring_submit(
+            'recv', sock.fileno(), buf,
+            cancelled=functools.partial(self._io_uring_recv_late, sock, buf))
+        fut.add_done_callback(
+            functools.partial(self._io_uring_recv_cancel, sock))
+        return fut
+
+    def _io_uring_recv_cancel(self, sock, fut):
+        if fut.cancelled() and not self.is_closed():
+            self._io_uring_count_recv_cancelled(sock, 1)
+
+    def _io_uring_recv_late(self, sock, buf, result):
+        # Called with the result of a cancelled recv operation, before or
+        # after _io_uring_recv_cancel().
+        if result > 0:
+            try:
+                unread = self._io_uring_unread[sock]
+            except KeyError:
+                unread = self._io_uring_unread[sock] = bytearray()
+            unread += memoryview(buf)[:result]
+        self._io_uring_count_recv_cancelled(sock, -1)
+
+    def _io_uring_count_recv_cancelled(self, sock, delta):
+        # Each cancelled recv operation adds 1 when it is cancelled and
+        # -1 when it completes, in any order: the receive calls wait until
+        # the count drops back to 0.
+        state = self._io_uring_recv_cancelled.get(sock)
+        if state is None:
+            state = [0, self.create_future()]
+            self._io_uring_recv_cancelled[sock] = state
+        state[0] += delta
+        if not state[0]:
+            del self._io_uring_recv_cancelled[sock]
+            state[1].set_result(None)
+
+    async def _io_uring_read_unread(self, sock, n):
+        # Return up to n bytes received by cancelled recv operations on
+        # sock, or None.
+        state = self._io_uring_recv_cancelled.get(sock)
+        if state is not None:
+            await tasks.shield(state[1])
+        unread = self._io_uring_unread.get(sock)
+        if not unread:
+            return None
+        data = bytes(unread[:n])
+        del unread[:n]
+        if not unread:
+            del self._io_uring_unread[sock]
+        return data
+
+    async def sock_recv(self, sock, n):
+        if not self._io_uring:
+            return await super().sock_recv(sock, n)
+        base_events._check_ssl_socket(sock)
+        if self._debug and sock.gettimeout() != 0:
+            raise ValueError("the socket must be non-blocking")
+        if self._io_uring_unread or self._io_uring_recv_cancelled:
+            data = await self._io_uring_read_unread(sock, n)
+            if data is not None:
+                return data
+        try:
+            return sock.recv(n)
+        except (BlockingIOError, InterruptedError):
+            pass
+        self._ensure_fd_no_transport(sock.fileno())
+        buf = bytearray(n)
+        nbytes = await self._io_uring_recv(sock, buf)
+        return bytes(memoryview(buf)[:nbytes])
+
+    async def sock_recv_into(self, sock, buf):
+        if not self._io_uring:
+            return await super().sock_recv_into(sock, buf)
+        base_events._check_ssl_socket(sock)
+        if self._debug and sock.gettimeout() != 0:
+            raise ValueError("the socket must be non-blocking")
+        if self._io_uring_unread or self._io_uring_recv_cancelled:
+            with memoryview(buf) as view, view.cast('B') as view:
+                data = await self._io_uring_read_unread(sock, len(view))
+                if data is not None:
+                    view[:len(data)] = data
+                    return len(data)
+        try:
+            return sock.recv_into(buf)
+        except (BlockingIOError, InterruptedError):
+            pass
+        self._ensure_fd_no_transport(sock.fileno())
+        # The data received by a cancelled operation is copied from buf
+        # when it completes.
+        return await self._io_uring_recv(sock, buf)
+
+    async def sock_sendall(self, sock, data):
+        if not self._io_uring:
+            return await super().sock_sendall(sock, data)
+        base_events._check_ssl_socket(sock)
+        if self._debug and sock.gettimeout() != 0:
+            raise ValueError("the socket must be non-blocking")
+        try:
+            n = sock.send(data)
+        except (BlockingIOError, InterruptedError):
+            n = 0
+
+        if n == len(data):
+            # all data sent
+            return
+
+        fd = sock.fileno()
+        self._ensure_fd_no_transport(fd)
+        view = memoryview(data).cast('B')
+        total = len(view)
+        while n < total:
+            n += await self._io_uring_submit('send', fd, view[n:])
+
+    async def sock_accept(self, sock):
+        if not self._io_uring:
+            return await super().sock_accept(sock)
+        base_events._check_ssl_socket(sock)
+        if self._debug and sock.gettimeout() != 0:
+            raise ValueError("the socket must be non-blocking")
+        try:
+            conn, address = sock.accept()
+            conn.setblocking(False)
+            return conn, address
+        except (BlockingIOError, InterruptedError):
+            pass
+        self._ensure_fd_no_transport(sock.fileno())
+        fd = await self._io_uring_submit('accept', sock.fileno(),
+                                         cancelled=_close_accepted)
+        conn = socket.socket(sock.family, sock.type, sock.proto, fileno=fd)
+        conn.setblocking(False)
+        try:
+            address = conn.getpeername()
+        except OSError:
+            # The peer is already gone: the connection only has EOF or an
+            # error to report.
+            address = None
+        return conn, address
+
+    async def _sock_sendfile_native(self, sock, file, offset, count):
+        if not self._io_uring:
+            return await super()._sock_sendfile_native(sock, file, offset,
+                                                       count)
+        try:
+            fileno = file.fileno()
+        except (AttributeError, io.UnsupportedOperation) as err:
+            raise exceptions.SendfileNotAvailableError("not a regular file")
+        try:
+            st = os.fstat(fileno)
+        except OSError:
+            raise exceptions.SendfileNotAvailableError("not a regular file")
+        if not stat.S_ISREG(st.st_mode):
+            # Reads at an offset are not supported.
+            raise exceptions.SendfileNotAvailableError("not a regular file")
+        blocksize = count if count else st.st_size
+        if not blocksize:
+            return 0  # empty file
+        blocksize = min(blocksize, constants.SENDFILE_FALLBACK_READBUFFER_SIZE)
+
+        # Double buffering: the next block is read while the previous one
+        # is sent.
+        fd = sock.fileno()
+        buffers = (bytearray(blocksize), bytearray(blocksize))
+        index = 0
+        read_offset = offset
+        total_sent = 0
+
+        def read_next():
+            size = blocksize
+            if count:
+                size = min(size, offset + count - read_offset)
+                if size <= 0:
+                    return None
+            view = memoryview(buffers[index])[:size]
+            return self._io_uring_submit('read', fileno, view,
+                                         offset=read_offset)
+
+        pending = read_next()
+        try:
+            while pending is not None:
+                nread = await pending
+                pending = None
+                if not nread:
+                    break  # EOF
+                view = memoryview(buffers[index])[:nread]
+                read_offset += nread
+                index ^= 1
+                pending = read_next()
+                start = 0
+                while start < nread:
+                    sent = await self._io_uring_submit('send', fd,
+                                                       view[start:])
+                    start += sent
+                    total_sent += sent
+            return total_sent
+        except OSError as exc:
+            if total_sent == 0:
+                # As with os.sendfile(), fall back on using plain send().
+                raise exceptions.SendfileNotAvailableError(
+                    "io_uring sendfile failed") from exc
+            raise
+        finally:
+            if pending is not None:
+                pending.cancel()
+            self._sock_sendfile_update_filepos(fileno, offset + total_sent,
+                                               total_sent)
+
+
+def _close_accepted(result):
+    # Called with the result of a cancelled accept operation.
+    if result >= 0:
+        os.close(result)
+
+
+def _io_uring_selector():
+    if hasattr(selectors, 'IoUringSelector'):
+        try:
+            return selectors.IoUringSelector()
+        except OSError:
+            # Not supported by the kernel, or denied by a seccomp filter.
+            pass
+    return selectors.DefaultSelector()
+
+
 class _UnixReadPipeTransport(transports.ReadTransport):
 
     max_size = 256 * 1024  # max bytes we read in one event loop iteration
@@ -14,6 +14,7 @@
                                       BrokenExecutor,
                                       Future,
                                       Executor,
+                                      ExecutorStats,
                                       wait,
                                       as_completed)
 
@@ -26,10 +27,14 @@
     'BrokenExecutor',
     'Future',
     'Executor',
+    'ExecutorStats',
     'wait',
     'as_completed',
+    'MemoizingExecutor',
     'ProcessPoolExecutor',
     'ThreadPoolExecutor',
+    'WarmProcessPool',
+    'WorkStealingThreadPoolExecutor',
 )
 
 
@@ -38,16 +43,32 @@ def __dir__():
 
 
 def __getattr__(name):
-    global ProcessPoolExecutor, ThreadPoolExecutor
+    global MemoizingExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+    global WarmProcessPool, WorkStealingThreadPoolExecutor
+
+    if name == 'MemoizingExecutor':
+        from ._memo import MemoizingExecutor as me
+        MemoizingExecutor = me
+        return me
 
     if name == 'ProcessPoolExecutor':
         from .process import ProcessPoolExecutor as pe
         ProcessPoolExecutor = pe
         return pe
 
+    if name == 'WarmProcessPool':
+        from .process import WarmProcessPool as wpp
+        WarmProcessPool = wpp
+        return wpp
+
     if name == 'ThreadPoolExecutor':
         from .thread import ThreadPoolExecutor as te
         ThreadPoolExecutor = te
         return te
 
+    if name == 'WorkStealingThreadPoolExecutor':
+        from .thread import WorkStealingThreadPoolExecutor as wte
+        WorkStealingThreadPoolExecutor = wte
+        return wte
+
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,10 +4,14 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 import collections
+import itertools
 import logging
+import math
+import queue
 import threading
 import time
 import types
+import weakref
 
 FIRST_COMPLETED = 'FIRST_COMPLETED'
 FIRST_EXCEPTION = 'FIRST_EXCEPTION'
@@ -580,7 +584,19 @@ def submit(self, fn, /, *args, **kwargs):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def submit_many(self, fn, /, *iterables):
+        """Submits a callable to be executed with each set of arguments.
+
+        Equivalent to [submit(fn, *args) for args in zip(*iterables)], but
+        executors may schedule the calls more efficiently as a batch.
+
+        Returns:
+            A list of Futures representing the given calls, in order.
+        """
+        return [self.submit(fn, *args) for args in zip(*iterables)]
+
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None,
+            ordered=True):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -592,6 +608,12 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before being passed to a child process. This argument is only
                 used by ProcessPoolExecutor; it is ignored by
                 ThreadPoolExecutor.
+            buffersize: The maximum number of submitted calls whose results
+                have not been yielded yet. If None, all the calls are
+                submitted at once; otherwise the iterables are consumed
+                lazily, as the results are yielded.
+            ordered: If False, the results are yielded as soon as they are
+                available instead of in the order of the iterables.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -602,18 +624,72 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if buffersize is not None and buffersize < 1:
+            raise ValueError("buffersize must be None or >= 1.")
+
         if timeout is not None:
             end_time = timeout + time.monotonic()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        if buffersize is None:
+            fs = self.submit_many(fn, *iterables)
+        else:
+            args_iter = zip(*iterables)
+            fs = collections.deque(
+                self.submit(fn, *args)
+                for args in itertools.islice(args_iter, buffersize))
+            # Don't keep the executor alive while the results are consumed.
+            executor_ref = weakref.ref(self)
+
+        def submit_next():
+            # Submit the next call of a bounded map, if any is left.
+            if buffersize is None:
+                return None
+            executor = executor_ref()
+            if executor is None:
+                return None
+            args = next(args_iter, None)
+            if args is None:
+                return None
+            return executor.submit(fn, *args)
+
+        if not ordered:
+            done = queue.SimpleQueue()
+            for future in fs:
+                future.add_done_callback(done.put)
+            fs = set(fs)
+
+            def next_done():
+                try:
+                    if timeout is None:
+                        future = done.get()
+                    else:
+                        future = done.get(
+                            timeout=max(end_time - time.monotonic(), 0))
+                except queue.Empty:
+                    raise TimeoutError from None
+                fs.remove(future)
+                next_future = submit_next()
+                if next_future is not None:
+                    fs.add(next_future)
+                    next_future.add_done_callback(done.put)
+                return future
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
         def result_iterator():
             try:
+                if not ordered:
+                    while fs:
+                        # Careful not to keep a reference to the future
+                        yield _result_or_cancel(next_done())
+                    return
                 # reverse to keep finishing order
                 fs.reverse()
                 while fs:
+                    next_future = submit_next()
+                    if next_future is not None:
+                        fs.appendleft(next_future)
+                        del next_future
                     # Careful not to keep a reference to the popped future
                     if timeout is None:
                         yield _result_or_cancel(fs.pop())
@@ -652,3 +728,295 @@ class BrokenExecutor(RuntimeError):
     """
     Raised when a executor has become non-functional after a severe failure.
     """
+
+
+# The durations recorded by the histograms of the executor statistics are
+# counted in buckets whose upper bounds are powers of two, from 2**-20
+# seconds (about one microsecond) to 2**12 seconds (about an hour); the last
+# bucket counts the longer durations.
+_HISTOGRAM_UNIT = 2.0 ** -20
+_HISTOGRAM_BUCKETS = 34
+
+class _Histogram(object):
+    """A histogram with power-of-two bucket boundaries.
+
+    Bucket 0 counts the values below unit, bucket i counts the values in
+    [unit * 2**(i-1), unit * 2**i) and the last bucket also counts all the
+    larger values.  Negative values are counted as 0.  Adding a value is
+    O(1).
+
+    This is also the implementation of asyncio.Histogram.
+    """
+
+    __slots__ = ('_unit', '_buckets', '_count', '_total', '_min', '_max')
+
+    def __init__(self, unit=_HISTOGRAM_UNIT, nbuckets=_HISTOGRAM_BUCKETS):
+        if unit <= 0:
+            raise ValueError("unit must be a positive number")
+        if nbuckets < 1:
+            raise ValueError("nbuckets must be at least 1")
+        self._unit = unit
+        self._buckets = [0] * nbuckets
+        self.clear()
+
+    def __repr__(self):
+        return '<%s count=%d total=%r max=%r>' % (
+            self.__class__.__name__, self._count, self._total, self._max)
+
+    def add(self, value, _frexp=math.frexp):
+        """Record a value."""
+        buckets = self._buckets
+        if value > 0:
+            # unit * 2**(i - 1) <= value < unit * 2**i
+            i = _frexp(value / self._unit)[1]
+            if i < 0:
+                i = 0
+            elif i >= len(buckets):
+                i = len(buckets) - 1
+        else:
+            value = 0
+            i = 0
+        buckets[i] += 1
+        if self._count:
+            if value < self._min:
+                self._min = value
+            elif value > self._max:
+                self._max = value
+        else:
+            self._min = self._max = value
+        self._count += 1
+        self._total += value
+
+    def clear(self):
+        """Forget all the recorded values."""
+        self._buckets = [0] * len(self._buckets)
+        self._count = 0
+        self._total = 0
+        self._min = None
+        self._max = None
+
+    def copy(self):
+        """Return a copy of the histogram."""
+        h = object.__new__(self.__class__)
+        h._unit = self._unit
+        h._buckets = self._buckets.copy()
+        h._count = self._count
+        h._total = self._total
+        h._min = self._min
+        h._max = self._max
+        return h
+
+    @property
+    def count(self):
+        """The number of recorded values."""
+        return self._count
+
+    @property
+    def total(self):
+        """The sum of the recorded values."""
+        return self._total
+
+    @property
+    def min(self):
+        """The smallest recorded value, or None if there is none."""
+        return self._min
+
+    @property
+    def max(self):
+        """The largest recorded value, or None if there is none."""
+        return self._max
+
+    def mean(self):
+        """Return the mean of the recorded values, or None if there is none."""
+        if not self._count:
+            return None
+        return self._total / self._count
+
+    def quantile(self, q):
+        """Return an upper bound of the q-quantile of the recorded values.
+
+        q must be between 0 and 1: 0.5 for the median, 0.99 for the 99th
+        percentile.  The bound is the upper bound of the bucket of the
+        quantile, or the largest value if it is lower.  Return None if
+        there is no value.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self._count:
+            return None
+        rank = max(1, math.ceil(self._count * q))
+        seen = 0
+        for bound, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                return min(bound, self._max)
+        return self._max
+
+    def percentile(self, p):
+        """Return an upper bound of the p-th percentile (0 <= p <= 100).
+
+        This is quantile(p / 100).
+        """
+        if not 0 <= p <= 100:
+            raise ValueError("p must be between 0 and 100")
+        return self.quantile(p / 100)
+
+    def buckets(self):
+        """Return a list of (upper bound, count) pairs.
+
+        The count of a bucket is the number of values greater than or equal
+        to the bound of the previous bucket and less than its own bound.
+        The bound of the last bucket is infinite.
+        """
+        unit = self._unit
+        last = len(self._buckets) - 1
+        return [(unit * 2 ** i if i < last else math.inf, count)
+                for i, count in enumerate(self._buckets)]
+
+    def snapshot(self):
+        """Return the histogram as a dict of plain Python objects.
+
+        Only the buckets which counted values are listed.
+        """
+        return {
+            'count': self._count,
+            'total': self._total,
+            'min': self._min,
+            'max': self._max,
+            'buckets': [(bound, count) for bound, count in self.buckets()
+                        if count],
+        }
+
+
+class ExecutorStats(collections.namedtuple('ExecutorStats',
+        'submitted started completed failed cancelled workers max_workers '
+        'elapsed wait_time run_time')):
+    """A snapshot of the statistics of an executor.
+
+    Attributes:
+        submitted: The number of calls submitted.
+        started: The number of calls which started running.
+        completed: The number of calls which finished, including the
+            calls which raised an exception.
+        failed: The number of completed calls which raised an exception.
+        cancelled: The number of calls cancelled before they started.
+        workers: The number of worker threads or processes.
+        max_workers: The maximum number of workers.
+        elapsed: The number of seconds since the executor was created.
+        wait_time: A histogram of the number of seconds the calls waited
+            between their submission and their start.
+        run_time: A histogram of the number of seconds the calls ran.
+    """
+
+    __slots__ = ()
+
+    @property
+    def pending(self):
+        """The number of calls waiting to be started."""
+        return self.submitted - self.started - self.cancelled
+
+    @property
+    def running(self):
+        """The number of calls running."""
+        return self.started - self.completed
+
+    @property
+    def utilization(self):
+        """The fraction of the time the workers could have spent running
+        calls since the executor was created, which they did spend."""
+        capacity = self.elapsed * self.max_workers
+        if capacity <= 0:
+            return 0.0
+        return min(self.run_time.total / capacity, 1.0)
+
+
+class _StatsRecorder(object):
+    """Collects the statistics of the calls of an executor.
+
+    The executor calls the call_*() methods when the state of a call
+    changes, and the notify_*() ones once the future of the call was
+    updated.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.created = time.monotonic()
+        self.submitted = 0
+        self.started = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.wait_time = _Histogram()
+        self.run_time = _Histogram()
+        # Callbacks set by the user, or None.
+        self.on_submit = None
+        self.on_start = None
+        self.on_finish = None
+
+    def set_callbacks(self, on_submit, on_start, on_finish):
+        for callback in (on_submit, on_start, on_finish):
+            if callback is not None and not callable(callback):
+                raise TypeError("stats callbacks must be callables or None")
+        self.on_submit = on_submit
+        self.on_start = on_start
+        self.on_finish = on_finish
+
+    def call_submitted(self):
+        # Return the submission time of the call.
+        with self.lock:
+            self.submitted += 1
+        return time.monotonic()
+
+    def call_started(self, future, submit_time):
+        # Return the start time of the call.
+        now = time.monotonic()
+        wait_time = now - submit_time
+        with self.lock:
+            self.started += 1
+            self.wait_time.add(wait_time)
+        if self.on_start is not None:
+            self._invoke(self.on_start, future, wait_time)
+        return now
+
+    def call_finished(self, run_time, failed):
+        # run_time is None if it is not known.
+        with self.lock:
+            self.completed += 1
+            if failed:
+                self.failed += 1
+            if run_time is not None:
+                self.run_time.add(run_time)
+
+    def call_cancelled(self):
+        with self.lock:
+            self.cancelled += 1
+
+    def call_abandoned(self, started):
+        # The call failed because the executor broke.
+        with self.lock:
+            if not started:
+                self.started += 1
+            self.completed += 1
+            self.failed += 1
+
+    def notify_submitted(self, future):
+        if self.on_submit is not None:
+            self._invoke(self.on_submit, future)
+
+    def notify_finished(self, future, run_time):
+        if self.on_finish is not None:
+            self._invoke(self.on_finish, future, run_time)
+
+    def _invoke(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception:
+            LOGGER.exception('exception calling stats callback %r', callback)
+
+    def snapshot(self, workers, max_workers):
+        with self.lock:
+            return ExecutorStats(self.submitted, self.started,
+                                 self.completed, self.failed,
+                                 self.cancelled, workers, max_workers,
+                                 time.monotonic() - self.created,
+                                 self.wait_time.copy(), self.run_time.copy())
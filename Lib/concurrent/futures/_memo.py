@@ -0,0 +1,237 @@
+"""Implements MemoizingExecutor."""
+
+import collections
+import functools
+import hashlib
+import pickle
+import threading
+
+from concurrent.futures import _base
+
+
+class MemoizingExecutor(_base.Executor):
+    """Wraps an executor to cache the results of the calls submitted to it.
+
+    Calls are identified by a hash of their pickled function and arguments,
+    so that submitting a call identical to a previous one doesn't run it
+    again: the returned future gets the cached result.  The results of up
+    to maxsize calls are kept, the least recently used ones being discarded
+    first; if maxsize is None, the cache can grow without bound.  Calls
+    which raise an exception or are cancelled are not cached.
+
+    While a call is running, identical calls submitted wait for it instead
+    of running it again.  Each caller gets its own future: cancelling it
+    only cancels the call if no other caller waits for it, and it is running
+    once the call started.  Calls whose
+    function or arguments can't be pickled are submitted to the executor
+    without caching.
+
+    Only pure functions, whose result depends on their arguments only,
+    should be submitted to a MemoizingExecutor.
+    """
+
+    def __init__(self, executor, maxsize=128):
+        """Initializes a new MemoizingExecutor instance.
+
+        Args:
+            executor: The executor running the calls.
+            maxsize: The maximum number of results cached, or None.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be None or >= 0")
+        self._executor = executor
+        self._maxsize = maxsize
+        # key -> result, from the least to the most recently used
+        self._cache = collections.OrderedDict()
+        # key -> _Call of the running call
+        self._running = {}
+        self._lock = threading.Lock()
+        self._hits = self._misses = 0
+
+    @property
+    def executor(self):
+        """The wrapped executor."""
+        return self._executor
+
+    @staticmethod
+    def _make_key(fn, args, kwargs):
+        data = pickle.dumps((fn, args, sorted(kwargs.items())),
+                            pickle.HIGHEST_PROTOCOL)
+        return hashlib.sha256(data).digest()
+
+    def submit(self, fn, /, *args, **kwargs):
+        try:
+            key = self._make_key(fn, args, kwargs)
+        except Exception:
+            # Not picklable: can't be cached.
+            return self._executor.submit(fn, *args, **kwargs)
+
+        f = _base.Future()
+        with self._lock:
+            try:
+                result = self._cache[key]
+            except KeyError:
+                pass
+            else:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                f.set_result(result)
+                return f
+
+            call = self._running.get(key)
+            if call is not None:
+                self._hits += 1
+                call.waiters.append(f)
+                if call.started:
+                    f.set_running_or_notify_cancel()
+                new_call = False
+            else:
+                self._misses += 1
+                call = self._running[key] = _Call(f)
+                new_call = True
+        f.add_done_callback(functools.partial(self._waiter_done, key, call))
+        if not new_call:
+            return f
+
+        # Outside of the lock: the executor may block or call back.
+        try:
+            call_future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException as exc:
+            with self._lock:
+                if self._running.get(key) is call:
+                    del self._running[key]
+                waiters, call.waiters = call.waiters, []
+            for waiter in waiters:
+                if waiter is not f:
+                    _copy_state(exc, waiter)
+            raise
+        with self._lock:
+            call.future = call_future
+            cancel = not call.waiters
+        if cancel:
+            # Cancelled by all its callers meanwhile.
+            call_future.cancel()
+        else:
+            self._watch_start(call, call_future)
+        call_future.add_done_callback(
+            functools.partial(self._call_done, key, call))
+        return f
+    submit.__doc__ = _base.Executor.submit.__doc__
+
+    def _watch_start(self, call, call_future):
+        # Futures have no callback for their start: wrap the method which
+        # the executor calls before running the call, so that the futures
+        # of the callers are marked as running with it.
+        set_running = call_future.set_running_or_notify_cancel
+
+        def set_running_or_notify_cancel():
+            running = set_running()
+            if running:
+                self._call_started(call)
+            return running
+
+        call_future.set_running_or_notify_cancel = set_running_or_notify_cancel
+        # The executor may have started the call before it was wrapped.
+        if call_future.running() or call_future.done():
+            self._call_started(call)
+
+    def _call_started(self, call):
+        # The futures are updated with the lock held, so that a caller
+        # can't cancel its future meanwhile (see _waiter_done()).
+        with self._lock:
+            if call.started:
+                return
+            call.started = True
+            for waiter in list(call.waiters):
+                if not waiter.set_running_or_notify_cancel():
+                    # Cancelled by its caller: it is notified now.
+                    call.waiters.remove(waiter)
+
+    def _waiter_done(self, key, call, f):
+        # A caller cancelling its future only cancels the call if no other
+        # caller waits for it.
+        if not f.cancelled():
+            return
+        with self._lock:
+            try:
+                call.waiters.remove(f)
+            except ValueError:
+                return
+            # Notify wait() and as_completed(), as an executor does when
+            # it discards a cancelled call.
+            f.set_running_or_notify_cancel()
+            if call.waiters or call.future is None:
+                return
+            # Identical calls submitted from now on run again.
+            if self._running.get(key) is call:
+                del self._running[key]
+        call.future.cancel()
+
+    def _call_done(self, key, call, call_future):
+        # The result is cached before the futures of the callers are
+        # completed.
+        with self._lock:
+            if self._running.get(key) is call:
+                del self._running[key]
+            waiters, call.waiters = call.waiters, []
+            if not (self._maxsize == 0 or call_future.cancelled()
+                    or call_future.exception() is not None):
+                self._cache[key] = call_future.result()
+                if (self._maxsize is not None
+                        and len(self._cache) > self._maxsize):
+                    self._cache.popitem(last=False)
+        for waiter in waiters:
+            _copy_state(call_future, waiter)
+
+    def cache_info(self):
+        """Report cache statistics.
+
+        Returns:
+            A named tuple (hits, misses, maxsize, currsize), like
+            functools.lru_cache().cache_info().  The identical calls
+            submitted while a call is running count as hits.
+        """
+        with self._lock:
+            return functools._CacheInfo(self._hits, self._misses,
+                                        self._maxsize, len(self._cache))
+
+    def cache_clear(self):
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+    shutdown.__doc__ = _base.Executor.shutdown.__doc__
+
+
+class _Call(object):
+    """A call running in the wrapped executor."""
+
+    def __init__(self, waiter):
+        # The future of the call, set once it is submitted.
+        self.future = None
+        # Whether the call started running.
+        self.started = False
+        # The futures returned to the callers waiting for the call.
+        self.waiters = [waiter]
+
+
+def _copy_state(source, waiter):
+    # Complete waiter with the outcome of the future or exception source.
+    try:
+        if isinstance(source, BaseException):
+            waiter.set_exception(source)
+        elif source.cancelled():
+            waiter.cancel()
+        elif source.exception() is not None:
+            waiter.set_exception(source.exception())
+        else:
+            waiter.set_result(source.result())
+    except _base.InvalidStateError:
+        # Cancelled by its caller meanwhile.
+        pass
+    if waiter.cancelled():
+        # Notify wait() and as_completed().
+        waiter.set_running_or_notify_cancel()
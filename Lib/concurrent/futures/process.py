@@ -56,8 +56,10 @@
 import threading
 import weakref
 from functools import partial
+import importlib
 import itertools
 import sys
+import time
 from traceback import format_exception
 
 
@@ -115,6 +117,13 @@ def _python_exit():
 # - the thread wakeup reader
 _MAX_WINDOWS_WORKERS = 63 - 2
 
+# Bounds of the time taken by a chunk of map(chunksize=None), in seconds.
+# Between them, the chunks are sized to run _ADAPTIVE_OVERHEAD_RATIO times
+# longer than the round trip to a worker.
+_ADAPTIVE_MIN_TIME = 0.001
+_ADAPTIVE_MAX_TIME = 0.1
+_ADAPTIVE_OVERHEAD_RATIO = 10
+
 # Hack to embed stringification of remote traceback in local traceback
 
 class _RemoteTraceback(Exception):
@@ -139,18 +148,21 @@ def _rebuild_exc(exc, tb):
     return exc
 
 class _WorkItem(object):
-    def __init__(self, future, fn, args, kwargs):
+    def __init__(self, future, fn, args, kwargs, submit_time=None):
         self.future = future
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        self.submit_time = submit_time
 
 class _ResultItem(object):
-    def __init__(self, work_id, exception=None, result=None, exit_pid=None):
+    def __init__(self, work_id, exception=None, result=None, exit_pid=None,
+                 run_time=None):
         self.work_id = work_id
         self.exception = exception
         self.result = result
         self.exit_pid = exit_pid
+        self.run_time = run_time
 
 class _CallItem(object):
     def __init__(self, work_id, fn, args, kwargs):
@@ -163,10 +175,11 @@ def __init__(self, work_id, fn, args, kwargs):
 class _SafeQueue(Queue):
     """Safe Queue set exception to the future object linked to a job"""
     def __init__(self, max_size=0, *, ctx, pending_work_items, shutdown_lock,
-                 thread_wakeup):
+                 thread_wakeup, stats=None):
         self.pending_work_items = pending_work_items
         self.shutdown_lock = shutdown_lock
         self.thread_wakeup = thread_wakeup
+        self.stats = stats
         super().__init__(max_size, ctx=ctx)
 
     def _on_queue_feeder_error(self, e, obj):
@@ -180,7 +193,11 @@ def _on_queue_feeder_error(self, e, obj):
             # case, the executor_manager_thread fails all work_items
             # with BrokenProcessPool
             if work_item is not None:
+                if self.stats is not None:
+                    self.stats.call_finished(None, True)
                 work_item.future.set_exception(e)
+                if self.stats is not None:
+                    self.stats.notify_finished(work_item.future, None)
         else:
             super()._on_queue_feeder_error(e, obj)
 
@@ -207,16 +224,91 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+def _process_timed_chunk(fn, item):
+    """ Processes a chunk of an adaptive map.
+
+    item is a (submission time, chunk) pair.  Returns the submission time,
+    the times at which the processing of the chunk started and ended,
+    and the results.
+
+    This function is run in a separate process.
+
+    """
+    submitted, chunk = item
+    started = time.monotonic()
+    results = [fn(*args) for args in chunk]
+    return submitted, started, time.monotonic(), results
+
+
+class _AdaptiveChunks:
+    """ Iterates over zip()ed iterables in chunks of varying size.
+
+    The chunk size starts at one.  It is then adjusted from the timings
+    reported by _process_timed_chunk() so that running a chunk takes
+    about _ADAPTIVE_OVERHEAD_RATIO times as long as sending it to a
+    worker and getting its results back, within the bounds of
+    _ADAPTIVE_MIN_TIME and _ADAPTIVE_MAX_TIME seconds.  The chunk size
+    at most doubles from one chunk to the next.
+
+    """
+    def __init__(self, *iterables):
+        self._it = zip(*iterables)
+        self.chunksize = 1
+        # Moving average of the time taken by a single call.
+        self._call_time = None
+        # Smallest delay observed between the submission of a chunk and
+        # the start of its processing: the IPC overhead, one way.
+        self._delay = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        chunk = tuple(itertools.islice(self._it, self.chunksize))
+        if not chunk:
+            raise StopIteration
+        return time.monotonic(), chunk
+
+    def update(self, submitted, started, ended, count):
+        """ Adjusts the chunk size from the timings of a chunk of count
+        calls. """
+        delay = max(started - submitted, 0.0)
+        if self._delay is None or delay < self._delay:
+            self._delay = delay
+        call_time = (ended - started) / count
+        if self._call_time is None:
+            self._call_time = call_time
+        else:
+            self._call_time = (self._call_time + call_time) / 2
+        target = min(max(2 * self._delay * _ADAPTIVE_OVERHEAD_RATIO,
+                         _ADAPTIVE_MIN_TIME),
+                     _ADAPTIVE_MAX_TIME)
+        if self._call_time > 0:
+            chunksize = int(target / self._call_time)
+        else:
+            chunksize = 2 * self.chunksize
+        self.chunksize = max(1, min(chunksize, 2 * self.chunksize))
+
+    def results(self, timed_results):
+        """ Yields the results of the chunks, updating the chunk size. """
+        for submitted, started, ended, results in timed_results:
+            self.update(submitted, started, ended, len(results))
+            results.reverse()
+            while results:
+                yield results.pop()
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None,
-                     exit_pid=None):
+                     exit_pid=None, run_time=None):
     """Safely send back the given result or exception"""
     try:
         result_queue.put(_ResultItem(work_id, result=result,
-                                     exception=exception, exit_pid=exit_pid))
+                                     exception=exception, exit_pid=exit_pid,
+                                     run_time=run_time))
     except BaseException as e:
         exc = _ExceptionWithTraceback(e, e.__traceback__)
         result_queue.put(_ResultItem(work_id, exception=exc,
-                                     exit_pid=exit_pid))
+                                     exit_pid=exit_pid, run_time=run_time))
 
 
 def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
@@ -254,15 +346,18 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             if num_tasks >= max_tasks:
                 exit_pid = os.getpid()
 
+        start_time = time.monotonic()
         try:
             r = call_item.fn(*call_item.args, **call_item.kwargs)
         except BaseException as e:
+            run_time = time.monotonic() - start_time
             exc = _ExceptionWithTraceback(e, e.__traceback__)
             _sendback_result(result_queue, call_item.work_id, exception=exc,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid, run_time=run_time)
         else:
+            run_time = time.monotonic() - start_time
             _sendback_result(result_queue, call_item.work_id, result=r,
-                             exit_pid=exit_pid)
+                             exit_pid=exit_pid, run_time=run_time)
             del r
 
         # Liberate the resource as soon as possible, to avoid holding onto
@@ -330,6 +425,18 @@ def weakref_cb(_,
         #     {5: <_WorkItem...>, 6: <_WorkItem...>, ...}
         self.pending_work_items = executor._pending_work_items
 
+        # The _StatsRecorder of the executor.
+        self.stats = executor._stats
+
+        # Idle workers are stopped after idle_timeout seconds (or never if
+        # None), until min_workers remain.
+        self.idle_timeout = executor._idle_timeout
+        self.min_workers = executor._min_workers
+        # Time since which some workers have had nothing to do, or None.
+        self.idle_since = None
+        # Number of workers asked to stop because they were idle.
+        self.n_reaped_workers = 0
+
         super().__init__()
 
     def run(self):
@@ -338,12 +445,16 @@ def run(self):
         while True:
             self.add_call_item_to_queue()
 
-            result_item, is_broken, cause = self.wait_result_broken_or_wakeup()
+            result_item, is_broken, cause = self.wait_result_broken_or_wakeup(
+                self.reap_idle_worker())
 
             if is_broken:
                 self.terminate_broken(cause)
                 return
-            if result_item is not None:
+            if isinstance(result_item, int):
+                if self.process_worker_exit(result_item):
+                    return
+            elif result_item is not None:
                 self.process_result_item(result_item)
 
                 process_exited = result_item.exit_pid is not None
@@ -391,6 +502,8 @@ def add_call_item_to_queue(self):
                 work_item = self.pending_work_items[work_id]
 
                 if work_item.future.set_running_or_notify_cancel():
+                    self.stats.call_started(work_item.future,
+                                            work_item.submit_time)
                     self.call_queue.put(_CallItem(work_id,
                                                   work_item.fn,
                                                   work_item.args,
@@ -398,20 +511,57 @@ def add_call_item_to_queue(self):
                                         block=True)
                 else:
                     del self.pending_work_items[work_id]
+                    self.stats.call_cancelled()
                     continue
 
-    def wait_result_broken_or_wakeup(self):
+    def reap_idle_worker(self):
+        # Stop a worker if some workers have had nothing to do for
+        # idle_timeout seconds. Return the number of seconds until the next
+        # worker could be stopped, or None.
+        if self.idle_timeout is None:
+            return None
+        n_workers = len(self.processes) - self.n_reaped_workers
+        if (n_workers <= self.min_workers
+                or len(self.pending_work_items) >= n_workers
+                or self.is_shutting_down()):
+            self.idle_since = None
+            return None
+        now = time.monotonic()
+        if self.idle_since is None:
+            self.idle_since = now
+        elif now - self.idle_since >= self.idle_timeout:
+            try:
+                # The sentinel is picked up by an idle worker.
+                self.call_queue.put_nowait(None)
+            except queue.Full:
+                pass
+            else:
+                self.n_reaped_workers += 1
+                if executor := self.executor_reference():
+                    # Keep the count of idle workers consistent.
+                    executor._idle_worker_semaphore.acquire(blocking=False)
+                    del executor
+            if n_workers - 1 <= self.min_workers:
+                self.idle_since = None
+                return None
+            self.idle_since = now
+        return self.idle_since + self.idle_timeout - now
+
+    def wait_result_broken_or_wakeup(self, timeout=None):
         # Wait for a result to be ready in the result_queue while checking
         # that all worker processes are still running, or for a wake up
         # signal send. The wake up signals come either from new tasks being
         # submitted, from the executor being shutdown/gc-ed, or from the
-        # shutdown of the python interpreter.
+        # shutdown of the python interpreter. Return after timeout seconds
+        # if nothing happened.
         result_reader = self.result_queue._reader
         assert not self.thread_wakeup._closed
         wakeup_reader = self.thread_wakeup._reader
         readers = [result_reader, wakeup_reader]
         worker_sentinels = [p.sentinel for p in list(self.processes.values())]
-        ready = mp.connection.wait(readers + worker_sentinels)
+        ready = mp.connection.wait(readers + worker_sentinels, timeout)
+        if not ready:
+            return None, False, None
 
         cause = None
         is_broken = True
@@ -432,27 +582,44 @@ def wait_result_broken_or_wakeup(self):
         return result_item, is_broken, cause
 
     def process_result_item(self, result_item):
-        # Process the received a result_item. This can be either the PID of a
-        # worker that exited gracefully or a _ResultItem
-
-        if isinstance(result_item, int):
-            # Clean shutdown of a worker using its PID
-            # (avoids marking the executor broken)
-            assert self.is_shutting_down()
-            p = self.processes.pop(result_item)
-            p.join()
-            if not self.processes:
+        # Process the received a result_item, a _ResultItem: mark the future
+        # as completed.
+        work_item = self.pending_work_items.pop(result_item.work_id, None)
+        # work_item can be None if another process terminated (see above)
+        if work_item is not None:
+            self.stats.call_finished(result_item.run_time,
+                                     bool(result_item.exception))
+            if result_item.exception:
+                work_item.future.set_exception(result_item.exception)
+            else:
+                work_item.future.set_result(result_item.result)
+            self.stats.notify_finished(work_item.future, result_item.run_time)
+
+    def process_worker_exit(self, pid):
+        # Process the PID of a worker that exited gracefully, because it was
+        # idle or the executor is shutting down (avoids marking the executor
+        # broken). Return True if this thread must exit.
+        assert self.n_reaped_workers or self.is_shutting_down()
+        p = self.processes.pop(pid)
+        p.join()
+        if self.n_reaped_workers:
+            self.n_reaped_workers -= 1
+        executor = self.executor_reference()
+        if executor is not None and executor._call_queue is not None:
+            # Calls may have been submitted while the worker was stopping.
+            with self.shutdown_lock:
+                n_needed = min(len(self.pending_work_items),
+                               executor._max_workers)
+                while len(self.processes) - self.n_reaped_workers < n_needed:
+                    executor._spawn_process()
+        elif not self.processes:
+            if self.pending_work_items:
+                # No worker can be started to run them anymore.
+                self.terminate_broken(None)
+            else:
                 self.join_executor_internals()
-                return
-        else:
-            # Received a _ResultItem so mark the future as completed.
-            work_item = self.pending_work_items.pop(result_item.work_id, None)
-            # work_item can be None if another process terminated (see above)
-            if work_item is not None:
-                if result_item.exception:
-                    work_item.future.set_exception(result_item.exception)
-                else:
-                    work_item.future.set_result(result_item.result)
+            return True
+        return False
 
     def is_shutting_down(self):
         # Check whether we should start shutting down the executor.
@@ -489,7 +656,9 @@ def terminate_broken(self, cause):
 
         # Mark pending tasks as failed.
         for work_id, work_item in self.pending_work_items.items():
+            self.stats.call_abandoned(work_item.future.running())
             work_item.future.set_exception(bpe)
+            self.stats.notify_finished(work_item.future, None)
             # Delete references to object. See issue16284
             del work_item
         self.pending_work_items.clear()
@@ -514,7 +683,9 @@ def flag_executor_shutting_down(self):
                 # to only have futures that are currently running.
                 new_pending_work_items = {}
                 for work_id, work_item in self.pending_work_items.items():
-                    if not work_item.future.cancel():
+                    if work_item.future.cancel():
+                        self.stats.call_cancelled()
+                    else:
                         new_pending_work_items[work_id] = work_item
                 self.pending_work_items = new_pending_work_items
                 # Drain work_ids_queue since we no longer need to
@@ -616,7 +787,9 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 min_workers=0, idle_timeout=None, max_pending=None,
+                 pending_timeout=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -634,6 +807,20 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            min_workers: The number of worker processes which are not stopped
+                when they are idle.
+            idle_timeout: If not None, an idle worker process is stopped
+                after idle_timeout seconds during which some workers had no
+                calls to execute, until min_workers remain; workers are
+                started again on demand. Requires a non-'fork' mp_context
+                start method. When given, we default to using 'spawn' if no
+                mp_context is supplied.
+            max_pending: If not None, the maximum number of calls submitted
+                and not completed yet. When it is reached, submit() blocks
+                until a call completes.
+            pending_timeout: The maximum number of seconds submit() blocks
+                when max_pending is reached, before raising TimeoutError. If
+                None, there is no limit on the wait time.
         """
         _check_system_limits()
 
@@ -653,7 +840,7 @@ def __init__(self, max_workers=None, mp_context=None,
             self._max_workers = max_workers
 
         if mp_context is None:
-            if max_tasks_per_child is not None:
+            if max_tasks_per_child is not None or idle_timeout is not None:
                 mp_context = mp.get_context("spawn")
             else:
                 mp_context = mp.get_context()
@@ -680,6 +867,27 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        if not 0 <= min_workers <= self._max_workers:
+            raise ValueError("min_workers must be >= 0 and <= max_workers")
+        self._min_workers = min_workers
+        if idle_timeout is not None:
+            if idle_timeout <= 0:
+                raise ValueError("idle_timeout must be greater than 0")
+            if self._mp_context.get_start_method(allow_none=False) == "fork":
+                # https://github.com/python/cpython/issues/90622
+                raise ValueError("idle_timeout is incompatible with"
+                                 " the 'fork' multiprocessing start method;"
+                                 " supply a different mp_context.")
+        self._idle_timeout = idle_timeout
+
+        if max_pending is not None:
+            if max_pending <= 0:
+                raise ValueError("max_pending must be >= 1")
+            self._pending_slots = threading.Semaphore(max_pending)
+        else:
+            self._pending_slots = None
+        self._pending_timeout = pending_timeout
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -694,6 +902,7 @@ def __init__(self, max_workers=None, mp_context=None,
         self._queue_count = 0
         self._pending_work_items = {}
         self._cancel_pending_futures = False
+        self._stats = _base._StatsRecorder()
 
         # _ThreadWakeup is a communication channel used to interrupt the wait
         # of the main loop of executor_manager_thread from another thread (e.g.
@@ -714,7 +923,8 @@ def __init__(self, max_workers=None, mp_context=None,
             max_size=queue_size, ctx=self._mp_context,
             pending_work_items=self._pending_work_items,
             shutdown_lock=self._shutdown_lock,
-            thread_wakeup=self._executor_manager_thread_wakeup)
+            thread_wakeup=self._executor_manager_thread_wakeup,
+            stats=self._stats)
         # Killed worker processes can produce spurious "broken pipe"
         # tracebacks in the queue's own worker thread. But we detect killed
         # processes anyway, so silence the tracebacks.
@@ -767,6 +977,25 @@ def _spawn_process(self):
         self._processes[p.pid] = p
 
     def submit(self, fn, /, *args, **kwargs):
+        pending_slots = self._pending_slots
+        if pending_slots is not None:
+            # Wait for a slot before taking the lock: the slots are freed
+            # by the completion of the calls.
+            if not pending_slots.acquire(timeout=self._pending_timeout):
+                raise TimeoutError('too many pending calls')
+        try:
+            f = self._submit(fn, args, kwargs)
+        except BaseException:
+            if pending_slots is not None:
+                pending_slots.release()
+            raise
+        if pending_slots is not None:
+            f.add_done_callback(lambda _: pending_slots.release())
+        self._stats.notify_submitted(f)
+        return f
+    submit.__doc__ = _base.Executor.submit.__doc__
+
+    def _submit(self, fn, args, kwargs):
         with self._shutdown_lock:
             if self._broken:
                 raise BrokenProcessPool(self._broken)
@@ -777,7 +1006,7 @@ def submit(self, fn, /, *args, **kwargs):
                                    'interpreter shutdown')
 
             f = _base.Future()
-            w = _WorkItem(f, fn, args, kwargs)
+            w = _WorkItem(f, fn, args, kwargs, self._stats.call_submitted())
 
             self._pending_work_items[self._queue_count] = w
             self._work_ids.put(self._queue_count)
@@ -789,9 +1018,35 @@ def submit(self, fn, /, *args, **kwargs):
                 self._adjust_process_count()
             self._start_executor_manager_thread()
             return f
-    submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def stats(self):
+        """Return an ExecutorStats snapshot of the statistics of the calls.
+
+        The run time of a call is measured in the worker process; its wait
+        time lasts until it is sent to a worker.
+        """
+        processes = self._processes
+        return self._stats.snapshot(len(processes) if processes else 0,
+                                    self._max_workers)
+
+    def set_stats_callbacks(self, *, on_submit=None, on_start=None,
+                            on_finish=None):
+        """Set the callbacks invoked when the state of a call changes.
+
+        Args:
+            on_submit: Called as on_submit(future) by the thread submitting
+                the call, once it is submitted.
+            on_start: Called as on_start(future, wait_time) when the call
+                is sent to a worker process, wait_time being the number of
+                seconds since it was submitted.
+            on_finish: Called as on_finish(future, run_time) once the
+                future is done, run_time being the number of seconds the
+                call ran, or None if it is not known.
+        """
+        self._stats.set_callbacks(on_submit, on_start, on_finish)
+
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None,
+            ordered=True):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -802,6 +1057,15 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If None, the chunk size is adjusted from the time the calls
+                take compared to the cost of sending them to the workers.
+            buffersize: The maximum number of submitted chunks whose results
+                have not been yielded yet. If None, all the chunks are
+                submitted at once, unless chunksize is None, in which case it
+                defaults to twice the number of workers.
+            ordered: If False, the results of the chunks are yielded as soon
+                as they are available instead of in the order of the
+                iterables.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -812,12 +1076,23 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize is None:
+            # The chunk size can only adapt if the chunks are made lazily.
+            if buffersize is None:
+                buffersize = 2 * self._max_workers
+            chunks = _AdaptiveChunks(*iterables)
+            results = super().map(partial(_process_timed_chunk, fn), chunks,
+                                  timeout=timeout, buffersize=buffersize,
+                                  ordered=ordered)
+            return chunks.results(results)
+
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
         results = super().map(partial(_process_chunk, fn),
                               _get_chunks(*iterables, chunksize=chunksize),
-                              timeout=timeout)
+                              timeout=timeout, buffersize=buffersize,
+                              ordered=ordered)
         return _chain_from_iterable_of_lists(results)
 
     def shutdown(self, wait=True, *, cancel_futures=False):
@@ -841,3 +1116,258 @@ def shutdown(self, wait=True, *, cancel_futures=False):
         self._executor_manager_thread_wakeup = None
 
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
+
+
+def _warm_up(started, startup_queue, preload, initializer, initargs):
+    """ Initializes a worker process of a WarmProcessPool.
+
+    Imports the preload modules, runs the initializer and reports the time
+    taken since the process was started.
+
+    This function is run in a separate process.
+
+    """
+    for name in preload:
+        importlib.import_module(name)
+    if initializer is not None:
+        initializer(*initargs)
+    startup_queue.put((os.getpid(), time.monotonic() - started))
+
+
+class _WarmExecutorManagerThread(_ExecutorManagerThread):
+    """ The manager thread of a WarmProcessPool.
+
+    It also collects the startup times reported by the workers, so that
+    they can't fill the pipe of the startup queue and block the
+    initializer of the workers started later.
+    """
+
+    def __init__(self, executor):
+        super().__init__(executor)
+        self.collect_startup_times = executor._collect_startup_times
+        self.startup_reader = executor._startup_queue._reader
+
+    def wait_result_broken_or_wakeup(self, timeout=None):
+        if timeout is not None:
+            end_time = time.monotonic() + timeout
+        while True:
+            readers = [self.startup_reader, self.result_queue._reader,
+                       self.thread_wakeup._reader]
+            worker_sentinels = [p.sentinel
+                                for p in list(self.processes.values())]
+            ready = mp.connection.wait(readers + worker_sentinels, timeout)
+            if ready != [self.startup_reader]:
+                break
+            self.collect_startup_times()
+            if timeout is not None:
+                timeout = max(end_time - time.monotonic(), 0)
+        if self.startup_reader in ready:
+            self.collect_startup_times()
+        return super().wait_result_broken_or_wakeup(0)
+
+
+class _WarmProcessPoolExecutor(ProcessPoolExecutor):
+    """ The ProcessPoolExecutor running the calls of a WarmProcessPool. """
+
+    def __init__(self, max_workers, mp_context, initializer, initargs,
+                 preload):
+        super().__init__(max_workers, mp_context, initializer, initargs)
+        self._startup_queue = self._mp_context.SimpleQueue()
+        self._warm_up_args = (self._startup_queue, preload, initializer,
+                              initargs)
+        self._initializer = _warm_up
+        self._startup_times = {}
+        self._startup_condition = threading.Condition()
+
+    def _spawn_process(self):
+        # The start time is only known now: pass it to the worker with the
+        # arguments of its initializer.
+        self._initargs = (time.monotonic(), *self._warm_up_args)
+        super()._spawn_process()
+
+    def _start_executor_manager_thread(self):
+        if self._executor_manager_thread is None:
+            if not self._safe_to_dynamically_spawn_children:  # ie, using fork.
+                self._launch_processes()
+            self._executor_manager_thread = _WarmExecutorManagerThread(self)
+            self._executor_manager_thread.start()
+            _threads_wakeups[self._executor_manager_thread] = \
+                self._executor_manager_thread_wakeup
+
+    def _collect_startup_times(self):
+        # Only read the queue with the condition held, so that get() can't
+        # block after empty() returned False.
+        with self._startup_condition:
+            queue = self._startup_queue
+            while not queue.empty():
+                pid, seconds = queue.get()
+                self._startup_times[pid] = seconds
+            self._startup_condition.notify_all()
+
+    def _launch_all(self):
+        with self._shutdown_lock:
+            if self._shutdown_thread:
+                raise RuntimeError('cannot start workers after shutdown')
+            if self._executor_manager_thread is None:
+                if self._safe_to_dynamically_spawn_children:
+                    self._launch_processes()
+                self._start_executor_manager_thread()
+            else:
+                while len(self._processes) < self._max_workers:
+                    self._spawn_process()
+            return len(self._processes)
+
+
+class WarmProcessPool:
+    """A set of worker processes shared by executors.
+
+    The workers are started once and run the calls of all the executors
+    returned by executor(), so that short-lived executors don't pay for
+    starting processes and importing modules.  The startup cost of each
+    worker is reported by startup_times.
+    """
+
+    def __init__(self, max_workers=None, mp_context=None, initializer=None,
+                 initargs=(), *, preload=()):
+        """Initializes a new WarmProcessPool instance.
+
+        Args:
+            max_workers: The maximum number of worker processes. If None or
+                not given then as many worker processes will be created as
+                the machine has processors.
+            mp_context: A multiprocessing context to launch the workers.
+            initializer: A callable used to initialize worker processes.
+            initargs: A tuple of arguments to pass to the initializer.
+            preload: Names of modules to import before running the
+                initializer. With the 'forkserver' start method, they are
+                added to the modules imported once by the fork server of
+                the process (see multiprocessing.set_forkserver_preload()),
+                if it is not running yet; with the 'fork' start method,
+                they are imported by the current process; otherwise, they
+                are imported by each worker when it starts.
+        """
+        preload = list(preload)
+        if not all(type(name) is str for name in preload):
+            raise TypeError('preload must be a list of module names')
+        self._executor = _WarmProcessPoolExecutor(
+            max_workers, mp_context, initializer, initargs, preload)
+        mp_context = self._executor._mp_context
+        method = mp_context.get_start_method()
+        if method == 'forkserver':
+            # The fork server is shared by the whole process: add the modules
+            # to its preload list rather than replacing it.
+            from multiprocessing import forkserver
+            modules = forkserver._forkserver._preload_modules
+            mp_context.set_forkserver_preload(
+                modules + [name for name in preload if name not in modules])
+        elif method == 'fork':
+            for name in preload:
+                importlib.import_module(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown(wait=True)
+        return False
+
+    @property
+    def max_workers(self):
+        return self._executor._max_workers
+
+    @property
+    def startup_times(self):
+        """A dict mapping the pid of each started worker to the number of
+        seconds it took to be ready to run calls, including the preload
+        imports and the initializer."""
+        executor = self._executor
+        with executor._startup_condition:
+            executor._collect_startup_times()
+            return dict(executor._startup_times)
+
+    def _wait_startup_times(self, count, timeout=None):
+        # Wait until count workers have reported their startup time; the
+        # manager thread collects them.
+        executor = self._executor
+        if timeout is not None:
+            end_time = time.monotonic() + timeout
+        with executor._startup_condition:
+            while len(executor._startup_times) < count:
+                if executor._broken:
+                    raise BrokenProcessPool(executor._broken)
+                wait = 0.1
+                if timeout is not None:
+                    remaining = end_time - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError('workers did not start in time')
+                    wait = min(wait, remaining)
+                executor._startup_condition.wait(wait)
+
+    def start(self, timeout=None):
+        """Start all the workers and wait until they are ready.
+
+        Raises:
+            TimeoutError: If the workers are not ready after timeout
+                seconds.
+        """
+        self._wait_startup_times(self._executor._launch_all(), timeout)
+
+    def executor(self):
+        """Return a new executor running its calls in the pool.
+
+        The executor is a ProcessPoolExecutor whose shutdown() method only
+        waits for (or cancels) the calls submitted through it: the workers
+        keep running until the pool is shut down.
+        """
+        return _PoolExecutor(self)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        """Stop the workers.
+
+        Args:
+            wait: If True, wait for the pending calls of all the executors
+                to complete and for the workers to exit.
+            cancel_futures: If True, cancel the calls which have not started
+                running yet.
+        """
+        self._executor.shutdown(wait, cancel_futures=cancel_futures)
+
+
+class _PoolExecutor(ProcessPoolExecutor):
+    """ The executors returned by WarmProcessPool.executor(). """
+
+    def __init__(self, pool):
+        # The processes and queues belong to the pool's executor: don't
+        # call ProcessPoolExecutor.__init__().
+        self._pool = pool
+        self._max_workers = pool.max_workers
+        self._futures = set()
+        self._shutdown_lock = threading.Lock()
+        self._shutdown_thread = False
+        # The statistics and their callbacks are those of the whole pool.
+        self._stats = pool._executor._stats
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._shutdown_lock:
+            if self._shutdown_thread:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            f = self._pool._executor.submit(fn, *args, **kwargs)
+            self._futures.add(f)
+        f.add_done_callback(self._futures.discard)
+        return f
+    submit.__doc__ = _base.Executor.submit.__doc__
+
+    def stats(self):
+        return self._pool._executor.stats()
+    stats.__doc__ = ProcessPoolExecutor.stats.__doc__
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._shutdown_lock:
+            self._shutdown_thread = True
+            futures = list(self._futures)
+        if cancel_futures:
+            for f in futures:
+                f.cancel()
+        if wait:
+            _base.wait(futures)
+    shutdown.__doc__ = _base.Executor.shutdown.__doc__
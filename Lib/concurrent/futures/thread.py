@@ -6,9 +6,11 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
+import time
 import types
 import weakref
 import os
@@ -44,24 +46,65 @@ def _python_exit():
 
 
 class _WorkItem(object):
-    def __init__(self, future, fn, args, kwargs):
+    def __init__(self, future, fn, args, kwargs, stats=None):
         self.future = future
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
+        # The _StatsRecorder of the executor, or None.
+        self.stats = stats
+        if stats is not None:
+            self.submit_time = stats.call_submitted()
 
     def run(self):
+        stats = self.stats
         if not self.future.set_running_or_notify_cancel():
+            if stats is not None:
+                stats.call_cancelled()
+            return
+        if stats is None:
+            self._run()
             return
 
+        start_time = stats.call_started(self.future, self.submit_time)
         try:
             result = self.fn(*self.args, **self.kwargs)
         except BaseException as exc:
+            run_time = time.monotonic() - start_time
+            stats.call_finished(run_time, True)
             self.future.set_exception(exc)
+            stats.notify_finished(self.future, run_time)
             # Break a reference cycle with the exception 'exc'
             self = None
         else:
+            run_time = time.monotonic() - start_time
+            stats.call_finished(run_time, False)
             self.future.set_result(result)
+            stats.notify_finished(self.future, run_time)
+
+    def _run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except BaseException as exc:
+            self.future.set_exception(exc)
+            # Break a reference cycle with the exception 'exc'
+            self = None
+        else:
+            self.future.set_result(result)
+
+    def abandon(self, exc):
+        # Fail the call without running it.
+        if self.stats is not None:
+            self.stats.call_abandoned(False)
+        self.future.set_exception(exc)
+        if self.stats is not None:
+            self.stats.notify_finished(self.future, None)
+
+    def cancel(self):
+        # Cancel the call, which was removed from the work queue.
+        if self.stats is not None:
+            self.stats.call_cancelled()
+        self.future.cancel()
 
     __class_getitem__ = classmethod(types.GenericAlias)
 
@@ -157,8 +200,15 @@ def __init__(self, max_workers=None, thread_name_prefix='',
                                     ("ThreadPoolExecutor-%d" % self._counter()))
         self._initializer = initializer
         self._initargs = initargs
+        self._stats = _base._StatsRecorder()
 
     def submit(self, fn, /, *args, **kwargs):
+        f = self._submit(fn, args, kwargs)
+        self._stats.notify_submitted(f)
+        return f
+    submit.__doc__ = _base.Executor.submit.__doc__
+
+    def _submit(self, fn, args, kwargs):
         with self._shutdown_lock, _global_shutdown_lock:
             if self._broken:
                 raise BrokenThreadPool(self._broken)
@@ -170,12 +220,31 @@ def submit(self, fn, /, *args, **kwargs):
                                    'interpreter shutdown')
 
             f = _base.Future()
-            w = _WorkItem(f, fn, args, kwargs)
+            w = _WorkItem(f, fn, args, kwargs, self._stats)
 
             self._work_queue.put(w)
             self._adjust_thread_count()
             return f
-    submit.__doc__ = _base.Executor.submit.__doc__
+
+    def stats(self):
+        """Return an ExecutorStats snapshot of the statistics of the calls."""
+        return self._stats.snapshot(len(self._threads), self._max_workers)
+
+    def set_stats_callbacks(self, *, on_submit=None, on_start=None,
+                            on_finish=None):
+        """Set the callbacks invoked when the state of a call changes.
+
+        Args:
+            on_submit: Called as on_submit(future) by the thread submitting
+                the call, once it is submitted.
+            on_start: Called as on_start(future, wait_time) when the call
+                starts, wait_time being the number of seconds since it
+                was submitted.
+            on_finish: Called as on_finish(future, run_time) once the
+                future is done, run_time being the number of seconds the
+                call ran.
+        """
+        self._stats.set_callbacks(on_submit, on_start, on_finish)
 
     def _adjust_thread_count(self):
         # if idle threads are available, don't spin new threads
@@ -211,7 +280,7 @@ def _initializer_failed(self):
                 except queue.Empty:
                     break
                 if work_item is not None:
-                    work_item.future.set_exception(BrokenThreadPool(self._broken))
+                    work_item.abandon(BrokenThreadPool(self._broken))
 
     def shutdown(self, wait=True, *, cancel_futures=False):
         with self._shutdown_lock:
@@ -225,7 +294,7 @@ def shutdown(self, wait=True, *, cancel_futures=False):
                     except queue.Empty:
                         break
                     if work_item is not None:
-                        work_item.future.cancel()
+                        work_item.cancel()
 
             # Send a wake-up to prevent threads calling
             # _work_queue.get(block=True) from permanently blocking.
@@ -234,3 +303,368 @@ def shutdown(self, wait=True, *, cancel_futures=False):
             for t in self._threads:
                 t.join()
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
+
+
+# The worker running in the current thread, if it belongs to a
+# WorkStealingThreadPoolExecutor.
+_local = threading.local()
+
+
+class _StealingWorker(object):
+    def __init__(self, pool):
+        self.pool = pool
+        # Work items of the worker: the worker takes them from the left
+        # end, other workers steal them from the right end.
+        self.work_items = collections.deque()
+        # Released to wake up the worker while it is in pool.idle.
+        self.wakeup = threading.Lock()
+        self.wakeup.acquire()
+        # A worker is started to run a work item.
+        self.busy = True
+        # Cleared when the worker has exited because it was idle for too
+        # long; the work items added after that must be submitted again.
+        self.alive = True
+
+
+class _StealingPool(object):
+    """State shared by a WorkStealingThreadPoolExecutor and its workers.
+
+    The workers don't reference the executor, so that it can be collected
+    while they wait for work.
+    """
+
+    def __init__(self, idle_timeout):
+        self.idle_timeout = -1 if idle_timeout is None else idle_timeout
+        # Tuple of the running workers, replaced with the lock held.
+        self.workers = ()
+        self.threads = set()
+        self.lock = threading.Lock()
+        # Workers waiting for work.  A worker removed from it by someone
+        # else must be woken up by them.
+        self.idle = collections.deque()
+        self.shutdown = False
+        self.broken = False
+
+    def put(self, item):
+        # Called by _python_exit() and when the executor is collected.
+        self.shutdown = True
+        self.wake_all()
+
+    def wake_all(self):
+        idle = self.idle
+        while True:
+            try:
+                worker = idle.pop()
+            except IndexError:
+                return
+            worker.wakeup.release()
+
+    def has_work(self):
+        return any(worker.work_items for worker in self.workers)
+
+    def steal(self, thief):
+        for worker in self.workers:
+            if worker is not thief and worker.work_items:
+                try:
+                    return worker.work_items.pop()
+                except IndexError:
+                    pass
+        return None
+
+    def park(self, worker):
+        # Wait until there is work to do.  Return False if the worker
+        # must exit.
+        idle = self.idle
+        idle.append(worker)
+        # Look again for work submitted before the worker was in idle.
+        if self.shutdown or _shutdown or self.has_work():
+            try:
+                idle.remove(worker)
+            except ValueError:
+                worker.wakeup.acquire()
+                return True
+            return self.has_work()
+        if worker.wakeup.acquire(timeout=self.idle_timeout):
+            return True
+        try:
+            idle.remove(worker)
+        except ValueError:
+            # Woken up right after the timeout.
+            worker.wakeup.acquire()
+            return True
+        with self.lock:
+            self.workers = tuple(w for w in self.workers if w is not worker)
+            worker.alive = False
+        return False
+
+    def initializer_failed(self, worker):
+        with self.lock:
+            self.broken = ('A thread initializer failed, the thread pool '
+                           'is not usable anymore')
+            workers = self.workers
+            self.workers = tuple(w for w in workers if w is not worker)
+            self.threads.discard(threading.current_thread())
+            worker.alive = False
+            # Mark pending futures failed
+            for w in workers:
+                while True:
+                    try:
+                        work_item = w.work_items.popleft()
+                    except IndexError:
+                        break
+                    work_item.abandon(BrokenThreadPool(self.broken))
+
+
+def _stealing_worker(worker, initializer, initargs):
+    pool = worker.pool
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except BaseException:
+            _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+            pool.initializer_failed(worker)
+            return
+    _local.worker = worker
+    work_items = worker.work_items
+    try:
+        while True:
+            work_item = None
+            if work_items:
+                try:
+                    work_item = work_items.popleft()
+                except IndexError:
+                    pass
+            if work_item is None:
+                work_item = pool.steal(worker)
+                if work_item is None:
+                    if pool.park(worker):
+                        continue
+                    # Run the work items added while the worker was
+                    # exiting.
+                    while work_items:
+                        work_items.popleft().run()
+                    with pool.lock:
+                        pool.threads.discard(threading.current_thread())
+                    return
+            worker.busy = True
+            work_item.run()
+            # Delete references to object. See issue16284
+            del work_item
+            worker.busy = False
+    except BaseException:
+        _base.LOGGER.critical('Exception in worker', exc_info=True)
+
+
+class WorkStealingThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor with a work queue per worker thread.
+
+    A call submitted from a worker thread is queued on that worker;
+    other calls go to an idle worker if there is one, else to a new
+    worker or, once there are max_workers, to the workers in turn.  A
+    worker whose queue is empty steals calls from the other queues.
+    Workers exit after idle_timeout seconds without work (never if
+    idle_timeout is None); new ones are started as needed.
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+                 initializer=None, initargs=(), *, idle_timeout=60.0):
+        """Initializes a new WorkStealingThreadPoolExecutor instance.
+
+        Args:
+            max_workers: The maximum number of threads that can be used to
+                execute the given calls.
+            thread_name_prefix: An optional name prefix to give our threads.
+            initializer: A callable used to initialize worker threads.
+            initargs: A tuple of arguments to pass to the initializer.
+            idle_timeout: The number of seconds after which an idle worker
+                thread exits, or None.
+        """
+        super().__init__(max_workers, thread_name_prefix,
+                         initializer, initargs)
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be greater than 0")
+        self._pool = pool = _StealingPool(idle_timeout)
+        self._threads = pool.threads
+        self._thread_counter = itertools.count().__next__
+        self._next_worker = itertools.count().__next__
+        # When the executor gets lost, the weakref callback will wake up
+        # the worker threads.
+        pool.executor_ref = weakref.ref(self, pool.put)
+
+    @property
+    def _broken(self):
+        return self._pool.broken
+
+    @_broken.setter
+    def _broken(self, value):
+        # Set by ThreadPoolExecutor.__init__().
+        pass
+
+    def submit(self, fn, /, *args, **kwargs):
+        self._check_submit()
+        f = _base.Future()
+        self._dispatch((_WorkItem(f, fn, args, kwargs, self._stats),))
+        self._stats.notify_submitted(f)
+        return f
+    submit.__doc__ = _base.Executor.submit.__doc__
+
+    def submit_many(self, fn, /, *iterables):
+        self._check_submit()
+        fs = []
+        work_items = []
+        for args in zip(*iterables):
+            f = _base.Future()
+            fs.append(f)
+            work_items.append(_WorkItem(f, fn, args, {}, self._stats))
+        self._dispatch(work_items)
+        if self._stats.on_submit is not None:
+            for f in fs:
+                self._stats.notify_submitted(f)
+        return fs
+    submit_many.__doc__ = _base.Executor.submit_many.__doc__
+
+    def _check_submit(self):
+        pool = self._pool
+        if pool.broken:
+            raise BrokenThreadPool(pool.broken)
+        if pool.shutdown:
+            raise RuntimeError('cannot schedule new futures after shutdown')
+        if _shutdown:
+            raise RuntimeError('cannot schedule new futures after '
+                               'interpreter shutdown')
+
+    def _dispatch(self, work_items):
+        pool = self._pool
+        worker = getattr(_local, 'worker', None)
+        if worker is not None and worker.pool is pool and worker.alive:
+            # Keep the calls submitted by a worker on this worker: the
+            # other workers steal them if they run out of work.
+            worker.work_items.extend(work_items)
+            self._wake_idle(len(work_items))
+        else:
+            for work_item in work_items:
+                self._dispatch_one(work_item)
+        if pool.shutdown or _shutdown:
+            # The pool was shut down concurrently: the work items that are
+            # still queued may never run.
+            cancelled = False
+            for work_item in work_items:
+                for worker in pool.workers:
+                    try:
+                        worker.work_items.remove(work_item)
+                    except ValueError:
+                        continue
+                    self._stats.call_cancelled()
+                    cancelled = True
+                    break
+            if cancelled:
+                raise RuntimeError('cannot schedule new futures after '
+                                   'shutdown')
+
+    def _dispatch_one(self, work_item):
+        pool = self._pool
+        idle = pool.idle
+        while True:
+            if idle:
+                try:
+                    worker = idle.pop()
+                except IndexError:
+                    pass
+                else:
+                    worker.work_items.append(work_item)
+                    worker.wakeup.release()
+                    return
+
+            workers = pool.workers
+            if len(workers) < self._max_workers:
+                # Prefer a worker which is about to look for work over
+                # starting a new thread.
+                for worker in workers:
+                    if not worker.busy:
+                        break
+                else:
+                    worker = self._start_worker(work_item)
+                    if worker is not None:
+                        return
+                    continue
+            else:
+                worker = workers[self._next_worker() % len(workers)]
+            worker.work_items.append(work_item)
+            # The worker may have parked after idle was checked above and
+            # before the work item was added.
+            try:
+                idle.remove(worker)
+            except ValueError:
+                pass
+            else:
+                worker.wakeup.release()
+                return
+            if worker.alive:
+                return
+            try:
+                worker.work_items.remove(work_item)
+            except ValueError:
+                # The worker ran it while exiting.
+                return
+
+    def _wake_idle(self, count):
+        # Wake up or start up to count workers so that they steal work.
+        idle = self._pool.idle
+        for _ in range(count):
+            try:
+                worker = idle.pop()
+            except IndexError:
+                if self._start_worker(None) is None:
+                    return
+            else:
+                worker.wakeup.release()
+
+    def _start_worker(self, work_item):
+        # Start a worker thread running work_item first, if it is not None.
+        # Return None if there are already max_workers workers.
+        pool = self._pool
+        with pool.lock, _global_shutdown_lock:
+            if len(pool.workers) >= self._max_workers:
+                return None
+            if _shutdown:
+                raise RuntimeError('cannot schedule new futures after '
+                                   'interpreter shutdown')
+            worker = _StealingWorker(pool)
+            if work_item is not None:
+                worker.work_items.append(work_item)
+            else:
+                worker.busy = False
+            thread_name = '%s_%d' % (self._thread_name_prefix or self,
+                                     self._thread_counter())
+            t = threading.Thread(name=thread_name, target=_stealing_worker,
+                                 args=(worker,
+                                       self._initializer,
+                                       self._initargs))
+            t.start()
+            pool.workers += (worker,)
+            pool.threads.add(t)
+            _threads_queues[t] = pool
+            return worker
+
+    def _adjust_thread_count(self):
+        # Threads are started by _dispatch_one().
+        pass
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        pool = self._pool
+        with self._shutdown_lock:
+            self._shutdown = True
+            pool.shutdown = True
+            if cancel_futures:
+                for worker in pool.workers:
+                    while True:
+                        try:
+                            work_item = worker.work_items.pop()
+                        except IndexError:
+                            break
+                        work_item.cancel()
+            pool.wake_all()
+        if wait:
+            for t in list(pool.threads):
+                t.join()
+    shutdown.__doc__ = _base.Executor.shutdown.__doc__
@@ -3,6 +3,7 @@
 csv.py - read/write/investigate CSV files
 """
 
+import codecs
 import re
 import types
 from _csv import Error, __version__, writer, reader, register_dialect, \
@@ -19,7 +20,7 @@
            "field_size_limit", "reader", "writer",
            "register_dialect", "get_dialect", "list_dialects", "Sniffer",
            "unregister_dialect", "__version__", "DictReader", "DictWriter",
-           "unix_dialect"]
+           "ColumnReader", "unix_dialect"]
 
 class Dialect:
     """Describe a CSV dialect.
@@ -132,6 +133,93 @@ def __next__(self):
     __class_getitem__ = classmethod(types.GenericAlias)
 
 
+_line_end = re.compile(r'\r\n?|\n')
+
+def _decode_lines(f, encoding):
+    # The chunks of a binary file are split after b'\n', which is not a
+    # line boundary in every encoding (e.g. UTF-16) nor the only line
+    # ending, so decode them incrementally and split the text at '\r',
+    # '\n' or '\r\n', as a text file opened with newline='' does.
+    decode = codecs.getincrementaldecoder(encoding)().decode
+    text = ""
+    for data in f:
+        text = yield from _split_lines(text + decode(data), False)
+    text = yield from _split_lines(text + decode(b"", True), True)
+    if text:
+        yield text
+
+def _split_lines(text, final):
+    # Yield the complete lines of text and return the rest.
+    start = 0
+    for match in _line_end.finditer(text):
+        end = match.end()
+        if not final and end == len(text) and text[-1] == "\r":
+            # May be the first half of '\r\n'.
+            break
+        yield text[start:end]
+        start = end
+    return text[start:]
+
+
+class ColumnReader:
+    def __init__(self, f, fieldnames=None, types=None, batch_size=65536,
+                 encoding=None, dialect="excel", *args, **kwds):
+        if fieldnames is not None and iter(fieldnames) is fieldnames:
+            fieldnames = list(fieldnames)
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be None or >= 1")
+        self._fieldnames = fieldnames   # list of keys for the dict
+        self.types = types              # column types, by key or position
+        self.batch_size = batch_size    # maximum number of rows per batch
+        if encoding is not None:
+            # f is a binary file: decode its lines without a text layer.
+            f = _decode_lines(f, encoding)
+        self.reader = reader(f, dialect, *args, **kwds)
+        self.dialect = dialect
+        self.line_num = 0
+
+    def __iter__(self):
+        return self
+
+    @property
+    def fieldnames(self):
+        if self._fieldnames is None:
+            try:
+                self._fieldnames = next(self.reader)
+            except StopIteration:
+                pass
+        self.line_num = self.reader.line_num
+        return self._fieldnames
+
+    @fieldnames.setter
+    def fieldnames(self, value):
+        self._fieldnames = value
+
+    def _column_types(self, fieldnames):
+        if self.types is None:
+            return [None] * len(fieldnames)
+        if hasattr(self.types, "keys"):
+            return [self.types.get(key) for key in fieldnames]
+        types = list(self.types)
+        if len(types) != len(fieldnames):
+            raise ValueError("types must have an item for each field")
+        return types
+
+    def __next__(self):
+        fieldnames = self.fieldnames
+        if not fieldnames:
+            raise StopIteration
+        max_rows = -1 if self.batch_size is None else self.batch_size
+        columns = self.reader.read_columns(self._column_types(fieldnames),
+                                           max_rows)
+        self.line_num = self.reader.line_num
+        if not columns:
+            raise StopIteration
+        return dict(zip(fieldnames, columns))
+
+    __class_getitem__ = classmethod(types.GenericAlias)
+
+
 class DictWriter:
     def __init__(self, f, fieldnames, restval="", extrasaction="raise",
                  dialect="excel", *args, **kwds):
@@ -97,13 +97,13 @@
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads', 'AttrDict',
-    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
+    'dump', 'dumps', 'dumpb', 'load', 'loads', 'iterload', 'AttrDict',
+    'JSONDecoder', 'JSONDecodeError', 'JSONEncoder', 'JSONStreamDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import JSONDecoder, JSONDecodeError, JSONStreamDecoder
 from .encoder import JSONEncoder
 import codecs
 
@@ -238,6 +238,39 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         **kw).encode(obj)
 
 
+def dumpb(obj, fp=None, *, skipkeys=False, ensure_ascii=True,
+        check_circular=True, allow_nan=True, cls=None, indent=None,
+        separators=None, default=None, sort_keys=False, **kw):
+    """Serialize ``obj`` to a JSON formatted ``bytes`` object, encoded
+    to UTF-8.
+
+    The arguments have the same meaning as in ``dumps``.  The result is
+    the same as ``dumps(...).encode('utf-8', 'surrogatepass')``, but the C
+    encoder writes it directly, without creating the intermediate ``str``.
+
+    If ``fp`` (a ``.write()``-supporting binary file-like object) is given,
+    the bytes are written to it and ``None`` is returned.
+
+    """
+    # cached encoder
+    if (not skipkeys and ensure_ascii and
+        check_circular and allow_nan and
+        cls is None and indent is None and separators is None and
+        default is None and not sort_keys and not kw):
+        data = _default_encoder.encode_bytes(obj)
+    else:
+        if cls is None:
+            cls = JSONEncoder
+        data = cls(
+            skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+            check_circular=check_circular, allow_nan=allow_nan, indent=indent,
+            separators=separators, default=default, sort_keys=sort_keys,
+            **kw).encode_bytes(obj)
+    if fp is None:
+        return data
+    fp.write(data)
+
+
 _default_decoder = JSONDecoder(object_hook=None, object_pairs_hook=None)
 
 
@@ -358,6 +391,44 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
         kw['parse_constant'] = parse_constant
     return cls(**kw).decode(s)
 
+
+def iterload(fp, *, array=False, chunk_size=65536, cls=None,
+        object_hook=None, parse_float=None, parse_int=None,
+        parse_constant=None, object_pairs_hook=None, **kw):
+    """Iterate over the JSON documents read from ``fp`` (a
+    ``.read()``-supporting file-like object, in text or binary mode),
+    yielding each one as soon as it was read.
+
+    The documents can be separated by whitespace, as in JSON Lines.  If
+    ``array`` is true, ``fp`` must contain a single JSON array, and its
+    elements are yielded instead.  ``fp`` is read ``chunk_size`` characters
+    or bytes at a time, so only the document being decoded is held in
+    memory.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    stream = JSONStreamDecoder(cls(**kw), array=array)
+    while True:
+        data = fp.read(chunk_size)
+        if not data:
+            break
+        stream.feed(data)
+        yield from stream.read_values()
+    stream.close()
+    yield from stream.read_values()
+
 class AttrDict(dict):
     """Dict like object that supports attribute style dotted access.
 
@@ -1,5 +1,7 @@
 """Implementation of JSONDecoder
 """
+import codecs
+import collections
 import re
 
 from json import scanner
@@ -8,7 +10,7 @@
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder', 'JSONDecodeError']
+__all__ = ['JSONDecoder', 'JSONDecodeError', 'JSONStreamDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -283,7 +285,8 @@ class JSONDecoder(object):
 
     def __init__(self, *, object_hook=None, parse_float=None,
             parse_int=None, parse_constant=None, strict=True,
-            object_pairs_hook=None):
+            object_pairs_hook=None, object_kwargs_hook=None,
+            key_cache_size=0):
         """``object_hook``, if specified, will be called with the result
         of every JSON object decoded and its return value will be used in
         place of the given ``dict``.  This can be used to provide custom
@@ -296,6 +299,14 @@ def __init__(self, *, object_hook=None, parse_float=None,
         If ``object_hook`` is also defined, the ``object_pairs_hook`` takes
         priority.
 
+        ``object_kwargs_hook``, if specified will be called with the members
+        of every JSON object decoded as keyword arguments, and its return
+        value will be used instead of the ``dict``.  A class such as a
+        dataclass can be passed to create its instances directly from the
+        decoded pairs, without an intermediate ``dict``.  It takes priority
+        over ``object_hook``, and ``object_pairs_hook`` takes priority over
+        it.
+
         ``parse_float``, if specified, will be called with the string
         of every JSON float to be decoded. By default this is equivalent to
         float(num_str). This can be used to use another datatype or parser
@@ -315,6 +326,12 @@ def __init__(self, *, object_hook=None, parse_float=None,
         characters will be allowed inside strings.  Control characters in
         this context are those with character codes in the 0-31 range,
         including ``'\\t'`` (tab), ``'\\n'``, ``'\\r'`` and ``'\\0'``.
+
+        The decoded keys of objects are shared between the objects of a
+        document.  If ``key_cache_size`` is positive, they are also shared
+        between the documents decoded by this decoder, as long as there are
+        at most ``key_cache_size`` different keys.  This saves memory when
+        decoding many documents with the same keys, such as records.
         """
         self.object_hook = object_hook
         self.parse_float = parse_float or float
@@ -322,6 +339,8 @@ def __init__(self, *, object_hook=None, parse_float=None,
         self.parse_constant = parse_constant or _CONSTANTS.__getitem__
         self.strict = strict
         self.object_pairs_hook = object_pairs_hook
+        self.object_kwargs_hook = object_kwargs_hook
+        self.key_cache_size = key_cache_size
         self.parse_object = JSONObject
         self.parse_array = JSONArray
         self.parse_string = scanstring
@@ -354,3 +373,225 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+
+# A JSONDecodeError within this many characters of the end of the text
+# received so far may be due to a value cut in the middle (e.g. "-Infinit"
+# or an incomplete "\uXXXX\uXXXX" surrogate pair), so the stream decoder
+# waits for more text before raising it.
+_STREAM_LOOKAHEAD = 12
+
+# The end of the text received so far after a number which the next chunk
+# may continue, as in "1", "1." or "1e+".
+_NUMBER_TAIL = re.compile(r'(?:\.|[eE][-+]?)?\Z')
+
+# The last character of a JSON value starting with a given character.
+_CLOSERS = {'{': '}', '[': ']', '"': '"'}
+
+# An incomplete value is decoded again when a chunk contains a character
+# which may close it, if the pending text is at most this many times as
+# long as the chunk; this bounds the cost of rescanning it.
+_STREAM_RESCAN_RATIO = 8
+
+# The states of a JSONStreamDecoder.
+_DOCUMENT = 0       # expecting a top-level document
+_ARRAY_START = 1    # expecting the '[' of the top-level array
+_FIRST_ELEMENT = 2  # expecting an element or ']'
+_ELEMENT = 3        # expecting an element after ','
+_DELIMITER = 4      # expecting ',' or ']'
+_ARRAY_END = 5      # after the ']' of the top-level array
+
+
+class JSONStreamDecoder(object):
+    """Incremental JSON decoder.
+
+    Feed the text of a stream to feed() as it arrives, in ``str`` or
+    ``bytes`` chunks of any size, and get the values decoded so far from
+    read_values().  By default, the stream is a sequence of JSON documents
+    separated by optional whitespace, such as JSON Lines, and the values
+    are the documents.  If ``array`` is true, the stream is a single JSON
+    array and the values are its elements, so that the array never has
+    to be held in memory.
+
+    Each value is decoded by ``decoder`` (a ``JSONDecoder`` instance,
+    ``JSONDecoder()`` by default) once all its text was received.  The
+    text of the values already decoded is discarded, so the positions in
+    a ``JSONDecodeError`` are relative to the text which was pending.
+
+    """
+
+    def __init__(self, decoder=None, *, array=False):
+        if decoder is None:
+            decoder = JSONDecoder()
+        self.decoder = decoder
+        self._values = collections.deque()
+        self._state = _ARRAY_START if array else _DOCUMENT
+        # Unconsumed text, followed by the chunks received since the last
+        # attempt to decode it.
+        self._text = ''
+        self._chunks = []
+        self._size = 0
+        # When a value is incomplete, it is decoded again once the pending
+        # text grew to _min_size, or sooner if a chunk may have closed it
+        # (see _may_be_complete()), so that long values are not scanned over
+        # and over.  _depth estimates the nesting depth at the end of the
+        # pending text, ignoring the brackets in strings.
+        self._closer = None
+        self._depth = 0
+        self._min_size = 0
+        # The incremental decoder of bytes chunks, and the first bytes of
+        # the stream until there are enough to detect their encoding.
+        self._bytes_decoder = None
+        self._head = b''
+        self._closed = False
+        self._failed = False
+
+    def feed(self, data):
+        """Feed a chunk of the stream, a ``str`` or bytes-like object."""
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        if isinstance(data, str):
+            text = data
+        else:
+            text = self._decode_bytes(data, False)
+        if text and not self._failed:
+            self._chunks.append(text)
+            self._size += len(text)
+            if self._may_be_complete(text):
+                self._decode()
+
+    def close(self):
+        """Mark the end of the stream and decode the remaining values.
+
+        The error raised if the stream ends in the middle of a value is
+        raised by read_values() once the values before it are read.
+        """
+        if self._closed:
+            return
+        text = self._decode_bytes(b'', True)
+        self._closed = True
+        if not self._failed:
+            if text:
+                self._chunks.append(text)
+            self._decode()
+
+    def read_values(self):
+        """Return an iterator over the values decoded so far.
+
+        The values are consumed as they are retrieved from the iterator.
+        If the stream is not valid JSON, JSONDecodeError is raised once
+        the values before the error were retrieved.
+        """
+        values = self._values
+        while values:
+            value = values.popleft()
+            if isinstance(value, JSONDecodeError):
+                raise value
+            yield value
+
+    def _may_be_complete(self, text):
+        closer = self._closer
+        if closer is not None and closer != '"':
+            self._depth += (text.count('{') + text.count('[') -
+                            text.count('}') - text.count(']'))
+        if self._size >= self._min_size:
+            return True
+        if closer is None or closer not in text:
+            return False
+        # The value is likely complete if its brackets are balanced, but
+        # brackets in strings may fool the estimate: decode it again anyway
+        # if it is not much longer than the chunk.
+        return (self._depth <= 0 or
+                self._size <= _STREAM_RESCAN_RATIO * len(text))
+
+    def _decode_bytes(self, data, final):
+        if self._bytes_decoder is None:
+            if not data and not self._head:
+                return ''
+            self._head += data
+            if len(self._head) < 4 and not final:
+                return ''
+            from json import detect_encoding
+            decoder_factory = codecs.getincrementaldecoder(
+                detect_encoding(self._head))
+            self._bytes_decoder = decoder_factory('surrogatepass')
+            data = self._head
+            self._head = b''
+        return self._bytes_decoder.decode(data, final)
+
+    def _decode(self, _w=WHITESPACE.match):
+        if self._chunks:
+            self._chunks.insert(0, self._text)
+            self._text = ''.join(self._chunks)
+            self._chunks.clear()
+        s = self._text
+        n = len(s)
+        closed = self._closed
+        raw_decode = self.decoder.raw_decode
+        append = self._values.append
+        state = self._state
+        pos = 0
+        self._closer = None
+        self._min_size = 0
+        try:
+            while True:
+                pos = _w(s, pos).end()
+                if pos == n:
+                    break
+                if state == _DELIMITER:
+                    nextchar = s[pos]
+                    if nextchar == ',':
+                        state = _ELEMENT
+                    elif nextchar == ']':
+                        state = _ARRAY_END
+                    else:
+                        raise JSONDecodeError("Expecting ',' delimiter", s, pos)
+                    pos += 1
+                elif state == _ARRAY_START:
+                    if s[pos] != '[':
+                        raise JSONDecodeError("Expecting '['", s, pos)
+                    pos += 1
+                    state = _FIRST_ELEMENT
+                elif state == _ARRAY_END:
+                    raise JSONDecodeError("Extra data", s, pos)
+                elif state == _FIRST_ELEMENT and s[pos] == ']':
+                    pos += 1
+                    state = _ARRAY_END
+                else:
+                    try:
+                        value, end = raw_decode(s, pos)
+                    except JSONDecodeError as err:
+                        if closed or not (
+                                err.pos >= n - _STREAM_LOOKAHEAD or
+                                err.msg.startswith('Unterminated string')):
+                            raise
+                        closer = self._closer = _CLOSERS.get(s[pos])
+                        if closer is None:
+                            self._min_size = n - pos + 1
+                        else:
+                            self._min_size = 2 * (n - pos)
+                            if closer != '"':
+                                self._depth = (
+                                    s.count('{', pos) + s.count('[', pos) -
+                                    s.count('}', pos) - s.count(']', pos))
+                        break
+                    if (not closed and s[end - 1] in '0123456789' and
+                            _NUMBER_TAIL.match(s, end)):
+                        # The number may go on in the next chunk.
+                        self._min_size = n - pos + 1
+                        break
+                    append(value)
+                    pos = end
+                    if state != _DOCUMENT:
+                        state = _DELIMITER
+            if closed and state not in (_DOCUMENT, _ARRAY_END):
+                if state == _DELIMITER:
+                    raise JSONDecodeError("Expecting ',' delimiter", s, n)
+                raise JSONDecodeError("Expecting value", s, n)
+        except JSONDecodeError as err:
+            append(err)
+            self._failed = True
+            pos = n
+        self._state = state
+        self._text = s[pos:]
+        self._size = n - pos
@@ -202,6 +202,23 @@ def encode(self, o):
             chunks = list(chunks)
         return ''.join(chunks)
 
+    def encode_bytes(self, o):
+        """Return a JSON representation of a Python data structure,
+        encoded to UTF-8 ``bytes``.
+
+        >>> from json.encoder import JSONEncoder
+        >>> JSONEncoder().encode_bytes({"foo": ["bar", "baz"]})
+        b'{"foo": ["bar", "baz"]}'
+
+        """
+        # The C encoder writes ASCII output, which is the most common case,
+        # straight into the bytes object, without an intermediate str.
+        if (c_make_encoder is not None and
+                type(self).encode is JSONEncoder.encode and
+                type(self).iterencode is JSONEncoder.iterencode):
+            return self._make_c_encoder().encode_utf8(o, 0)
+        return self.encode(o).encode('utf-8', 'surrogatepass')
+
     def iterencode(self, o, _one_shot=False):
         """Encode the given object and yield each string
         representation as available.
@@ -212,6 +229,9 @@ def iterencode(self, o, _one_shot=False):
                 mysocket.write(chunk)
 
         """
+        if _one_shot and c_make_encoder is not None:
+            return self._make_c_encoder()(o, 0)
+
         if self.check_circular:
             markers = {}
         else:
@@ -244,19 +264,29 @@ def floatstr(o, allow_nan=self.allow_nan,
             return text
 
 
-        if (_one_shot and c_make_encoder is not None
-                and self.indent is None):
-            _iterencode = c_make_encoder(
-                markers, self.default, _encoder, self.indent,
-                self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, self.allow_nan)
-        else:
-            _iterencode = _make_iterencode(
-                markers, self.default, _encoder, self.indent, floatstr,
-                self.key_separator, self.item_separator, self.sort_keys,
-                self.skipkeys, _one_shot)
+        _iterencode = _make_iterencode(
+            markers, self.default, _encoder, self.indent, floatstr,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, _one_shot)
         return _iterencode(o, 0)
 
+    def _make_c_encoder(self):
+        if self.check_circular:
+            markers = {}
+        else:
+            markers = None
+        if self.ensure_ascii:
+            _encoder = encode_basestring_ascii
+        else:
+            _encoder = encode_basestring
+        indent = self.indent
+        if indent is not None and not isinstance(indent, str):
+            indent = ' ' * indent
+        return c_make_encoder(
+            markers, self.default, _encoder, indent,
+            self.key_separator, self.item_separator, self.sort_keys,
+            self.skipkeys, self.allow_nan)
+
 def _make_iterencode(markers, _default, _encoder, _indent, _floatstr,
         _key_separator, _item_separator, _sort_keys, _skipkeys, _one_shot,
         ## HACK: hand-optimized bytecode; turn globals into locals
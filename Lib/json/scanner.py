@@ -23,7 +23,12 @@ def py_make_scanner(context):
     parse_constant = context.parse_constant
     object_hook = context.object_hook
     object_pairs_hook = context.object_pairs_hook
+    object_kwargs_hook = getattr(context, 'object_kwargs_hook', None)
+    if object_pairs_hook is None and object_kwargs_hook is not None:
+        def object_pairs_hook(pairs):
+            return object_kwargs_hook(**dict(pairs))
     memo = context.memo
+    key_cache_size = getattr(context, 'key_cache_size', 0)
 
     def _scan_once(string, idx):
         try:
@@ -66,7 +71,8 @@ def scan_once(string, idx):
         try:
             return _scan_once(string, idx)
         finally:
-            memo.clear()
+            if len(memo) > key_cache_size:
+                memo.clear()
 
     return scan_once
 
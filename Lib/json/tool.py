@@ -11,11 +11,52 @@
 
 """
 import argparse
+import functools
 import json
 import sys
+import time
 from pathlib import Path
 
 
+def _dump_line(line, dump_args):
+    return json.dumps(json.loads(line), **dump_args)
+
+
+def _dump_lines_parallel(lines, outfile, jobs, dump_args):
+    # The lines are read as bytes, and decoded and encoded as JSON in the
+    # worker processes; the main process writes the results to outfile as
+    # the serial path does, so that its encoding and newlines apply.
+    # map() submits the lines lazily, in chunks whose size adapts to the
+    # time they take, and yields the results in order.
+    from concurrent.futures import ProcessPoolExecutor
+
+    dump_line = functools.partial(_dump_line, dump_args=dump_args)
+    with ProcessPoolExecutor(jobs or None) as executor:
+        for text in executor.map(dump_line, lines, chunksize=None):
+            outfile.write(text)
+            outfile.write('\n')
+
+
+class _Stats:
+    def __init__(self):
+        self.documents = 0
+        self.size = 0
+        self.start = time.perf_counter()
+
+    def count(self, lines):
+        for line in lines:
+            self.documents += 1
+            self.size += len(line)
+            yield line
+
+    def report(self, file):
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        mib = self.size / 2**20
+        print(f'{self.documents} documents, {mib:.1f} MiB in {elapsed:.2f} s '
+              f'({self.documents / elapsed:.0f} documents/s, '
+              f'{mib / elapsed:.1f} MiB/s)', file=file)
+
+
 def main():
     prog = 'python -m json.tool'
     description = ('A simple command line interface for json module '
@@ -36,6 +77,12 @@ def main():
     parser.add_argument('--json-lines', action='store_true', default=False,
                         help='parse input using the JSON Lines format. '
                         'Use with --no-indent or --compact to produce valid JSON Lines output.')
+    parser.add_argument('--jobs', type=int, default=None, metavar='N',
+                        help='with --json-lines, process the lines in N '
+                        'worker processes, 0 meaning one per CPU')
+    parser.add_argument('--stats', action='store_true', default=False,
+                        help='with --json-lines, report the number of documents '
+                        'processed and the throughput on stderr')
     group = parser.add_mutually_exclusive_group()
     group.add_argument('--indent', default=4, type=int,
                        help='separate items with newlines and use this number '
@@ -49,6 +96,13 @@ def main():
     group.add_argument('--compact', action='store_true',
                        help='suppress all whitespace separation (most compact)')
     options = parser.parse_args()
+    if not options.json_lines:
+        if options.jobs is not None:
+            parser.error('--jobs requires --json-lines')
+        if options.stats:
+            parser.error('--stats requires --json-lines')
+    if options.jobs is not None and options.jobs < 0:
+        parser.error('--jobs must be >= 0')
 
     dump_args = {
         'sort_keys': options.sort_keys,
@@ -62,7 +116,12 @@ def main():
     with options.infile as infile:
         try:
             if options.json_lines:
-                objs = (json.loads(line) for line in infile)
+                # json.loads() accepts UTF-8 encoded lines.
+                lines = getattr(infile, 'buffer', infile)
+                if options.stats:
+                    stats = _Stats()
+                    lines = stats.count(lines)
+                objs = (json.loads(line) for line in lines)
             else:
                 objs = (json.load(infile),)
 
@@ -71,11 +130,18 @@ def main():
             else:
                 out = options.outfile.open('w', encoding='utf-8')
             with out as outfile:
-                for obj in objs:
-                    json.dump(obj, outfile, **dump_args)
-                    outfile.write('\n')
+                if options.jobs is not None:
+                    _dump_lines_parallel(lines, outfile, options.jobs,
+                                         dump_args)
+                else:
+                    for obj in objs:
+                        # dumps() uses the C encoder, dump() does not.
+                        outfile.write(json.dumps(obj, **dump_args))
+                        outfile.write('\n')
         except ValueError as e:
             raise SystemExit(e)
+    if options.stats:
+        stats.report(sys.stderr)
 
 
 if __name__ == '__main__':
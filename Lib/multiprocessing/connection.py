@@ -44,6 +44,22 @@
 
 _mmap_counter = itertools.count()
 
+# Pickle protocol 5 buffers of at least this size are sent out-of-band by
+# the connections which support it, after the pickle data, instead of
+# being copied into it.
+_OUT_OF_BAND_MIN_SIZE = 2 ** 16
+# Header of the messages made of a pickle and its out-of-band buffers.
+# It can't be mistaken for a pickle, which starts with the PROTO opcode.
+_OUT_OF_BAND_MAGIC = b'\0oob'
+
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = -1
+if _IOV_MAX < 1:
+    # The minimum required by POSIX
+    _IOV_MAX = 16
+
 default_family = 'AF_INET'
 families = ['AF_INET']
 
@@ -113,6 +129,9 @@ def address_type(address):
 
 class _ConnectionBase:
     _handle = None
+    # Whether large buffers are sent out-of-band by send(), see
+    # _send_out_of_band() and _recv_parts().
+    _out_of_band = False
 
     def __init__(self, handle, readable=True, writable=True):
         handle = handle.__index__()
@@ -200,9 +219,51 @@ def send_bytes(self, buf, offset=0, size=None):
 
     def send(self, obj):
         """Send a (picklable) object"""
+        self._send_pickle(*self._dumps(obj))
+
+    def _dumps(self, obj):
+        """Pickle obj for _send_pickle().
+
+        Return the pickle data and the list of the pickle.PickleBuffer
+        objects to send out-of-band.
+        """
+        if not self._out_of_band:
+            return _ForkingPickler.dumps(obj), []
+        buffers = []
+        def buffer_callback(buffer):
+            with buffer.raw() as m:
+                if m.nbytes < _OUT_OF_BAND_MIN_SIZE:
+                    return True
+            buffers.append(buffer)
+            return False
+        data = _ForkingPickler.dumps(obj, 5, buffer_callback=buffer_callback)
+        return data, buffers
+
+    def _send_pickle(self, data, buffers):
+        """Send the result of _dumps()"""
         self._check_closed()
         self._check_writable()
-        self._send_bytes(_ForkingPickler.dumps(obj))
+        if buffers:
+            self._send_out_of_band(data, buffers)
+        else:
+            self._send_bytes(data)
+
+    def _recv_pickle(self):
+        """
+        Receive the data sent by _send_pickle().
+        Return the pickle data and its out-of-band buffers.
+        """
+        self._check_closed()
+        self._check_readable()
+        buf = self._recv_bytes()
+        if self._out_of_band:
+            buf.seek(0)
+            if buf.read(len(_OUT_OF_BAND_MAGIC)) == _OUT_OF_BAND_MAGIC:
+                header = buf.read()
+                sizes = struct.unpack("!%dQ" % (len(header) // 8), header)
+                data, *buffers = self._recv_parts(sizes)
+                return data, buffers
+        return buf.getbuffer(), []
 
     def recv_bytes(self, maxlength=None):
         """
@@ -244,10 +305,8 @@ def recv_bytes_into(self, buf, offset=0):
 
     def recv(self):
         """Receive a (picklable) object"""
-        self._check_closed()
-        self._check_readable()
-        buf = self._recv_bytes()
-        return _ForkingPickler.loads(buf.getbuffer())
+        data, buffers = self._recv_pickle()
+        return _ForkingPickler.loads(data, buffers=buffers)
 
     def poll(self, timeout=0.0):
         """Whether there is any input available to be read"""
@@ -344,12 +403,32 @@ def _get_more_data(self, ov, maxsize):
             return f
 
 
+if _winapi:
+
+    def _writev(handle, bufs, write=_multiprocessing.send):
+        return write(handle, bufs[0])
+
+    def _readinto(handle, buf, read=_multiprocessing.recv):
+        chunk = read(handle, len(buf))
+        buf[:len(chunk)] = chunk
+        return len(chunk)
+
+else:
+
+    _writev = os.writev
+
+    def _readinto(handle, buf, readv=os.readv):
+        return readv(handle, [buf])
+
+
 class Connection(_ConnectionBase):
     """
     Connection class based on an arbitrary file descriptor (Unix only), or
     a socket handle (Windows).
     """
 
+    _out_of_band = True
+
     if _winapi:
         def _close(self, _close=_multiprocessing.closesocket):
             _close(self._handle)
@@ -419,6 +498,45 @@ def _recv_bytes(self, maxsize=None):
             return None
         return self._recv(size)
 
+    def _send_out_of_band(self, data, buffers, writev=_writev):
+        # The message is a regular one holding the sizes of the pickle data
+        # and of the buffers, followed by their raw contents.  Everything
+        # is written with as few writev() calls as possible, without
+        # copying the buffers.
+        parts = [data]
+        parts += [buffer.raw() for buffer in buffers]
+        header = _OUT_OF_BAND_MAGIC + struct.pack(
+            "!%dQ" % len(parts), *[len(part) for part in parts])
+        bufs = [struct.pack("!i", len(header)) + header]
+        bufs += parts
+        handle = self._handle
+        while bufs:
+            n = writev(handle, bufs[:_IOV_MAX])
+            while n:
+                size = len(bufs[0])
+                if n < size:
+                    bufs[0] = memoryview(bufs[0])[n:]
+                    break
+                n -= size
+                del bufs[0]
+
+    def _recv_parts(self, sizes, readinto=_readinto):
+        # Read the raw contents of the parts sent by _send_out_of_band()
+        # directly into the bytearrays returned.
+        parts = []
+        handle = self._handle
+        for size in sizes:
+            part = bytearray(size)
+            with memoryview(part) as m:
+                pos = 0
+                while pos < size:
+                    n = readinto(handle, m[pos:])
+                    if n == 0:
+                        raise OSError("got end of file during message")
+                    pos += n
+            parts.append(part)
+        return parts
+
     def _poll(self, timeout):
         r = wait([self], timeout)
         return bool(r)
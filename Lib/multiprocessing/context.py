@@ -112,6 +112,14 @@ def SimpleQueue(self):
         from .queues import SimpleQueue
         return SimpleQueue(ctx=self.get_context())
 
+    def SharedMemoryQueue(self, maxsize=1024, *, slot_size=None,
+                          record_format=None):
+        '''Returns a bounded queue object using shared memory'''
+        from .queues import SharedMemoryQueue
+        return SharedMemoryQueue(maxsize, slot_size=slot_size,
+                                 record_format=record_format,
+                                 ctx=self.get_context())
+
     def Pool(self, processes=None, initializer=None, initargs=(),
              maxtasksperchild=None):
         '''Returns a process pool object'''
@@ -18,12 +18,15 @@
 import threading
 import signal
 import array
+import collections
+import contextlib
 import queue
 import time
 import types
 import os
 from os import getpid
 
+from concurrent.futures import Future
 from traceback import format_exc
 
 from . import connection
@@ -143,6 +146,9 @@ class Server(object):
     public = ['shutdown', 'create', 'accept_connection', 'get_methods',
               'debug_info', 'number_of_objects', 'dummy', 'incref', 'decref']
 
+    # Seconds after which an idle worker thread exits.
+    worker_idle_timeout = 60.0
+
     def __init__(self, registry, address, authkey, serializer):
         if not isinstance(authkey, bytes):
             raise TypeError(
@@ -161,6 +167,12 @@ def __init__(self, registry, address, authkey, serializer):
         self.id_to_local_proxy_obj = {}
         self.mutex = threading.Lock()
 
+        # Worker threads handling the connections: a thread is reused for
+        # a new connection once it is done with its current one.
+        self._worker_mutex = threading.Lock()
+        self._idle_workers = 0
+        self._connections = queue.SimpleQueue()
+
     def serve_forever(self):
         '''
         Run the server forever
@@ -189,9 +201,41 @@ def accepter(self):
                 c = self.listener.accept()
             except OSError:
                 continue
-            t = threading.Thread(target=self.handle_request, args=(c,))
-            t.daemon = True
-            t.start()
+            self._dispatch_connection(c)
+
+    def _dispatch_connection(self, c):
+        '''
+        Hand a new connection to an idle worker thread, or to a new one
+        '''
+        with self._worker_mutex:
+            if self._idle_workers:
+                self._idle_workers -= 1
+                self._connections.put(c)
+                return
+        t = threading.Thread(target=self._worker, args=(c,))
+        t.daemon = True
+        t.start()
+
+    def _worker(self, c):
+        name = threading.current_thread().name
+        while True:
+            self.handle_request(c)
+            # accept_connection() renames the thread.
+            threading.current_thread().name = name
+            with self._worker_mutex:
+                self._idle_workers += 1
+            while True:
+                try:
+                    c = self._connections.get(
+                        timeout=self.worker_idle_timeout)
+                    break
+                except queue.Empty:
+                    with self._worker_mutex:
+                        # Unless a connection was dispatched after the
+                        # timeout, exit.
+                        if self._connections.empty():
+                            self._idle_workers -= 1
+                            return
 
     def _handle_request(self, c):
         request = None
@@ -244,56 +288,20 @@ def serve_client(self, conn):
 
         recv = conn.recv
         send = conn.send
-        id_to_obj = self.id_to_obj
 
         while not self.stop_event.is_set():
 
             try:
-                methodname = obj = None
                 request = recv()
                 ident, methodname, args, kwds = request
-                try:
-                    obj, exposed, gettypeid = id_to_obj[ident]
-                except KeyError as ke:
-                    try:
-                        obj, exposed, gettypeid = \
-                            self.id_to_local_proxy_obj[ident]
-                    except KeyError:
-                        raise ke
-
-                if methodname not in exposed:
-                    raise AttributeError(
-                        'method %r of %r object is not in exposed=%r' %
-                        (methodname, type(obj), exposed)
-                        )
-
-                function = getattr(obj, methodname)
-
-                try:
-                    res = function(*args, **kwds)
-                except Exception as e:
-                    msg = ('#ERROR', e)
-                else:
-                    typeid = gettypeid and gettypeid.get(methodname, None)
-                    if typeid:
-                        rident, rexposed = self.create(conn, typeid, res)
-                        token = Token(typeid, self.address, rident)
-                        msg = ('#PROXY', (rexposed, token))
-                    else:
-                        msg = ('#RETURN', res)
-
-            except AttributeError:
-                if methodname is None:
-                    msg = ('#TRACEBACK', format_exc())
+                if methodname == '#BATCH':
+                    # Several calls sent together by BaseProxy._batch(),
+                    # run in order.
+                    msg = ('#RETURN',
+                           [self._call_method(conn, *call) for call in args])
                 else:
-                    try:
-                        fallback_func = self.fallback_mapping[methodname]
-                        result = fallback_func(
-                            self, conn, ident, obj, *args, **kwds
-                            )
-                        msg = ('#RETURN', result)
-                    except Exception:
-                        msg = ('#TRACEBACK', format_exc())
+                    msg = self._call_method(conn, ident, methodname,
+                                            args, kwds)
 
             except EOFError:
                 util.debug('got EOF -- exiting thread serving %r',
@@ -316,6 +324,57 @@ def serve_client(self, conn):
                 conn.close()
                 sys.exit(1)
 
+    def _call_method(self, conn, ident, methodname, args, kwds):
+        '''
+        Call a method of a shared object and return the reply message
+        '''
+        obj = None
+        try:
+            try:
+                obj, exposed, gettypeid = self.id_to_obj[ident]
+            except KeyError as ke:
+                try:
+                    obj, exposed, gettypeid = \
+                        self.id_to_local_proxy_obj[ident]
+                except KeyError:
+                    raise ke
+
+            if methodname not in exposed:
+                raise AttributeError(
+                    'method %r of %r object is not in exposed=%r' %
+                    (methodname, type(obj), exposed)
+                    )
+
+            function = getattr(obj, methodname)
+
+            try:
+                res = function(*args, **kwds)
+            except Exception as e:
+                msg = ('#ERROR', e)
+            else:
+                typeid = gettypeid and gettypeid.get(methodname, None)
+                if typeid:
+                    rident, rexposed = self.create(conn, typeid, res)
+                    token = Token(typeid, self.address, rident)
+                    msg = ('#PROXY', (rexposed, token))
+                else:
+                    msg = ('#RETURN', res)
+
+        except AttributeError:
+            try:
+                fallback_func = self.fallback_mapping[methodname]
+                result = fallback_func(
+                    self, conn, ident, obj, *args, **kwds
+                    )
+                msg = ('#RETURN', result)
+            except Exception:
+                msg = ('#TRACEBACK', format_exc())
+
+        except Exception:
+            msg = ('#TRACEBACK', format_exc())
+
+        return msg
+
     def fallback_getvalue(self, conn, ident, obj):
         return obj
 
@@ -738,6 +797,128 @@ def temp(self, /, *args, **kwds):
 # Subclass of set which get cleared after a fork
 #
 
+class _PipelinedFuture(Future):
+    '''
+    Future of a call sent by BaseProxy._callmethod_async()
+
+    The reply to the call is received when the result is requested.
+    '''
+    def __init__(self, pipeline):
+        super().__init__()
+        self._pipeline = pipeline
+
+    def cancel(self):
+        # The call has been sent already.
+        return False
+
+    def result(self, timeout=None):
+        self._pipeline.receive(self, timeout)
+        return super().result(0)
+
+    def exception(self, timeout=None):
+        self._pipeline.receive(self, timeout)
+        return super().exception(0)
+
+class _Pipeline(object):
+    '''
+    Connection of a thread to a manager, on which calls can be sent before
+    the replies to the previous ones are received
+    '''
+    # Maximum number of calls sent before the reply to the first one
+    # is received.
+    max_pending = 32
+
+    def __init__(self, conn):
+        self.conn = conn
+        # (futures, converters, batched) for each message sent and not
+        # replied to yet, in order.  batched is True for a '#BATCH'
+        # message, whose reply holds the replies to several calls.
+        self.pending = collections.deque()
+        # While a batch is open: the (future, converter, request) of the
+        # calls not sent yet, and the futures of all its calls.
+        self.batch = None
+        self.batch_futures = None
+        self.lock = threading.RLock()
+
+    def send(self, request, future, converter):
+        with self.lock:
+            if self.batch is not None:
+                self.batch.append((future, converter, request))
+                self.batch_futures.append(future)
+            else:
+                if len(self.pending) >= self.max_pending:
+                    # Don't fill the connection's buffers with replies.
+                    self._receive_one()
+                self.conn.send(request)
+                self.pending.append(([future], [converter], False))
+
+    def start_batch(self):
+        with self.lock:
+            self.batch = []
+            self.batch_futures = []
+
+    def flush_batch(self):
+        with self.lock:
+            batch = self.batch
+            if batch:
+                self.batch = []
+                self.conn.send(
+                    (None, '#BATCH', [request for _, _, request in batch], {})
+                    )
+                self.pending.append(([future for future, _, _ in batch],
+                                     [converter for _, converter, _ in batch],
+                                     True))
+
+    def end_batch(self):
+        '''
+        Send the calls of the batch and return their futures once they
+        are all replied to
+        '''
+        with self.lock:
+            try:
+                self.flush_batch()
+            finally:
+                futures = self.batch_futures
+                self.batch = self.batch_futures = None
+            self.receive()
+            return futures
+
+    def receive(self, future=None, timeout=None):
+        '''
+        Receive the replies up to the one to `future`, or all of them
+        '''
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        with self.lock:
+            if future is not None and not future.done():
+                self.flush_batch()
+            while self.pending and (future is None or not future.done()):
+                if timeout is not None and not self.conn.poll(
+                        max(deadline - time.monotonic(), 0)):
+                    raise TimeoutError
+                self._receive_one()
+
+    def _receive_one(self):
+        futures, converters, batched = self.pending.popleft()
+        try:
+            kind, result = self.conn.recv()
+            if not batched:
+                replies = [(kind, result)]
+            elif kind == '#RETURN':
+                replies = result
+            else:
+                raise convert_to_error(kind, result)
+        except Exception as e:
+            for fut in futures:
+                fut.set_exception(e)
+            return
+        for fut, converter, (kind, result) in zip(futures, converters,
+                                                  replies):
+            try:
+                fut.set_result(converter(kind, result))
+            except Exception as e:
+                fut.set_exception(e)
+
 class ProcessLocalSet(set):
     def __init__(self):
         util.register_after_fork(self, lambda obj: obj.clear())
@@ -804,22 +985,65 @@ def _connect(self):
         conn = self._Client(self._token.address, authkey=self._authkey)
         dispatch(conn, None, 'accept_connection', (name,))
         self._tls.connection = conn
+        self._tls.pipeline = _Pipeline(conn)
 
-    def _callmethod(self, methodname, args=(), kwds={}):
-        '''
-        Try to call a method of the referent and return a copy of the result
-        '''
+    def _get_pipeline(self):
         try:
-            conn = self._tls.connection
+            return self._tls.pipeline
         except AttributeError:
             util.debug('thread %r does not own a connection',
                        threading.current_thread().name)
             self._connect()
-            conn = self._tls.connection
+            return self._tls.pipeline
 
-        conn.send((self._id, methodname, args, kwds))
-        kind, result = conn.recv()
+    def _callmethod(self, methodname, args=(), kwds={}):
+        '''
+        Try to call a method of the referent and return a copy of the result
+        '''
+        pipeline = self._get_pipeline()
+        if pipeline.batch is not None:
+            return self._callmethod_async(methodname, args, kwds)
+        with pipeline.lock:
+            if pipeline.pending:
+                pipeline.receive()
+            conn = pipeline.conn
+            conn.send((self._id, methodname, args, kwds))
+            kind, result = conn.recv()
+        return self._convert_reply(kind, result)
+
+    def _callmethod_async(self, methodname, args=(), kwds={}):
+        '''
+        Send a call to a method of the referent without waiting for its
+        result, and return a future of the result
+        '''
+        pipeline = self._get_pipeline()
+        future = _PipelinedFuture(pipeline)
+        pipeline.send((self._id, methodname, args, kwds), future,
+                      self._convert_reply)
+        return future
+
+    @contextlib.contextmanager
+    def _batch(self):
+        '''
+        Send the calls made by this thread to the manager's objects in the
+        `with` block as a single message
+        '''
+        pipeline = self._get_pipeline()
+        if pipeline.batch is not None:
+            # The calls are sent by the outer batch.
+            yield
+            return
+        pipeline.start_batch()
+        try:
+            yield
+        finally:
+            futures = pipeline.end_batch()
+        for future in futures:
+            exc = future.exception()
+            if exc is not None:
+                raise exc
 
+    def _convert_reply(self, kind, result):
         if kind == '#RETURN':
             return result
         elif kind == '#PROXY':
@@ -885,6 +1109,7 @@ def _decref(token, authkey, state, tls, idset, _Client):
                        threading.current_thread().name)
             tls.connection.close()
             del tls.connection
+            del tls.pipeline
 
     def _after_fork(self):
         self._manager = None
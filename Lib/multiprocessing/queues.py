@@ -7,7 +7,7 @@
 # Licensed to PSF under a Contributor Agreement.
 #
 
-__all__ = ['Queue', 'SimpleQueue', 'JoinableQueue']
+__all__ = ['Queue', 'SimpleQueue', 'JoinableQueue', 'SharedMemoryQueue']
 
 import sys
 import os
@@ -17,6 +17,7 @@
 import types
 import weakref
 import errno
+import struct
 
 from queue import Empty, Full
 
@@ -79,8 +80,9 @@ def _reset(self, after_fork=False):
         self._joincancelled = False
         self._closed = False
         self._close = None
-        self._send_bytes = self._writer.send_bytes
-        self._recv_bytes = self._reader.recv_bytes
+        self._dumps = self._writer._dumps
+        self._send_pickle = self._writer._send_pickle
+        self._recv_pickle = self._reader._recv_pickle
         self._poll = self._reader.poll
 
     def put(self, obj, block=True, timeout=None):
@@ -100,7 +102,7 @@ def get(self, block=True, timeout=None):
             raise ValueError(f"Queue {self!r} is closed")
         if block and timeout is None:
             with self._rlock:
-                res = self._recv_bytes()
+                res = self._recv_pickle()
             self._sem.release()
         else:
             if block:
@@ -114,12 +116,13 @@ def get(self, block=True, timeout=None):
                         raise Empty
                 elif not self._poll():
                     raise Empty
-                res = self._recv_bytes()
+                res = self._recv_pickle()
                 self._sem.release()
             finally:
                 self._rlock.release()
         # unserialize the data after having released the lock
-        return _ForkingPickler.loads(res)
+        data, buffers = res
+        return _ForkingPickler.loads(data, buffers=buffers)
 
     def qsize(self):
         # Raises NotImplementedError on Mac OSX because of broken sem_getvalue()
@@ -165,7 +168,7 @@ def _start_thread(self):
         self._buffer.clear()
         self._thread = threading.Thread(
             target=Queue._feed,
-            args=(self._buffer, self._notempty, self._send_bytes,
+            args=(self._buffer, self._notempty, self._dumps, self._send_pickle,
                   self._wlock, self._reader.close, self._writer.close,
                   self._ignore_epipe, self._on_queue_feeder_error,
                   self._sem),
@@ -209,7 +212,7 @@ def _finalize_close(buffer, notempty):
             notempty.notify()
 
     @staticmethod
-    def _feed(buffer, notempty, send_bytes, writelock, reader_close,
+    def _feed(buffer, notempty, dumps, send_pickle, writelock, reader_close,
               writer_close, ignore_epipe, onerror, queue_sem):
         debug('starting thread to feed data to pipe')
         nacquire = notempty.acquire
@@ -241,13 +244,13 @@ def _feed(buffer, notempty, send_bytes, writelock, reader_close,
                             return
 
                         # serialize the data before acquiring the lock
-                        obj = _ForkingPickler.dumps(obj)
+                        obj = dumps(obj)
                         if wacquire is None:
-                            send_bytes(obj)
+                            send_pickle(*obj)
                         else:
                             wacquire()
                             try:
-                                send_bytes(obj)
+                                send_pickle(*obj)
                             finally:
                                 wrelease()
                 except IndexError:
@@ -364,18 +367,196 @@ def __setstate__(self, state):
 
     def get(self):
         with self._rlock:
-            res = self._reader.recv_bytes()
+            data, buffers = self._reader._recv_pickle()
         # unserialize the data after having released the lock
-        return _ForkingPickler.loads(res)
+        return _ForkingPickler.loads(data, buffers=buffers)
 
     def put(self, obj):
         # serialize the data before acquiring the lock
-        obj = _ForkingPickler.dumps(obj)
+        data, buffers = self._writer._dumps(obj)
         if self._wlock is None:
             # writes to a message oriented win32 pipe are atomic
-            self._writer.send_bytes(obj)
+            self._writer._send_pickle(data, buffers)
         else:
             with self._wlock:
-                self._writer.send_bytes(obj)
+                self._writer._send_pickle(data, buffers)
+
+    __class_getitem__ = classmethod(types.GenericAlias)
+
+#
+# Bounded queue type using a ring buffer in shared memory
+#
+
+class SharedMemoryQueue(object):
+    '''
+    Bounded queue whose items are stored in a ring of maxsize slots of a
+    shared memory block.
+
+    By default the items are pickled and each pickle must fit in
+    slot_size bytes.  If record_format is given, the items are tuples
+    packed directly into the slots with the struct module, without
+    pickling, and get() returns tuples.
+    '''
+
+    # Offsets of the indexes of the next slot to read and to write, kept
+    # on separate cache lines, and of the first slot.
+    _HEAD = 0
+    _TAIL = 64
+    _SLOTS = 128
+    _INDEX = struct.Struct('Q')
+    _LENGTH = struct.Struct('I')
+
+    def __init__(self, maxsize=1024, *, slot_size=None, record_format=None,
+                 ctx):
+        from .shared_memory import SharedMemory
+
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        if record_format is not None:
+            if slot_size is not None:
+                raise ValueError(
+                    "slot_size and record_format are mutually exclusive")
+            stride = struct.calcsize(record_format)
+        else:
+            if slot_size is None:
+                slot_size = 4096
+            elif slot_size <= 0:
+                raise ValueError("slot_size must be greater than 0")
+            stride = self._LENGTH.size + slot_size
+        # Align the slots on 8 bytes.
+        stride = (stride + 7) & ~7
+        self._shm = SharedMemory(create=True,
+                                 size=self._SLOTS + maxsize * stride)
+        self._maxsize = maxsize
+        self._slot_size = slot_size
+        self._record_format = record_format
+        # Free and filled slots
+        self._empty = ctx.BoundedSemaphore(maxsize)
+        self._full = ctx.Semaphore(0)
+        self._rlock = ctx.Lock()
+        self._wlock = ctx.Lock()
+        self._reset()
+
+    def __getstate__(self):
+        context.assert_spawning(self)
+        return (self._shm.name, self._maxsize, self._slot_size,
+                self._record_format, self._empty, self._full,
+                self._rlock, self._wlock)
+
+    def __setstate__(self, state):
+        from .shared_memory import SharedMemory
+
+        (name, self._maxsize, self._slot_size, self._record_format,
+         self._empty, self._full, self._rlock, self._wlock) = state
+        self._shm = SharedMemory(name)
+        self._reset()
+
+    def _reset(self):
+        self._closed = False
+        self._buf = self._shm.buf
+        if self._record_format is not None:
+            self._record = struct.Struct(self._record_format)
+            stride = self._record.size
+        else:
+            self._record = None
+            stride = self._LENGTH.size + self._slot_size
+        self._stride = (stride + 7) & ~7
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} name={self._shm.name!r} '
+                f'maxsize={self._maxsize}>')
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def put(self, obj, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        record = self._record
+        if record is None:
+            # serialize the data before acquiring the locks
+            data = _ForkingPickler.dumps(obj)
+            if len(data) > self._slot_size:
+                raise ValueError(f"pickled object is too large for the "
+                                 f"slots: {len(data)} > {self._slot_size}")
+        if not self._empty.acquire(block, timeout):
+            raise Full
+        try:
+            with self._wlock:
+                buf = self._buf
+                index, = self._INDEX.unpack_from(buf, self._TAIL)
+                offset = self._SLOTS + index % self._maxsize * self._stride
+                if record is None:
+                    self._LENGTH.pack_into(buf, offset, len(data))
+                    offset += self._LENGTH.size
+                    buf[offset:offset + len(data)] = data
+                else:
+                    record.pack_into(buf, offset, *obj)
+                self._INDEX.pack_into(buf, self._TAIL, index + 1)
+        except BaseException:
+            self._empty.release()
+            raise
+        self._full.release()
+
+    def get(self, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        if not self._full.acquire(block, timeout):
+            raise Empty
+        with self._rlock:
+            buf = self._buf
+            index, = self._INDEX.unpack_from(buf, self._HEAD)
+            offset = self._SLOTS + index % self._maxsize * self._stride
+            if self._record is None:
+                size, = self._LENGTH.unpack_from(buf, offset)
+                offset += self._LENGTH.size
+                res = bytes(buf[offset:offset + size])
+            else:
+                res = self._record.unpack_from(buf, offset)
+            self._INDEX.pack_into(buf, self._HEAD, index + 1)
+        self._empty.release()
+        if self._record is None:
+            # unserialize the data after having released the lock
+            res = _ForkingPickler.loads(res)
+        return res
+
+    def put_nowait(self, obj):
+        return self.put(obj, False)
+
+    def get_nowait(self):
+        return self.get(False)
+
+    def qsize(self):
+        # The result is approximate if other processes use the queue.
+        buf = self._buf
+        tail, = self._INDEX.unpack_from(buf, self._TAIL)
+        head, = self._INDEX.unpack_from(buf, self._HEAD)
+        return max(tail - head, 0)
+
+    def empty(self):
+        return self.qsize() == 0
+
+    def full(self):
+        return self.qsize() >= self._maxsize
+
+    def close(self):
+        '''Release the shared memory in this process.'''
+        if not self._closed:
+            self._closed = True
+            self._buf = None
+            self._shm.close()
+
+    def unlink(self):
+        '''Destroy the shared memory block.
+
+        It should be called once, by a single process, when no process
+        needs to attach to the queue anymore.
+        '''
+        self._shm.unlink()
 
     __class_getitem__ = classmethod(types.GenericAlias)
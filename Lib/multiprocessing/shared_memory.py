@@ -5,10 +5,11 @@
 """
 
 
-__all__ = [ 'SharedMemory', 'ShareableList' ]
+__all__ = [ 'SharedMemory', 'ShareableList', 'SharedArray', 'SharedTable' ]
 
 
 from functools import partial
+import array
 import mmap
 import os
 import errno
@@ -532,3 +533,398 @@ def index(self, value):
             raise ValueError(f"{value!r} not in this container")
 
     __class_getitem__ = classmethod(types.GenericAlias)
+
+
+# Type codes of the array module which can be stored in SharedArray and in
+# the numeric columns of SharedTable.
+_ARRAY_TYPECODES = 'bBhHiIlLqQfd'
+
+# Alignment of the data areas in SharedArray and SharedTable blocks.
+_DATA_ALIGNMENT = 64
+
+
+def _align(offset):
+    return -(-offset // _DATA_ALIGNMENT) * _DATA_ALIGNMENT
+
+
+def _check_typecode(typecode, allowed=_ARRAY_TYPECODES):
+    if not isinstance(typecode, str) or len(typecode) != 1 \
+            or typecode not in allowed:
+        raise ValueError(f"bad typecode {typecode!r} (must be one of "
+                         f"{', '.join(allowed)})")
+
+
+class SharedArray:
+    """Pattern for a typed array of numbers stored in a shared memory
+    block.
+
+    The items all have the C type given by typecode, one of the numeric
+    type codes of the array module.  Up to capacity items can be appended
+    to the array; its length is stored in the shared memory block, so
+    that the items appended by a process are seen by all the processes
+    attached to the array.  The buf attribute gives zero-copy access to
+    the items through the buffer protocol.
+
+    Appending is not synchronized: an array must have a single writer, or
+    its writers must hold a common lock."""
+
+    # The shared memory area is organized as follows:
+    # - 8 bytes: number of items as a 64-bit integer
+    # - 8 bytes: capacity as a 64-bit integer
+    # - 8 bytes: type code
+    # - capacity * itemsize bytes: the items, from offset 64
+    _format_header = "qq8s"
+
+    def __init__(self, typecode=None, capacity=None, *, name=None):
+        if name is None or typecode is not None:
+            _check_typecode(typecode)
+            if capacity is None or capacity < 0:
+                raise ValueError("capacity must be a non-negative integer")
+            size = _DATA_ALIGNMENT + capacity * struct.calcsize(typecode)
+            self.shm = SharedMemory(name, create=True, size=size)
+            struct.pack_into(self._format_header, self.shm.buf, 0,
+                             0, capacity, typecode.encode(_encoding))
+        else:
+            self.shm = SharedMemory(name)
+            _, capacity, typecode = struct.unpack_from(
+                self._format_header, self.shm.buf, 0)
+            typecode = typecode.rstrip(b'\x00').decode(_encoding)
+        self._typecode = typecode
+        self._capacity = capacity
+        self._length = self.shm.buf[:8].cast("q")
+        end = _DATA_ALIGNMENT + capacity * struct.calcsize(typecode)
+        self._items = self.shm.buf[_DATA_ALIGNMENT:end].cast(typecode)
+
+    def __len__(self):
+        return self._length[0]
+
+    def _check_index(self, position):
+        length = self._length[0]
+        if position < 0:
+            position += length
+        if not 0 <= position < length:
+            raise IndexError("index out of range")
+        return position
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return self.buf[position].tolist()
+        return self._items[self._check_index(position)]
+
+    def __setitem__(self, position, value):
+        if isinstance(position, slice):
+            self.buf[position] = memoryview(array.array(self._typecode, value))
+        else:
+            self._items[self._check_index(position)] = value
+
+    def __iter__(self):
+        return iter(self.buf.tolist())
+
+    def __reduce__(self):
+        return partial(self.__class__, name=self.shm.name), ()
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}({self._typecode!r}, '
+                f'capacity={self._capacity}, name={self.shm.name!r})')
+
+    @property
+    def typecode(self):
+        "The type code of the items."
+        return self._typecode
+
+    @property
+    def itemsize(self):
+        "The size in bytes of one item."
+        return self._items.itemsize
+
+    @property
+    def capacity(self):
+        "The maximum number of items."
+        return self._capacity
+
+    @property
+    def buf(self):
+        "A memoryview of the items currently in the array."
+        return self._items[:self._length[0]]
+
+    def append(self, value):
+        "Append value to the end of the array."
+        length = self._length[0]
+        if length >= self._capacity:
+            raise ValueError("array is full")
+        self._items[length] = value
+        # Publish the item only once it is written.
+        self._length[0] = length + 1
+
+    def extend(self, iterable):
+        "Append the items of iterable to the end of the array."
+        values = array.array(self._typecode, iterable)
+        length = self._length[0]
+        end = length + len(values)
+        if end > self._capacity:
+            raise ValueError("array is full")
+        self._items[length:end] = memoryview(values)
+        self._length[0] = end
+
+    def close(self):
+        """Closes access to the shared memory from this instance.
+
+        The memoryviews obtained from buf must be released first."""
+        self._items.release()
+        self._length.release()
+        self.shm.close()
+
+    __class_getitem__ = classmethod(types.GenericAlias)
+
+
+class _StringColumn:
+    """Read-only view of a string column of a SharedTable.
+
+    The strings are stored one after the other in the data buffer, and
+    the string i is data[offsets[i]:offsets[i + 1]], encoded in UTF-8."""
+
+    def __init__(self, offsets, data, length):
+        self.offsets = offsets[:length + 1]
+        self.data = data[:offsets[length]]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("index out of range")
+        offsets = self.offsets
+        return str(self.data[offsets[position]:offsets[position + 1]],
+                   _encoding)
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def release(self):
+        "Release the underlying memoryviews."
+        self.offsets.release()
+        self.data.release()
+
+
+class SharedTable:
+    """Pattern for a table of records stored column by column in a shared
+    memory block.
+
+    columns is a sequence of (name, typecode) pairs.  A typecode is
+    either one of the numeric type codes of the array module, or 's' for
+    a column of str values.  Each numeric column is stored as a
+    contiguous array, and column() gives zero-copy access to it through
+    the buffer protocol.  The str values of a column are encoded in
+    UTF-8 and stored one after the other in an area of str_size bytes
+    (32 bytes per row by default), indexed by their offsets.
+
+    Up to capacity rows can be appended to the table; its length is
+    stored in the shared memory block, so that the rows appended by a
+    process are seen by all the processes attached to the table.
+    Appending is not synchronized: a table must have a single writer, or
+    its writers must hold a common lock."""
+
+    # The shared memory area is organized as follows:
+    # - 8 bytes: number of rows as a 64-bit integer
+    # - 8 bytes: capacity as a 64-bit integer
+    # - 8 bytes: size of the data area of the str columns
+    # - 8 bytes: size of the columns description (D) in bytes
+    # - D bytes: the columns description, "name\0typecode" for each column,
+    #            separated by "\0"
+    # - the columns, each one starting at a multiple of 64 bytes:
+    #   - numeric columns: capacity * itemsize bytes
+    #   - str columns: (capacity + 1) * 8 bytes for the offsets of the
+    #                  values, followed by the data area
+    _format_header = "qqqq"
+
+    def __init__(self, columns=None, capacity=None, *, str_size=None,
+                 name=None):
+        if name is None or columns is not None:
+            columns = [(str(cname), typecode) for cname, typecode in columns]
+            if not columns:
+                raise ValueError("a table needs at least one column")
+            for cname, typecode in columns:
+                if '\0' in cname:
+                    raise ValueError("column names can't contain NUL")
+                _check_typecode(typecode, _ARRAY_TYPECODES + 's')
+            if len({cname for cname, _ in columns}) != len(columns):
+                raise ValueError("duplicate column name")
+            if capacity is None or capacity < 0:
+                raise ValueError("capacity must be a non-negative integer")
+            if str_size is None:
+                str_size = 32 * capacity
+            elif str_size < 0:
+                raise ValueError("str_size must be a non-negative integer")
+            description = '\0'.join(
+                f'{cname}\0{typecode}' for cname, typecode in columns
+            ).encode(_encoding)
+            layout = self._layout(columns, capacity, str_size,
+                                  len(description))
+            self.shm = SharedMemory(name, create=True, size=layout[-1])
+            struct.pack_into(self._format_header, self.shm.buf, 0,
+                             0, capacity, str_size, len(description))
+            size = struct.calcsize(self._format_header)
+            self.shm.buf[size:size + len(description)] = description
+        else:
+            self.shm = SharedMemory(name)
+            _, capacity, str_size, size = struct.unpack_from(
+                self._format_header, self.shm.buf, 0)
+            start = struct.calcsize(self._format_header)
+            fields = str(self.shm.buf[start:start + size],
+                         _encoding).split('\0')
+            columns = list(zip(fields[::2], fields[1::2]))
+            layout = self._layout(columns, capacity, str_size, size)
+
+        self._capacity = capacity
+        self._str_size = str_size
+        self._columns = tuple(columns)
+        self._length = self.shm.buf[:8].cast("q")
+        # For each column: the items, or the offsets and the data of the
+        # str values.
+        self._views = []
+        buf = self.shm.buf
+        for (_, typecode), start in zip(columns, layout):
+            if typecode == 's':
+                end = start + (capacity + 1) * 8
+                self._views.append((buf[start:end].cast("Q"),
+                                    buf[end:end + str_size]))
+            else:
+                end = start + capacity * struct.calcsize(typecode)
+                self._views.append(buf[start:end].cast(typecode))
+        self._index = {cname: i for i, (cname, _) in enumerate(columns)}
+
+    @staticmethod
+    def _layout(columns, capacity, str_size, description_size):
+        # Return the offsets of the columns, followed by the total size.
+        offsets = []
+        offset = struct.calcsize(SharedTable._format_header) + description_size
+        for _, typecode in columns:
+            offset = _align(offset)
+            offsets.append(offset)
+            if typecode == 's':
+                offset += (capacity + 1) * 8 + str_size
+            else:
+                offset += capacity * struct.calcsize(typecode)
+        offsets.append(offset)
+        return offsets
+
+    def __len__(self):
+        return self._length[0]
+
+    def __getitem__(self, position):
+        "Return the row at position as a tuple."
+        length = self._length[0]
+        if position < 0:
+            position += length
+        if not 0 <= position < length:
+            raise IndexError("index out of range")
+        row = []
+        for view in self._views:
+            if type(view) is tuple:
+                offsets, data = view
+                row.append(str(data[offsets[position]:offsets[position + 1]],
+                               _encoding))
+            else:
+                row.append(view[position])
+        return tuple(row)
+
+    def __iter__(self):
+        for position in range(self._length[0]):
+            yield self[position]
+
+    def __reduce__(self):
+        return partial(self.__class__, name=self.shm.name), ()
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}({list(self._columns)}, '
+                f'capacity={self._capacity}, name={self.shm.name!r})')
+
+    @property
+    def columns(self):
+        "The (name, typecode) pairs describing the columns."
+        return self._columns
+
+    @property
+    def capacity(self):
+        "The maximum number of rows."
+        return self._capacity
+
+    def column(self, name):
+        """Return the values of the column name.
+
+        The values of a numeric column are returned as a memoryview, and
+        those of a str column as a read-only sequence of str.  Both
+        reference the shared memory without copying it, and must be
+        released before the table is closed."""
+        view = self._views[self._index[name]]
+        length = self._length[0]
+        if type(view) is tuple:
+            offsets, data = view
+            return _StringColumn(offsets, data, length)
+        return view[:length]
+
+    def append(self, row):
+        "Append row, a sequence with one value per column, to the table."
+        self.extend((row,))
+
+    def extend(self, rows):
+        "Append the rows of the iterable rows to the table."
+        rows = [tuple(row) for row in rows]
+        ncolumns = len(self._columns)
+        for row in rows:
+            if len(row) != ncolumns:
+                raise ValueError(f"expected {ncolumns} values, "
+                                 f"got {len(row)}")
+        length = self._length[0]
+        end = length + len(rows)
+        if end > self._capacity:
+            raise ValueError("table is full")
+        # Convert all the values first, so that the table is left
+        # unchanged if one of them is invalid.
+        columns = []
+        for i, ((_, typecode), view) in enumerate(zip(self._columns,
+                                                      self._views)):
+            if typecode == 's':
+                offsets, data = view
+                values = [row[i].encode(_encoding) for row in rows]
+                start = offsets[length] if length else 0
+                ends = array.array("Q")
+                offset = start
+                for value in values:
+                    offset += len(value)
+                    ends.append(offset)
+                if offset > self._str_size:
+                    raise ValueError("str data area is full")
+                columns.append((b''.join(values), start, ends))
+            else:
+                columns.append(array.array(typecode,
+                                           [row[i] for row in rows]))
+        for values, view in zip(columns, self._views):
+            if type(view) is tuple:
+                offsets, data = view
+                values, start, ends = values
+                data[start:start + len(values)] = values
+                offsets[length + 1:end + 1] = memoryview(ends)
+            else:
+                view[length:end] = memoryview(values)
+        # Publish the rows only once they are written.
+        self._length[0] = end
+
+    def close(self):
+        """Closes access to the shared memory from this instance.
+
+        The values returned by column() must be released first."""
+        for view in self._views:
+            if type(view) is tuple:
+                for v in view:
+                    v.release()
+            else:
+                view.release()
+        self._length.release()
+        self.shm.close()
+
+    __class_getitem__ = classmethod(types.GenericAlias)
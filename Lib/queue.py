@@ -68,12 +68,13 @@ def task_done(self):
         Raises a ValueError if called more times than there were items
         placed in the queue.
         '''
-        with self.all_tasks_done:
+        with self.mutex:
             unfinished = self.unfinished_tasks - 1
             if unfinished <= 0:
                 if unfinished < 0:
                     raise ValueError('task_done() called too many times')
-                self.all_tasks_done.notify_all()
+                if self.all_tasks_done._waiters:
+                    self.all_tasks_done.notify_all()
             self.unfinished_tasks = unfinished
 
     def join(self):
@@ -119,6 +120,12 @@ def full(self):
         with self.mutex:
             return 0 < self.maxsize <= self._qsize()
 
+    # put() and get() hold the mutex itself rather than going through the
+    # conditions, and only notify a condition when a thread waits on it
+    # (its waiters are only added and removed with the mutex held).  So a
+    # put() on a queue with free slots, or a get() on a non-empty queue,
+    # costs a single lock acquisition when no other thread is blocked.
+
     def put(self, item, block=True, timeout=None):
         '''Put an item into the queue.
 
@@ -130,26 +137,19 @@ def put(self, item, block=True, timeout=None):
         is immediately available, else raise the Full exception ('timeout'
         is ignored in that case).
         '''
-        with self.not_full:
+        with self.mutex:
             if self.maxsize > 0:
                 if not block:
                     if self._qsize() >= self.maxsize:
                         raise Full
-                elif timeout is None:
-                    while self._qsize() >= self.maxsize:
-                        self.not_full.wait()
-                elif timeout < 0:
+                elif timeout is not None and timeout < 0:
                     raise ValueError("'timeout' must be a non-negative number")
-                else:
-                    endtime = time() + timeout
-                    while self._qsize() >= self.maxsize:
-                        remaining = endtime - time()
-                        if remaining <= 0.0:
-                            raise Full
-                        self.not_full.wait(remaining)
+                elif self._qsize() >= self.maxsize:
+                    self._wait_not_full(timeout)
             self._put(item)
             self.unfinished_tasks += 1
-            self.not_empty.notify()
+            if self.not_empty._waiters:
+                self.not_empty.notify()
 
     def get(self, block=True, timeout=None):
         '''Remove and return an item from the queue.
@@ -162,26 +162,85 @@ def get(self, block=True, timeout=None):
         available, else raise the Empty exception ('timeout' is ignored
         in that case).
         '''
-        with self.not_empty:
+        with self.mutex:
             if not block:
                 if not self._qsize():
                     raise Empty
-            elif timeout is None:
-                while not self._qsize():
-                    self.not_empty.wait()
-            elif timeout < 0:
+            elif timeout is not None and timeout < 0:
                 raise ValueError("'timeout' must be a non-negative number")
-            else:
-                endtime = time() + timeout
-                while not self._qsize():
-                    remaining = endtime - time()
-                    if remaining <= 0.0:
-                        raise Empty
-                    self.not_empty.wait(remaining)
+            elif not self._qsize():
+                self._wait_not_empty(timeout)
             item = self._get()
-            self.not_full.notify()
+            if self.not_full._waiters:
+                self.not_full.notify()
             return item
 
+    def put_many(self, items, block=True, timeout=None):
+        '''Put all items of an iterable into the queue.
+
+        The items are added in batches as large as the free slots allow,
+        taking the mutex once per batch, and each batch wakes up at most
+        one waiting consumer per item.  If optional args 'block' is true
+        and 'timeout' is None (the default), block if necessary until free
+        slots are available for the remaining items.  If 'timeout' is a
+        non-negative number, it blocks at most 'timeout' seconds in total
+        and raises the Full exception if the items could not all be added
+        within that time; the items added before stay in the queue.
+        Otherwise ('block' is false), either all items are added or, if
+        there are not enough free slots for all of them, none is and the
+        Full exception is raised.
+        '''
+        items = list(items)
+        with self.mutex:
+            if self.maxsize <= 0:
+                self._put_batch(items, 0, len(items))
+                return
+            if not block:
+                if self._qsize() + len(items) > self.maxsize:
+                    raise Full
+                self._put_batch(items, 0, len(items))
+                return
+            if timeout is not None:
+                if timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                endtime = time() + timeout
+            start = 0
+            while start < len(items):
+                if self._qsize() >= self.maxsize:
+                    self._wait_not_full(
+                        None if timeout is None else endtime - time())
+                count = min(len(items) - start, self.maxsize - self._qsize())
+                self._put_batch(items, start, count)
+                start += count
+
+    def get_many(self, max_items=None, block=True, timeout=None):
+        '''Remove and return a list of items from the queue.
+
+        Return up to max_items items, or all the available items if
+        max_items is None, taking the mutex once.  The optional args
+        'block' and 'timeout' behave as for get(): they tell whether and
+        how long to wait for the first item, and the Empty exception is
+        raised if none is available.
+        '''
+        if max_items is not None and max_items < 1:
+            raise ValueError('max_items must be None or a positive integer')
+        with self.mutex:
+            if not block:
+                if not self._qsize():
+                    raise Empty
+            elif timeout is not None and timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            elif not self._qsize():
+                self._wait_not_empty(timeout)
+            count = self._qsize()
+            if max_items is not None and max_items < count:
+                count = max_items
+            get = self._get
+            items = [get() for _ in range(count)]
+            if self.not_full._waiters:
+                self.not_full.notify(count)
+            return items
+
     def put_nowait(self, item):
         '''Put an item into the queue without blocking.
 
@@ -198,6 +257,49 @@ def get_nowait(self):
         '''
         return self.get(block=False)
 
+    # These helpers are called with the mutex held.
+
+    def _wait_not_full(self, timeout):
+        # Wait until a slot is free, raise Full after timeout seconds (a
+        # negative timeout expired already).
+        if timeout is None:
+            while self._qsize() >= self.maxsize:
+                self.not_full.wait()
+        else:
+            endtime = time() + timeout
+            while self._qsize() >= self.maxsize:
+                remaining = endtime - time()
+                if remaining <= 0.0:
+                    raise Full
+                self.not_full.wait(remaining)
+
+    def _wait_not_empty(self, timeout):
+        # Wait until an item is available, raise Empty after timeout seconds.
+        if timeout is None:
+            while not self._qsize():
+                self.not_empty.wait()
+        else:
+            endtime = time() + timeout
+            while not self._qsize():
+                remaining = endtime - time()
+                if remaining <= 0.0:
+                    raise Empty
+                self.not_empty.wait(remaining)
+
+    def _put_batch(self, items, start, count):
+        # Add items[start:start+count]; the items added are counted even if
+        # _put() fails.
+        added = 0
+        try:
+            for i in range(start, start + count):
+                self._put(items[i])
+                added += 1
+        finally:
+            if added:
+                self.unfinished_tasks += added
+                if self.not_empty._waiters:
+                    self.not_empty.notify(added)
+
     # Override these methods to implement other queue organizations
     # (e.g. stack or priority queue).
     # These will only be called with appropriate locks held
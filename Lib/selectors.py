@@ -8,6 +8,7 @@
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 from collections.abc import Mapping
+import itertools
 import math
 import select
 import sys
@@ -580,6 +581,141 @@ def close(self):
             super().close()
 
 
+if hasattr(select, 'io_uring'):
+
+    class IoUringSelector(_BaseSelectorImpl):
+        """io_uring-based selector.
+
+        Each registered file object is watched by a one-shot poll
+        operation.  The operations that must be (re-)armed are submitted
+        together with the wait, in a single system call per select().
+        """
+
+        def __init__(self, entries=256):
+            super().__init__()
+            self._ring = select.io_uring(entries)
+            # user_data 0 is used for the operations whose completion is
+            # ignored.
+            self._ids = itertools.count(1)
+            # user_data of an armed poll operation -> fd
+            self._polls = {}
+            # fd -> user_data of its armed poll operation
+            self._armed = {}
+            # fds whose poll operation must be armed by the next select()
+            self._dirty = set()
+            # user_data -> completion callback of other operations
+            self._callbacks = {}
+            # completions reaped outside of select()
+            self._completions = []
+
+        def fileno(self):
+            return self._ring.fileno()
+
+        def register(self, fileobj, events, data=None):
+            key = super().register(fileobj, events, data)
+            self._dirty.add(key.fd)
+            return key
+
+        def unregister(self, fileobj):
+            key = super().unregister(fileobj)
+            self._dirty.discard(key.fd)
+            user_data = self._armed.pop(key.fd, None)
+            if user_data is not None:
+                del self._polls[user_data]
+                self._ring.poll_remove(user_data, 0)
+            return key
+
+        def _arm(self):
+            ring = self._ring
+            for fd in self._dirty:
+                events = self._fd_to_key[fd].events
+                poller_events = 0
+                if events & EVENT_READ:
+                    poller_events |= select.POLLIN
+                if events & EVENT_WRITE:
+                    poller_events |= select.POLLOUT
+                user_data = next(self._ids)
+                ring.poll_add(fd, poller_events, user_data)
+                self._polls[user_data] = fd
+                self._armed[fd] = user_data
+            self._dirty.clear()
+
+        def select(self, timeout=None):
+            if timeout is None:
+                wait_nr = 1
+            elif timeout <= 0:
+                wait_nr = 0
+                timeout = None
+            else:
+                wait_nr = 1
+            if self._dirty:
+                self._arm()
+            ready = []
+            if self._completions:
+                completions = self._completions
+                self._completions = []
+                completions += self._ring.submit()
+            else:
+                completions = self._ring.submit(wait_nr, timeout)
+            for user_data, result, flags in completions:
+                fd = self._polls.pop(user_data, None)
+                if fd is None:
+                    callback = self._callbacks.pop(user_data, None)
+                    if callback is not None:
+                        callback(result)
+                    continue
+                del self._armed[fd]
+                if result >= 0:
+                    events = 0
+                    if result & ~select.POLLIN:
+                        events |= EVENT_WRITE
+                    if result & ~select.POLLOUT:
+                        events |= EVENT_READ
+                    self._dirty.add(fd)
+                else:
+                    # The fd is invalid.  Report it once, like poll() does
+                    # with POLLNVAL, but don't re-arm it.
+                    events = EVENT_READ | EVENT_WRITE
+                key = self._fd_to_key[fd]
+                ready.append((key, events & key.events))
+            return ready
+
+        def _submit(self, operation, callback, *args, **kwargs):
+            # Queue an io_uring operation, which is submitted by the next
+            # select().  callback is called by select() with the result of
+            # the operation.  Return an id to pass to _cancel().
+            user_data = next(self._ids)
+            getattr(self._ring, operation)(*args, user_data=user_data,
+                                           **kwargs)
+            self._callbacks[user_data] = callback
+            return user_data
+
+        def _cancel(self, user_data, callback=None):
+            # Cancel an operation queued by _submit(); its callback is not
+            # called.  The operation may have completed in the kernel
+            # before the cancellation: if callback is not None, it is
+            # called instead with the result of the operation, a negative
+            # errno value such as -ECANCELED if it was cancelled.  The
+            # cancellation is submitted right away.
+            if user_data not in self._callbacks:
+                return
+            if callback is None:
+                del self._callbacks[user_data]
+            else:
+                self._callbacks[user_data] = callback
+            self._ring.cancel(user_data, 0)
+            self._completions += self._ring.submit()
+
+        def close(self):
+            self._ring.close()
+            self._callbacks.clear()
+            self._completions.clear()
+            self._polls.clear()
+            self._armed.clear()
+            self._dirty.clear()
+            super().close()
+
+
 def _can_use(method):
     """Check if we can use the selector depending upon the
     operating system. """
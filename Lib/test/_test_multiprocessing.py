@@ -1270,6 +1270,19 @@ def _on_queue_feeder_error(e, obj):
         self.assertTrue(not_serializable_obj.reduce_was_called)
         self.assertTrue(not_serializable_obj.on_queue_feeder_error_was_called)
 
+    def test_out_of_band_buffers(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        data = bytearray(os.urandom(
+            2 * multiprocessing.connection._OUT_OF_BAND_MIN_SIZE))
+        for q in (self.Queue(), self.JoinableQueue()):
+            q.put(pickle.PickleBuffer(data))
+            q.put(1)
+            self.assertEqual(q.get(timeout=support.SHORT_TIMEOUT), data)
+            self.assertEqual(q.get(timeout=support.SHORT_TIMEOUT), 1)
+            close_queue(q)
+
     def test_closed_queue_put_get_exceptions(self):
         for q in multiprocessing.Queue(), multiprocessing.JoinableQueue():
             q.close()
@@ -2373,6 +2386,78 @@ def test_namespace(self):
         self.assertTrue(hasattr(n, 'name'))
         self.assertTrue(not hasattr(n, 'job'))
 
+
+class _TestProxyPipelining(BaseTestCase):
+
+    ALLOWED_TYPES = ('manager',)
+
+    def test_callmethod_async(self):
+        d = self.dict()
+        f1 = d._callmethod_async('__setitem__', ('a', 1))
+        f2 = d._callmethod_async('__getitem__', ('a',))
+        f3 = d._callmethod_async('__getitem__', ('b',))
+        self.assertFalse(f1.cancel())
+        self.assertEqual(f2.result(), 1)
+        self.assertTrue(f1.done())
+        self.assertIsNone(f1.result())
+        self.assertIsInstance(f3.exception(), KeyError)
+        self.assertRaises(KeyError, f3.result)
+        # Synchronous calls receive the pending replies first.
+        f4 = d._callmethod_async('__setitem__', ('b', 2))
+        self.assertEqual(d['b'], 2)
+        self.assertTrue(f4.done())
+
+    def test_callmethod_async_many(self):
+        a = self.list()
+        futures = [a._callmethod_async('append', (i,)) for i in range(100)]
+        futures.append(a._callmethod_async('__len__'))
+        self.assertEqual(futures[-1].result(), 100)
+        self.assertEqual(a[:], list(range(100)))
+
+    def test_batch(self):
+        d = self.dict()
+        a = self.list()
+        conn = d._get_pipeline().conn
+        with unittest.mock.patch.object(conn, 'send',
+                                        wraps=conn.send) as send:
+            with d._batch():
+                for i in range(10):
+                    d[i] = i
+                a.append(1)
+                f = d._callmethod('__len__')
+                g = a._callmethod_async('__len__')
+            self.assertEqual(send.call_count, 1)
+        self.assertEqual(f.result(), 10)
+        self.assertEqual(g.result(), 1)
+        self.assertEqual(d.copy(), {i: i for i in range(10)})
+
+    def test_batch_error(self):
+        d = self.dict()
+        with self.assertRaises(KeyError):
+            with d._batch():
+                d['a'] = 1
+                d['b']
+                d['c'] = 2
+        self.assertEqual(d.copy(), {'a': 1, 'c': 2})
+
+    def test_batch_result(self):
+        d = self.dict()
+        with d._batch():
+            d['a'] = 1
+            # Requesting a result sends the calls made so far.
+            self.assertEqual(d.get('a').result(), 1)
+            with d._batch():
+                d['b'] = 2
+            f = d.get('b')
+            self.assertFalse(f.done())
+        self.assertEqual(f.result(), 2)
+
+    def test_batch_proxy_result(self):
+        d = self.dict({'a': 1})
+        with d._batch():
+            f = d._callmethod('__iter__')
+        self.assertEqual(list(f.result()), ['a'])
+
 #
 #
 #
@@ -3256,6 +3341,46 @@ def test_sendbytes(self):
 
         self.assertRaises(ValueError, a.send_bytes, msg, 4, -1)
 
+    @classmethod
+    def _echo_buffers(cls, conn):
+        for buffers in iter(conn.recv, None):
+            conn.send([pickle.PickleBuffer(b) for b in buffers])
+        conn.close()
+
+    def test_out_of_band_buffers(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        conn, child_conn = self.Pipe()
+        p = self.Process(target=self._echo_buffers, args=(child_conn,))
+        p.daemon = True
+        p.start()
+        child_conn.close()
+
+        size = multiprocessing.connection._OUT_OF_BAND_MIN_SIZE
+        data = [bytearray(os.urandom(n)) for n in (10, size, 3 * size + 1)]
+        if isinstance(conn, multiprocessing.connection.Connection):
+            # Only the large buffers are sent out-of-band.
+            _, buffers = conn._dumps([pickle.PickleBuffer(b) for b in data])
+            self.assertEqual([b.raw().nbytes for b in buffers],
+                             [size, 3 * size + 1])
+
+        conn.send([pickle.PickleBuffer(b) for b in data])
+        result = conn.recv()
+        self.assertEqual(result, data)
+        self.assertEqual([type(b) for b in result], [bytearray] * 3)
+
+        # Read-only buffers stay read-only.
+        data = [bytes(b) for b in data]
+        conn.send([pickle.PickleBuffer(b) for b in data])
+        result = conn.recv()
+        self.assertEqual([bytes(b) for b in result], data)
+        self.assertTrue(all(memoryview(b).readonly for b in result))
+
+        conn.send(None)
+        conn.close()
+        p.join()
+
     @classmethod
     def _is_fd_assigned(cls, fd):
         try:
@@ -4344,6 +4469,292 @@ def test_shared_memory_cleaned_after_process_termination(self):
                     "resource_tracker: There appear to be 1 leaked "
                     "shared_memory objects to clean up at shutdown", err)
 
+#
+#
+#
+
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestSharedArray(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    def make_array(self, *args, **kwargs):
+        a = shared_memory.SharedArray(*args, **kwargs)
+        self.addCleanup(a.shm.unlink)
+        self.addCleanup(a.close)
+        return a
+
+    def test_append(self):
+        a = self.make_array('i', 5)
+        self.assertEqual(a.typecode, 'i')
+        self.assertEqual(a.itemsize, array.array('i').itemsize)
+        self.assertEqual(a.capacity, 5)
+        self.assertEqual(len(a), 0)
+        a.append(1)
+        a.extend(range(2, 4))
+        a.extend(array.array('i', [4]))
+        self.assertEqual(len(a), 4)
+        self.assertEqual(list(a), [1, 2, 3, 4])
+        self.assertEqual(a[-1], 4)
+        self.assertEqual(a[1:3], [2, 3])
+        a[0] = 10
+        a[1:3] = [20, 30]
+        self.assertEqual(list(a), [10, 20, 30, 4])
+        with self.assertRaises(IndexError):
+            a[4]
+        with self.assertRaises(IndexError):
+            a[4] = 5
+        with self.assertRaises(TypeError):
+            a.append(1.5)
+        with self.assertRaises(ValueError):
+            a.extend([5, 6])
+        self.assertEqual(len(a), 4)
+        a.append(5)
+        with self.assertRaises(ValueError):
+            a.append(6)
+        self.assertEqual(list(a), [10, 20, 30, 4, 5])
+
+    def test_buffer(self):
+        a = self.make_array('d', 10)
+        a.extend([0.5, 1.5, 2.5])
+        with a.buf as view:
+            self.assertEqual(view.format, 'd')
+            self.assertEqual(view.tolist(), [0.5, 1.5, 2.5])
+            view[0] = 3.5
+        self.assertEqual(a[0], 3.5)
+
+    def test_bad_arguments(self):
+        for typecode in ('u', 'x', 'dd', None):
+            with self.subTest(typecode=typecode):
+                with self.assertRaises(ValueError):
+                    shared_memory.SharedArray(typecode, 10)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedArray('d')
+        with self.assertRaises(ValueError):
+            shared_memory.SharedArray('d', -1)
+
+    def test_pickling(self):
+        a = self.make_array('q', 10)
+        a.append(1)
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                b = pickle.loads(pickle.dumps(a, proto))
+                self.assertEqual(b.shm.name, a.shm.name)
+                self.assertEqual(b.typecode, 'q')
+                self.assertEqual(b.capacity, 10)
+                self.assertEqual(list(b), [1])
+                b.close()
+
+    @classmethod
+    def _extend(cls, name, values):
+        a = shared_memory.SharedArray(name=name)
+        a.extend(values)
+        a.close()
+
+    def test_child_process(self):
+        a = self.make_array('q', 10)
+        a.append(1)
+        p = self.Process(target=self._extend, args=(a.shm.name, [2, 3]))
+        p.start()
+        p.join()
+        self.assertEqual(p.exitcode, 0)
+        self.assertEqual(list(a), [1, 2, 3])
+
+
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestSharedTable(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    COLUMNS = [('id', 'q'), ('name', 's'), ('score', 'd')]
+
+    def make_table(self, *args, **kwargs):
+        t = shared_memory.SharedTable(*args, **kwargs)
+        self.addCleanup(t.shm.unlink)
+        self.addCleanup(t.close)
+        return t
+
+    def test_append(self):
+        t = self.make_table(self.COLUMNS, 4)
+        self.assertEqual(t.columns, tuple(self.COLUMNS))
+        self.assertEqual(t.capacity, 4)
+        self.assertEqual(len(t), 0)
+        t.append((1, 'spam', 0.5))
+        t.extend([[2, 'h\xe9', 1.5], (3, '', 2.5)])
+        self.assertEqual(len(t), 3)
+        self.assertEqual(t[1], (2, 'h\xe9', 1.5))
+        self.assertEqual(t[-1], (3, '', 2.5))
+        self.assertEqual(list(t), [(1, 'spam', 0.5), (2, 'h\xe9', 1.5),
+                                   (3, '', 2.5)])
+        with self.assertRaises(IndexError):
+            t[3]
+        with self.assertRaises(ValueError):
+            t.extend([(4, 'x', 0.0), (5, 'y', 0.0)])
+        t.append((4, 'eggs', 3.5))
+        with self.assertRaises(ValueError):
+            t.append((5, 'x', 0.0))
+        self.assertEqual(len(t), 4)
+
+    def test_invalid_rows(self):
+        t = self.make_table(self.COLUMNS, 4, str_size=10)
+        t.append((1, 'spam', 0.5))
+        with self.assertRaises(ValueError):
+            t.append((2, 'ham'))
+        with self.assertRaises(TypeError):
+            t.append((2, 'ham', 'eggs'))
+        with self.assertRaises(AttributeError):
+            t.append((2, 3, 1.0))
+        with self.assertRaises(ValueError):
+            t.append((2, 'x' * 7, 1.0))
+        # The table is left unchanged.
+        self.assertEqual(list(t), [(1, 'spam', 0.5)])
+        t.append((2, 'x' * 6, 1.0))
+        self.assertEqual(t[1], (2, 'x' * 6, 1.0))
+
+    def test_column(self):
+        t = self.make_table(self.COLUMNS, 10)
+        t.extend((i, str(i) * i, i / 2) for i in range(5))
+        with t.column('score') as scores:
+            self.assertEqual(scores.format, 'd')
+            self.assertEqual(scores.tolist(), [0.0, 0.5, 1.0, 1.5, 2.0])
+        names = t.column('name')
+        self.assertEqual(len(names), 5)
+        self.assertEqual(names[3], '333')
+        self.assertEqual(names[-1], '4444')
+        self.assertEqual(names[1:3], ['1', '22'])
+        self.assertEqual(list(names), ['', '1', '22', '333', '4444'])
+        self.assertEqual(names.offsets.tolist(), [0, 0, 1, 3, 6, 10])
+        self.assertEqual(bytes(names.data), b'1223334444')
+        names.release()
+        with self.assertRaises(KeyError):
+            t.column('spam')
+
+    def test_bad_arguments(self):
+        for columns in ([], [('a', 'q'), ('a', 'd')], [('a', 'u')],
+                        [('a\0', 'q')]):
+            with self.subTest(columns=columns):
+                with self.assertRaises(ValueError):
+                    shared_memory.SharedTable(columns, 10)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedTable(self.COLUMNS)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedTable(self.COLUMNS, 10, str_size=-1)
+
+    def test_pickling(self):
+        t = self.make_table(self.COLUMNS, 10)
+        t.append((1, 'spam', 0.5))
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(proto=proto):
+                u = pickle.loads(pickle.dumps(t, proto))
+                self.assertEqual(u.shm.name, t.shm.name)
+                self.assertEqual(u.columns, t.columns)
+                self.assertEqual(u.capacity, 10)
+                self.assertEqual(list(u), [(1, 'spam', 0.5)])
+                u.close()
+
+    @classmethod
+    def _extend(cls, name, rows):
+        t = shared_memory.SharedTable(name=name)
+        t.extend(rows)
+        t.close()
+
+    def test_child_process(self):
+        t = self.make_table(self.COLUMNS, 10)
+        t.append((1, 'spam', 0.5))
+        rows = [(2, 'ham', 1.5), (3, 'eggs', 2.5)]
+        p = self.Process(target=self._extend, args=(t.shm.name, rows))
+        p.start()
+        p.join()
+        self.assertEqual(p.exitcode, 0)
+        self.assertEqual(list(t), [(1, 'spam', 0.5)] + rows)
+        with t.column('id') as ids:
+            self.assertEqual(ids.tolist(), [1, 2, 3])
+
+
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestSharedMemoryQueue(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    def make_queue(self, *args, **kwargs):
+        q = self.SharedMemoryQueue(*args, **kwargs)
+        self.addCleanup(q.unlink)
+        self.addCleanup(q.close)
+        return q
+
+    def test_put_get(self):
+        q = self.make_queue(3, slot_size=100)
+        self.assertEqual(q.maxsize, 3)
+        self.assertTrue(q.empty())
+        q.put({'spam': 1})
+        q.put_nowait([1, 2.5])
+        self.assertEqual(q.qsize(), 2)
+        self.assertFalse(q.empty())
+        self.assertFalse(q.full())
+        with self.assertRaisesRegex(ValueError, 'too large'):
+            q.put('x' * 100)
+        q.put(None)
+        self.assertTrue(q.full())
+        self.assertRaises(pyqueue.Full, q.put, 1, False)
+        self.assertRaises(pyqueue.Full, q.put, 1, True, 0.01)
+        self.assertEqual(q.get(), {'spam': 1})
+        self.assertEqual(q.get_nowait(), [1, 2.5])
+        self.assertIsNone(q.get(timeout=support.SHORT_TIMEOUT))
+        self.assertTrue(q.empty())
+        self.assertRaises(pyqueue.Empty, q.get, False)
+        self.assertRaises(pyqueue.Empty, q.get, True, 0.01)
+        # The ring wraps around.
+        for i in range(10):
+            q.put(i)
+            self.assertEqual(q.get(), i)
+
+    def test_records(self):
+        q = self.make_queue(2, record_format='qd')
+        q.put((1, 2.5))
+        with self.assertRaises(struct.error):
+            q.put(('spam', 2.5))
+        # The failed put() didn't take a slot.
+        q.put((-3, 4.0))
+        self.assertTrue(q.full())
+        self.assertEqual(q.get(), (1, 2.5))
+        self.assertEqual(q.get(), (-3, 4.0))
+
+    def test_invalid_arguments(self):
+        for maxsize in (0, -1):
+            with self.assertRaisesRegex(ValueError, 'maxsize'):
+                self.SharedMemoryQueue(maxsize)
+        with self.assertRaisesRegex(ValueError, 'slot_size'):
+            self.SharedMemoryQueue(slot_size=0)
+        with self.assertRaisesRegex(ValueError, 'mutually exclusive'):
+            self.SharedMemoryQueue(slot_size=10, record_format='q')
+
+    def test_closed(self):
+        q = self.make_queue(2)
+        q.close()
+        q.close()
+        with self.assertRaisesRegex(ValueError, 'is closed'):
+            q.put(1)
+        with self.assertRaisesRegex(ValueError, 'is closed'):
+            q.get()
+
+    @classmethod
+    def _produce(cls, q, start, count):
+        for i in range(start, start + count):
+            q.put((i, i / 2))
+
+    def test_multiple_producers(self):
+        q = self.make_queue(5, record_format='qd')
+        procs = [self.Process(target=self._produce, args=(q, i * 100, 100))
+                 for i in range(3)]
+        for p in procs:
+            p.daemon = True
+            p.start()
+        items = [q.get(timeout=support.SHORT_TIMEOUT) for _ in range(300)]
+        for p in procs:
+            join_process(p)
+        self.assertEqual(sorted(items), [(i, i / 2) for i in range(300)])
+        self.assertTrue(q.empty())
+
 #
 # Test to verify that `Finalize` works.
 #
@@ -5854,6 +6265,7 @@ class ProcessesMixin(BaseMixin):
     Pipe = staticmethod(multiprocessing.Pipe)
     Queue = staticmethod(multiprocessing.Queue)
     JoinableQueue = staticmethod(multiprocessing.JoinableQueue)
+    SharedMemoryQueue = staticmethod(multiprocessing.SharedMemoryQueue)
     Lock = staticmethod(multiprocessing.Lock)
     RLock = staticmethod(multiprocessing.RLock)
     Semaphore = staticmethod(multiprocessing.Semaphore)
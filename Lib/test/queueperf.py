@@ -0,0 +1,68 @@
+# It's intended that this script be run by hand.  It runs speed tests on
+# the queue classes with several producer and consumer threads; it does
+# not test for correctness.
+#
+# Usage: queueperf.py [producers [consumers [items]]]
+
+import queue
+import sys
+import threading
+import time
+
+
+def run(q, producers, consumers, items, batch=None):
+    per_producer = items // producers
+    per_consumer = per_producer * producers // consumers
+
+    def produce():
+        if batch is None:
+            put = q.put
+            for i in range(per_producer):
+                put(i)
+        else:
+            put_many = q.put_many
+            for i in range(0, per_producer, batch):
+                put_many(range(i, min(i + batch, per_producer)))
+
+    def consume():
+        if batch is None:
+            get = q.get
+            for _ in range(per_consumer):
+                get()
+        else:
+            get_many = q.get_many
+            count = 0
+            while count < per_consumer:
+                count += len(get_many(min(batch, per_consumer - count)))
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    threads += [threading.Thread(target=consume) for _ in range(consumers)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+def main():
+    producers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    consumers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    items = int(sys.argv[3]) if len(sys.argv) > 3 else 200000
+    print(producers, "producers,", consumers, "consumers,", items, "items")
+    for name, factory in [('Queue()', queue.Queue),
+                          ('Queue(1000)', lambda: queue.Queue(1000)),
+                          ('LifoQueue()', queue.LifoQueue),
+                          ('PriorityQueue()', queue.PriorityQueue)]:
+        for batch in (None, 100):
+            elapsed = run(factory(), producers, consumers, items, batch)
+            how = "put/get" if batch is None else "put_many/get_many(%d)" % batch
+            print("%-16s %-24s %.3f seconds, %.0f items/s"
+                  % (name, how, elapsed, items / elapsed))
+    elapsed = run(queue.SimpleQueue(), producers, consumers, items)
+    print("%-16s %-24s %.3f seconds, %.0f items/s"
+          % ('SimpleQueue()', "put/get", elapsed, items / elapsed))
+
+
+if __name__ == '__main__':
+    main()
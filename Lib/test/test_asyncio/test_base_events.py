@@ -474,6 +474,78 @@ def cb():
         # Ensure only uncancelled events remain scheduled
         self.assertTrue(all([not x._cancelled for x in self.loop._scheduled]))
 
+    def test_timer_wheel_call_later(self):
+        calls = []
+
+        def cb(arg):
+            calls.append(arg)
+
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_wheel(True)
+        self.assertTrue(self.loop.get_timer_wheel())
+        h = self.loop.call_later(10.0, cb, 'x')
+        self.assertIsInstance(h, asyncio.TimerHandle)
+        self.assertTrue(h._scheduled)
+        self.assertFalse(self.loop._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+        self.loop.call_later(-1, cb, 'a')
+        self.loop.call_later(-2, cb, 'b')
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, ['b', 'a'])
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+
+    def test_timer_wheel_time_and_call_at(self):
+        def cb():
+            self.loop.stop()
+
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_wheel(True)
+        delay = 0.1
+
+        when = self.loop.time() + delay
+        self.loop.call_at(when, cb)
+        t0 = self.loop.time()
+        self.loop.run_forever()
+        dt = self.loop.time() - t0
+
+        self.assertGreaterEqual(dt, delay - 0.050, dt)
+        self.assertLessEqual(dt, 0.9, dt)
+
+    def test_timer_wheel_cancel(self):
+        def cb():
+            pass
+
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_wheel(True)
+        handles = [self.loop.call_later(3600, cb) for _ in range(10)]
+        for h in handles[:5]:
+            h.cancel()
+            self.assertFalse(h._scheduled)
+        # Cancelled handles are removed right away.
+        self.assertEqual(len(self.loop._timer_wheel), 5)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+
+    def test_set_timer_wheel_moves_timers(self):
+        calls = []
+
+        def cb(arg):
+            calls.append(arg)
+
+        self.loop._process_events = mock.Mock()
+        self.loop.call_later(-1, cb, 'a')
+        self.loop.call_later(3600, cb, 'b')
+        self.loop.call_later(3600, cb, 'c').cancel()
+        self.loop.set_timer_wheel(True)
+        self.assertFalse(self.loop._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 2)
+
+        self.loop.set_timer_wheel(False)
+        self.assertFalse(self.loop.get_timer_wheel())
+        self.assertEqual(sorted(h._args for h in self.loop._scheduled),
+                         [('a',), ('b',)])
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, ['a'])
+
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError,
             self.loop.run_until_complete, 'blah')
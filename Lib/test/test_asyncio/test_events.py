@@ -2166,6 +2166,14 @@ class EPollEventLoopTests(UnixEventLoopTestsMixin,
             def create_event_loop(self):
                 return asyncio.SelectorEventLoop(selectors.EpollSelector())
 
+    if hasattr(selectors, 'IoUringSelector'):
+        class IoUringEventLoopTests(UnixEventLoopTestsMixin,
+                                    SubprocessTestsMixin,
+                                    test_utils.TestCase):
+
+            def create_event_loop(self):
+                return asyncio.IoUringEventLoop()
+
     if hasattr(selectors, 'PollSelector'):
         class PollEventLoopTests(UnixEventLoopTestsMixin,
                                  SubprocessTestsMixin,
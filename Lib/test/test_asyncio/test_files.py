@@ -0,0 +1,263 @@
+"""Tests for files.py"""
+
+import io
+import os
+import time
+import unittest
+from unittest import mock
+
+import asyncio
+from test import support
+from test.support import os_helper
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+DATA = b''.join(b'line %d\n' % i for i in range(10000))
+
+
+class FileTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(DATA)
+
+    def run_coro(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def open_file(self, *args, **kwargs):
+        return self.run_coro(
+            asyncio.open_file(os_helper.TESTFN, *args, **kwargs))
+
+    def test_read_ahead_default(self):
+        with open(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(asyncio.AsyncFile(f).read_ahead, 2 ** 16)
+        with open(os_helper.TESTFN, 'r+b') as f:
+            self.assertEqual(asyncio.AsyncFile(f).read_ahead, 0)
+            with self.assertRaises(ValueError):
+                asyncio.AsyncFile(f, read_ahead=10)
+        with open(os_helper.TESTFN, 'r') as f:
+            self.assertEqual(asyncio.AsyncFile(f).read_ahead, 0)
+            with self.assertRaises(ValueError):
+                asyncio.AsyncFile(f, read_ahead=10)
+            with self.assertRaises(ValueError):
+                asyncio.AsyncFile(f, read_ahead=-1)
+
+    def test_attributes(self):
+        f = self.open_file('rb')
+        self.assertEqual(f.name, os_helper.TESTFN)
+        self.assertEqual(f.mode, 'rb')
+        self.assertIsInstance(f.fileno(), int)
+        self.assertFalse(f.closed)
+        self.assertIn('BufferedReader', repr(f))
+        self.run_coro(f.close())
+        self.assertTrue(f.closed)
+        # close() can be called more than once.
+        self.run_coro(f.close())
+
+    def test_open_error(self):
+        with self.assertRaises(FileNotFoundError):
+            self.run_coro(asyncio.open_file(os_helper.TESTFN + '.missing'))
+
+    def check_sequential_reads(self, read_ahead):
+        async def main():
+            async with await asyncio.open_file(
+                    os_helper.TESTFN, 'rb', read_ahead=read_ahead) as f:
+                chunks = [await f.read(5), await f.readline(),
+                          await f.readline(3), await f.readline()]
+                buf = bytearray(1000)
+                n = await f.readinto(buf)
+                chunks.append(bytes(buf[:n]))
+                while chunk := await f.read(3000):
+                    chunks.append(chunk)
+                self.assertEqual(await f.read(), b'')
+                self.assertEqual(await f.readline(), b'')
+                self.assertEqual(await f.readinto(buf), 0)
+                return chunks
+
+        chunks = self.run_coro(main())
+        self.assertEqual(chunks[:4], [b'line ', b'0\n', b'lin', b'e 1\n'])
+        self.assertEqual(len(chunks[4]), 1000)
+        self.assertEqual(b''.join(chunks), DATA)
+
+    def test_sequential_reads(self):
+        self.check_sequential_reads(None)
+        self.check_sequential_reads(100)
+
+    def test_sequential_reads_without_read_ahead(self):
+        self.check_sequential_reads(0)
+
+    def test_iteration(self):
+        async def main():
+            async with await asyncio.open_file(
+                    os_helper.TESTFN, 'rb', read_ahead=100) as f:
+                return [line async for line in f]
+
+        self.assertEqual(self.run_coro(main()), DATA.splitlines(True))
+
+    def test_read_all(self):
+        async def main():
+            async with await asyncio.open_file(os_helper.TESTFN, 'rb') as f:
+                start = await f.read(10)
+                return start + await f.read()
+
+        self.assertEqual(self.run_coro(main()), DATA)
+
+    def test_seek_tell(self):
+        async def main():
+            async with await asyncio.open_file(
+                    os_helper.TESTFN, 'rb', read_ahead=1000) as f:
+                self.assertEqual(await f.read(10), DATA[:10])
+                # The read-ahead buffer is not taken into account.
+                self.assertEqual(await f.tell(), 10)
+                self.assertEqual(await f.read(10), DATA[10:20])
+                self.assertEqual(await f.seek(5000), 5000)
+                self.assertEqual(await f.read(10), DATA[5000:5010])
+                self.assertEqual(await f.seek(-10, io.SEEK_CUR), 5000)
+                self.assertEqual(await f.readline(),
+                                 DATA[5000:DATA.index(b'\n', 5000) + 1])
+                self.assertEqual(await f.seek(0, io.SEEK_END), len(DATA))
+                self.assertEqual(await f.read(10), b'')
+
+        self.run_coro(main())
+
+    def test_write(self):
+        async def main():
+            async with await asyncio.open_file(os_helper.TESTFN, 'w+') as f:
+                self.assertEqual(await f.write('spam\n'), 5)
+                await f.writelines(['ham\n', 'eggs\n'])
+                await f.flush()
+                self.assertEqual(await f.tell(), 14)
+                await f.seek(0)
+                self.assertEqual(await f.readline(), 'spam\n')
+                self.assertEqual(await f.read(), 'ham\neggs\n')
+                await f.truncate(4)
+
+        self.run_coro(main())
+        with open(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(f.read(), b'spam')
+
+    def test_concurrent_writes_keep_order(self):
+        async def main():
+            async with await asyncio.open_file(os_helper.TESTFN, 'wb') as f:
+                await asyncio.gather(*[f.write(b'%d,' % i)
+                                       for i in range(100)])
+
+        self.run_coro(main())
+        with open(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(f.read(),
+                             b''.join(b'%d,' % i for i in range(100)))
+
+    def test_operations_run_in_order(self):
+        # Operations started in different loop iterations are not run
+        # concurrently.
+        log = []
+
+        class SlowFile(io.RawIOBase):
+            def readable(self):
+                return True
+
+            def readinto(self, b):
+                log.append(('start', len(b)))
+                if len(log) == 1:
+                    time.sleep(0.1)
+                log.append(('end', len(b)))
+                b[:] = b'x' * len(b)
+                return len(b)
+
+        f = asyncio.AsyncFile(SlowFile(), read_ahead=0)
+
+        async def main():
+            first = asyncio.create_task(f.read(1))
+            await asyncio.sleep(0.01)
+            return await asyncio.gather(first, f.read(2))
+
+        self.assertEqual(self.run_coro(main()), [b'x', b'xx'])
+        self.assertEqual(log, [('start', 1), ('end', 1),
+                               ('start', 2), ('end', 2)])
+
+    def test_batched_submission(self):
+        f1 = self.open_file('rb', read_ahead=0)
+        f2 = self.open_file('rb', read_ahead=0)
+        pool = self.loop._get_file_io_pool()
+
+        async def main():
+            reads = [f.read(10) for f in (f1, f2) for _ in range(5)]
+            return await asyncio.gather(*reads)
+
+        with mock.patch.object(pool._executor, 'submit',
+                               wraps=pool._executor.submit) as submit:
+            results = self.run_coro(main())
+        # One job per file.
+        self.assertEqual(submit.call_count, 2)
+        self.assertEqual(results[:5], results[5:])
+        self.assertEqual(b''.join(results[:5]), DATA[:50])
+        self.run_coro(f1.close())
+        self.run_coro(f2.close())
+
+    def test_error(self):
+        f = self.open_file('rb', read_ahead=0)
+        with self.assertRaises(io.UnsupportedOperation):
+            self.run_coro(f.write(b'spam'))
+        self.run_coro(f.close())
+        with self.assertRaises(ValueError):
+            self.run_coro(f.read())
+
+    def test_cancelled_read_keeps_data(self):
+        f = self.open_file('rb', read_ahead=100)
+
+        async def main():
+            task = asyncio.create_task(f.read(10))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return await f.read(10)
+
+        self.assertEqual(self.run_coro(main()), DATA[:10])
+        self.run_coro(f.close())
+
+    @unittest.skipUnless(hasattr(os, 'pipe'), 'requires os.pipe()')
+    def test_pipe(self):
+        rfd, wfd = os.pipe()
+        r = open(rfd, 'rb')
+        w = open(wfd, 'wb', buffering=0)
+
+        async def main():
+            async with asyncio.AsyncFile(r) as reader:
+                self.assertTrue(reader.read_ahead)
+                async with asyncio.AsyncFile(w) as writer:
+                    task = asyncio.create_task(reader.readline())
+                    await asyncio.sleep(0.01)
+                    self.assertFalse(task.done())
+                    await writer.write(b'spam\nham')
+                    self.assertEqual(await asyncio.wait_for(
+                        task, support.SHORT_TIMEOUT), b'spam\n')
+                self.assertEqual(await reader.read(), b'ham')
+
+        self.run_coro(main())
+
+    def test_shutdown(self):
+        f = self.open_file('rb')
+        self.addCleanup(f._file.close)
+        pool = self.loop._file_io_pool
+        self.assertIsNotNone(pool)
+        self.addCleanup(pool.shutdown, wait=True)
+        self.run_coro(self.loop.shutdown_default_executor())
+        self.assertIsNotNone(self.loop._file_io_pool)
+        self.assertIs(self.loop._default_executor, None)
+        with self.assertRaises(RuntimeError):
+            self.open_file('rb')
+        self.loop.close()
+        self.assertIsNone(self.loop._file_io_pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+"""Tests for metrics.py"""
+
+import math
+import pickle
+import time
+import unittest
+
+import asyncio
+from asyncio import tasks
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class HistogramTests(unittest.TestCase):
+
+    def test_empty(self):
+        h = asyncio.Histogram(1)
+        self.assertEqual(h.count, 0)
+        self.assertEqual(h.total, 0)
+        self.assertIsNone(h.min)
+        self.assertIsNone(h.max)
+        self.assertIsNone(h.mean())
+        self.assertIsNone(h.percentile(50))
+        self.assertIsNone(h.quantile(0.5))
+        self.assertEqual(h.snapshot(),
+                         {'count': 0, 'total': 0, 'min': None, 'max': None,
+                          'buckets': []})
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.Histogram(0)
+        with self.assertRaises(ValueError):
+            asyncio.Histogram(1, nbuckets=0)
+        with self.assertRaises(ValueError):
+            asyncio.Histogram(1).percentile(101)
+
+    def test_buckets(self):
+        h = asyncio.Histogram(1, nbuckets=5)
+        for value in (0, 1, 1.5, 2, 3, 4, 7, 100):
+            h.add(value)
+        self.assertEqual(h.buckets(),
+                         [(1, 1), (2, 2), (4, 2), (8, 2), (math.inf, 1)])
+        self.assertEqual(h.count, 8)
+        self.assertEqual(h.total, 118.5)
+        self.assertEqual(h.min, 0)
+        self.assertEqual(h.max, 100)
+        self.assertEqual(h.mean(), 118.5 / 8)
+        self.assertEqual(h.snapshot()['buckets'],
+                         [(1, 1), (2, 2), (4, 2), (8, 2), (math.inf, 1)])
+
+    def test_percentile(self):
+        h = asyncio.Histogram(1)
+        for value in range(1, 101):
+            h.add(value)
+        self.assertEqual(h.percentile(0), 2)
+        self.assertEqual(h.percentile(50), 64)
+        self.assertEqual(h.percentile(100), 100)
+        self.assertEqual(h.quantile(0.5), 64)
+
+    def test_same_as_executor_stats(self):
+        # The histograms of asyncio and of concurrent.futures share their
+        # implementation.
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            stats = executor.stats()
+        h = asyncio.Histogram(2.0 ** -20, nbuckets=34)
+        self.assertEqual(h.buckets(), stats.run_time.buckets())
+        self.assertEqual(h.snapshot(), stats.run_time.snapshot())
+        self.assertIsNone(stats.run_time.mean())
+
+    def test_clear(self):
+        h = asyncio.Histogram(1e-6)
+        h.add(0.5)
+        h.clear()
+        self.assertEqual(h.count, 0)
+        self.assertIsNone(h.max)
+        self.assertEqual(h.snapshot()['buckets'], [])
+
+
+class BaseLoopMetricsTests:
+
+    Task = None
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        if self.Task is not None:
+            self.loop.set_task_factory(
+                lambda loop, coro, **kwargs: self.Task(coro, loop=loop,
+                                                       **kwargs))
+        self.metrics = asyncio.LoopMetrics(slow_callback_duration=0.05)
+        self.loop.set_metrics(self.metrics)
+
+    def test_set_metrics(self):
+        self.assertIs(self.loop.get_metrics(), self.metrics)
+        with self.assertRaises(TypeError):
+            self.loop.set_metrics(object())
+        self.loop.set_metrics(None)
+        self.assertIsNone(self.loop.get_metrics())
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(self.metrics.iterations, 0)
+
+    def test_callbacks(self):
+        calls = []
+        for i in range(3):
+            self.loop.call_soon(calls.append, i)
+        self.loop.call_soon(self.loop.call_soon, calls.append, 3)
+        self.loop.call_soon(calls.append, 4).cancel()
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(calls, [0, 1, 2, 3])
+
+        m = self.metrics
+        self.assertGreaterEqual(m.iterations, 2)
+        self.assertEqual(m.select_time.count, m.iterations)
+        self.assertEqual(m.ready_depth.count, m.iterations)
+        self.assertGreaterEqual(m.ready_depth.max, 5)
+        # Cancelled handles are not run.
+        self.assertGreaterEqual(m.callback_time.count, 5)
+        self.assertEqual(m.slow_callbacks, 0)
+        self.assertIsNotNone(m.slowest_callback)
+
+    def test_slow_callback(self):
+        def slow():
+            time.sleep(0.06)
+
+        self.loop.call_soon(slow)
+        test_utils.run_briefly(self.loop)
+        m = self.metrics
+        self.assertEqual(m.slow_callbacks, 1)
+        duration, description = m.slowest_callback
+        self.assertGreaterEqual(duration, 0.05)
+        self.assertIn('slow', description)
+
+    def test_select_time(self):
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertGreaterEqual(self.metrics.select_time.max, 0.02)
+
+    def test_task_cpu_time(self):
+        def spin(seconds):
+            deadline = time.thread_time() + seconds
+            while time.thread_time() < deadline:
+                pass
+
+        async def worker(fut):
+            spin(0.01)
+            await fut
+            spin(0.01)
+
+        async def main():
+            fut = self.loop.create_future()
+            task = self.loop.create_task(worker(fut))
+            await asyncio.sleep(0)
+            running = self.metrics.task_cpu_times()
+            self.assertIn(task, running)
+            self.assertGreaterEqual(running[task], 0.01)
+            fut.set_result(None)
+            await task
+            self.assertNotIn(task, self.metrics.task_cpu_times())
+
+        self.loop.run_until_complete(main())
+        m = self.metrics
+        # worker() and main() both finished.
+        self.assertEqual(m.task_cpu_time.count, 2)
+        self.assertGreaterEqual(m.task_cpu_time.max, 0.02)
+        self.assertEqual(m.snapshot()['tasks_running'], 0)
+
+    def test_snapshot(self):
+        self.loop.run_until_complete(asyncio.sleep(0))
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['iterations'], self.metrics.iterations)
+        self.assertEqual(snapshot['callback_time']['count'],
+                         self.metrics.callback_time.count)
+        self.assertEqual(pickle.loads(pickle.dumps(snapshot)), snapshot)
+
+    def test_clear(self):
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.metrics.clear()
+        self.assertEqual(self.metrics.iterations, 0)
+        self.assertEqual(self.metrics.callback_time.count, 0)
+        self.assertIsNone(self.metrics.slowest_callback)
+
+    def test_debug_mode(self):
+        self.loop.set_debug(True)
+        self.loop.call_soon(lambda: None)
+        test_utils.run_briefly(self.loop)
+        self.assertGreaterEqual(self.metrics.callback_time.count, 2)
+
+
+class PyTaskLoopMetricsTests(BaseLoopMetricsTests, test_utils.TestCase):
+    Task = tasks._PyTask
+
+
+@unittest.skipUnless(hasattr(tasks, '_CTask'),
+                     'requires the C _asyncio module')
+class CTaskLoopMetricsTests(BaseLoopMetricsTests, test_utils.TestCase):
+    Task = getattr(tasks, '_CTask', None)
+
+
+if __name__ == '__main__':
+    unittest.main()
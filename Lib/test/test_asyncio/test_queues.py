@@ -3,6 +3,7 @@
 import asyncio
 import unittest
 from types import GenericAlias
+from test import support
 
 
 def tearDownModule():
@@ -432,6 +433,180 @@ async def test_cancelled_put_silence_value_error_exception(self):
             await put_task
 
 
+class QueueBatchTests(unittest.IsolatedAsyncioTestCase):
+
+    def test_nonblocking_get_many(self):
+        q = asyncio.Queue()
+        with self.assertRaises(asyncio.QueueEmpty):
+            q.get_many_nowait()
+        for i in range(5):
+            q.put_nowait(i)
+        self.assertEqual(q.get_many_nowait(3), [0, 1, 2])
+        self.assertEqual(q.get_many_nowait(), [3, 4])
+        with self.assertRaises(ValueError):
+            q.get_many_nowait(0)
+
+    def test_nonblocking_put_many(self):
+        q = asyncio.Queue(maxsize=3)
+        q.put_many_nowait([1, 2])
+        # All or nothing.
+        with self.assertRaises(asyncio.QueueFull):
+            q.put_many_nowait([3, 4])
+        self.assertEqual(q.qsize(), 2)
+        q.put_many_nowait(iter([3]))
+        self.assertEqual(q.get_many_nowait(), [1, 2, 3])
+
+    async def test_get_many_returns_available_items(self):
+        q = asyncio.Queue()
+        q.put_nowait(1)
+        self.assertEqual(await q.get_many(10), [1])
+
+    async def test_get_many_single_wakeup(self):
+        q = asyncio.Queue()
+        wakeups = 0
+
+        async def consumer():
+            nonlocal wakeups
+            while True:
+                items = await q.get_many()
+                wakeups += 1
+                if None in items:
+                    return items
+
+        task = asyncio.create_task(consumer())
+        await asyncio.sleep(0)
+        await q.put_many([1, 2, 3, None])
+        self.assertEqual(await task, [1, 2, 3, None])
+        self.assertEqual(wakeups, 1)
+
+    async def test_put_many_wakes_one_getter_per_item(self):
+        q = asyncio.Queue()
+        getters = [asyncio.create_task(q.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        await q.put_many([1, 2])
+        await asyncio.sleep(0)
+        self.assertEqual([g.done() for g in getters], [True, True, False])
+        self.assertEqual(len(q._getters), 1)
+        q.put_nowait(3)
+        self.assertEqual(await asyncio.gather(*getters), [1, 2, 3])
+
+    async def test_put_many_blocks_when_full(self):
+        q = asyncio.Queue(maxsize=2)
+        task = asyncio.create_task(q.put_many(range(5)))
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+        self.assertEqual(q.qsize(), 2)
+        items = []
+        while len(items) < 5:
+            items.extend(await q.get_many())
+        await task
+        self.assertEqual(items, [0, 1, 2, 3, 4])
+        self.assertEqual(q._unfinished_tasks, 5)
+
+    async def test_get_many_wakes_putters(self):
+        q = asyncio.Queue(maxsize=2)
+        q.put_nowait(0)
+        q.put_nowait(1)
+        putters = [asyncio.create_task(q.put(i)) for i in (2, 3)]
+        await asyncio.sleep(0)
+        self.assertEqual(q.get_many_nowait(), [0, 1])
+        await asyncio.gather(*putters)
+        self.assertEqual(q.get_many_nowait(), [2, 3])
+
+    async def test_get_many_timeout_empty(self):
+        q = asyncio.Queue()
+        self.assertEqual(await q.get_many(10, timeout=0.01), [])
+        self.assertEqual(await q.get_many(timeout=0), [])
+        self.assertEqual(len(q._getters), 0)
+
+    async def test_get_many_timeout_fills_batch(self):
+        q = asyncio.Queue()
+
+        async def producer():
+            for i in range(5):
+                await asyncio.sleep(0)
+                q.put_nowait(i)
+
+        task = asyncio.create_task(producer())
+        items = await q.get_many(5, timeout=support.SHORT_TIMEOUT)
+        await task
+        self.assertEqual(items, [0, 1, 2, 3, 4])
+        self.assertEqual(q._batch_getters, [])
+
+    async def test_get_many_timeout_partial_batch(self):
+        q = asyncio.Queue()
+        q.put_nowait(1)
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        self.assertEqual(await q.get_many(5, timeout=0.05), [1])
+        self.assertGreaterEqual(loop.time() - t0, 0.04)
+        self.assertEqual(q._batch_getters, [])
+
+    async def test_get_many_cancelled(self):
+        q = asyncio.Queue()
+        task = asyncio.create_task(q.get_many(5, timeout=10))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(len(q._getters), 0)
+
+        q.put_nowait(1)
+        task = asyncio.create_task(q.get_many(5, timeout=10))
+        await asyncio.sleep(0)
+        self.assertEqual(len(q._batch_getters), 1)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(q._batch_getters, [])
+        self.assertEqual(q.get_nowait(), 1)
+
+    async def test_get_many_cancelled_wakes_getter(self):
+        q = asyncio.Queue()
+        task = asyncio.create_task(q.get_many(10, timeout=10))
+        await asyncio.sleep(0)
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        q.put_nowait('x')
+        await asyncio.sleep(0)
+        self.assertEqual(len(q._batch_getters), 1)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(await asyncio.wait_for(getter, support.SHORT_TIMEOUT),
+                         'x')
+
+    async def test_get_many_items_taken_while_filling(self):
+        q = asyncio.Queue()
+        task = asyncio.create_task(q.get_many(2,
+                                              timeout=support.SHORT_TIMEOUT))
+        q.put_nowait(1)
+        await asyncio.sleep(0)
+        self.assertEqual(len(q._batch_getters), 1)
+        q.put_nowait(2)
+        self.assertEqual(q.get_many_nowait(), [1, 2])
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+        q.put_many_nowait([3, 4])
+        self.assertEqual(await task, [3, 4])
+
+        task = asyncio.create_task(q.get_many(5, timeout=0.05))
+        q.put_nowait(1)
+        await asyncio.sleep(0)
+        self.assertEqual(q.get_nowait(), 1)
+        self.assertEqual(await task, [])
+
+    async def test_put_many_cancelled(self):
+        q = asyncio.Queue(maxsize=1)
+        task = asyncio.create_task(q.put_many([1, 2, 3]))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(len(q._putters), 0)
+        self.assertEqual(q.get_nowait(), 1)
+
+
 class LifoQueueTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_order(self):
@@ -442,6 +617,11 @@ async def test_order(self):
         items = [await q.get() for _ in range(3)]
         self.assertEqual([2, 3, 1], items)
 
+    async def test_batch_order(self):
+        q = asyncio.LifoQueue()
+        await q.put_many([1, 3, 2])
+        self.assertEqual(await q.get_many(), [2, 3, 1])
+
 
 class PriorityQueueTests(unittest.IsolatedAsyncioTestCase):
 
@@ -453,6 +633,11 @@ async def test_order(self):
         items = [await q.get() for _ in range(3)]
         self.assertEqual([1, 2, 3], items)
 
+    async def test_batch_order(self):
+        q = asyncio.PriorityQueue()
+        await q.put_many([1, 3, 2])
+        self.assertEqual(await q.get_many(2), [1, 2])
+
 
 class _QueueJoinTestMixin:
 
@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import array
 import collections
 import selectors
 import socket
@@ -906,7 +907,8 @@ def test_write_ready_tryagain(self):
         transport._write_ready()
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(buffer, transport._buffer)
+        self.assertEqual(list_to_buffer([b'data1', b'data2']),
+                         transport._buffer)
 
     def test_write_ready_exception(self):
         err = self.sock.send.side_effect = OSError()
@@ -942,6 +944,119 @@ def test_write_eof_buffer(self):
         self.sock.shutdown.assert_called_with(socket.SHUT_WR)
         tr.close()
 
+    def test_write_buffer_size(self):
+        self.sock.send.return_value = 2
+        transport = self.socket_transport()
+        transport.write(b'data')
+        self.assertEqual(2, transport.get_write_buffer_size())
+        transport.write(b'data')
+        self.assertEqual(6, transport.get_write_buffer_size())
+
+        self.sock.send.return_value = 1
+        transport._write_ready()
+        self.assertEqual(5, transport.get_write_buffer_size())
+        self.assertEqual(list_to_buffer([b'a', b'data']), transport._buffer)
+
+    def test_write_partial_keeps_memoryview(self):
+        data = b'data'
+        self.sock.send.return_value = 2
+
+        transport = self.socket_transport()
+        transport.write(data)
+        self.assertIs(data, transport._buffer[0].obj)
+        self.sock.send.return_value = 1
+        transport._write_ready()
+        # A second partial send slices the view without copying.
+        self.assertIs(data, transport._buffer[0].obj)
+        self.assertEqual(list_to_buffer([b'a']), transport._buffer)
+
+    def test_write_buffer_bytearray_copied(self):
+        data = bytearray(b'data2')
+        transport = self.socket_transport()
+        transport._buffer.append(memoryview(b'data1'))
+        transport.write(data)
+        data[:] = b'xxxxx'
+        self.assertEqual(list_to_buffer([b'data1', b'data2']),
+                         transport._buffer)
+
+    def test_write_buffer_array_as_bytes(self):
+        data = array.array('i', [1, 2])
+        transport = self.socket_transport()
+        transport._buffer.append(memoryview(b'data'))
+        transport.write(memoryview(data))
+        self.assertEqual(data.itemsize * 2, len(transport._buffer[1]))
+        self.assertEqual(data.tobytes(), transport._buffer[1])
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_full(self):
+        data = [b'header', memoryview(b'body')]
+        sent = []
+        def sendmsg(buffers):
+            sent.extend(buffers)
+            return 10
+        self.sock.sendmsg = mock.Mock(side_effect=sendmsg)
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines(data)
+        self.sock.sendmsg.assert_called_once()
+        self.assertEqual([b'header', b'body'], sent)
+        self.assertFalse(self.loop.writers)
+        self.assertFalse(transport._buffer)
+        self.assertEqual(0, transport.get_write_buffer_size())
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_partial(self):
+        data = [b'header', b'body']
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 8
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines(data)
+        self.assertTrue(self.sock.sendmsg.called)
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_buffer([b'dy']), transport._buffer)
+        self.assertIs(data[1], transport._buffer[0].obj)
+        self.assertEqual(2, transport.get_write_buffer_size())
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_pauses_protocol(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.side_effect = BlockingIOError
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_buffer_limits(high=4)
+        transport.writelines([b'data', b'data'])
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(8, transport.get_write_buffer_size())
+        self.assertTrue(self.protocol.pause_writing.called)
+
+    def test_writelines_send_partial(self):
+        self.sock.send.return_value = 2
+
+        transport = self.socket_transport()
+        transport.writelines([b'data1', b'data2', b''])
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_buffer([b'ta1', b'data2']),
+                         transport._buffer)
+        self.assertEqual(8, transport.get_write_buffer_size())
+
+    def test_writelines_bytearray_copied(self):
+        data = bytearray(b'data')
+        self.sock.send.side_effect = BlockingIOError
+
+        transport = self.socket_transport()
+        transport.writelines([data])
+        data[:] = b'xxxx'
+        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+
+    def test_writelines_closing(self):
+        transport = self.socket_transport()
+        transport.close()
+        self.assertEqual(transport._conn_lost, 1)
+        transport.writelines([b'data'])
+        self.assertEqual(transport._conn_lost, 2)
+        self.assertFalse(transport._buffer)
+
     def test_write_eof_after_close(self):
         tr = self.socket_transport()
         tr.close()
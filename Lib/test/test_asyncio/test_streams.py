@@ -66,6 +66,20 @@ def test_open_unix_connection(self):
             conn_fut = asyncio.open_unix_connection(httpd.address)
             self._basetest_open_connection(conn_fut)
 
+    def test_open_connection_zero_copy(self):
+        with test_utils.run_test_server() as httpd:
+            conn_fut = asyncio.open_connection(*httpd.address,
+                                               zero_copy=True)
+            reader, writer = self.loop.run_until_complete(conn_fut)
+            self.assertTrue(reader._zero_copy)
+            writer.write(b'GET / HTTP/1.0\r\n\r\n')
+            data = self.loop.run_until_complete(reader.readline())
+            self.assertIsInstance(data, memoryview)
+            self.assertEqual(data, b'HTTP/1.0 200 OK\r\n')
+            data = self.loop.run_until_complete(reader.read())
+            self.assertTrue(bytes(data).endswith(b'\r\n\r\nTest message'))
+            writer.close()
+
     def _basetest_open_connection_no_loop_ssl(self, open_connection_fut):
         messages = []
         self.loop.set_exception_handler(lambda loop, ctx: messages.append(ctx))
@@ -534,6 +548,266 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(5)
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(self.DATA)
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(5, n)
+        self.assertEqual(b'line1', buf)
+        self.assertEqual(self.DATA[5:], stream._buffer)
+
+    def test_readinto_short(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        buf = bytearray(10)
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)))
+        self.assertEqual(4, n)
+        self.assertEqual(b'data', buf[:n])
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_eof()
+        buf = bytearray(10)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(0, n)
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(0, n)
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete,
+            stream.readinto(bytearray(2)))
+
+    def test_zero_copy_read(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        chunk = b'line1line2'
+        stream.feed_data(chunk)
+        stream.feed_data(b'line3')
+
+        data = self.loop.run_until_complete(stream.read(5))
+        self.assertIsInstance(data, memoryview)
+        self.assertIs(chunk, data.obj)
+        self.assertEqual(b'line1', data)
+
+        # read() never joins chunks in zero-copy mode.
+        data = self.loop.run_until_complete(stream.read(100))
+        self.assertIs(chunk, data.obj)
+        self.assertEqual(b'line2', data)
+
+        stream.feed_eof()
+        data = self.loop.run_until_complete(stream.read())
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(b'line3', data)
+        self.assertTrue(stream.at_eof())
+
+    def test_zero_copy_copies_mutable_data(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        buf = bytearray(b'data')
+        stream.feed_data(buf)
+        buf[:] = b'xxxx'
+        data = self.loop.run_until_complete(stream.read(4))
+        self.assertEqual(b'data', data)
+
+    def test_zero_copy_readexactly(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        stream.feed_data(b'\x00\x04dataAB')
+        stream.feed_data(b'CD')
+
+        header = self.loop.run_until_complete(stream.readexactly(2))
+        self.assertIsInstance(header, memoryview)
+        self.assertEqual(b'\x00\x04', header)
+        data = self.loop.run_until_complete(stream.readexactly(4))
+        self.assertEqual(b'data', data)
+        # Spans two chunks.
+        data = self.loop.run_until_complete(stream.readexactly(4))
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(b'ABCD', data)
+        self.assertEqual(0, len(stream._buffer))
+
+    def test_zero_copy_readexactly_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        stream.feed_data(b'ab')
+        stream.feed_data(b'c')
+        stream.feed_eof()
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readexactly(10))
+        self.assertIsInstance(cm.exception.partial, memoryview)
+        self.assertEqual(b'abc', cm.exception.partial)
+        self.assertEqual(0, len(stream._buffer))
+
+    def test_zero_copy_eof(self):
+        # The data returned at EOF is a memoryview too.
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        stream.feed_data(b'li')
+        stream.feed_data(b'ne1')
+        stream.feed_eof()
+        data = self.loop.run_until_complete(stream.readline())
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(b'line1', data)
+        for coro in (stream.readline(), stream.read(), stream.read(1),
+                     stream.read(0), stream.readexactly(0)):
+            data = self.loop.run_until_complete(coro)
+            self.assertIsInstance(data, memoryview)
+            self.assertEqual(b'', data)
+
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        stream.feed_data(b'data')
+        stream.feed_data(b'\r')
+        stream.feed_eof()
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readuntil(b'\r\n'))
+        self.assertIsInstance(cm.exception.partial, memoryview)
+        self.assertEqual(b'data\r', cm.exception.partial)
+        self.assertEqual(0, len(stream._buffer))
+
+    def test_zero_copy_readuntil(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        for chunk in (b'lin', b'e1\r', b'\n', b'line2\r\nxx', b'\r', b'\r\n'):
+            stream.feed_data(chunk)
+
+        data = self.loop.run_until_complete(stream.readuntil(b'\r\n'))
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(b'line1\r\n', data)
+        data = self.loop.run_until_complete(stream.readuntil(b'\r\n'))
+        self.assertEqual(b'line2\r\n', data)
+        data = self.loop.run_until_complete(stream.readuntil(b'\r\n'))
+        self.assertEqual(b'xx\r\r\n', data)
+
+    def test_zero_copy_readuntil_long_separator(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        for chunk in (b'dataS', b'E', b'P', b'SEP'):
+            stream.feed_data(chunk)
+
+        data = self.loop.run_until_complete(stream.readuntil(b'SEPSEP'))
+        self.assertEqual(b'dataSEPSEP', data)
+
+    def test_zero_copy_readline_limit(self):
+        stream = asyncio.StreamReader(limit=3, loop=self.loop, zero_copy=True)
+        stream.feed_data(b'li')
+        stream.feed_data(b'ne1\nline2\n')
+
+        self.assertRaises(
+            ValueError, self.loop.run_until_complete, stream.readline())
+        self.assertEqual(b'line2\n', bytes(stream._buffer))
+
+    def test_zero_copy_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        stream.feed_data(b'line1')
+        stream.feed_data(b'line2')
+        buf = bytearray(7)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(7, n)
+        self.assertEqual(b'line1li', buf)
+        self.assertEqual(b'ne2', bytes(stream._buffer))
+
+    def test_zero_copy_async_iterator(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        stream.feed_data(b'line1\nli')
+        stream.feed_data(b'ne2\n')
+        stream.feed_eof()
+
+        async def reader():
+            return [bytes(line) async for line in stream]
+
+        lines = self.loop.run_until_complete(reader())
+        self.assertEqual([b'line1\n', b'line2\n'], lines)
+
+    def test_buffer_updated(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = stream._get_buffer(-1)
+        self.assertGreater(len(buf), len(self.DATA))
+        buf[:len(self.DATA)] = self.DATA
+        stream._buffer_updated(len(self.DATA))
+        self.assertEqual(self.DATA, stream._buffer)
+        # The receive buffer is reused.
+        self.assertIs(buf, stream._get_buffer(-1))
+
+        data = self.loop.run_until_complete(stream.readline())
+        self.assertEqual(b'line1\n', data)
+
+    def test_buffer_updated_pauses_transport(self):
+        stream = asyncio.StreamReader(limit=4, loop=self.loop)
+        transport = mock.Mock()
+        stream.set_transport(transport)
+        buf = stream._get_buffer(-1)
+        buf[:9] = b'123456789'
+        stream._buffer_updated(9)
+        transport.pause_reading.assert_called_once_with()
+        self.assertTrue(stream._paused)
+
+    def test_zero_copy_buffer_updated(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        buf = stream._get_buffer(-1)
+        buf[:5] = b'line1'
+        stream._buffer_updated(5)
+        buf2 = stream._get_buffer(-1)
+        buf2[:5] = b'line2'
+        stream._buffer_updated(5)
+
+        data = self.loop.run_until_complete(stream.readexactly(5))
+        self.assertEqual(b'line1', data)
+        self.assertTrue(data.readonly)
+        # Both reads landed in the same arena, so this needs no copy.
+        self.assertIs(data.obj, buf.obj)
+        data = self.loop.run_until_complete(stream.readexactly(5))
+        self.assertEqual(b'line2', data)
+        self.assertIs(data.obj, buf.obj)
+
+    def test_zero_copy_buffer_updated_new_arena(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        buf = stream._get_buffer(-1)
+        size = len(buf)
+        buf[:] = b'x' * size
+        stream._buffer_updated(size)
+        buf2 = stream._get_buffer(-1)
+        self.assertIsNot(buf.obj, buf2.obj)
+        buf2[:2] = b'yy'
+        stream._buffer_updated(2)
+
+        data = self.loop.run_until_complete(stream.read(size + 2))
+        self.assertEqual(b'x' * size, data)
+        # Data that was already received is not overwritten.
+        self.assertEqual(b'x', bytes(buf[-1:]))
+        data = self.loop.run_until_complete(stream.read(2))
+        self.assertEqual(b'yy', data)
+
+    def test_buffered_protocol(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+        protocol.connection_made(mock.Mock())
+
+        asyncio.protocols._feed_data_to_buffered_proto(protocol, self.DATA)
+        self.assertEqual(self.DATA, stream._buffer)
+
+    def test_buffered_protocol_reader_gone(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.streams._BufferedStreamReaderProtocol(
+            stream, loop=self.loop)
+        del stream
+        gc.collect()
+
+        buf = protocol.get_buffer(-1)
+        self.assertTrue(len(buf))
+        protocol.buffer_updated(len(buf))
+
+    def test_open_connection_buffered_protocol(self):
+        with test_utils.run_test_server() as httpd:
+            conn_fut = asyncio.open_connection(*httpd.address)
+            reader, writer = self.loop.run_until_complete(conn_fut)
+            self.assertIsInstance(writer._protocol, asyncio.BufferedProtocol)
+            writer.close()
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
@@ -932,6 +1206,11 @@ def test___repr__nondefault_limit(self):
         stream = asyncio.StreamReader(loop=self.loop, limit=123)
         self.assertEqual("<StreamReader limit=123>", repr(stream))
 
+    def test___repr__zero_copy(self):
+        stream = asyncio.StreamReader(loop=self.loop, zero_copy=True)
+        stream.feed_data(b'data')
+        self.assertEqual("<StreamReader 4 bytes zero_copy>", repr(stream))
+
     def test___repr__eof(self):
         stream = asyncio.StreamReader(loop=self.loop)
         stream.feed_eof()
@@ -0,0 +1,176 @@
+"""Tests for timerwheel.py"""
+
+import heapq
+import random
+import unittest
+from unittest import mock
+
+import asyncio
+from asyncio import timerwheel
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class TimerWheelTests(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = mock.Mock()
+
+    def handle(self, when):
+        return asyncio.TimerHandle(when, lambda: None, (), self.loop)
+
+    def test_resolution(self):
+        wheel = timerwheel.TimerWheel(0, resolution=0.01)
+        self.assertEqual(wheel.resolution, 0.01)
+        with self.assertRaises(ValueError):
+            timerwheel.TimerWheel(0, resolution=0)
+
+    def test_empty(self):
+        wheel = timerwheel.TimerWheel(10.0)
+        self.assertEqual(len(wheel), 0)
+        self.assertFalse(wheel)
+        self.assertIsNone(wheel.next_deadline())
+        self.assertEqual(wheel.pop_expired(1e6), [])
+
+    def test_add_and_pop(self):
+        wheel = timerwheel.TimerWheel(10.0)
+        h1 = self.handle(10.5)
+        h2 = self.handle(10.2)
+        h3 = self.handle(20.0)
+        for h in (h1, h2, h3):
+            wheel.add(h)
+        self.assertEqual(len(wheel), 3)
+        self.assertEqual(wheel.pop_expired(10.1), [])
+        self.assertEqual(wheel.pop_expired(10.6), [h2, h1])
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.pop_expired(20.0), [])
+        self.assertEqual(wheel.pop_expired(20.0001), [h3])
+        self.assertFalse(wheel)
+
+    def test_add_twice(self):
+        wheel = timerwheel.TimerWheel(0)
+        h = self.handle(1)
+        wheel.add(h)
+        with self.assertRaises(ValueError):
+            wheel.add(h)
+
+    def test_equal_handles(self):
+        # TimerHandles with the same time and callback compare equal,
+        # the wheel must still keep them apart.
+        wheel = timerwheel.TimerWheel(0)
+        cb = lambda: None
+        h1 = asyncio.TimerHandle(1.0, cb, (), self.loop)
+        h2 = asyncio.TimerHandle(1.0, cb, (), self.loop)
+        self.assertEqual(h1, h2)
+        wheel.add(h1)
+        wheel.add(h2)
+        wheel.discard(h1)
+        self.assertEqual(len(wheel), 1)
+        expired = wheel.pop_expired(2.0)
+        self.assertEqual(len(expired), 1)
+        self.assertIs(expired[0], h2)
+
+    def test_past_deadline(self):
+        wheel = timerwheel.TimerWheel(100.0)
+        h = self.handle(50.0)
+        wheel.add(h)
+        self.assertEqual(wheel.next_deadline(), 50.0)
+        self.assertEqual(wheel.pop_expired(100.0), [h])
+
+    def test_discard(self):
+        wheel = timerwheel.TimerWheel(0)
+        h1 = self.handle(5)
+        h2 = self.handle(5000)
+        wheel.add(h1)
+        wheel.add(h2)
+        wheel.discard(h1)
+        wheel.discard(h1)
+        wheel.discard(self.handle(1))
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(list(wheel), [h2])
+        self.assertEqual(wheel.pop_expired(1e9), [h2])
+
+    def test_clear(self):
+        wheel = timerwheel.TimerWheel(0)
+        for when in (1, 100, 1e6, 1e12):
+            wheel.add(self.handle(when))
+        wheel.clear()
+        self.assertFalse(wheel)
+        self.assertIsNone(wheel.next_deadline())
+
+    def test_next_deadline(self):
+        wheel = timerwheel.TimerWheel(0)
+        h = self.handle(0.1005)
+        wheel.add(h)
+        # Level 0: the exact deadline is known.
+        self.assertEqual(wheel.next_deadline(), 0.1005)
+
+        wheel = timerwheel.TimerWheel(0)
+        wheel.add(self.handle(100))
+        # Further away the deadline is the start of the slot to cascade,
+        # which is never later than the timer.
+        deadline = wheel.next_deadline()
+        self.assertGreater(deadline, 0)
+        self.assertLessEqual(deadline, 100)
+        self.assertEqual(wheel.pop_expired(deadline), [])
+        # Eventually the exact deadline is found.
+        for _ in range(10):
+            deadline = wheel.next_deadline()
+            if deadline == 100:
+                break
+            self.assertEqual(wheel.pop_expired(deadline), [])
+        self.assertEqual(deadline, 100)
+
+    def test_overflow(self):
+        wheel = timerwheel.TimerWheel(0, resolution=1.0)
+        far = self.handle(2.0 ** 40)
+        never = self.handle(float('inf'))
+        wheel.add(far)
+        wheel.add(never)
+        self.assertEqual(len(wheel), 2)
+        self.assertEqual(wheel.pop_expired(2.0 ** 40), [])
+        self.assertEqual(wheel.pop_expired(2.0 ** 40 + 1), [far])
+        self.assertEqual(wheel.pop_expired(1e300), [])
+        self.assertEqual(list(wheel), [never])
+
+    def test_random_against_heap(self):
+        rng = random.Random(42)
+        now = 1000.0
+        wheel = timerwheel.TimerWheel(now)
+        heap = []
+        for _ in range(200):
+            for _ in range(rng.randrange(20)):
+                delay = rng.choice([0.0005, 0.01, 0.3, 5, 70, 5000])
+                h = self.handle(now + rng.random() * delay)
+                wheel.add(h)
+                heapq.heappush(heap, h)
+            for h in rng.sample(heap, min(len(heap), rng.randrange(5))):
+                if not h._cancelled:
+                    h._cancelled = True
+                    wheel.discard(h)
+
+            now += rng.choice([0, 0.0003, 0.002, 0.05, 1, 100])
+            expected = []
+            while heap and heap[0]._when < now:
+                h = heapq.heappop(heap)
+                if not h._cancelled:
+                    expected.append(h)
+            expired = wheel.pop_expired(now)
+            self.assertEqual([h._when for h in expired],
+                             [h._when for h in expected])
+            self.assertEqual(len(wheel),
+                             sum(not h._cancelled for h in heap))
+
+            deadline = wheel.next_deadline()
+            pending = [h._when for h in heap if not h._cancelled]
+            if pending:
+                self.assertLessEqual(deadline, min(pending))
+            else:
+                self.assertIsNone(deadline)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@
 import multiprocessing
 import os
 import pathlib
+import selectors
 import signal
 import socket
 import stat
@@ -14,6 +15,7 @@
 import unittest
 from unittest import mock
 import warnings
+from test import support
 from test.support import os_helper
 from test.support import socket_helper
 from test.support import wait_process
@@ -656,6 +658,181 @@ def test_sock_sendfile_exception(self):
         self.assertEqual(1000, self.file.tell())
 
 
+class IoUringEventLoopTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.IoUringEventLoop()
+        self.set_event_loop(self.loop)
+
+    def require_io_uring(self):
+        if not self.loop._io_uring:
+            self.skipTest('io_uring is not available')
+
+    def socketpair(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        a.setblocking(False)
+        b.setblocking(False)
+        return a, b
+
+    def test_fallback(self):
+        with mock.patch('select.io_uring', create=True,
+                        side_effect=OSError(errno.ENOSYS, 'not supported')):
+            loop = asyncio.IoUringEventLoop()
+        self.addCleanup(loop.close)
+        self.assertFalse(loop._io_uring)
+        self.assertIsInstance(loop._selector, selectors.DefaultSelector)
+
+        a, b = self.socketpair()
+        b.send(b'data')
+        self.assertEqual(loop.run_until_complete(loop.sock_recv(a, 10)),
+                         b'data')
+
+    def test_custom_selector(self):
+        loop = asyncio.IoUringEventLoop(selectors.SelectSelector())
+        self.addCleanup(loop.close)
+        self.assertFalse(loop._io_uring)
+
+    def test_sock_recv_cancel(self):
+        self.require_io_uring()
+        a, b = self.socketpair()
+
+        async def main():
+            task = asyncio.create_task(self.loop.sock_recv(a, 10))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0)
+            # The cancelled operation didn't consume the data.
+            b.send(b'data')
+            return await self.loop.sock_recv(a, 10)
+
+        self.assertEqual(self.loop.run_until_complete(main()), b'data')
+
+    def test_sock_recv_cancel_after_completion(self):
+        # The recv operation completes in the kernel before it is
+        # cancelled: the data is returned by the next receive calls.
+        self.require_io_uring()
+        a, b = self.socketpair()
+
+        async def main():
+            task = asyncio.create_task(self.loop.sock_recv(a, 10))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)  # The operation is submitted.
+            b.send(b'data')
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            buf = bytearray(2)
+            nbytes = await asyncio.wait_for(
+                self.loop.sock_recv_into(a, buf), support.SHORT_TIMEOUT)
+            b.send(b'more')
+            rest = await asyncio.wait_for(self.loop.sock_recv(a, 10),
+                                          support.SHORT_TIMEOUT)
+            return bytes(buf[:nbytes]), rest
+
+        self.assertEqual(self.loop.run_until_complete(main()),
+                         (b'da', b'ta'))
+        self.assertEqual(self.loop.run_until_complete(
+            self.loop.sock_recv(a, 10)), b'more')
+
+    def test_sock_accept_cancel_after_completion(self):
+        # The accept operation completes in the kernel before it is
+        # cancelled: the accepted connection is closed.
+        self.require_io_uring()
+        listener = socket.create_server(('127.0.0.1', 0))
+        self.addCleanup(listener.close)
+        listener.setblocking(False)
+        client = socket.socket()
+        self.addCleanup(client.close)
+        client.settimeout(support.SHORT_TIMEOUT)
+
+        async def main():
+            task = asyncio.create_task(self.loop.sock_accept(listener))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)  # The operation is submitted.
+            client.connect(listener.getsockname())
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0)
+
+        self.loop.run_until_complete(main())
+        try:
+            self.assertEqual(client.recv(10), b'')
+        except ConnectionResetError:
+            pass
+
+    def test_sock_errors(self):
+        self.require_io_uring()
+        a, b = self.socketpair()
+        b.close()
+        self.assertEqual(self.loop.run_until_complete(
+            self.loop.sock_recv(a, 10)), b'')
+        with self.assertRaises(BrokenPipeError):
+            self.loop.run_until_complete(self.loop.sock_sendall(a, b'data'))
+
+    def test_sock_recv_into_sendall(self):
+        self.require_io_uring()
+        a, b = self.socketpair()
+        data = bytes(range(256)) * 4096  # 1 MiB
+
+        async def main():
+            buf = bytearray(len(data))
+            view = memoryview(buf)
+            sender = asyncio.create_task(self.loop.sock_sendall(a, data))
+            nbytes = 0
+            while nbytes < len(data):
+                nbytes += await self.loop.sock_recv_into(b, view[nbytes:])
+            await sender
+            return buf
+
+        self.assertEqual(self.loop.run_until_complete(main()), data)
+
+    def test_sock_sendfile(self):
+        self.require_io_uring()
+        a, b = self.socketpair()
+        data = os.urandom(600 * 1024)
+
+        async def main(file, offset, count):
+            sender = asyncio.create_task(
+                self.loop._sock_sendfile_native(a, file, offset, count))
+            received = bytearray()
+            while not sender.done() or len(received) < sender.result():
+                received += await self.loop.sock_recv(b, 65536)
+            return sender.result(), bytes(received)
+
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(data)
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'rb') as f:
+            sent, received = self.loop.run_until_complete(
+                main(f, 10, 500 * 1024))
+            self.assertEqual(sent, 500 * 1024)
+            self.assertEqual(received, data[10:10 + sent])
+            self.assertEqual(f.tell(), 10 + sent)
+
+            # count=None sends up to the end of the file.
+            sent, received = self.loop.run_until_complete(
+                main(f, 100, None))
+            self.assertEqual(received, data[100:])
+            self.assertEqual(f.tell(), len(data))
+
+    def test_sock_sendfile_not_seekable(self):
+        self.require_io_uring()
+        a, b = self.socketpair()
+        rfd, wfd = os.pipe()
+        self.addCleanup(os.close, wfd)
+        os.write(wfd, b'data')
+        with open(rfd, 'rb') as f:
+            with self.assertRaises(asyncio.SendfileNotAvailableError):
+                self.loop.run_until_complete(
+                    self.loop._sock_sendfile_native(a, f, 0, 4))
+
+
 class UnixReadPipeTransportTests(test_utils.TestCase):
 
     def setUp(self):
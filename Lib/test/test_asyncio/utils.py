@@ -535,7 +535,8 @@ def get_function_source(func):
 class TestCase(unittest.TestCase):
     @staticmethod
     def close_loop(loop):
-        if loop._default_executor is not None:
+        if (loop._default_executor is not None
+                or loop._file_io_pool is not None):
             if not loop.is_closed():
                 loop.run_until_complete(loop.shutdown_default_executor())
             else:
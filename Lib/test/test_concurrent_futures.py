@@ -8,6 +8,7 @@
 from test.support import hashlib_helper
 from test.support.script_helper import assert_python_ok
 
+import collections
 import contextlib
 import itertools
 import logging
@@ -151,6 +152,10 @@ class ThreadPoolMixin(ExecutorMixin):
     executor_type = futures.ThreadPoolExecutor
 
 
+class WorkStealingThreadPoolMixin(ExecutorMixin):
+    executor_type = futures.WorkStealingThreadPoolExecutor
+
+
 class ProcessPoolForkMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
     ctx = "fork"
@@ -193,6 +198,7 @@ def get_context(self):
 
 def create_executor_tests(mixin, bases=(BaseTestCase,),
                           executor_mixins=(ThreadPoolMixin,
+                                           WorkStealingThreadPoolMixin,
                                            ProcessPoolForkMixin,
                                            ProcessPoolForkserverMixin,
                                            ProcessPoolSpawnMixin)):
@@ -520,6 +526,22 @@ def test_cancel_futures_wait_false(self):
         self.assertEqual(out.strip(), b"apple")
 
 
+class WorkStealingThreadPoolShutdownTest(WorkStealingThreadPoolMixin,
+                                        ThreadPoolShutdownTest):
+    def test_del_shutdown(self):
+        executor = self.executor_type(max_workers=5)
+        res = executor.map(abs, range(-5, 5))
+        threads = list(executor._threads)
+        del executor
+
+        for t in threads:
+            t.join()
+
+        # Make sure the results were all computed before the
+        # executor got shutdown.
+        assert all([r == abs(v) for r, v in zip(res, range(-5, 5))])
+
+
 class ProcessPoolShutdownTest(ExecutorShutdownTest):
     def test_processes_terminate(self):
         def acquire_lock(lock):
@@ -732,6 +754,11 @@ def future_func():
             sys.setswitchinterval(oldswitchinterval)
 
 
+class WorkStealingThreadPoolWaitTests(WorkStealingThreadPoolMixin,
+                                      ThreadPoolWaitTests):
+    pass
+
+
 create_executor_tests(WaitTests,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
@@ -912,6 +939,48 @@ def test_free_reference(self):
             support.gc_collect()  # For PyPy or other GCs.
             self.assertIsNone(wr())
 
+    def test_free_reference_unordered(self):
+        for obj in self.executor.map(make_dummy_object, range(10),
+                                     buffersize=2, ordered=False):
+            wr = weakref.ref(obj)
+            del obj
+            support.gc_collect()  # For PyPy or other GCs.
+            self.assertIsNone(wr())
+
+    def test_map_buffersize(self):
+        self.assertEqual(
+                list(self.executor.map(pow, range(10), range(10),
+                                       buffersize=3)),
+                list(map(pow, range(10), range(10))))
+        for buffersize in (0, -1):
+            with self.assertRaisesRegex(ValueError, "buffersize"):
+                self.executor.map(pow, range(10), range(10),
+                                  buffersize=buffersize)
+
+    def test_map_buffersize_lazy(self):
+        # The input is consumed as the results are.
+        it = self.executor.map(abs, itertools.count(), buffersize=2)
+        self.assertEqual([next(it) for _ in range(5)], [0, 1, 2, 3, 4])
+        it.close()
+
+    def test_map_unordered(self):
+        for buffersize in (None, 3):
+            results = self.executor.map(pow, range(10), range(10),
+                                        buffersize=buffersize, ordered=False)
+            self.assertCountEqual(results, map(pow, range(10), range(10)))
+
+    def test_map_unordered_exception(self):
+        i = self.executor.map(divmod, [1, 1, 1], [0, 0, 0], ordered=False)
+        self.assertRaises(ZeroDivisionError, i.__next__)
+
+    def test_map_unordered_timeout(self):
+        results = []
+        with self.assertRaises(futures.TimeoutError):
+            for i in self.executor.map(time.sleep, [3, 0, 0],
+                                       timeout=1.5, ordered=False):
+                results.append(i)
+        self.assertEqual([None, None], results)
+
 
 class ThreadPoolExecutorTest(ThreadPoolMixin, ExecutorTest, BaseTestCase):
     def test_map_submits_without_iteration(self):
@@ -992,6 +1061,92 @@ def log_n_wait(ident):
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
 
+class WorkStealingThreadPoolExecutorTest(WorkStealingThreadPoolMixin,
+                                         ThreadPoolExecutorTest):
+    def test_submit_many(self):
+        fs = self.executor.submit_many(pow, range(100), itertools.repeat(2))
+        self.assertEqual([f.result() for f in fs],
+                         [i ** 2 for i in range(100)])
+        self.assertEqual(self.executor.submit_many(pow), [])
+        self.executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.executor.submit_many(pow, [1], [2])
+
+    def test_work_stealing(self):
+        self.executor.shutdown()
+        self.executor = executor = self.executor_type(2)
+        event = threading.Event()
+        ran_by = []
+
+        def record(i):
+            ran_by.append(threading.get_ident())
+
+        def block():
+            # The calls are queued on this worker, which then blocks: a
+            # second worker is started and steals them.
+            fs = executor.submit_many(record, range(10))
+            event.wait(support.SHORT_TIMEOUT)
+            return threading.get_ident(), fs
+
+        f = executor.submit(block)
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT,
+                                        "calls not stolen"):
+            if len(ran_by) == 10:
+                break
+        self.assertFalse(f.done())
+        event.set()
+        ident, fs = f.result()
+        for g in fs:
+            g.result()
+        self.assertNotIn(ident, ran_by)
+        self.assertEqual(len(executor._threads), 2)
+
+    def test_idle_timeout(self):
+        self.executor.shutdown()
+        self.executor = executor = self.executor_type(2, idle_timeout=0.05)
+        self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+        threads = list(executor._threads)
+        self.assertEqual(len(threads), 1)
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT,
+                                        "idle thread not exited"):
+            if not executor._threads:
+                break
+        threads[0].join()
+        # New threads are started as needed.
+        self.assertEqual(executor.submit(mul, 3, 14).result(), 42)
+        self.assertEqual(len(executor._threads), 1)
+
+    def test_submit_to_parking_worker(self):
+        # The worker parks after submit() found no idle worker and before
+        # it queued the call on the worker.
+        class Idle(collections.deque):
+            hide = False
+            def __bool__(self):
+                if self.hide:
+                    self.hide = False
+                    return False
+                return len(self) > 0
+
+        self.executor.shutdown()
+        self.executor = executor = self.executor_type(1, idle_timeout=None)
+        idle = executor._pool.idle = Idle()
+        self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT,
+                                        "worker not parked"):
+            if idle:
+                break
+        idle.hide = True
+        f = executor.submit(mul, 3, 14)
+        self.assertEqual(f.result(timeout=support.SHORT_TIMEOUT), 42)
+
+    def test_idle_timeout_negative(self):
+        for value in (0, -1):
+            with self.assertRaisesRegex(ValueError,
+                                        "idle_timeout must be greater "
+                                        "than 0"):
+                self.executor_type(idle_timeout=value)
+
+
 class ProcessPoolExecutorTest(ExecutorTest):
 
     @unittest.skipUnless(sys.platform=='win32', 'Windows-only process limit')
@@ -1028,6 +1183,43 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_adaptive_chunksize(self):
+        ref = list(map(pow, range(40), range(40)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40),
+                                   chunksize=None)),
+            ref)
+        self.assertCountEqual(
+            self.executor.map(pow, range(40), range(40), chunksize=None,
+                              ordered=False),
+            ref)
+        # The input is consumed lazily.
+        it = self.executor.map(abs, itertools.count(), chunksize=None)
+        self.assertEqual([next(it) for _ in range(5)], [0, 1, 2, 3, 4])
+        it.close()
+
+    def test_adaptive_chunks(self):
+        chunks = futures.process._AdaptiveChunks(range(1000))
+        submitted, chunk = next(chunks)
+        self.assertEqual(chunk, ((0,),))
+        # Fast calls: the chunk size doubles up to the target time, which
+        # is bounded by _ADAPTIVE_MIN_TIME and _ADAPTIVE_MAX_TIME.
+        sizes = []
+        for _ in range(10):
+            chunks.update(0.0, 0.0, chunks.chunksize * 1e-5, chunks.chunksize)
+            sizes.append(chunks.chunksize)
+        self.assertEqual(sizes, [2, 4, 8, 16, 32, 64, 100, 100, 100, 100])
+        # Slow calls make the chunk size drop at once.
+        chunks.update(0.0, 0.0, 10.0, 1)
+        self.assertEqual(chunks.chunksize, 1)
+        self.assertEqual(len(next(chunks)[1]), 1)
+
+        # A larger IPC overhead makes the chunks larger.
+        chunks = futures.process._AdaptiveChunks(range(1000))
+        chunks.chunksize = 1000
+        chunks.update(0.0, 0.01, 0.01 + 1e-5, 1)
+        self.assertEqual(chunks.chunksize, 2000)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -1157,12 +1349,445 @@ def test_max_tasks_early_shutdown(self):
         for i, future in enumerate(futures):
             self.assertEqual(future.result(), mul(i, i))
 
+    def wait_for_workers(self, executor, count):
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+            if len(executor._processes) == count:
+                break
+
+    def test_idle_timeout(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            with self.assertRaises(ValueError):
+                self.executor_type(1, mp_context=context, idle_timeout=1)
+            return
+        # not using self.executor as we need to control construction.
+        with self.executor_type(3, mp_context=context, min_workers=1,
+                                idle_timeout=0.1) as executor:
+            for _ in range(2):
+                fs = [executor.submit(time.sleep, 0.3) for _ in range(3)]
+                # Workers are started on demand.
+                self.assertGreater(len(executor._processes), 1)
+                futures.wait(fs)
+                # The idle workers are stopped, down to min_workers.
+                self.wait_for_workers(executor, 1)
+                time.sleep(0.3)
+                self.assertEqual(len(executor._processes), 1)
+            self.assertEqual(list(executor.map(abs, range(-10, 0))),
+                             list(range(10, 0, -1)))
+
+    def test_idle_timeout_no_min_workers(self):
+        context = self.get_context()
+        if context.get_start_method(allow_none=False) == "fork":
+            self.skipTest("Incompatible with the fork start method.")
+        with self.executor_type(2, mp_context=context,
+                                idle_timeout=0.05) as executor:
+            for i in range(5):
+                self.assertEqual(executor.submit(mul, i, 2).result(), i * 2)
+                self.wait_for_workers(executor, 0)
+
+    def test_idle_timeout_defaults_to_spawn_context(self):
+        executor = self.executor_type(1, idle_timeout=1)
+        self.assertEqual(executor._mp_context.get_start_method(), "spawn")
+
+    def test_max_pending(self):
+        with self.executor_type(2, mp_context=self.get_context(),
+                                max_pending=2,
+                                pending_timeout=0.1) as executor:
+            fs = [executor.submit(time.sleep, 0.5) for _ in range(2)]
+            with self.assertRaises(TimeoutError):
+                executor.submit(mul, 2, 3)
+            futures.wait(fs)
+            self.assertEqual(executor.submit(mul, 2, 3).result(), 6)
+
+    def test_max_pending_blocks(self):
+        with self.executor_type(2, mp_context=self.get_context(),
+                                max_pending=1) as executor:
+            fs = [executor.submit(time.sleep, 0.01) for _ in range(5)]
+            # Each call was submitted once the previous one was done.
+            self.assertTrue(all(f.done() for f in fs[:-1]))
+            self.assertIsNone(fs[-1].result())
+
+    def test_scaling_arguments(self):
+        context = self.get_context()
+        for kwargs in [dict(min_workers=3), dict(min_workers=-1),
+                       dict(idle_timeout=0), dict(max_pending=0)]:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    self.executor_type(2, mp_context=context, **kwargs)
+
 
 create_executor_tests(ProcessPoolExecutorTest,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
                                        ProcessPoolSpawnMixin))
 
+
+def is_imported(name):
+    return name in sys.modules
+
+
+class WarmProcessPoolTest:
+    def setUp(self):
+        super().setUp()
+        self.pool = futures.WarmProcessPool(
+            2, self.get_context(), init, ('initialized',),
+            preload=['colorsys'])
+
+    def tearDown(self):
+        self.pool.shutdown(wait=True)
+        self.pool = None
+        super().tearDown()
+
+    def test_start(self):
+        self.assertEqual(self.pool.startup_times, {})
+        self.pool.start(timeout=support.SHORT_TIMEOUT)
+        times = self.pool.startup_times
+        self.assertEqual(len(times), 2)
+        for seconds in times.values():
+            self.assertGreaterEqual(seconds, 0)
+
+    def test_startup_times_collected(self):
+        # The manager thread reads the startup times as the workers report
+        # them, without waiting for startup_times to be read.
+        executor = self.pool._executor
+        with self.pool.executor() as pool_executor:
+            pid = pool_executor.submit(os.getpid).result()
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+            with executor._startup_condition:
+                if pid in executor._startup_times:
+                    break
+        self.assertTrue(executor._startup_queue.empty())
+        self.assertIn(pid, self.pool.startup_times)
+
+    def test_executors_share_workers(self):
+        self.pool.start(timeout=support.SHORT_TIMEOUT)
+        pids = set(self.pool.startup_times)
+        for _ in range(3):
+            with self.pool.executor() as executor:
+                self.assertIsInstance(executor, futures.ProcessPoolExecutor)
+                self.assertEqual(list(executor.map(mul, range(5), range(5))),
+                                 [0, 1, 4, 9, 16])
+                self.assertIn(executor.submit(os.getpid).result(), pids)
+                self.assertEqual(executor.submit(get_init_status).result(),
+                                 'initialized')
+                self.assertTrue(
+                    executor.submit(is_imported, 'colorsys').result())
+        self.assertEqual(set(self.pool.startup_times), pids)
+
+    def test_executor_shutdown(self):
+        executor = self.pool.executor()
+        future = executor.submit(time.sleep, 0.1)
+        executor.shutdown(wait=True)
+        self.assertTrue(future.done())
+        with self.assertRaises(RuntimeError):
+            executor.submit(pow, 2, 3)
+        # The workers keep running.
+        with self.pool.executor() as executor:
+            self.assertEqual(executor.submit(pow, 2, 3).result(), 8)
+
+    def test_executor_shutdown_cancel_futures(self):
+        executor = self.pool.executor()
+        fs = [executor.submit(time.sleep, 0.1) for _ in range(20)]
+        executor.shutdown(wait=True, cancel_futures=True)
+        self.assertTrue(all(f.done() for f in fs))
+        self.assertTrue(any(f.cancelled() for f in fs))
+
+    def test_shutdown(self):
+        self.pool.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.pool.start()
+        with self.assertRaises(RuntimeError):
+            self.pool.executor().submit(pow, 2, 3)
+
+    def test_preload_type_error(self):
+        with self.assertRaises(TypeError):
+            futures.WarmProcessPool(preload=[1])
+
+
+create_executor_tests(WarmProcessPoolTest,
+                      executor_mixins=(ProcessPoolForkMixin,
+                                       ProcessPoolForkserverMixin,
+                                       ProcessPoolSpawnMixin))
+
+class ManualExecutor(futures.Executor):
+    """An executor whose calls are completed by the test."""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        f = futures.Future()
+        self.calls.append(f)
+        return f
+
+
+class MemoizingExecutorTest:
+    def setUp(self):
+        super().setUp()
+        self.memo = futures.MemoizingExecutor(self.executor, maxsize=2)
+
+    def tearDown(self):
+        self.memo = None
+        super().tearDown()
+
+    def test_cache(self):
+        m = self.memo
+        self.assertIs(m.executor, self.executor)
+        self.assertEqual(m.submit(mul, 2, 3).result(), 6)
+        self.assertEqual(m.cache_info(), (0, 1, 2, 1))
+        f = m.submit(mul, 2, 3)
+        self.assertTrue(f.done())
+        self.assertEqual(f.result(), 6)
+        self.assertEqual(m.submit(mul, 2, y=3).result(), 6)
+        self.assertEqual(m.cache_info(), (1, 2, 2, 2))
+        self.assertEqual(list(m.map(mul, [2, 4], [3, 5])), [6, 20])
+        self.assertEqual(m.cache_info(), (2, 3, 2, 2))
+        # The least recently used result was discarded.
+        m.submit(mul, 2, y=3).result()
+        self.assertEqual(m.cache_info(), (2, 4, 2, 2))
+        m.cache_clear()
+        self.assertEqual(m.cache_info(), (0, 0, 2, 0))
+
+    def test_running_call(self):
+        m = self.memo
+        f1 = m.submit(time.sleep, 0.1)
+        f2 = m.submit(time.sleep, 0.1)
+        self.assertIsNot(f1, f2)
+        self.assertIsNone(f1.result())
+        self.assertIsNone(f2.result())
+        self.assertEqual(m.cache_info(), (1, 1, 2, 1))
+
+    def test_cancel(self):
+        executor = ManualExecutor()
+        m = futures.MemoizingExecutor(executor)
+        f1 = m.submit(mul, 2, 3)
+        f2 = m.submit(mul, 2, 3)
+        call, = executor.calls
+        # Other callers still wait for the call.
+        self.assertTrue(f1.cancel())
+        self.assertFalse(call.cancelled())
+        call.set_result(6)
+        self.assertTrue(f1.cancelled())
+        self.assertEqual(f2.result(), 6)
+        self.assertEqual(m.cache_info(), (1, 1, 128, 1))
+        # The last caller cancels the call.
+        f3 = m.submit(mul, 4, 5)
+        self.assertTrue(f3.cancel())
+        self.assertTrue(executor.calls[1].cancelled())
+        f4 = m.submit(mul, 4, 5)
+        self.assertEqual(len(executor.calls), 3)
+        executor.calls[2].set_result(20)
+        self.assertEqual(f4.result(), 20)
+        self.assertEqual(m.cache_info(), (1, 3, 128, 2))
+
+    def test_cancel_notifies_waiters(self):
+        # wait() and as_completed() see the cancelled futures as done, like
+        # the futures of an executor.
+        executor = ManualExecutor()
+        m = futures.MemoizingExecutor(executor)
+        f1 = m.submit(mul, 2, 3)
+        f2 = m.submit(mul, 2, 3)
+        self.assertTrue(f1.cancel())
+        self.assertEqual(futures.wait([f1], timeout=0).done, {f1})
+        self.assertEqual(list(futures.as_completed([f1], timeout=0)), [f1])
+        # The last caller cancels the call.
+        self.assertTrue(f2.cancel())
+        self.assertTrue(executor.calls[0].cancelled())
+        self.assertEqual(futures.wait([f2], timeout=0).done, {f2})
+        # The other callers get the result.
+        f3 = m.submit(mul, 4, 5)
+        f4 = m.submit(mul, 4, 5)
+        self.assertTrue(f4.cancel())
+        executor.calls[1].set_result(20)
+        self.assertEqual(f3.result(), 20)
+        self.assertEqual(futures.wait([f3, f4], timeout=0).done, {f3, f4})
+
+    def test_cancel_running_call(self):
+        m = self.memo
+        f1 = m.submit(time.sleep, 0.3)
+        for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+            if f1.running():
+                break
+        f2 = m.submit(time.sleep, 0.3)
+        self.assertTrue(f2.running())
+        # A running call can't be cancelled.
+        self.assertFalse(f1.cancel())
+        self.assertFalse(f2.cancel())
+        self.assertIsNone(f1.result())
+        self.assertIsNone(f2.result())
+
+    def test_call_started(self):
+        executor = ManualExecutor()
+        m = futures.MemoizingExecutor(executor)
+        f1 = m.submit(mul, 2, 3)
+        f2 = m.submit(mul, 2, 3)
+        self.assertTrue(f2.cancel())
+        self.assertFalse(f1.running())
+        call, = executor.calls
+        self.assertTrue(call.set_running_or_notify_cancel())
+        self.assertTrue(f1.running())
+        self.assertFalse(f1.cancel())
+        self.assertTrue(f2.cancelled())
+        f3 = m.submit(mul, 2, 3)
+        self.assertTrue(f3.running())
+        call.set_result(6)
+        self.assertEqual(f1.result(), 6)
+        self.assertEqual(f3.result(), 6)
+
+    def test_exception_not_cached(self):
+        m = self.memo
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                m.submit(divmod, 1, 0).result()
+        self.assertEqual(m.cache_info(), (0, 2, 2, 0))
+
+    def test_maxsize(self):
+        m = futures.MemoizingExecutor(self.executor, maxsize=0)
+        m.submit(mul, 2, 3).result()
+        self.assertEqual(m.cache_info(), (0, 1, 0, 0))
+        m = futures.MemoizingExecutor(self.executor, maxsize=None)
+        self.assertEqual(list(m.map(abs, range(300))), list(range(300)))
+        self.assertEqual(m.cache_info(), (0, 300, None, 300))
+        with self.assertRaises(ValueError):
+            futures.MemoizingExecutor(self.executor, maxsize=-1)
+
+    def test_unpicklable(self):
+        if not isinstance(self.executor, futures.ThreadPoolExecutor):
+            self.skipTest('requires a thread pool')
+        m = self.memo
+        self.assertEqual(m.submit(lambda: 5).result(), 5)
+        self.assertEqual(m.submit(lambda: 5).result(), 5)
+        self.assertEqual(m.cache_info(), (0, 0, 2, 0))
+
+    def test_shutdown(self):
+        with self.memo as m:
+            m.submit(mul, 2, 3).result()
+        with self.assertRaises(RuntimeError):
+            self.executor.submit(mul, 2, 3)
+
+
+create_executor_tests(MemoizingExecutorTest)
+
+
+class ExecutorStatsTest:
+    def test_counters(self):
+        stats = self.executor.stats()
+        self.assertIsInstance(stats, futures.ExecutorStats)
+        self.assertEqual(stats[:5], (0, 0, 0, 0, 0))
+        self.assertEqual(stats.max_workers, self.worker_count)
+        self.assertEqual(stats.wait_time.count, 0)
+        self.assertIsNone(stats.run_time.mean())
+
+        fs = [self.executor.submit(mul, i, 2) for i in range(10)]
+        fs.append(self.executor.submit(divmod, 1, 0))
+        futures.wait(fs)
+        stats = self.executor.stats()
+        self.assertEqual(stats.submitted, 11)
+        self.assertEqual(stats.started, 11)
+        self.assertEqual(stats.completed, 11)
+        self.assertEqual(stats.failed, 1)
+        self.assertEqual(stats.cancelled, 0)
+        self.assertEqual(stats.pending, 0)
+        self.assertEqual(stats.running, 0)
+        self.assertGreaterEqual(stats.workers, 1)
+        self.assertLessEqual(stats.workers, self.worker_count)
+        self.assertEqual(stats.wait_time.count, 11)
+        self.assertEqual(stats.run_time.count, 11)
+        self.assertGreater(stats.elapsed, 0)
+        self.assertGreaterEqual(stats.utilization, 0)
+        self.assertLessEqual(stats.utilization, 1)
+
+    def test_run_time(self):
+        self.executor.submit(time.sleep, 0.1).result()
+        run_time = self.executor.stats().run_time
+        self.assertEqual(run_time.count, 1)
+        self.assertGreaterEqual(run_time.min, 0.09)
+        self.assertEqual(run_time.min, run_time.max)
+        self.assertEqual(run_time.quantile(0.5), run_time.max)
+        self.assertEqual(run_time.mean(), run_time.total)
+
+    def test_pending_and_cancelled(self):
+        fs = [self.executor.submit(time.sleep, 0.2)
+              for _ in range(self.worker_count)]
+        fs += [self.executor.submit(mul, i, 2) for i in range(20)]
+        stats = self.executor.stats()
+        self.assertEqual(stats.submitted, 25)
+        self.assertEqual(stats.pending + stats.running + stats.completed, 25)
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        stats = self.executor.stats()
+        self.assertEqual(stats.pending, 0)
+        self.assertEqual(stats.running, 0)
+        self.assertEqual(stats.cancelled, sum(f.cancelled() for f in fs))
+        self.assertEqual(stats.completed + stats.cancelled, 25)
+
+    def test_callbacks(self):
+        events = []
+        self.executor.set_stats_callbacks(
+            on_submit=lambda f: events.append(('submit', f)),
+            on_start=lambda f, wait_time: events.append(('start', f)),
+            on_finish=lambda f, run_time: events.append(
+                ('finish', f, f.done(), run_time >= 0)))
+        fs = [self.executor.submit(mul, i, 2) for i in range(5)]
+        fs.append(self.executor.submit(divmod, 1, 0))
+        self.executor.shutdown(wait=True)
+        for f in fs:
+            f_events = [e[0] for e in events if e[1] is f]
+            self.assertCountEqual(f_events, ['submit', 'start', 'finish'])
+            self.assertLess(f_events.index('start'), f_events.index('finish'))
+            self.assertIn(('finish', f, True, True), events)
+        # Break the reference cycles through the traceback of divmod().
+        events.clear()
+
+    def test_callback_error(self):
+        def on_start(f, wait_time):
+            raise ZeroDivisionError
+        self.executor.set_stats_callbacks(on_start=on_start)
+        with self.assertLogs('concurrent.futures', 'ERROR') as cm:
+            self.assertEqual(self.executor.submit(mul, 2, 3).result(), 6)
+        self.assertIn('exception calling stats callback', cm.output[0])
+        with self.assertRaises(TypeError):
+            self.executor.set_stats_callbacks(on_finish=1)
+
+
+create_executor_tests(ExecutorStatsTest)
+
+
+class HistogramTests(unittest.TestCase):
+    def test_histogram(self):
+        h = futures._base._Histogram()
+        self.assertIsNone(h.quantile(0.5))
+        self.assertIsNone(h.mean())
+        self.assertIsNone(h.min)
+        for seconds in (0.001, 0.002, 0.003, 0.1, 10000.0, 0.0, -1.0):
+            h.add(seconds)
+        self.assertEqual(h.count, 7)
+        self.assertEqual(h.min, 0.0)
+        self.assertEqual(h.max, 10000.0)
+        self.assertAlmostEqual(h.total, 10000.106)
+        self.assertAlmostEqual(h.mean(), 10000.106 / 7)
+        buckets = h.buckets()
+        self.assertEqual(sum(count for bound, count in buckets), 7)
+        self.assertEqual(buckets[0], (2.0 ** -20, 2))
+        self.assertEqual(buckets[-1], (float('inf'), 1))
+        counts = dict(buckets)
+        self.assertEqual(counts[2.0 ** -9], 1)
+        self.assertEqual(counts[2.0 ** -8], 2)
+        self.assertEqual(counts[2.0 ** -3], 1)
+        self.assertEqual(h.quantile(0), 2.0 ** -20)
+        self.assertEqual(h.quantile(0.5), 2.0 ** -8)
+        self.assertEqual(h.quantile(0.8), 2.0 ** -3)
+        self.assertEqual(h.quantile(1), 10000.0)
+        with self.assertRaises(ValueError):
+            h.quantile(1.5)
+        self.assertEqual(h.percentile(50), 2.0 ** -8)
+        copy = h.copy()
+        h.add(1.0)
+        self.assertEqual(copy.count, 7)
+        self.assertEqual(h.count, 8)
+        with self.assertRaises(AttributeError):
+            h.count = 0
+
+
 def _crash(delay=None):
     """Induces a segfault."""
     if delay:
@@ -914,6 +914,134 @@ def test_read_semi_sep(self):
         self.assertEqual(next(reader), {"1": '1', "2": '2', "3": 'abc',
                                          "4": '4', "5": '5', "6": '6'})
 
+class TestColumns(unittest.TestCase):
+    def test_read_columns(self):
+        reader = csv.reader(["1,2.5,abc\r\n", "\r\n", "-3, 4e3,d\r\n",
+                             "5,-0.125,ef\r\n"])
+        columns = reader.read_columns([int, float, None], 2)
+        self.assertEqual(columns, [[1, -3], [2.5, 4000.0], ['abc', 'd']])
+        self.assertIs(type(columns[0][1]), int)
+        self.assertEqual(reader.line_num, 3)
+        self.assertEqual(reader.read_columns([int, float, str]),
+                         [[5], [-0.125], ['ef']])
+        self.assertEqual(reader.read_columns([int, float, str]), [])
+
+    def test_read_columns_arrays(self):
+        import array
+        reader = csv.reader(["1,2.5\r\n", "-30,1e-3\r\n",
+                             "9223372036854775807,inf\r\n"])
+        ints, floats = reader.read_columns(['q', 'd'])
+        self.assertEqual(ints, array.array('q', [1, -30, 2**63-1]))
+        self.assertEqual(floats, array.array('d', [2.5, 1e-3, float('inf')]))
+        reader = csv.reader(["9223372036854775808\r\n"])
+        self.assertRaises(OverflowError, reader.read_columns, ['q'])
+        reader = csv.reader(["1\r\n"])
+        self.assertRaises(ValueError, reader.read_columns, ['i'])
+
+    def test_read_columns_conversion(self):
+        reader = csv.reader([" 1_000 ,1_0.5,\u0661\u0662\r\n"])
+        self.assertEqual(reader.read_columns([int, float, int]),
+                         [[1000], [10.5], [12]])
+        reader = csv.reader(["12345678901234567890123,x\r\n"])
+        self.assertEqual(reader.read_columns([int, str.upper]),
+                         [[12345678901234567890123], ['X']])
+        reader = csv.reader(["a\r\n"])
+        self.assertRaises(ValueError, reader.read_columns, [int])
+        reader = csv.reader(["a\r\n"])
+        self.assertRaises(ValueError, reader.read_columns, [float])
+        reader = csv.reader(['1,"2"\r\n'], quoting=csv.QUOTE_NONNUMERIC)
+        self.assertEqual(reader.read_columns([None, None]), [[1.0], ['2']])
+
+    def test_read_columns_errors(self):
+        reader = csv.reader(["1,2\r\n", "3\r\n"])
+        self.assertRaises(csv.Error, reader.read_columns, [int, int])
+        self.assertRaises(TypeError, reader.read_columns, None)
+        self.assertRaises(TypeError, reader.read_columns, [1])
+        self.assertRaises(ValueError, reader.read_columns, [])
+        reader = csv.reader(["1,2\r\n", "3,4\r\n"])
+        def convert(field):
+            return next(reader)
+        self.assertRaises(RuntimeError, reader.read_columns, [convert, None])
+
+    def test_column_reader(self):
+        import array
+        data = "id,price,name\r\n1,2.5,a\r\n2,3.5,b\r\n3,4.5,c\r\n"
+        reader = csv.ColumnReader(StringIO(data), batch_size=2,
+                                  types={"id": int, "price": "d"})
+        self.assertEqual(reader.fieldnames, ["id", "price", "name"])
+        self.assertEqual(next(reader),
+                         {"id": [1, 2],
+                          "price": array.array('d', [2.5, 3.5]),
+                          "name": ['a', 'b']})
+        self.assertEqual(reader.line_num, 3)
+        self.assertEqual(next(reader),
+                         {"id": [3],
+                          "price": array.array('d', [4.5]),
+                          "name": ['c']})
+        self.assertRaises(StopIteration, next, reader)
+
+        reader = csv.ColumnReader(StringIO(data), batch_size=None,
+                                  fieldnames=iter("xyz"),
+                                  types=[None, str, str])
+        self.assertEqual(list(reader),
+                         [{"x": ['id', '1', '2', '3'],
+                           "y": ['price', '2.5', '3.5', '4.5'],
+                           "z": ['name', 'a', 'b', 'c']}])
+        reader = csv.ColumnReader(StringIO(data), types=[int, float])
+        self.assertRaises(ValueError, next, reader)
+        self.assertRaises(ValueError, csv.ColumnReader, StringIO(data),
+                          batch_size=0)
+
+    def test_column_reader_binary(self):
+        from io import BytesIO
+        data = "a;b\r\n\xe9;1\r\n\u20ac;2\r\n"
+        reader = csv.ColumnReader(BytesIO(data.encode("utf-8")),
+                                  types=[None, int], encoding="utf-8",
+                                  delimiter=";")
+        self.assertEqual(list(reader), [{"a": ['\xe9', '\u20ac'],
+                                         "b": [1, 2]}])
+        # b'\n' bytes inside characters and split newlines in UTF-16
+        data = "a;b\r\n\u0a0a;1\r\n\u0d0a;2\n"
+        for encoding in "utf-16", "utf-16-le", "utf-16-be":
+            with self.subTest(encoding=encoding):
+                reader = csv.ColumnReader(BytesIO(data.encode(encoding)),
+                                          types=[None, int],
+                                          encoding=encoding, delimiter=";")
+                self.assertEqual(list(reader), [{"a": ['\u0a0a', '\u0d0a'],
+                                                 "b": [1, 2]}])
+
+    def test_column_reader_binary_newlines(self):
+        # Lines are split as by a text file opened with newline=''.
+        from io import BytesIO
+        for data in (b'a,b\r1,"x\ry"\r2,z\r',
+                     b'a,b\r\n1,"x\ry"\n2,z',
+                     b'a,b\n1,"x\ry"\r\n2,z\r\n'):
+            with self.subTest(data=data):
+                expected = list(csv.ColumnReader(
+                    StringIO(data.decode(), newline='')))
+                self.assertEqual(expected, [{"a": ['1', '2'],
+                                             "b": ['x\ry', 'z']}])
+                chunks = BytesIO(data)
+                reader = csv.ColumnReader(chunks, encoding="ascii")
+                self.assertEqual(list(reader), expected)
+                # \r\n split between two chunks
+                chunks = [data[i:i + 1] for i in range(len(data))]
+                reader = csv.ColumnReader(chunks, encoding="ascii")
+                self.assertEqual(list(reader), expected)
+
+    def test_column_reader_error(self):
+        # The rows of a batch read before an error are lost
+        reader = csv.ColumnReader(StringIO("a,b\r\n1,2\r\n3\r\n4,5\r\n"),
+                                  types=[int, int])
+        self.assertRaises(csv.Error, next, reader)
+        self.assertEqual(list(reader), [{"a": [4], "b": [5]}])
+
+    def test_column_reader_empty(self):
+        self.assertEqual(list(csv.ColumnReader(StringIO(""))), [])
+        self.assertEqual(list(csv.ColumnReader(StringIO("a,b\r\n"))), [])
+        reader = csv.ColumnReader(StringIO("a,b\r\n"), types=[int])
+        self.assertRaises(ValueError, next, reader)
+
 class TestArrayWrites(unittest.TestCase):
     def test_int_write(self):
         import array
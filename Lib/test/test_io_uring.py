@@ -0,0 +1,203 @@
+"""
+Tests for the io_uring wrapper.
+"""
+import errno
+import os
+import select
+import socket
+import tempfile
+import time
+import unittest
+from test import support
+
+if not hasattr(select, "io_uring"):
+    raise unittest.SkipTest("test works only on Linux 5.11+")
+
+try:
+    select.io_uring(1).close()
+except OSError as e:
+    raise unittest.SkipTest(f"io_uring is not available: {e}")
+
+
+class TestIoUring(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = select.io_uring(8)
+        self.addCleanup(self.ring.close)
+
+    def socketpair(self):
+        a, b = socket.socketpair()
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+        a.setblocking(False)
+        b.setblocking(False)
+        return a, b
+
+    def test_create(self):
+        ring = select.io_uring()
+        self.assertIsInstance(ring.fileno(), int)
+        self.assertFalse(ring.closed)
+        self.assertFalse(os.get_inheritable(ring.fileno()))
+        self.assertTrue(ring.features)
+        ring.close()
+        self.assertTrue(ring.closed)
+        self.assertRaises(ValueError, ring.fileno)
+        self.assertRaises(ValueError, ring.nop, 1)
+        self.assertRaises(ValueError, ring.submit)
+        ring.close()
+
+        with self.assertRaises(ValueError):
+            select.io_uring(0)
+        with self.assertRaises(TypeError):
+            select.io_uring(1.5)
+
+    def test_context_manager(self):
+        with select.io_uring() as ring:
+            self.assertFalse(ring.closed)
+        self.assertTrue(ring.closed)
+        with self.assertRaises(ValueError):
+            with ring:
+                pass
+
+    def test_nop(self):
+        self.assertEqual(self.ring.submit(), [])
+        self.ring.nop(1)
+        self.ring.nop(2**64 - 1)
+        self.assertEqual(sorted(self.ring.submit(2)),
+                         [(1, 0, 0), (2**64 - 1, 0, 0)])
+
+    def test_full_submission_queue(self):
+        # Queued operations are submitted when the queue is full.
+        for i in range(20):
+            self.ring.nop(i)
+        results = self.ring.submit(20)
+        self.assertEqual(sorted(r[0] for r in results), list(range(20)))
+
+    def test_timeout(self):
+        t0 = time.monotonic()
+        self.assertEqual(self.ring.submit(1, 0.05), [])
+        self.assertGreaterEqual(time.monotonic() - t0, 0.04)
+        self.assertEqual(self.ring.submit(1, 0), [])
+        self.assertEqual(self.ring.submit(1, -1), [])
+        with self.assertRaises(TypeError):
+            self.ring.submit(1, 'spam')
+
+    def test_recv_send(self):
+        a, b = self.socketpair()
+        buf = bytearray(10)
+        self.ring.recv(a.fileno(), buf, 1)
+        self.assertEqual(self.ring.submit(), [])
+        # The buffer is kept exported until the completion is reaped.
+        with self.assertRaises(BufferError):
+            buf.append(0)
+        self.ring.send(b.fileno(), b'spam', 2)
+        results = self.ring.submit(2, support.SHORT_TIMEOUT)
+        if len(results) < 2:
+            results += self.ring.submit(1, support.SHORT_TIMEOUT)
+        self.assertEqual(sorted(results), [(1, 4, 0), (2, 4, 0)])
+        self.assertEqual(buf[:4], b'spam')
+        buf.append(0)
+
+    def test_buffer_checks(self):
+        a, b = self.socketpair()
+        with self.assertRaises(TypeError):
+            self.ring.recv(a.fileno(), b'readonly', 1)
+        with self.assertRaises(TypeError):
+            self.ring.recv(a.fileno(), 'str', 1)
+        with self.assertRaises(TypeError):
+            self.ring.recv(a.fileno(), memoryview(bytearray(10))[::2], 1)
+        buf = bytearray(10)
+        self.ring.recv(a.fileno(), buf, 1)
+        with self.assertRaises(ValueError):
+            self.ring.recv(a.fileno(), bytearray(10), 1)
+        self.assertEqual(self.ring.submit(), [])
+
+    def test_errors(self):
+        a, b = self.socketpair()
+        b.close()
+        self.ring.send(a.fileno(), b'spam', 1)
+        self.ring.recv(a.fileno(), bytearray(10), 2)
+        results = dict((r[0], r[1])
+                       for r in self.ring.submit(2, support.SHORT_TIMEOUT))
+        self.assertEqual(results[1], -errno.EPIPE)
+        self.assertEqual(results[2], 0)
+
+    def test_cancel(self):
+        a, b = self.socketpair()
+        self.ring.recv(a.fileno(), bytearray(10), 1)
+        self.ring.submit()
+        self.ring.cancel(1, 2)
+        results = dict((r[0], r[1])
+                       for r in self.ring.submit(2, support.SHORT_TIMEOUT))
+        self.assertEqual(results, {1: -errno.ECANCELED, 2: 0})
+
+    def test_close_pending(self):
+        a, b = self.socketpair()
+        buf = bytearray(10)
+        self.ring.recv(a.fileno(), buf, 1)
+        self.ring.submit()
+        self.ring.close()
+        # The operation was cancelled and the buffer released.
+        buf.append(0)
+        b.send(b'spam')
+        self.assertEqual(a.recv(10), b'spam')
+
+    def test_close_many_pending(self):
+        # More operations are pending than the submission queue can hold
+        # cancellations for.
+        ring = select.io_uring(2)
+        bufs = []
+        for i in range(10):
+            a, b = self.socketpair()
+            buf = bytearray(10)
+            bufs.append(buf)
+            ring.recv(a.fileno(), buf, i + 1)
+            ring.submit()
+        ring.close()
+        for buf in bufs:
+            buf.append(0)
+
+    def test_accept(self):
+        server = socket.create_server(('127.0.0.1', 0))
+        self.addCleanup(server.close)
+        self.ring.accept(server.fileno(), 1)
+        self.assertEqual(self.ring.submit(), [])
+        client = socket.create_connection(server.getsockname())
+        self.addCleanup(client.close)
+        [(user_data, fd, flags)] = self.ring.submit(1, support.SHORT_TIMEOUT)
+        self.assertEqual(user_data, 1)
+        conn = socket.socket(fileno=fd)
+        self.addCleanup(conn.close)
+        self.assertFalse(conn.get_inheritable())
+        self.assertEqual(conn.getpeername(), client.getsockname())
+
+    def test_poll(self):
+        a, b = self.socketpair()
+        self.ring.poll_add(a.fileno(), select.POLLIN, 1)
+        self.ring.poll_add(a.fileno(), select.POLLOUT, 2)
+        results = self.ring.submit(1, support.SHORT_TIMEOUT)
+        self.assertEqual(results, [(2, select.POLLOUT, 0)])
+        self.ring.poll_remove(1, 3)
+        results = dict((r[0], r[1])
+                       for r in self.ring.submit(2, support.SHORT_TIMEOUT))
+        self.assertEqual(results, {1: -errno.ECANCELED, 3: 0})
+
+    def test_read_write(self):
+        with tempfile.TemporaryFile() as f:
+            fd = f.fileno()
+            self.ring.write(fd, b'0123456789', 1, offset=0)
+            self.assertEqual(self.ring.submit(1), [(1, 10, 0)])
+            buf = bytearray(4)
+            self.ring.read(fd, buf, 2, offset=3)
+            self.assertEqual(self.ring.submit(1), [(2, 4, 0)])
+            self.assertEqual(buf, b'3456')
+            # offset=-1 uses and updates the file position.
+            os.lseek(fd, 8, os.SEEK_SET)
+            self.ring.read(fd, buf, 3)
+            self.assertEqual(self.ring.submit(1), [(3, 2, 0)])
+            self.assertEqual(buf[:2], b'89')
+            self.assertEqual(os.lseek(fd, 0, os.SEEK_CUR), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import decimal
 from io import StringIO
 from collections import OrderedDict
+from dataclasses import dataclass
 from test.test_json import PyTest, CTest
 from test import support
 
@@ -43,6 +44,64 @@ def test_object_pairs_hook(self):
                                     object_pairs_hook=OrderedDict),
                          OrderedDict([('empty', OrderedDict())]))
 
+    def test_object_kwargs_hook(self):
+        @dataclass
+        class Point:
+            x: int
+            y: int = 0
+
+        class Slots:
+            __slots__ = ('a', 'b')
+            def __init__(self, a, b=None):
+                self.a = a
+                self.b = b
+
+        self.assertEqual(self.loads('[{"x": 1, "y": 2}, {"x": 3}]',
+                                    object_kwargs_hook=Point),
+                         [Point(1, 2), Point(3)])
+        obj = self.loads('{"b": [], "a": 1}', object_kwargs_hook=Slots)
+        self.assertIsInstance(obj, Slots)
+        self.assertEqual((obj.a, obj.b), (1, []))
+        # The last value of a repeated key wins, as in a dict.
+        self.assertEqual(self.loads('{"x": 1, "y": 2, "x": 3}',
+                                    object_kwargs_hook=Point),
+                         Point(3, 2))
+        s = '{%s}' % ', '.join('"k%d": %d' % (i % 50, i) for i in range(100))
+        self.assertEqual(self.loads(s, object_kwargs_hook=lambda **kw: kw),
+                         self.loads(s))
+        self.assertEqual(self.loads('{"a": {}, "b": {"c": null}}',
+                                    object_kwargs_hook=lambda **kw: kw),
+                         {'a': {}, 'b': {'c': None}})
+        self.assertRaises(TypeError, self.loads, '{"z": 1}',
+                          object_kwargs_hook=Point)
+        class Bad:
+            def __init__(self):
+                return 1
+        self.assertRaises(TypeError, self.loads, '{}',
+                          object_kwargs_hook=Bad)
+        # object_pairs_hook > object_kwargs_hook > object_hook
+        self.assertEqual(self.loads('{"x": 1}', object_kwargs_hook=Point,
+                                    object_hook=len),
+                         Point(1))
+        self.assertEqual(self.loads('{"x": 1}', object_kwargs_hook=Point,
+                                    object_pairs_hook=list),
+                         [('x', 1)])
+
+    def test_key_cache(self):
+        s = '{"a_key": 1, "b_\xe9": 2}'
+        decoder = self.json.decoder.JSONDecoder(key_cache_size=2)
+        keys = sorted(decoder.decode(s))
+        for key, cached in zip(sorted(decoder.decode(s)), keys):
+            self.assertIs(key, cached)
+        # Too many keys clear the cache.
+        decoder.decode('{"c_key": 1, "d_key": 2, "e_key": 3}')
+        for key, cached in zip(sorted(decoder.decode(s)), keys):
+            self.assertIsNot(key, cached)
+        decoder = self.json.decoder.JSONDecoder()
+        keys = sorted(decoder.decode(s))
+        for key, cached in zip(sorted(decoder.decode(s)), keys):
+            self.assertIsNot(key, cached)
+
     def test_decoder_optimizations(self):
         # Several optimizations were made that skip over calls to
         # the whitespace regex, so this test is designed to try and
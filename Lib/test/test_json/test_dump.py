@@ -1,4 +1,4 @@
-from io import StringIO
+from io import BytesIO, StringIO
 from test.test_json import PyTest, CTest
 
 from test.support import bigmemtest, _1G
@@ -12,6 +12,37 @@ def test_dump(self):
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
+    def test_dumpb(self):
+        self.assertEqual(self.json.dumpb({}), b'{}')
+        self.assertEqual(self.json.dumpb(['\xe9', '\U0001f600']),
+                         b'["\\u00e9", "\\ud83d\\ude00"]')
+        self.assertEqual(self.json.dumpb(['\xe9', '\U0001f600', '\udc80'],
+                                         ensure_ascii=False),
+                         b'["\xc3\xa9", "\xf0\x9f\x98\x80", "\xed\xb2\x80"]')
+        self.assertEqual(self.json.dumpb({'a': 1}, sort_keys=True,
+                                         separators=(',', ':')),
+                         b'{"a":1}')
+        self.assertRaises(TypeError, self.json.dumpb, [object()])
+
+    def test_dumpb_fp(self):
+        fp = BytesIO()
+        self.assertIsNone(self.json.dumpb({'a': ['\xe9']}, fp))
+        self.assertIsNone(self.json.dumpb(['\xe9'], fp, indent=1,
+                                          ensure_ascii=False))
+        self.assertEqual(fp.getvalue(),
+                         b'{"a": ["\\u00e9"]}[\n "\xc3\xa9"\n]')
+        fp = BytesIO()
+        self.assertRaises(TypeError, self.json.dumpb, [object()], fp)
+        self.assertEqual(fp.getvalue(), b'')
+
+    def test_encode_bytes_subclass(self):
+        # An overridden encode() is honoured by encode_bytes().
+        class Encoder(self.json.JSONEncoder):
+            def encode(self, o):
+                return super().encode(o) + '\n'
+        self.assertEqual(Encoder().encode_bytes([1]), b'[1]\n')
+        self.assertEqual(self.json.dumpb([1], cls=Encoder), b'[1]\n')
+
     def test_dump_skipkeys(self):
         v = {b'invalid_key': False, 'valid_key': True}
         with self.assertRaises(TypeError):
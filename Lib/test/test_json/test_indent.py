@@ -62,6 +62,26 @@ def check(indent, expected):
         # indent=None is more compact
         check(None, '{"3": 1}')
 
+    def test_indent_empty_containers(self):
+        self.assertEqual(self.dumps([[], {}, [{}]], indent=1),
+                         '[\n [],\n {},\n [\n  {}\n ]\n]')
+        # All the keys are skipped, but the container is not empty.
+        self.assertEqual(self.dumps({b'a': 1}, indent=2, skipkeys=True),
+                         '{\n  \n}')
+        self.assertEqual(self.dumps({'a': {b'b': 1}}, indent='', skipkeys=True),
+                         '{\n"a": {\n\n}\n}')
+
+    def test_indent_bytes(self):
+        h = {'a': ['\xe9', 1.5, None], 'b': {}}
+        for indent in (None, 0, 2, '\t'):
+            for ensure_ascii in (True, False):
+                with self.subTest(indent=indent, ensure_ascii=ensure_ascii):
+                    d = self.dumps(h, indent=indent, ensure_ascii=ensure_ascii)
+                    b = self.json.dumpb(h, indent=indent,
+                                        ensure_ascii=ensure_ascii)
+                    self.assertIsInstance(b, bytes)
+                    self.assertEqual(b, d.encode('utf-8'))
+
 
 class TestPyIndent(TestIndent, PyTest): pass
 class TestCIndent(TestIndent, CTest): pass
@@ -68,6 +68,24 @@ def test_bad_markers_argument_to_encoder(self):
             self.json.encoder.c_make_encoder(1, None, None, None, ': ', ', ',
                                              False, False, False)
 
+    def test_bad_indent_argument_to_encoder(self):
+        with self.assertRaisesRegex(
+            TypeError,
+            r'make_encoder\(\) argument 4 must be str or None, not int',
+        ):
+            self.json.encoder.c_make_encoder(None, None, None, 2, ': ', ', ',
+                                             False, False, False)
+
+    def test_encode_utf8(self):
+        enc = self.json.encoder.c_make_encoder(
+            None, None, self.json.encoder.c_encode_basestring, '  ', ': ',
+            ',', False, False, False)
+        self.assertEqual(enc.encode_utf8({'a': ['\xe9']}, 0),
+                         '{\n  "a": [\n    "\xe9"\n  ]\n}'.encode())
+        self.assertEqual(enc.encode_utf8(['\ud800'], 1),
+                         b'[\n    "\xed\xa0\x80"\n  ]')
+        self.assertRaises(TypeError, enc.encode_utf8, {'a': object()}, 0)
+
     def test_bad_bool_args(self):
         def test(name):
             self.json.encoder.JSONEncoder(**{name: BadBool()}).encode({'a': 1})
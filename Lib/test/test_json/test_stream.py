@@ -0,0 +1,168 @@
+from io import BytesIO, StringIO
+from test.test_json import PyTest, CTest
+
+
+DOCUMENTS = [
+    {"a": [1, 2.5, -3e-2], "b": {"c": None, "d": True}},
+    [],
+    {},
+    "café \U0001f600 \"quoted\" \\ \n",
+    12345,
+    -0.5,
+    float('inf'),
+    False,
+    [[[["nested"]]], {"x": [{}]}],
+]
+TEXT = '\n'.join([
+    '{"a": [1, 2.5, -3e-2], "b": {"c": null, "d": true}}',
+    '[]',
+    '{ }',
+    '"caf\\u00e9 \\ud83d\\ude00 \\"quoted\\" \\\\ \\n"',
+    '12345',
+    '-0.5',
+    'Infinity',
+    'false',
+    '[[[["nested"]]], {"x": [{}]}]',
+])
+
+
+class TestStream:
+    def decode(self, chunks, **kwargs):
+        stream = self.json.JSONStreamDecoder(**kwargs)
+        values = []
+        for chunk in chunks:
+            stream.feed(chunk)
+            values.extend(stream.read_values())
+        stream.close()
+        values.extend(stream.read_values())
+        return values
+
+    def split(self, data, size):
+        return [data[i:i + size] for i in range(0, len(data), size)]
+
+    def test_documents(self):
+        for size in (1, 2, 3, 7, len(TEXT)):
+            with self.subTest(size=size):
+                self.assertEqual(self.decode(self.split(TEXT, size)),
+                                 DOCUMENTS)
+        self.assertEqual(self.decode(['1 2', '3 4\n', ' 5']), [1, 23, 4, 5])
+        self.assertEqual(self.decode([]), [])
+        self.assertEqual(self.decode([' \n\t', '']), [])
+
+    def test_values_as_they_complete(self):
+        stream = self.json.JSONStreamDecoder()
+        stream.feed('{"a": 1}\n{"b": ')
+        self.assertEqual(list(stream.read_values()), [{"a": 1}])
+        stream.feed('2}\n12')
+        self.assertEqual(list(stream.read_values()), [{"b": 2}])
+        stream.feed('3')
+        self.assertEqual(list(stream.read_values()), [])
+        stream.close()
+        self.assertEqual(list(stream.read_values()), [123])
+        with self.assertRaises(ValueError):
+            stream.feed('1')
+
+    def test_array(self):
+        text = '[%s]' % ', '.join(TEXT.splitlines())
+        for size in (1, 5, len(text)):
+            with self.subTest(size=size):
+                self.assertEqual(self.decode(self.split(text, size),
+                                             array=True),
+                                 DOCUMENTS)
+        self.assertEqual(self.decode([' [', ' ] \n'], array=True), [])
+        self.assertEqual(self.decode(['[1', '0,2', '0]'], array=True),
+                         [10, 20])
+
+    def test_bytes(self):
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                         'utf-32', 'utf-32-be'):
+            data = TEXT.encode(encoding)
+            for size in (1, 3, len(data)):
+                with self.subTest(encoding=encoding, size=size):
+                    self.assertEqual(self.decode(self.split(data, size)),
+                                     DOCUMENTS)
+        self.assertEqual(self.decode([b'1']), [1])
+        self.assertEqual(self.decode([bytearray(b'[1,'), memoryview(b'2]')],
+                                     array=True),
+                         [1, 2])
+
+    def test_decoder(self):
+        decoder = self.json.JSONDecoder(parse_int=str, object_hook=len)
+        self.assertEqual(self.decode(['{"a": 1, "b": 2} 3'], decoder=decoder),
+                         [2, '3'])
+
+    def check_error(self, chunks, msg, values=(), **kwargs):
+        stream = self.json.JSONStreamDecoder(**kwargs)
+        got = []
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            for chunk in chunks:
+                stream.feed(chunk)
+                for value in stream.read_values():
+                    got.append(value)
+            stream.close()
+            for value in stream.read_values():
+                got.append(value)
+        self.assertEqual(cm.exception.msg, msg)
+        self.assertEqual(got, list(values))
+        return stream
+
+    def test_errors(self):
+        self.check_error(['{"a": 1}\n{"b": 2,,}' + ' ' * 20, '{}'],
+                         'Expecting property name enclosed in double quotes',
+                         [{"a": 1}])
+        self.check_error(['[1, 2]\n[3, 4'], "Expecting ',' delimiter",
+                         [[1, 2]])
+        self.check_error(['"abc'], 'Unterminated string starting at')
+        self.check_error(['tru'], 'Expecting value')
+        self.check_error(['[1, 2'], "Expecting ',' delimiter", [1, 2],
+                         array=True)
+        self.check_error(['[1,'], 'Expecting value', [1], array=True)
+        self.check_error([''], 'Expecting value', array=True)
+        self.check_error(['{}'], "Expecting '['", array=True)
+        self.check_error(['[1] [2]'], 'Extra data', [1], array=True)
+        self.check_error(['[1 2]'], "Expecting ',' delimiter", [1],
+                         array=True)
+        # Nothing is decoded after an error.
+        stream = self.json.JSONStreamDecoder()
+        stream.feed('1 } 2' + ' ' * 20)
+        values = stream.read_values()
+        self.assertEqual(next(values), 1)
+        self.assertRaises(self.JSONDecodeError, next, values)
+        stream.feed('3 ')
+        stream.close()
+        self.assertEqual(list(stream.read_values()), [])
+
+    def test_long_value(self):
+        # A long value fed in small chunks is not rescanned for every chunk.
+        text = '[%s]' % ', '.join(['"%d"' % i for i in range(20000)])
+        stream = self.json.JSONStreamDecoder()
+        attempts = 0
+        raw_decode = stream.decoder.raw_decode
+        def counting_raw_decode(s, idx=0):
+            nonlocal attempts
+            attempts += 1
+            return raw_decode(s, idx)
+        stream.decoder.raw_decode = counting_raw_decode
+        for chunk in self.split(text, 10):
+            stream.feed(chunk)
+        stream.close()
+        self.assertEqual(len(next(stream.read_values())), 20000)
+        self.assertLess(attempts, 30)
+
+    def test_iterload(self):
+        self.assertEqual(list(self.json.iterload(StringIO(TEXT),
+                                                 chunk_size=4)),
+                         DOCUMENTS)
+        fp = BytesIO(('[%s]' % TEXT.replace('\n', ',')).encode('utf-16'))
+        self.assertEqual(list(self.json.iterload(fp, array=True)), DOCUMENTS)
+        values = self.json.iterload(StringIO('{"a": 1.5} {"b": 2}'),
+                                    parse_float=str, object_pairs_hook=list)
+        self.assertEqual(list(values), [[('a', '1.5')], [('b', 2)]])
+        values = self.json.iterload(StringIO('1 2 ]'))
+        self.assertEqual(next(values), 1)
+        self.assertEqual(next(values), 2)
+        self.assertRaises(self.JSONDecodeError, next, values)
+
+
+class TestPyStream(TestStream, PyTest): pass
+class TestCStream(TestStream, CTest): pass
@@ -147,6 +147,61 @@ def test_jsonlines(self):
         self.assertEqual(process.stdout, self.jsonlines_expect)
         self.assertEqual(process.stderr, '')
 
+    def test_jsonlines_jobs(self):
+        raw = ''.join('{"n": %d, "s": ["\xe9"]}\n' % i for i in range(100))
+        for jobs in '0', '2':
+            args = (sys.executable, '-m', 'json.tool', '--json-lines',
+                    '--jobs', jobs, '--compact', '--no-ensure-ascii')
+            process = subprocess.run(args, input=raw.encode(),
+                                     capture_output=True, check=True)
+            self.assertEqual(process.stdout, raw.replace(' ', '').encode())
+            self.assertEqual(process.stderr, b'')
+        args = (sys.executable, '-m', 'json.tool', '--json-lines',
+                '--jobs', '2')
+        process = subprocess.run(args, input=self.jsonlines_raw,
+                                 capture_output=True, text=True, check=True)
+        self.assertEqual(process.stdout, self.jsonlines_expect)
+
+    def test_jsonlines_jobs_output_encoding(self):
+        # The output of the workers is encoded by sys.stdout, as in the
+        # serial path.
+        raw = '["\xe9"]\n["\u20ac"]\n'
+        env = dict(os.environ, PYTHONIOENCODING='latin-1:replace')
+        outputs = []
+        for jobs in [], ['--jobs', '2']:
+            args = (sys.executable, '-m', 'json.tool', '--json-lines',
+                    '--compact', '--no-ensure-ascii', *jobs)
+            process = subprocess.run(args, input=raw.encode(), env=env,
+                                     capture_output=True, check=True)
+            outputs.append(process.stdout)
+        self.assertEqual(outputs[0], b'["\xe9"]\n["?"]\n')
+        self.assertEqual(outputs[1], outputs[0])
+
+    def test_jsonlines_jobs_error(self):
+        args = (sys.executable, '-m', 'json.tool', '--json-lines',
+                '--jobs', '2', '--compact')
+        process = subprocess.run(args, input='[1]\n[2\n[3]\n',
+                                 capture_output=True, text=True)
+        self.assertEqual(process.returncode, 1)
+        self.assertEqual(process.stdout, '[1]\n')
+        self.assertIn("Expecting ',' delimiter", process.stderr)
+
+    def test_stats(self):
+        args = sys.executable, '-m', 'json.tool', '--json-lines', '--stats'
+        process = subprocess.run(args, input=self.jsonlines_raw,
+                                 capture_output=True, text=True, check=True)
+        self.assertEqual(process.stdout, self.jsonlines_expect)
+        self.assertRegex(process.stderr,
+                         r'^2 documents, 0\.0 MiB in .* s \(.* documents/s, .* MiB/s\)\n$')
+
+    def test_jobs_and_stats_require_jsonlines(self):
+        for option in ['--jobs', '2'], ['--stats']:
+            args = sys.executable, '-m', 'json.tool', *option
+            process = subprocess.run(args, input='[]', capture_output=True,
+                                     text=True)
+            self.assertEqual(process.returncode, 2)
+            self.assertIn('requires --json-lines', process.stderr)
+
     def test_help_flag(self):
         rc, out, err = assert_python_ok('-m', 'json.tool', '-h')
         self.assertEqual(rc, 0)
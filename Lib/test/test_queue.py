@@ -241,6 +241,68 @@ def test_shrinking_queue(self):
         with self.assertRaises(self.queue.Full):
             q.put_nowait(4)
 
+    def test_put_many_get_many(self):
+        q = self.type2test()
+        q.put_many([3, 1, 2])
+        q.put_many(iter([]))
+        self.assertEqual(q.qsize(), 3)
+        self.assertEqual(q.unfinished_tasks, 3)
+        items = q.get_many(2)
+        self.assertEqual(len(items), 2)
+        items += q.get_many()
+        target_order = dict(Queue = [3, 1, 2],
+                            LifoQueue = [2, 1, 3],
+                            PriorityQueue = [1, 2, 3])
+        self.assertEqual(items, target_order[q.__class__.__name__])
+        with self.assertRaises(self.queue.Empty):
+            q.get_many(block=False)
+        with self.assertRaises(self.queue.Empty):
+            q.get_many(timeout=0.01)
+        with self.assertRaises(ValueError):
+            q.get_many(0)
+        with self.assertRaises(ValueError):
+            q.get_many(timeout=-1)
+
+    def test_put_many_bounded(self):
+        q = self.type2test(QUEUE_SIZE)
+        q.put(0)
+        with self.assertRaises(self.queue.Full):
+            q.put_many(range(QUEUE_SIZE), block=False)
+        self.assertEqual(q.qsize(), 1)
+        q.put_many(range(QUEUE_SIZE - 1), block=False)
+        self.assertTrue(q.full())
+        q.get_many()
+        with self.assertRaises(self.queue.Full):
+            q.put_many(range(QUEUE_SIZE + 2), timeout=0.01)
+        # The items which fitted were added.
+        self.assertEqual(q.qsize(), QUEUE_SIZE)
+        with self.assertRaises(ValueError):
+            q.put_many([1], timeout=-1)
+
+    def test_blocking_put_many(self):
+        q = self.type2test(QUEUE_SIZE)
+        items = list(range(3 * QUEUE_SIZE))
+        got = []
+        def consume():
+            while len(got) < len(items):
+                got.extend(q.get_many())
+        thread = threading.Thread(target=consume)
+        thread.start()
+        try:
+            q.put_many(items)
+        finally:
+            threading_helper.join_thread(thread)
+        self.assertEqual(sorted(got), items)
+        self.assertEqual(q.unfinished_tasks, len(items))
+
+    def test_blocking_get_many(self):
+        q = self.type2test()
+        result = self.do_blocking_test(q.get_many, (), q.put_many, ([1],))
+        self.assertEqual(result, [1])
+        result = self.do_blocking_test(q.get_many, (None, True, 10),
+                                       q.put_many, ([2, 2],))
+        self.assertEqual(result, [2, 2])
+
 class QueueTest(BaseQueueTestMixin):
 
     def setUp(self):
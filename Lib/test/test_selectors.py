@@ -533,6 +533,54 @@ def test_register_file(self):
                 s.get_key(f)
 
 
+@unittest.skipUnless(hasattr(selectors, 'IoUringSelector'),
+                     "Test needs selectors.IoUringSelector")
+class IoUringSelectorTestCase(BaseSelectorTestCase, ScalableSelectorMixIn,
+                              unittest.TestCase):
+
+    SELECTOR = getattr(selectors, 'IoUringSelector', None)
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.SELECTOR().close()
+        except OSError as exc:
+            raise unittest.SkipTest(f'io_uring is not available: {exc}')
+
+    def test_register_bad_fd(self):
+        # The fd is only checked by the next select(), which reports it
+        # ready once.
+        s = self.SELECTOR()
+        self.addCleanup(s.close)
+        bad_f = os_helper.make_bad_fd()
+        key = s.register(bad_f, selectors.EVENT_READ)
+        self.assertEqual(s.select(0), [(key, selectors.EVENT_READ)])
+        self.assertEqual(s.select(0), [])
+        s.unregister(bad_f)
+
+    def test_operation(self):
+        s = self.SELECTOR()
+        self.addCleanup(s.close)
+        rd, wr = self.make_socketpair()
+        results = []
+        buf = bytearray(10)
+        s._submit('recv', results.append, rd.fileno(), buf)
+        self.assertEqual(s.select(0), [])
+        wr.send(b'data')
+        self.assertEqual(s.select(support.SHORT_TIMEOUT), [])
+        self.assertEqual(results, [4])
+        self.assertEqual(buf[:4], b'data')
+
+        # A cancelled operation doesn't call its callback.
+        user_data = s._submit('recv', results.append, rd.fileno(), buf)
+        s._cancel(user_data)
+        s.select(0)
+        wr.send(b'data')
+        self.assertEqual(s.select(0), [])
+        self.assertEqual(results, [4])
+        self.assertEqual(rd.recv(10), b'data')
+
+
 @unittest.skipUnless(hasattr(selectors, 'KqueueSelector'),
                      "Test needs selectors.KqueueSelector)")
 class KqueueSelectorTestCase(BaseSelectorTestCase, ScalableSelectorMixIn,
@@ -31,9 +31,13 @@ typedef struct {
        all running event loops.  {EventLoop: Task} */
     PyObject *current_tasks;
 
-    /* WeakSet containing all alive tasks. */
+    /* WeakSet containing all alive tasks, except eager tasks still
+       running their first step. */
     PyObject *all_tasks;
 
+    /* Set containing eager tasks while they run their first step. */
+    PyObject *eager_tasks;
+
     /* An isinstance type cache for the 'is_coroutine()' function. */
     PyObject *iscoroutine_typecache;
 
@@ -1835,6 +1839,7 @@ class _asyncio.Task "TaskObj *" "&Task_Type"
 /*[clinic end generated code: output=da39a3ee5e6b4b0d input=719dcef0fcc03b37]*/
 
 static int task_call_step_soon(asyncio_state *state, TaskObj *, PyObject *);
+static int task_eager_start(asyncio_state *state, TaskObj *task);
 static PyObject * task_wakeup(TaskObj *, PyObject *);
 static PyObject * task_step(asyncio_state *, TaskObj *, PyObject *);
 
@@ -1957,6 +1962,13 @@ register_task(asyncio_state *state, PyObject *task)
 }
 
 
+static int
+register_eager_task(asyncio_state *state, PyObject *task)
+{
+    return PySet_Add(state->eager_tasks, task);
+}
+
+
 static int
 unregister_task(asyncio_state *state, PyObject *task)
 {
@@ -1970,6 +1982,13 @@ unregister_task(asyncio_state *state, PyObject *task)
 }
 
 
+static int
+unregister_eager_task(asyncio_state *state, PyObject *task)
+{
+    return PySet_Discard(state->eager_tasks, task) < 0 ? -1 : 0;
+}
+
+
 static int
 enter_task(asyncio_state *state, PyObject *loop, PyObject *task)
 {
@@ -2022,6 +2041,42 @@ leave_task(asyncio_state *state, PyObject *loop, PyObject *task)
     return _PyDict_DelItem_KnownHash(state->current_tasks, loop, hash);
 }
 
+static PyObject *
+swap_current_task(asyncio_state *state, PyObject *loop, PyObject *task)
+{
+    PyObject *prev_task;
+    Py_hash_t hash;
+    hash = PyObject_Hash(loop);
+    if (hash == -1) {
+        return NULL;
+    }
+
+    prev_task = _PyDict_GetItem_KnownHash(state->current_tasks, loop, hash);
+    if (prev_task == NULL) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+        prev_task = Py_None;
+    }
+    Py_INCREF(prev_task);
+
+    if (task == Py_None) {
+        if (_PyDict_DelItem_KnownHash(state->current_tasks, loop, hash) == -1) {
+            goto error;
+        }
+    } else {
+        if (_PyDict_SetItem_KnownHash(state->current_tasks, loop, task, hash) == -1) {
+            goto error;
+        }
+    }
+
+    return prev_task;
+
+error:
+    Py_DECREF(prev_task);
+    return NULL;
+}
+
 /* ----- Task */
 
 /*[clinic input]
@@ -2032,14 +2087,16 @@ _asyncio.Task.__init__
     loop: object = None
     name: object = None
     context: object = None
+    eager_start: bool = False
 
 A coroutine wrapped in a Future.
 [clinic start generated code]*/
 
 static int
 _asyncio_Task___init___impl(TaskObj *self, PyObject *coro, PyObject *loop,
-                            PyObject *name, PyObject *context)
-/*[clinic end generated code: output=49ac96fe33d0e5c7 input=924522490c8ce825]*/
+                            PyObject *name, PyObject *context,
+                            int eager_start)
+/*[clinic end generated code: output=7aced2d27836f1a1 input=18e3f113a51b829d]*/
 
 {
     if (future_init((FutureObj*)self, loop)) {
@@ -2088,6 +2145,25 @@ _asyncio_Task___init___impl(TaskObj *self, PyObject *coro, PyObject *loop,
         return -1;
     }
 
+    if (eager_start) {
+        PyObject *res = PyObject_CallMethodNoArgs(self->task_loop,
+                                                  &_Py_ID(is_running));
+        if (res == NULL) {
+            return -1;
+        }
+        int is_loop_running = PyObject_IsTrue(res);
+        Py_DECREF(res);
+        if (is_loop_running < 0) {
+            return -1;
+        }
+        if (is_loop_running) {
+            if (task_eager_start(state, self)) {
+                return -1;
+            }
+            return 0;
+        }
+    }
+
     if (task_call_step_soon(state, self, NULL)) {
         return -1;
     }
@@ -3058,6 +3134,81 @@ task_step(asyncio_state *state, TaskObj *task, PyObject *exc)
     }
 }
 
+static int
+task_eager_start(asyncio_state *state, TaskObj *task)
+{
+    PyObject *exc = NULL;
+    int retval = 0;
+
+    PyObject *prevtask = swap_current_task(state, task->task_loop,
+                                           (PyObject *)task);
+    if (prevtask == NULL) {
+        return -1;
+    }
+
+    if (register_eager_task(state, (PyObject *)task) == -1) {
+        Py_DECREF(prevtask);
+        return -1;
+    }
+
+    if (PyContext_Enter(task->task_context) == -1) {
+        Py_DECREF(prevtask);
+        return -1;
+    }
+
+    PyObject *stepres = task_step_impl(state, task, NULL);
+    if (stepres == NULL) {
+        exc = PyErr_GetRaisedException();
+        retval = -1;
+    }
+    else {
+        Py_DECREF(stepres);
+    }
+
+    /* Restore the previous state even if the step failed, chaining any
+       error raised along the way onto the original one. */
+    if (unregister_eager_task(state, (PyObject *)task) == -1) {
+        _PyErr_ChainExceptions1(exc);
+        exc = PyErr_GetRaisedException();
+        retval = -1;
+    }
+
+    PyObject *curtask = swap_current_task(state, task->task_loop, prevtask);
+    Py_DECREF(prevtask);
+    if (curtask == NULL) {
+        _PyErr_ChainExceptions1(exc);
+        exc = PyErr_GetRaisedException();
+        retval = -1;
+    }
+    else {
+        assert(curtask == (PyObject *)task);
+        Py_DECREF(curtask);
+    }
+
+    if (PyContext_Exit(task->task_context) == -1) {
+        _PyErr_ChainExceptions1(exc);
+        exc = PyErr_GetRaisedException();
+        retval = -1;
+    }
+
+    if (task->task_state == STATE_PENDING) {
+        if (register_task(state, (PyObject *)task) == -1) {
+            _PyErr_ChainExceptions1(exc);
+            exc = PyErr_GetRaisedException();
+            retval = -1;
+        }
+    }
+    else {
+        /* The coroutine finished synchronously; drop it right away. */
+        Py_CLEAR(task->task_coro);
+    }
+
+    if (exc != NULL) {
+        PyErr_SetRaisedException(exc);
+    }
+    return retval;
+}
+
 static PyObject *
 task_wakeup(TaskObj *task, PyObject *o)
 {
@@ -3222,6 +3373,28 @@ _asyncio__register_task_impl(PyObject *module, PyObject *task)
 }
 
 
+/*[clinic input]
+_asyncio._register_eager_task
+
+    task: object
+
+Register a new task in asyncio as executed by loop.
+
+Returns None.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__register_eager_task_impl(PyObject *module, PyObject *task)
+/*[clinic end generated code: output=dfe1d45367c73f1a input=237f684683398c51]*/
+{
+    asyncio_state *state = get_asyncio_state(module);
+    if (register_eager_task(state, task) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
 /*[clinic input]
 _asyncio._unregister_task
 
@@ -3244,6 +3417,28 @@ _asyncio__unregister_task_impl(PyObject *module, PyObject *task)
 }
 
 
+/*[clinic input]
+_asyncio._unregister_eager_task
+
+    task: object
+
+Unregister a task.
+
+Returns None.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__unregister_eager_task_impl(PyObject *module, PyObject *task)
+/*[clinic end generated code: output=a426922bd07f23d1 input=9d07401ef14ee048]*/
+{
+    asyncio_state *state = get_asyncio_state(module);
+    if (unregister_eager_task(state, task) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
 /*[clinic input]
 _asyncio._enter_task
 
@@ -3294,6 +3489,27 @@ _asyncio__leave_task_impl(PyObject *module, PyObject *loop, PyObject *task)
 }
 
 
+/*[clinic input]
+_asyncio._swap_current_task
+
+    loop: object
+    task: object
+
+Temporarily swap in the supplied task and return the original one (or None).
+
+This is intended for use during eager coroutine execution.
+
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__swap_current_task_impl(PyObject *module, PyObject *loop,
+                                 PyObject *task)
+/*[clinic end generated code: output=9f88de958df74c7e input=c9c72208d3d38b6c]*/
+{
+    return swap_current_task(get_asyncio_state(module), loop, task);
+}
+
+
 /*[clinic input]
 _asyncio.current_task
 
@@ -3376,6 +3592,7 @@ module_traverse(PyObject *mod, visitproc visit, void *arg)
     Py_VISIT(state->asyncio_CancelledError);
 
     Py_VISIT(state->all_tasks);
+    Py_VISIT(state->eager_tasks);
     Py_VISIT(state->current_tasks);
     Py_VISIT(state->iscoroutine_typecache);
 
@@ -3413,6 +3630,7 @@ module_clear(PyObject *mod)
     Py_CLEAR(state->asyncio_CancelledError);
 
     Py_CLEAR(state->all_tasks);
+    Py_CLEAR(state->eager_tasks);
     Py_CLEAR(state->current_tasks);
     Py_CLEAR(state->iscoroutine_typecache);
 
@@ -3498,6 +3716,11 @@ module_init(asyncio_state *state)
         goto fail;
     }
 
+    state->eager_tasks = PySet_New(NULL);
+    if (state->eager_tasks == NULL) {
+        goto fail;
+    }
+
     Py_DECREF(module);
     return 0;
 
@@ -3518,9 +3741,12 @@ static PyMethodDef asyncio_methods[] = {
     _ASYNCIO__GET_RUNNING_LOOP_METHODDEF
     _ASYNCIO__SET_RUNNING_LOOP_METHODDEF
     _ASYNCIO__REGISTER_TASK_METHODDEF
+    _ASYNCIO__REGISTER_EAGER_TASK_METHODDEF
     _ASYNCIO__UNREGISTER_TASK_METHODDEF
+    _ASYNCIO__UNREGISTER_EAGER_TASK_METHODDEF
     _ASYNCIO__ENTER_TASK_METHODDEF
     _ASYNCIO__LEAVE_TASK_METHODDEF
+    _ASYNCIO__SWAP_CURRENT_TASK_METHODDEF
     {NULL, NULL}
 };
 
@@ -3561,6 +3787,10 @@ module_exec(PyObject *mod)
         return -1;
     }
 
+    if (PyModule_AddObjectRef(mod, "_eager_tasks", state->eager_tasks) < 0) {
+        return -1;
+    }
+
     if (PyModule_AddObjectRef(mod, "_current_tasks", state->current_tasks) < 0) {
         return -1;
     }
@@ -112,6 +112,25 @@ typedef struct {
 
 } DialectObj;
 
+/* How Reader.read_columns() stores the fields of a column */
+typedef enum {
+    COLUMN_STR,             /* list of str */
+    COLUMN_INT,             /* list of int */
+    COLUMN_FLOAT,           /* list of float */
+    COLUMN_CALL,            /* list of converter(str) */
+    COLUMN_INT64,           /* array('q') */
+    COLUMN_DOUBLE           /* array('d') */
+} ColumnKind;
+
+typedef struct {
+    ColumnKind kind;
+    PyObject *values;       /* list of the values, for the list kinds */
+    PyObject *converter;    /* for COLUMN_CALL */
+    char *buf;              /* C values, for the array kinds */
+    Py_ssize_t buf_len;     /* size of the values in buf, in bytes */
+    Py_ssize_t buf_size;    /* size of the allocated buf */
+} ColumnSink;
+
 typedef struct {
     PyObject_HEAD
 
@@ -126,6 +145,9 @@ typedef struct {
     Py_ssize_t field_len;       /* length of current field */
     int numeric_field;          /* treat field as numeric */
     unsigned long line_num;     /* Source-file line number */
+    ColumnSink *columns;        /* columns of read_columns(), or NULL */
+    Py_ssize_t ncolumns;        /* number of columns */
+    Py_ssize_t column_index;    /* column of the next field of the record */
 } ReaderObj;
 
 typedef struct {
@@ -605,11 +627,15 @@ _call_dialect(_csvstate *module_state, PyObject *dialect_inst, PyObject *kwargs)
 /*
  * READER
  */
+static int column_save_field(ReaderObj *self);
+
 static int
 parse_save_field(ReaderObj *self)
 {
     PyObject *field;
 
+    if (self->columns != NULL)
+        return column_save_field(self);
     field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
                                       (void *) self->field, self->field_len);
     if (field == NULL)
@@ -859,24 +885,17 @@ parse_reset(ReaderObj *self)
     return 0;
 }
 
-static PyObject *
-Reader_iternext(ReaderObj *self)
+/* Parse the next record of the input.  Return 1 if a record was parsed,
+   0 at the end of the input and -1 on error. */
+static int
+parse_record(ReaderObj *self, _csvstate *module_state)
 {
-    PyObject *fields = NULL;
     Py_UCS4 c;
     Py_ssize_t pos, linelen;
     int kind;
     const void *data;
     PyObject *lineobj;
 
-    _csvstate *module_state = _csv_state_from_type(Py_TYPE(self),
-                                                   "Reader.__next__");
-    if (module_state == NULL) {
-        return NULL;
-    }
-
-    if (parse_reset(self) < 0)
-        return NULL;
     do {
         lineobj = PyIter_Next(self->input_iter);
         if (lineobj == NULL) {
@@ -889,7 +908,7 @@ Reader_iternext(ReaderObj *self)
                 else if (parse_save_field(self) >= 0)
                     break;
             }
-            return NULL;
+            return PyErr_Occurred() ? -1 : 0;
         }
         if (!PyUnicode_Check(lineobj)) {
             PyErr_Format(module_state->error_obj,
@@ -899,11 +918,11 @@ Reader_iternext(ReaderObj *self)
                          Py_TYPE(lineobj)->tp_name
                 );
             Py_DECREF(lineobj);
-            return NULL;
+            return -1;
         }
         if (PyUnicode_READY(lineobj) == -1) {
             Py_DECREF(lineobj);
-            return NULL;
+            return -1;
         }
         ++self->line_num;
         kind = PyUnicode_KIND(lineobj);
@@ -914,18 +933,41 @@ Reader_iternext(ReaderObj *self)
             c = PyUnicode_READ(kind, data, pos);
             if (parse_process_char(self, module_state, c) < 0) {
                 Py_DECREF(lineobj);
-                goto err;
+                return -1;
             }
             pos++;
         }
         Py_DECREF(lineobj);
         if (parse_process_char(self, module_state, EOL) < 0)
-            goto err;
+            return -1;
     } while (self->state != START_RECORD);
 
+    return 1;
+}
+
+static PyObject *
+Reader_iternext(ReaderObj *self)
+{
+    PyObject *fields;
+
+    _csvstate *module_state = _csv_state_from_type(Py_TYPE(self),
+                                                   "Reader.__next__");
+    if (module_state == NULL) {
+        return NULL;
+    }
+    if (self->columns != NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "reader is used by read_columns()");
+        return NULL;
+    }
+
+    if (parse_reset(self) < 0)
+        return NULL;
+    if (parse_record(self, module_state) <= 0)
+        return NULL;
+
     fields = self->fields;
     self->fields = NULL;
-err:
     return fields;
 }
 
@@ -962,6 +1004,390 @@ Reader_clear(ReaderObj *self)
     return 0;
 }
 
+/*
+ * Column-oriented reading
+ */
+
+/* Longest field converted to a number without creating a str */
+#define COLUMN_NUMBER_MAX 64
+
+/* Parse the field as a decimal integer fitting in a long long, ignoring
+   surrounding whitespace.  Return 0 if it has another form, which is left to
+   int(). */
+static int
+column_parse_int64(ReaderObj *self, long long *result)
+{
+    const Py_UCS4 *p = self->field;
+    const Py_UCS4 *end = p + self->field_len;
+    unsigned long long value = 0;
+    int negative = 0, ndigits = 0;
+
+    while (p < end && Py_UNICODE_ISSPACE(*p))
+        p++;
+    while (end > p && Py_UNICODE_ISSPACE(end[-1]))
+        end--;
+    if (p < end && (*p == '-' || *p == '+')) {
+        negative = (*p == '-');
+        p++;
+    }
+    for (; p < end; p++) {
+        /* 18 digits cannot overflow */
+        if (*p < '0' || *p > '9' || ++ndigits > 18)
+            return 0;
+        value = value * 10 + (*p - '0');
+    }
+    if (ndigits == 0)
+        return 0;
+    *result = negative ? -(long long)value : (long long)value;
+    return 1;
+}
+
+/* Parse the field as a float, ignoring surrounding whitespace.  Return 0
+   if it has another form, which is left to float(). */
+static int
+column_parse_double(ReaderObj *self, double *result)
+{
+    char buf[COLUMN_NUMBER_MAX + 1];
+    const Py_UCS4 *p = self->field;
+    const Py_UCS4 *end = p + self->field_len;
+    char *endptr;
+    Py_ssize_t i, len;
+
+    while (p < end && Py_UNICODE_ISSPACE(*p))
+        p++;
+    while (end > p && Py_UNICODE_ISSPACE(end[-1]))
+        end--;
+    len = end - p;
+    if (len == 0 || len > COLUMN_NUMBER_MAX)
+        return 0;
+    for (i = 0; i < len; i++) {
+        /* Underscores are handled by float() */
+        if (p[i] >= 128 || p[i] == '_')
+            return 0;
+        buf[i] = (char)p[i];
+    }
+    buf[len] = '\0';
+    *result = PyOS_string_to_double(buf, &endptr, NULL);
+    if (*result == -1.0 && PyErr_Occurred()) {
+        PyErr_Clear();
+        return 0;
+    }
+    return endptr == buf + len;
+}
+
+static int
+column_append(ColumnSink *col, const void *value, Py_ssize_t size)
+{
+    if (col->buf_len + size > col->buf_size) {
+        Py_ssize_t new_size = col->buf_size ? 2 * col->buf_size : 1024;
+        char *new_buf = col->buf;
+        PyMem_Resize(new_buf, char, new_size);
+        if (new_buf == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        col->buf = new_buf;
+        col->buf_size = new_size;
+    }
+    memcpy(col->buf + col->buf_len, value, size);
+    col->buf_len += size;
+    return 0;
+}
+
+static int
+column_save_field(ReaderObj *self)
+{
+    ColumnSink *col;
+    PyObject *field = NULL, *value;
+    long long ll;
+    double d;
+    int numeric_field = self->numeric_field;
+
+    self->numeric_field = 0;
+    if (self->column_index >= self->ncolumns) {
+        /* Counted, to be reported at the end of the record */
+        self->column_index++;
+        self->field_len = 0;
+        return 0;
+    }
+    col = &self->columns[self->column_index++];
+
+    /* The fast paths of the numeric columns, without a str */
+    switch (col->kind) {
+    case COLUMN_INT:
+        if (column_parse_int64(self, &ll)) {
+            self->field_len = 0;
+            value = PyLong_FromLongLong(ll);
+            goto append;
+        }
+        break;
+    case COLUMN_INT64:
+        if (column_parse_int64(self, &ll)) {
+            self->field_len = 0;
+            return column_append(col, &ll, sizeof(ll));
+        }
+        break;
+    case COLUMN_FLOAT:
+        if (column_parse_double(self, &d)) {
+            self->field_len = 0;
+            value = PyFloat_FromDouble(d);
+            goto append;
+        }
+        break;
+    case COLUMN_DOUBLE:
+        if (column_parse_double(self, &d)) {
+            self->field_len = 0;
+            return column_append(col, &d, sizeof(d));
+        }
+        break;
+    default:
+        break;
+    }
+
+    field = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                      (void *) self->field, self->field_len);
+    self->field_len = 0;
+    if (field == NULL)
+        return -1;
+    switch (col->kind) {
+    case COLUMN_STR:
+        if (numeric_field) {
+            value = PyNumber_Float(field);
+        }
+        else {
+            value = Py_NewRef(field);
+        }
+        break;
+    case COLUMN_INT:
+        value = PyLong_FromUnicodeObject(field, 10);
+        break;
+    case COLUMN_FLOAT:
+        value = PyFloat_FromString(field);
+        break;
+    case COLUMN_CALL:
+        value = PyObject_CallOneArg(col->converter, field);
+        break;
+    case COLUMN_INT64:
+        value = PyLong_FromUnicodeObject(field, 10);
+        Py_DECREF(field);
+        if (value == NULL)
+            return -1;
+        ll = PyLong_AsLongLong(value);
+        Py_DECREF(value);
+        if (ll == -1 && PyErr_Occurred())
+            return -1;
+        return column_append(col, &ll, sizeof(ll));
+    case COLUMN_DOUBLE:
+        value = PyFloat_FromString(field);
+        Py_DECREF(field);
+        if (value == NULL)
+            return -1;
+        d = PyFloat_AS_DOUBLE(value);
+        Py_DECREF(value);
+        return column_append(col, &d, sizeof(d));
+    default:
+        Py_UNREACHABLE();
+    }
+    Py_DECREF(field);
+
+append:
+    if (value == NULL)
+        return -1;
+    if (PyList_Append(col->values, value) < 0) {
+        Py_DECREF(value);
+        return -1;
+    }
+    Py_DECREF(value);
+    return 0;
+}
+
+static void
+columns_free(ColumnSink *columns, Py_ssize_t ncolumns)
+{
+    for (Py_ssize_t i = 0; i < ncolumns; i++) {
+        Py_XDECREF(columns[i].values);
+        Py_XDECREF(columns[i].converter);
+        PyMem_Free(columns[i].buf);
+    }
+    PyMem_Free(columns);
+}
+
+static int
+column_init(ColumnSink *col, PyObject *type)
+{
+    if (type == Py_None || type == (PyObject *)&PyUnicode_Type) {
+        col->kind = COLUMN_STR;
+    }
+    else if (type == (PyObject *)&PyLong_Type) {
+        col->kind = COLUMN_INT;
+    }
+    else if (type == (PyObject *)&PyFloat_Type) {
+        col->kind = COLUMN_FLOAT;
+    }
+    else if (PyUnicode_Check(type)) {
+        if (PyUnicode_CompareWithASCIIString(type, "q") == 0) {
+            col->kind = COLUMN_INT64;
+        }
+        else if (PyUnicode_CompareWithASCIIString(type, "d") == 0) {
+            col->kind = COLUMN_DOUBLE;
+        }
+        else {
+            PyErr_Format(PyExc_ValueError,
+                         "column typecode must be 'q' or 'd', not %R", type);
+            return -1;
+        }
+        return 0;
+    }
+    else if (PyCallable_Check(type)) {
+        col->kind = COLUMN_CALL;
+        col->converter = Py_NewRef(type);
+    }
+    else {
+        PyErr_Format(PyExc_TypeError,
+                     "column type must be None, a callable or a typecode, "
+                     "not %.200s", Py_TYPE(type)->tp_name);
+        return -1;
+    }
+    col->values = PyList_New(0);
+    return col->values == NULL ? -1 : 0;
+}
+
+static PyObject *
+column_finish(ColumnSink *col)
+{
+    PyObject *array_type, *mview, *res, *tmp;
+    const char *typecode;
+
+    if (col->kind != COLUMN_INT64 && col->kind != COLUMN_DOUBLE) {
+        return Py_NewRef(col->values);
+    }
+    typecode = (col->kind == COLUMN_INT64) ? "q" : "d";
+    array_type = _PyImport_GetModuleAttrString("array", "array");
+    if (array_type == NULL)
+        return NULL;
+    res = PyObject_CallFunction(array_type, "s", typecode);
+    Py_DECREF(array_type);
+    if (res == NULL || col->buf_len == 0)
+        return res;
+    mview = PyMemoryView_FromMemory(col->buf, col->buf_len, PyBUF_READ);
+    if (mview == NULL) {
+        Py_DECREF(res);
+        return NULL;
+    }
+    tmp = PyObject_CallMethod(res, "frombytes", "O", mview);
+    Py_DECREF(mview);
+    if (tmp == NULL) {
+        Py_CLEAR(res);
+    }
+    else {
+        Py_DECREF(tmp);
+    }
+    return res;
+}
+
+PyDoc_STRVAR(Reader_read_columns_doc,
+"read_columns(types, max_rows=-1)\n"
+"\n"
+"Read up to max_rows records, or all the remaining records if max_rows is\n"
+"negative, and return a list of their columns, or an empty list at the end\n"
+"of the input.  Empty lines are skipped.  If an exception is raised, the\n"
+"records already read by this call are lost.\n"
+"\n"
+"types is a sequence with an item for each column: None or str for a list\n"
+"of str, int or float for a list of numbers, another callable to call with\n"
+"each field, or the typecode 'q' or 'd' for an array.array.");
+
+static PyObject *
+Reader_read_columns(ReaderObj *self, PyObject *args, PyObject *kwargs)
+{
+    static char *kwlist[] = {"types", "max_rows", NULL};
+    PyObject *types, *result = NULL;
+    Py_ssize_t max_rows = -1, nrows = 0, ncolumns, i;
+    ColumnSink *columns;
+    int rc;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|n:read_columns",
+                                     kwlist, &types, &max_rows))
+        return NULL;
+    _csvstate *module_state = _csv_state_from_type(Py_TYPE(self),
+                                                   "Reader.read_columns");
+    if (module_state == NULL) {
+        return NULL;
+    }
+    if (self->columns != NULL) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "reader is used by read_columns()");
+        return NULL;
+    }
+    types = PySequence_Fast(types, "types must be a sequence");
+    if (types == NULL)
+        return NULL;
+    ncolumns = PySequence_Fast_GET_SIZE(types);
+    if (ncolumns == 0) {
+        Py_DECREF(types);
+        PyErr_SetString(PyExc_ValueError, "types must not be empty");
+        return NULL;
+    }
+    columns = PyMem_Calloc(ncolumns, sizeof(ColumnSink));
+    if (columns == NULL) {
+        Py_DECREF(types);
+        return PyErr_NoMemory();
+    }
+    for (i = 0; i < ncolumns; i++) {
+        if (column_init(&columns[i],
+                        PySequence_Fast_GET_ITEM(types, i)) < 0) {
+            Py_DECREF(types);
+            goto done;
+        }
+    }
+    Py_DECREF(types);
+
+    self->columns = columns;
+    self->ncolumns = ncolumns;
+    while (max_rows < 0 || nrows < max_rows) {
+        self->field_len = 0;
+        self->state = START_RECORD;
+        self->numeric_field = 0;
+        self->column_index = 0;
+        rc = parse_record(self, module_state);
+        if (rc < 0)
+            goto done;
+        if (rc == 0)
+            break;
+        if (self->column_index == 0)
+            continue;       /* empty line */
+        if (self->column_index != ncolumns) {
+            PyErr_Format(module_state->error_obj,
+                         "expected %zd fields, got %zd",
+                         ncolumns, self->column_index);
+            goto done;
+        }
+        nrows++;
+    }
+
+    if (nrows == 0) {
+        result = PyList_New(0);
+        goto done;
+    }
+    result = PyList_New(ncolumns);
+    if (result == NULL)
+        goto done;
+    for (i = 0; i < ncolumns; i++) {
+        PyObject *column = column_finish(&columns[i]);
+        if (column == NULL) {
+            Py_CLEAR(result);
+            goto done;
+        }
+        PyList_SET_ITEM(result, i, column);
+    }
+
+done:
+    self->columns = NULL;
+    self->ncolumns = 0;
+    columns_free(columns, ncolumns);
+    return result;
+}
+
 PyDoc_STRVAR(Reader_Type_doc,
 "CSV reader\n"
 "\n"
@@ -970,6 +1396,8 @@ PyDoc_STRVAR(Reader_Type_doc,
 );
 
 static struct PyMethodDef Reader_methods[] = {
+    { "read_columns", (PyCFunction)(void(*)(void))Reader_read_columns,
+      METH_VARARGS | METH_KEYWORDS, Reader_read_columns_doc},
     { NULL, NULL }
 };
 #define R_OFF(x) offsetof(ReaderObj, x)
@@ -1020,6 +1448,9 @@ csv_reader(PyObject *module, PyObject *args, PyObject *keyword_args)
     self->field = NULL;
     self->field_size = 0;
     self->line_num = 0;
+    self->columns = NULL;
+    self->ncolumns = 0;
+    self->column_index = 0;
 
     if (parse_reset(self) < 0) {
         Py_DECREF(self);
@@ -21,19 +21,23 @@ typedef struct _PyScannerObject {
     signed char strict;
     PyObject *object_hook;
     PyObject *object_pairs_hook;
+    PyObject *object_kwargs_hook;
     PyObject *parse_float;
     PyObject *parse_int;
     PyObject *parse_constant;
     PyObject *memo;
+    Py_ssize_t key_cache_size;
 } PyScannerObject;
 
 static PyMemberDef scanner_members[] = {
     {"strict", T_BOOL, offsetof(PyScannerObject, strict), READONLY, "strict"},
     {"object_hook", T_OBJECT, offsetof(PyScannerObject, object_hook), READONLY, "object_hook"},
     {"object_pairs_hook", T_OBJECT, offsetof(PyScannerObject, object_pairs_hook), READONLY},
+    {"object_kwargs_hook", T_OBJECT, offsetof(PyScannerObject, object_kwargs_hook), READONLY},
     {"parse_float", T_OBJECT, offsetof(PyScannerObject, parse_float), READONLY, "parse_float"},
     {"parse_int", T_OBJECT, offsetof(PyScannerObject, parse_int), READONLY, "parse_int"},
     {"parse_constant", T_OBJECT, offsetof(PyScannerObject, parse_constant), READONLY, "parse_constant"},
+    {"key_cache_size", T_PYSSIZET, offsetof(PyScannerObject, key_cache_size), READONLY, "key_cache_size"},
     {NULL}
 };
 
@@ -86,11 +90,11 @@ encoder_dealloc(PyObject *self);
 static int
 encoder_clear(PyEncoderObject *self);
 static int
-encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *seq, Py_ssize_t indent_level);
+encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *seq, Py_ssize_t indent_level, PyObject *indent_cache);
 static int
-encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *obj, Py_ssize_t indent_level);
+encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *obj, Py_ssize_t indent_level, PyObject *indent_cache);
 static int
-encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *dct, Py_ssize_t indent_level);
+encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer, PyObject *dct, Py_ssize_t indent_level, PyObject *indent_cache);
 static PyObject *
 _encoded_const(PyObject *obj);
 static void
@@ -637,6 +641,7 @@ scanner_traverse(PyScannerObject *self, visitproc visit, void *arg)
     Py_VISIT(Py_TYPE(self));
     Py_VISIT(self->object_hook);
     Py_VISIT(self->object_pairs_hook);
+    Py_VISIT(self->object_kwargs_hook);
     Py_VISIT(self->parse_float);
     Py_VISIT(self->parse_int);
     Py_VISIT(self->parse_constant);
@@ -649,6 +654,7 @@ scanner_clear(PyScannerObject *self)
 {
     Py_CLEAR(self->object_hook);
     Py_CLEAR(self->object_pairs_hook);
+    Py_CLEAR(self->object_kwargs_hook);
     Py_CLEAR(self->parse_float);
     Py_CLEAR(self->parse_int);
     Py_CLEAR(self->parse_constant);
@@ -656,6 +662,73 @@ scanner_clear(PyScannerObject *self)
     return 0;
 }
 
+/* Number of members of an object above which the keys passed to
+   object_kwargs_hook are looked up in a dict rather than linearly. */
+#define KWARGS_LINEAR_SEARCH_MAX 16
+
+static PyObject *
+call_kwargs_hook(PyObject *hook, PyObject *args, PyObject *kwnames)
+{
+    /* Return hook(**members), where args is a list holding a free slot
+       followed by the values of the members and kwnames is a tuple of their
+       names.
+
+       For a class with the default __new__() and an __init__() written in
+       Python, such as a dataclass, the instance is created here and passed
+       to __init__() along with the members, which spares building the
+       dict of keyword arguments of type.__call__().
+    */
+    PyObject **stack = PySequence_Fast_ITEMS(args);
+    Py_ssize_t nargs = PyList_GET_SIZE(args) - 1;
+    PyTypeObject *type;
+    PyObject *init, *obj, *res;
+
+    assert(nargs == PyTuple_GET_SIZE(kwnames));
+    if (!Py_IS_TYPE(hook, &PyType_Type) ||
+        ((PyTypeObject *)hook)->tp_new != PyBaseObject_Type.tp_new)
+    {
+        goto generic;
+    }
+    type = (PyTypeObject *)hook;
+    init = _PyType_Lookup(type, &_Py_ID(__init__));
+    if (init == NULL || !PyFunction_Check(init)) {
+        goto generic;
+    }
+    Py_INCREF(init);
+    res = PyTuple_New(0);
+    if (res == NULL) {
+        Py_DECREF(init);
+        return NULL;
+    }
+    obj = type->tp_new(type, res, NULL);
+    Py_DECREF(res);
+    if (obj == NULL) {
+        Py_DECREF(init);
+        return NULL;
+    }
+    Py_SETREF(stack[0], Py_NewRef(obj));
+    res = PyObject_Vectorcall(init, stack, 1, kwnames);
+    Py_DECREF(init);
+    if (res == NULL) {
+        Py_DECREF(obj);
+        return NULL;
+    }
+    if (res != Py_None) {
+        PyErr_Format(PyExc_TypeError,
+                     "__init__() should return None, not '%.200s'",
+                     Py_TYPE(res)->tp_name);
+        Py_DECREF(res);
+        Py_DECREF(obj);
+        return NULL;
+    }
+    Py_DECREF(res);
+    return obj;
+
+generic:
+    return PyObject_Vectorcall(hook, stack + 1,
+                               PY_VECTORCALL_ARGUMENTS_OFFSET, kwnames);
+}
+
 static PyObject *
 _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ssize_t *next_idx_ptr)
 {
@@ -672,7 +745,11 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     PyObject *val = NULL;
     PyObject *rval = NULL;
     PyObject *key = NULL;
+    PyObject *keys = NULL;
+    PyObject *key_index = NULL;
     int has_pairs_hook = (s->object_pairs_hook != Py_None);
+    int has_kwargs_hook = (!has_pairs_hook &&
+                           s->object_kwargs_hook != Py_None);
     Py_ssize_t next_idx;
 
     if (PyUnicode_READY(pystr) == -1)
@@ -682,12 +759,24 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
     kind = PyUnicode_KIND(pystr);
     end_idx = PyUnicode_GET_LENGTH(pystr) - 1;
 
-    if (has_pairs_hook)
+    if (has_kwargs_hook) {
+        /* rval holds a free slot for call_kwargs_hook() followed by the
+           values, keys holds the names of the keyword arguments */
+        keys = PyList_New(0);
+        if (keys == NULL)
+            return NULL;
+        rval = PyList_New(1);
+        if (rval != NULL)
+            PyList_SET_ITEM(rval, 0, Py_NewRef(Py_None));
+    }
+    else if (has_pairs_hook)
         rval = PyList_New(0);
     else
         rval = PyDict_New();
-    if (rval == NULL)
+    if (rval == NULL) {
+        Py_XDECREF(keys);
         return NULL;
+    }
 
     /* skip whitespace after { */
     while (idx <= end_idx && IS_WHITESPACE(PyUnicode_READ(kind,str, idx))) idx++;
@@ -738,6 +827,66 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
                 }
                 Py_DECREF(item);
             }
+            else if (has_kwargs_hook) {
+                /* As in a dict, the last value of a repeated key wins.
+                   Keys are memoized, so a repeated key is the same object:
+                   small objects are searched linearly, larger ones through
+                   a dict mapping the keys to their index. */
+                Py_ssize_t i, nkeys = PyList_GET_SIZE(keys);
+                if (key_index == NULL && nkeys >= KWARGS_LINEAR_SEARCH_MAX) {
+                    key_index = PyDict_New();
+                    if (key_index == NULL)
+                        goto bail;
+                    for (i = 0; i < nkeys; i++) {
+                        PyObject *pos = PyLong_FromSsize_t(i);
+                        if (pos == NULL)
+                            goto bail;
+                        if (PyDict_SetItem(key_index, PyList_GET_ITEM(keys, i),
+                                           pos) < 0) {
+                            Py_DECREF(pos);
+                            goto bail;
+                        }
+                        Py_DECREF(pos);
+                    }
+                }
+                if (key_index == NULL) {
+                    for (i = 0; i < nkeys; i++) {
+                        if (PyList_GET_ITEM(keys, i) == key)
+                            break;
+                    }
+                }
+                else {
+                    PyObject *pos = PyDict_GetItemWithError(key_index, key);
+                    if (pos != NULL)
+                        i = PyLong_AsSsize_t(pos);
+                    else if (PyErr_Occurred())
+                        goto bail;
+                    else {
+                        i = nkeys;
+                        pos = PyLong_FromSsize_t(nkeys);
+                        if (pos == NULL)
+                            goto bail;
+                        if (PyDict_SetItem(key_index, key, pos) < 0) {
+                            Py_DECREF(pos);
+                            goto bail;
+                        }
+                        Py_DECREF(pos);
+                    }
+                }
+                if (i < nkeys) {
+                    PyObject *old = PyList_GET_ITEM(rval, i + 1);
+                    PyList_SET_ITEM(rval, i + 1, val);
+                    val = NULL;
+                    Py_DECREF(old);
+                }
+                else if (PyList_Append(keys, key) == -1 ||
+                         PyList_Append(rval, val) == -1)
+                {
+                    goto bail;
+                }
+                Py_CLEAR(key);
+                Py_CLEAR(val);
+            }
             else {
                 if (PyDict_SetItem(rval, key, val) < 0)
                     goto bail;
@@ -771,6 +920,21 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
         return val;
     }
 
+    /* object_kwargs_hook(**members), without building a dict */
+    if (has_kwargs_hook) {
+        PyObject *kwnames = PyList_AsTuple(keys);
+        Py_DECREF(keys);
+        Py_XDECREF(key_index);
+        if (kwnames == NULL) {
+            Py_DECREF(rval);
+            return NULL;
+        }
+        val = call_kwargs_hook(s->object_kwargs_hook, rval, kwnames);
+        Py_DECREF(kwnames);
+        Py_DECREF(rval);
+        return val;
+    }
+
     /* if object_hook is not None: rval = object_hook(rval) */
     if (s->object_hook != Py_None) {
         val = PyObject_CallOneArg(s->object_hook, rval);
@@ -781,6 +945,8 @@ _parse_object_unicode(PyScannerObject *s, PyObject *pystr, Py_ssize_t idx, Py_ss
 bail:
     Py_XDECREF(key);
     Py_XDECREF(val);
+    Py_XDECREF(keys);
+    Py_XDECREF(key_index);
     Py_XDECREF(rval);
     return NULL;
 }
@@ -1136,18 +1302,34 @@ scanner_call(PyScannerObject *self, PyObject *args, PyObject *kwds)
                  Py_TYPE(pystr)->tp_name);
         return NULL;
     }
-    PyDict_Clear(self->memo);
+    /* Memoized keys are kept for the next call up to key_cache_size. */
+    if (PyDict_GET_SIZE(self->memo) > self->key_cache_size)
+        PyDict_Clear(self->memo);
     if (rval == NULL)
         return NULL;
     return _build_rval_index_tuple(rval, next_idx);
 }
 
+static int
+get_optional_attr(PyObject *obj, const char *name, PyObject **result)
+{
+    PyObject *oname = PyUnicode_InternFromString(name);
+    if (oname == NULL) {
+        *result = NULL;
+        return -1;
+    }
+    int rc = _PyObject_LookupAttr(obj, oname, result);
+    Py_DECREF(oname);
+    return rc;
+}
+
 static PyObject *
 scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
     PyScannerObject *s;
     PyObject *ctx;
     PyObject *strict;
+    PyObject *key_cache_size;
     static char *kwlist[] = {"context", NULL};
 
     if (!PyArg_ParseTupleAndKeywords(args, kwds, "O:make_scanner", kwlist, &ctx))
@@ -1185,6 +1367,21 @@ scanner_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     s->parse_constant = PyObject_GetAttrString(ctx, "parse_constant");
     if (s->parse_constant == NULL)
         goto bail;
+    /* These two are optional, for contexts other than JSONDecoder */
+    if (get_optional_attr(ctx, "object_kwargs_hook",
+                          &s->object_kwargs_hook) < 0)
+        goto bail;
+    if (s->object_kwargs_hook == NULL)
+        s->object_kwargs_hook = Py_NewRef(Py_None);
+    if (get_optional_attr(ctx, "key_cache_size", &key_cache_size) < 0)
+        goto bail;
+    if (key_cache_size != NULL) {
+        s->key_cache_size = PyNumber_AsSsize_t(key_cache_size,
+                                               PyExc_OverflowError);
+        Py_DECREF(key_cache_size);
+        if (s->key_cache_size == -1 && PyErr_Occurred())
+            goto bail;
+    }
 
     return (PyObject *)s;
 
@@ -1236,6 +1433,12 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
                      "not %.200s", Py_TYPE(markers)->tp_name);
         return NULL;
     }
+    if (indent != Py_None && !PyUnicode_Check(indent)) {
+        PyErr_Format(PyExc_TypeError,
+                     "make_encoder() argument 4 must be str or None, "
+                     "not %.200s", Py_TYPE(indent)->tp_name);
+        return NULL;
+    }
 
     s = (PyEncoderObject *)type->tp_alloc(type, 0);
     if (s == NULL)
@@ -1263,6 +1466,106 @@ encoder_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     return (PyObject *)s;
 }
 
+static PyObject *
+create_indent_cache(PyEncoderObject *s, Py_ssize_t indent_level)
+{
+    /* Return a list whose item 2*i is the newline and indentation of the
+       nesting level i (relative to indent_level), and whose item 2*i-1 is
+       the item separator followed by it.  The list only holds the level 0
+       at first: update_indent_cache() adds the deeper levels as needed. */
+    PyObject *newline_indent, *indent_cache;
+
+    newline_indent = PyUnicode_FromOrdinal('\n');
+    if (newline_indent != NULL && indent_level > 0) {
+        PyUnicode_AppendAndDel(&newline_indent,
+                               PySequence_Repeat(s->indent, indent_level));
+    }
+    if (newline_indent == NULL) {
+        return NULL;
+    }
+    indent_cache = PyList_New(1);
+    if (indent_cache == NULL) {
+        Py_DECREF(newline_indent);
+        return NULL;
+    }
+    PyList_SET_ITEM(indent_cache, 0, newline_indent);
+    return indent_cache;
+}
+
+static int
+update_indent_cache(PyEncoderObject *s, Py_ssize_t indent_level,
+                    PyObject *indent_cache)
+{
+    /* Add the items of indent_level to indent_cache, which holds those of
+       indent_level - 1. */
+    PyObject *newline_indent, *separator;
+    int rv;
+
+    assert(indent_level > 0);
+    assert(PyList_GET_SIZE(indent_cache) == 2 * indent_level - 1);
+    newline_indent = PyUnicode_Concat(
+        PyList_GET_ITEM(indent_cache, 2 * (indent_level - 1)), s->indent);
+    if (newline_indent == NULL) {
+        return -1;
+    }
+    separator = PyUnicode_Concat(s->item_separator, newline_indent);
+    if (separator == NULL) {
+        Py_DECREF(newline_indent);
+        return -1;
+    }
+    rv = PyList_Append(indent_cache, separator);
+    if (rv == 0) {
+        rv = PyList_Append(indent_cache, newline_indent);
+    }
+    Py_DECREF(separator);
+    Py_DECREF(newline_indent);
+    return rv;
+}
+
+static PyObject *
+get_item_separator(PyEncoderObject *s, Py_ssize_t indent_level,
+                   PyObject *indent_cache)
+{
+    /* Return a borrowed reference to the item separator of indent_level,
+       followed by its newline and indentation. */
+    assert(indent_level > 0);
+    if (PyList_GET_SIZE(indent_cache) < 2 * indent_level + 1) {
+        if (update_indent_cache(s, indent_level, indent_cache) < 0) {
+            return NULL;
+        }
+    }
+    return PyList_GET_ITEM(indent_cache, 2 * indent_level - 1);
+}
+
+static int
+write_newline_indent(_PyUnicodeWriter *writer, Py_ssize_t indent_level,
+                     PyObject *indent_cache)
+{
+    /* The items of indent_level must be in indent_cache already. */
+    return _PyUnicodeWriter_WriteStr(
+        writer, PyList_GET_ITEM(indent_cache, 2 * indent_level));
+}
+
+static int
+encoder_write(PyEncoderObject *self, _PyUnicodeWriter *writer,
+              PyObject *obj, Py_ssize_t indent_level)
+{
+    /* Encode obj into writer, at the given indentation level */
+    PyObject *indent_cache = NULL;
+    int rv;
+
+    if (self->indent != Py_None) {
+        indent_cache = create_indent_cache(self, indent_level);
+        if (indent_cache == NULL) {
+            return -1;
+        }
+    }
+    /* The nesting levels are relative to indent_level from now on. */
+    rv = encoder_listencode_obj(self, writer, obj, 0, indent_cache);
+    Py_XDECREF(indent_cache);
+    return rv;
+}
+
 static PyObject *
 encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
 {
@@ -1279,7 +1582,7 @@ encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
     _PyUnicodeWriter_Init(&writer);
     writer.overallocate = 1;
 
-    if (encoder_listencode_obj(self, &writer, obj, indent_level)) {
+    if (encoder_write(self, &writer, obj, indent_level)) {
         _PyUnicodeWriter_Dealloc(&writer);
         return NULL;
     }
@@ -1293,6 +1596,50 @@ encoder_call(PyEncoderObject *self, PyObject *args, PyObject *kwds)
     return result;
 }
 
+PyDoc_STRVAR(encoder_encode_utf8_doc,
+"encode_utf8(obj, _current_indent_level) -> bytes\n"
+"\n"
+"Return the JSON representation of obj, encoded to UTF-8.");
+
+static PyObject *
+encoder_encode_utf8(PyEncoderObject *self, PyObject *args)
+{
+    PyObject *obj, *str, *result;
+    Py_ssize_t indent_level;
+    _PyUnicodeWriter writer;
+
+    if (!PyArg_ParseTuple(args, "On:encode_utf8", &obj, &indent_level))
+        return NULL;
+
+    _PyUnicodeWriter_Init(&writer);
+    writer.overallocate = 1;
+
+    if (encoder_write(self, &writer, obj, indent_level)) {
+        _PyUnicodeWriter_Dealloc(&writer);
+        return NULL;
+    }
+    if (writer.maxchar < 128) {
+        /* The buffer is ASCII (always the case if ensure_ascii is true), so
+           it is UTF-8 already: copy it without building a str. */
+        assert(writer.kind == PyUnicode_1BYTE_KIND);
+        result = PyBytes_FromStringAndSize(writer.data, writer.pos);
+        _PyUnicodeWriter_Dealloc(&writer);
+        return result;
+    }
+    str = _PyUnicodeWriter_Finish(&writer);
+    if (str == NULL)
+        return NULL;
+    result = PyUnicode_AsEncodedString(str, "utf-8", "surrogatepass");
+    Py_DECREF(str);
+    return result;
+}
+
+static PyMethodDef encoder_methods[] = {
+    {"encode_utf8", (PyCFunction)encoder_encode_utf8, METH_VARARGS,
+        encoder_encode_utf8_doc},
+    {NULL, NULL, 0, NULL}
+};
+
 static PyObject *
 _encoded_const(PyObject *obj)
 {
@@ -1370,7 +1717,8 @@ _steal_accumulate(_PyUnicodeWriter *writer, PyObject *stolen)
 
 static int
 encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
-                       PyObject *obj, Py_ssize_t indent_level)
+                       PyObject *obj, Py_ssize_t indent_level,
+                       PyObject *indent_cache)
 {
     /* Encode Python object obj to a JSON term */
     PyObject *newobj;
@@ -1406,14 +1754,14 @@ encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
     else if (PyList_Check(obj) || PyTuple_Check(obj)) {
         if (_Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_list(s, writer, obj, indent_level);
+        rv = encoder_listencode_list(s, writer, obj, indent_level, indent_cache);
         _Py_LeaveRecursiveCall();
         return rv;
     }
     else if (PyDict_Check(obj)) {
         if (_Py_EnterRecursiveCall(" while encoding a JSON object"))
             return -1;
-        rv = encoder_listencode_dict(s, writer, obj, indent_level);
+        rv = encoder_listencode_dict(s, writer, obj, indent_level, indent_cache);
         _Py_LeaveRecursiveCall();
         return rv;
     }
@@ -1447,7 +1795,7 @@ encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
             Py_XDECREF(ident);
             return -1;
         }
-        rv = encoder_listencode_obj(s, writer, newobj, indent_level);
+        rv = encoder_listencode_obj(s, writer, newobj, indent_level, indent_cache);
         _Py_LeaveRecursiveCall();
 
         Py_DECREF(newobj);
@@ -1468,7 +1816,8 @@ encoder_listencode_obj(PyEncoderObject *s, _PyUnicodeWriter *writer,
 
 static int
 encoder_encode_key_value(PyEncoderObject *s, _PyUnicodeWriter *writer, bool *first,
-                         PyObject *key, PyObject *value, Py_ssize_t indent_level)
+                         PyObject *key, PyObject *value, Py_ssize_t indent_level,
+                         PyObject *indent_cache, PyObject *item_separator)
 {
     PyObject *keystr = NULL;
     PyObject *encoded;
@@ -1505,7 +1854,7 @@ encoder_encode_key_value(PyEncoderObject *s, _PyUnicodeWriter *writer, bool *fir
         *first = false;
     }
     else {
-        if (_PyUnicodeWriter_WriteStr(writer, s->item_separator) < 0) {
+        if (_PyUnicodeWriter_WriteStr(writer, item_separator) < 0) {
             Py_DECREF(keystr);
             return -1;
         }
@@ -1523,7 +1872,7 @@ encoder_encode_key_value(PyEncoderObject *s, _PyUnicodeWriter *writer, bool *fir
     if (_PyUnicodeWriter_WriteStr(writer, s->key_separator) < 0) {
         return -1;
     }
-    if (encoder_listencode_obj(s, writer, value, indent_level) < 0) {
+    if (encoder_listencode_obj(s, writer, value, indent_level, indent_cache) < 0) {
         return -1;
     }
     return 0;
@@ -1531,12 +1880,14 @@ encoder_encode_key_value(PyEncoderObject *s, _PyUnicodeWriter *writer, bool *fir
 
 static int
 encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
-                        PyObject *dct, Py_ssize_t indent_level)
+                        PyObject *dct, Py_ssize_t indent_level,
+                        PyObject *indent_cache)
 {
     /* Encode Python dict dct a JSON term */
     PyObject *ident = NULL;
     PyObject *items = NULL;
     PyObject *key, *value;
+    PyObject *separator = s->item_separator;
     bool first = true;
 
     if (PyDict_GET_SIZE(dct) == 0)  /* Fast path */
@@ -1562,13 +1913,11 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
         goto bail;
 
     if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
+        separator = get_item_separator(s, indent_level, indent_cache);
+        if (separator == NULL ||
+                write_newline_indent(writer, indent_level, indent_cache) < 0)
+            goto bail;
     }
 
     if (s->sort_keys || !PyDict_CheckExact(dct)) {
@@ -1586,7 +1935,9 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
 
             key = PyTuple_GET_ITEM(item, 0);
             value = PyTuple_GET_ITEM(item, 1);
-            if (encoder_encode_key_value(s, writer, &first, key, value, indent_level) < 0)
+            if (encoder_encode_key_value(s, writer, &first, key, value,
+                                         indent_level, indent_cache,
+                                         separator) < 0)
                 goto bail;
         }
         Py_CLEAR(items);
@@ -1594,7 +1945,9 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
     } else {
         Py_ssize_t pos = 0;
         while (PyDict_Next(dct, &pos, &key, &value)) {
-            if (encoder_encode_key_value(s, writer, &first, key, value, indent_level) < 0)
+            if (encoder_encode_key_value(s, writer, &first, key, value,
+                                         indent_level, indent_cache,
+                                         separator) < 0)
                 goto bail;
         }
     }
@@ -1604,12 +1957,11 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
             goto bail;
         Py_CLEAR(ident);
     }
-    /* TODO DOES NOT RUN; dead code
     if (s->indent != Py_None) {
         indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
+        if (write_newline_indent(writer, indent_level, indent_cache) < 0)
+            goto bail;
+    }
     if (_PyUnicodeWriter_WriteChar(writer, '}'))
         goto bail;
     return 0;
@@ -1622,10 +1974,12 @@ encoder_listencode_dict(PyEncoderObject *s, _PyUnicodeWriter *writer,
 
 static int
 encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
-                        PyObject *seq, Py_ssize_t indent_level)
+                        PyObject *seq, Py_ssize_t indent_level,
+                        PyObject *indent_cache)
 {
     PyObject *ident = NULL;
     PyObject *s_fast = NULL;
+    PyObject *separator = s->item_separator;
     Py_ssize_t i;
 
     ident = NULL;
@@ -1656,21 +2010,19 @@ encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
     if (_PyUnicodeWriter_WriteChar(writer, '['))
         goto bail;
     if (s->indent != Py_None) {
-        /* TODO: DOES NOT RUN */
         indent_level += 1;
-        /*
-            newline_indent = '\n' + (' ' * (_indent * _current_indent_level))
-            separator = _item_separator + newline_indent
-            buf += newline_indent
-        */
+        separator = get_item_separator(s, indent_level, indent_cache);
+        if (separator == NULL ||
+                write_newline_indent(writer, indent_level, indent_cache) < 0)
+            goto bail;
     }
     for (i = 0; i < PySequence_Fast_GET_SIZE(s_fast); i++) {
         PyObject *obj = PySequence_Fast_GET_ITEM(s_fast, i);
         if (i) {
-            if (_PyUnicodeWriter_WriteStr(writer, s->item_separator))
+            if (_PyUnicodeWriter_WriteStr(writer, separator))
                 goto bail;
         }
-        if (encoder_listencode_obj(s, writer, obj, indent_level))
+        if (encoder_listencode_obj(s, writer, obj, indent_level, indent_cache))
             goto bail;
     }
     if (ident != NULL) {
@@ -1679,12 +2031,11 @@ encoder_listencode_list(PyEncoderObject *s, _PyUnicodeWriter *writer,
         Py_CLEAR(ident);
     }
 
-    /* TODO: DOES NOT RUN
     if (s->indent != Py_None) {
         indent_level -= 1;
-
-        yield '\n' + (' ' * (_indent * _current_indent_level))
-    }*/
+        if (write_newline_indent(writer, indent_level, indent_cache) < 0)
+            goto bail;
+    }
     if (_PyUnicodeWriter_WriteChar(writer, ']'))
         goto bail;
     Py_DECREF(s_fast);
@@ -1742,6 +2093,7 @@ static PyType_Slot PyEncoderType_slots[] = {
     {Py_tp_traverse, encoder_traverse},
     {Py_tp_clear, encoder_clear},
     {Py_tp_members, encoder_members},
+    {Py_tp_methods, encoder_methods},
     {Py_tp_new, encoder_new},
     {0, 0}
 };
@@ -1034,6 +1034,963 @@ exit:
 
 #endif /* defined(HAVE_EPOLL) */
 
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring__doc__,
+"io_uring(entries=256)\n"
+"--\n"
+"\n"
+"Returns an io_uring object.\n"
+"\n"
+"  entries\n"
+"    The size of the submission queue.  It is rounded up to a power\n"
+"    of two; the completion queue is twice as large.\n"
+"\n"
+"Raise OSError if the kernel does not support io_uring, or is older than\n"
+"Linux 5.11.");
+
+static PyObject *
+select_io_uring_impl(PyTypeObject *type, unsigned int entries);
+
+static PyObject *
+select_io_uring(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(entries), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"entries", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "io_uring",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    unsigned int entries = 256;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 0, 1, 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (!_PyLong_UnsignedInt_Converter(fastargs[0], &entries)) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = select_io_uring_impl(type, entries);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_close__doc__,
+"close($self, /)\n"
+"--\n"
+"\n"
+"Close the io_uring file descriptor.\n"
+"\n"
+"Pending operations are cancelled first.  Further operations on the\n"
+"io_uring object will raise an exception.");
+
+#define SELECT_IO_URING_CLOSE_METHODDEF    \
+    {"close", (PyCFunction)select_io_uring_close, METH_NOARGS, select_io_uring_close__doc__},
+
+static PyObject *
+select_io_uring_close_impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring_close(pyIoUring_Object *self, PyObject *Py_UNUSED(ignored))
+{
+    return select_io_uring_close_impl(self);
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_fileno__doc__,
+"fileno($self, /)\n"
+"--\n"
+"\n"
+"Return the io_uring file descriptor.");
+
+#define SELECT_IO_URING_FILENO_METHODDEF    \
+    {"fileno", (PyCFunction)select_io_uring_fileno, METH_NOARGS, select_io_uring_fileno__doc__},
+
+static PyObject *
+select_io_uring_fileno_impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring_fileno(pyIoUring_Object *self, PyObject *Py_UNUSED(ignored))
+{
+    return select_io_uring_fileno_impl(self);
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_recv__doc__,
+"recv($self, /, fd, buffer, user_data, flags=0)\n"
+"--\n"
+"\n"
+"Queue a recv() of up to len(buffer) bytes into the writable buffer.\n"
+"\n"
+"The result of the operation is the number of bytes received.");
+
+#define SELECT_IO_URING_RECV_METHODDEF    \
+    {"recv", _PyCFunction_CAST(select_io_uring_recv), METH_FASTCALL|METH_KEYWORDS, select_io_uring_recv__doc__},
+
+static PyObject *
+select_io_uring_recv_impl(pyIoUring_Object *self, int fd, PyObject *buffer,
+                          unsigned long long user_data, int flags);
+
+static PyObject *
+select_io_uring_recv(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(fd), &_Py_ID(buffer), &_Py_ID(user_data), &_Py_ID(flags), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"fd", "buffer", "user_data", "flags", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "recv",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 3;
+    int fd;
+    PyObject *buffer;
+    unsigned long long user_data;
+    int flags = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 3, 4, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    buffer = args[1];
+    if (!_PyLong_UnsignedLongLong_Converter(args[2], &user_data)) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    flags = _PyLong_AsInt(args[3]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = select_io_uring_recv_impl(self, fd, buffer, user_data, flags);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_send__doc__,
+"send($self, /, fd, data, user_data, flags=0)\n"
+"--\n"
+"\n"
+"Queue a send() of the bytes-like object data.\n"
+"\n"
+"The result of the operation is the number of bytes sent.");
+
+#define SELECT_IO_URING_SEND_METHODDEF    \
+    {"send", _PyCFunction_CAST(select_io_uring_send), METH_FASTCALL|METH_KEYWORDS, select_io_uring_send__doc__},
+
+static PyObject *
+select_io_uring_send_impl(pyIoUring_Object *self, int fd, PyObject *data,
+                          unsigned long long user_data, int flags);
+
+static PyObject *
+select_io_uring_send(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(fd), &_Py_ID(data), &_Py_ID(user_data), &_Py_ID(flags), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"fd", "data", "user_data", "flags", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "send",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 3;
+    int fd;
+    PyObject *data;
+    unsigned long long user_data;
+    int flags = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 3, 4, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    data = args[1];
+    if (!_PyLong_UnsignedLongLong_Converter(args[2], &user_data)) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    flags = _PyLong_AsInt(args[3]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = select_io_uring_send_impl(self, fd, data, user_data, flags);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_read__doc__,
+"read($self, /, fd, buffer, user_data, offset=-1)\n"
+"--\n"
+"\n"
+"Queue a read of up to len(buffer) bytes into the writable buffer.\n"
+"\n"
+"  offset\n"
+"    The file offset to read at, or -1 to read at the current position\n"
+"    of the file.\n"
+"\n"
+"The result of the operation is the number of bytes read.");
+
+#define SELECT_IO_URING_READ_METHODDEF    \
+    {"read", _PyCFunction_CAST(select_io_uring_read), METH_FASTCALL|METH_KEYWORDS, select_io_uring_read__doc__},
+
+static PyObject *
+select_io_uring_read_impl(pyIoUring_Object *self, int fd, PyObject *buffer,
+                          unsigned long long user_data, long long offset);
+
+static PyObject *
+select_io_uring_read(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(fd), &_Py_ID(buffer), &_Py_ID(user_data), &_Py_ID(offset), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"fd", "buffer", "user_data", "offset", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "read",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 3;
+    int fd;
+    PyObject *buffer;
+    unsigned long long user_data;
+    long long offset = -1;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 3, 4, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    buffer = args[1];
+    if (!_PyLong_UnsignedLongLong_Converter(args[2], &user_data)) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    offset = PyLong_AsLongLong(args[3]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = select_io_uring_read_impl(self, fd, buffer, user_data, offset);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_write__doc__,
+"write($self, /, fd, data, user_data, offset=-1)\n"
+"--\n"
+"\n"
+"Queue a write of the bytes-like object data.\n"
+"\n"
+"  offset\n"
+"    The file offset to write at, or -1 to write at the current position\n"
+"    of the file.\n"
+"\n"
+"The result of the operation is the number of bytes written.");
+
+#define SELECT_IO_URING_WRITE_METHODDEF    \
+    {"write", _PyCFunction_CAST(select_io_uring_write), METH_FASTCALL|METH_KEYWORDS, select_io_uring_write__doc__},
+
+static PyObject *
+select_io_uring_write_impl(pyIoUring_Object *self, int fd, PyObject *data,
+                           unsigned long long user_data, long long offset);
+
+static PyObject *
+select_io_uring_write(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 4
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(fd), &_Py_ID(data), &_Py_ID(user_data), &_Py_ID(offset), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"fd", "data", "user_data", "offset", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "write",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[4];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 3;
+    int fd;
+    PyObject *data;
+    unsigned long long user_data;
+    long long offset = -1;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 3, 4, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    data = args[1];
+    if (!_PyLong_UnsignedLongLong_Converter(args[2], &user_data)) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    offset = PyLong_AsLongLong(args[3]);
+    if (offset == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = select_io_uring_write_impl(self, fd, data, user_data, offset);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_accept__doc__,
+"accept($self, /, fd, user_data, flags=0)\n"
+"--\n"
+"\n"
+"Queue an accept() on the listening socket fd.\n"
+"\n"
+"  flags\n"
+"    Flags for accept4(); SOCK_CLOEXEC is always set.\n"
+"\n"
+"The result of the operation is the file descriptor of the new connection.");
+
+#define SELECT_IO_URING_ACCEPT_METHODDEF    \
+    {"accept", _PyCFunction_CAST(select_io_uring_accept), METH_FASTCALL|METH_KEYWORDS, select_io_uring_accept__doc__},
+
+static PyObject *
+select_io_uring_accept_impl(pyIoUring_Object *self, int fd,
+                            unsigned long long user_data, int flags);
+
+static PyObject *
+select_io_uring_accept(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(fd), &_Py_ID(user_data), &_Py_ID(flags), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"fd", "user_data", "flags", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "accept",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 2;
+    int fd;
+    unsigned long long user_data;
+    int flags = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 2, 3, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[1], &user_data)) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    flags = _PyLong_AsInt(args[2]);
+    if (flags == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = select_io_uring_accept_impl(self, fd, user_data, flags);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_poll_add__doc__,
+"poll_add($self, /, fd, eventmask, user_data)\n"
+"--\n"
+"\n"
+"Queue a one-shot wait for the POLL* events of eventmask on fd.\n"
+"\n"
+"The result of the operation is the mask of the events that occurred.");
+
+#define SELECT_IO_URING_POLL_ADD_METHODDEF    \
+    {"poll_add", _PyCFunction_CAST(select_io_uring_poll_add), METH_FASTCALL|METH_KEYWORDS, select_io_uring_poll_add__doc__},
+
+static PyObject *
+select_io_uring_poll_add_impl(pyIoUring_Object *self, int fd,
+                              unsigned short eventmask,
+                              unsigned long long user_data);
+
+static PyObject *
+select_io_uring_poll_add(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(fd), &_Py_ID(eventmask), &_Py_ID(user_data), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"fd", "eventmask", "user_data", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "poll_add",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    int fd;
+    unsigned short eventmask;
+    unsigned long long user_data;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 3, 3, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_FileDescriptor_Converter(args[0], &fd)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedShort_Converter(args[1], &eventmask)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[2], &user_data)) {
+        goto exit;
+    }
+    return_value = select_io_uring_poll_add_impl(self, fd, eventmask, user_data);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_poll_remove__doc__,
+"poll_remove($self, /, target, user_data)\n"
+"--\n"
+"\n"
+"Queue the removal of a pending poll_add() operation.\n"
+"\n"
+"  target\n"
+"    The user_data of the poll_add() operation to remove.");
+
+#define SELECT_IO_URING_POLL_REMOVE_METHODDEF    \
+    {"poll_remove", _PyCFunction_CAST(select_io_uring_poll_remove), METH_FASTCALL|METH_KEYWORDS, select_io_uring_poll_remove__doc__},
+
+static PyObject *
+select_io_uring_poll_remove_impl(pyIoUring_Object *self,
+                                 unsigned long long target,
+                                 unsigned long long user_data);
+
+static PyObject *
+select_io_uring_poll_remove(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 2
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(target), &_Py_ID(user_data), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"target", "user_data", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "poll_remove",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    unsigned long long target;
+    unsigned long long user_data;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 2, 2, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &target)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[1], &user_data)) {
+        goto exit;
+    }
+    return_value = select_io_uring_poll_remove_impl(self, target, user_data);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_cancel__doc__,
+"cancel($self, /, target, user_data)\n"
+"--\n"
+"\n"
+"Queue the cancellation of a pending operation.\n"
+"\n"
+"  target\n"
+"    The user_data of the operation to cancel.\n"
+"\n"
+"The cancelled operation completes with -ECANCELED.");
+
+#define SELECT_IO_URING_CANCEL_METHODDEF    \
+    {"cancel", _PyCFunction_CAST(select_io_uring_cancel), METH_FASTCALL|METH_KEYWORDS, select_io_uring_cancel__doc__},
+
+static PyObject *
+select_io_uring_cancel_impl(pyIoUring_Object *self,
+                            unsigned long long target,
+                            unsigned long long user_data);
+
+static PyObject *
+select_io_uring_cancel(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 2
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(target), &_Py_ID(user_data), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"target", "user_data", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "cancel",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    unsigned long long target;
+    unsigned long long user_data;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 2, 2, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &target)) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[1], &user_data)) {
+        goto exit;
+    }
+    return_value = select_io_uring_cancel_impl(self, target, user_data);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_nop__doc__,
+"nop($self, /, user_data)\n"
+"--\n"
+"\n"
+"Queue an operation that does nothing and completes with 0.");
+
+#define SELECT_IO_URING_NOP_METHODDEF    \
+    {"nop", _PyCFunction_CAST(select_io_uring_nop), METH_FASTCALL|METH_KEYWORDS, select_io_uring_nop__doc__},
+
+static PyObject *
+select_io_uring_nop_impl(pyIoUring_Object *self,
+                         unsigned long long user_data);
+
+static PyObject *
+select_io_uring_nop(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(user_data), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"user_data", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "nop",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    unsigned long long user_data;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!_PyLong_UnsignedLongLong_Converter(args[0], &user_data)) {
+        goto exit;
+    }
+    return_value = select_io_uring_nop_impl(self, user_data);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring_submit__doc__,
+"submit($self, /, wait_nr=0, timeout=None)\n"
+"--\n"
+"\n"
+"Submit the queued operations and reap their completions.\n"
+"\n"
+"  wait_nr\n"
+"    The number of completions to wait for.\n"
+"  timeout\n"
+"    The maximum time to wait in seconds (as float); None waits\n"
+"    indefinitely.\n"
+"\n"
+"Returns the list of the available completions, as (user_data, result,\n"
+"flags) 3-tuples.  A negative result is a negated errno value.  The\n"
+"operations queued since the last call are handed to the kernel in a\n"
+"single system call.");
+
+#define SELECT_IO_URING_SUBMIT_METHODDEF    \
+    {"submit", _PyCFunction_CAST(select_io_uring_submit), METH_FASTCALL|METH_KEYWORDS, select_io_uring_submit__doc__},
+
+static PyObject *
+select_io_uring_submit_impl(pyIoUring_Object *self, unsigned int wait_nr,
+                            PyObject *timeout_obj);
+
+static PyObject *
+select_io_uring_submit(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 2
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(wait_nr), &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"wait_nr", "timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "submit",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    unsigned int wait_nr = 0;
+    PyObject *timeout_obj = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 2, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[0]) {
+        if (!_PyLong_UnsignedInt_Converter(args[0], &wait_nr)) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    timeout_obj = args[1];
+skip_optional_pos:
+    return_value = select_io_uring_submit_impl(self, wait_nr, timeout_obj);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring___enter____doc__,
+"__enter__($self, /)\n"
+"--\n"
+"\n");
+
+#define SELECT_IO_URING___ENTER___METHODDEF    \
+    {"__enter__", (PyCFunction)select_io_uring___enter__, METH_NOARGS, select_io_uring___enter____doc__},
+
+static PyObject *
+select_io_uring___enter___impl(pyIoUring_Object *self);
+
+static PyObject *
+select_io_uring___enter__(pyIoUring_Object *self, PyObject *Py_UNUSED(ignored))
+{
+    return select_io_uring___enter___impl(self);
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
+#if defined(HAVE_IO_URING)
+
+PyDoc_STRVAR(select_io_uring___exit____doc__,
+"__exit__($self, exc_type=None, exc_value=None, exc_tb=None, /)\n"
+"--\n"
+"\n");
+
+#define SELECT_IO_URING___EXIT___METHODDEF    \
+    {"__exit__", _PyCFunction_CAST(select_io_uring___exit__), METH_FASTCALL, select_io_uring___exit____doc__},
+
+static PyObject *
+select_io_uring___exit___impl(pyIoUring_Object *self, PyObject *exc_type,
+                              PyObject *exc_value, PyObject *exc_tb);
+
+static PyObject *
+select_io_uring___exit__(pyIoUring_Object *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *exc_type = Py_None;
+    PyObject *exc_value = Py_None;
+    PyObject *exc_tb = Py_None;
+
+    if (!_PyArg_CheckPositional("__exit__", nargs, 0, 3)) {
+        goto exit;
+    }
+    if (nargs < 1) {
+        goto skip_optional;
+    }
+    exc_type = args[0];
+    if (nargs < 2) {
+        goto skip_optional;
+    }
+    exc_value = args[1];
+    if (nargs < 3) {
+        goto skip_optional;
+    }
+    exc_tb = args[2];
+skip_optional:
+    return_value = select_io_uring___exit___impl(self, exc_type, exc_value, exc_tb);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_IO_URING) */
+
 #if defined(HAVE_KQUEUE)
 
 PyDoc_STRVAR(select_kqueue__doc__,
@@ -1294,6 +2251,62 @@ exit:
     #define SELECT_EPOLL___EXIT___METHODDEF
 #endif /* !defined(SELECT_EPOLL___EXIT___METHODDEF) */
 
+#ifndef SELECT_IO_URING_CLOSE_METHODDEF
+    #define SELECT_IO_URING_CLOSE_METHODDEF
+#endif /* !defined(SELECT_IO_URING_CLOSE_METHODDEF) */
+
+#ifndef SELECT_IO_URING_FILENO_METHODDEF
+    #define SELECT_IO_URING_FILENO_METHODDEF
+#endif /* !defined(SELECT_IO_URING_FILENO_METHODDEF) */
+
+#ifndef SELECT_IO_URING_RECV_METHODDEF
+    #define SELECT_IO_URING_RECV_METHODDEF
+#endif /* !defined(SELECT_IO_URING_RECV_METHODDEF) */
+
+#ifndef SELECT_IO_URING_SEND_METHODDEF
+    #define SELECT_IO_URING_SEND_METHODDEF
+#endif /* !defined(SELECT_IO_URING_SEND_METHODDEF) */
+
+#ifndef SELECT_IO_URING_READ_METHODDEF
+    #define SELECT_IO_URING_READ_METHODDEF
+#endif /* !defined(SELECT_IO_URING_READ_METHODDEF) */
+
+#ifndef SELECT_IO_URING_WRITE_METHODDEF
+    #define SELECT_IO_URING_WRITE_METHODDEF
+#endif /* !defined(SELECT_IO_URING_WRITE_METHODDEF) */
+
+#ifndef SELECT_IO_URING_ACCEPT_METHODDEF
+    #define SELECT_IO_URING_ACCEPT_METHODDEF
+#endif /* !defined(SELECT_IO_URING_ACCEPT_METHODDEF) */
+
+#ifndef SELECT_IO_URING_POLL_ADD_METHODDEF
+    #define SELECT_IO_URING_POLL_ADD_METHODDEF
+#endif /* !defined(SELECT_IO_URING_POLL_ADD_METHODDEF) */
+
+#ifndef SELECT_IO_URING_POLL_REMOVE_METHODDEF
+    #define SELECT_IO_URING_POLL_REMOVE_METHODDEF
+#endif /* !defined(SELECT_IO_URING_POLL_REMOVE_METHODDEF) */
+
+#ifndef SELECT_IO_URING_CANCEL_METHODDEF
+    #define SELECT_IO_URING_CANCEL_METHODDEF
+#endif /* !defined(SELECT_IO_URING_CANCEL_METHODDEF) */
+
+#ifndef SELECT_IO_URING_NOP_METHODDEF
+    #define SELECT_IO_URING_NOP_METHODDEF
+#endif /* !defined(SELECT_IO_URING_NOP_METHODDEF) */
+
+#ifndef SELECT_IO_URING_SUBMIT_METHODDEF
+    #define SELECT_IO_URING_SUBMIT_METHODDEF
+#endif /* !defined(SELECT_IO_URING_SUBMIT_METHODDEF) */
+
+#ifndef SELECT_IO_URING___ENTER___METHODDEF
+    #define SELECT_IO_URING___ENTER___METHODDEF
+#endif /* !defined(SELECT_IO_URING___ENTER___METHODDEF) */
+
+#ifndef SELECT_IO_URING___EXIT___METHODDEF
+    #define SELECT_IO_URING___EXIT___METHODDEF
+#endif /* !defined(SELECT_IO_URING___EXIT___METHODDEF) */
+
 #ifndef SELECT_KQUEUE_CLOSE_METHODDEF
     #define SELECT_KQUEUE_CLOSE_METHODDEF
 #endif /* !defined(SELECT_KQUEUE_CLOSE_METHODDEF) */
@@ -1309,4 +2322,4 @@ exit:
 #ifndef SELECT_KQUEUE_CONTROL_METHODDEF
     #define SELECT_KQUEUE_CONTROL_METHODDEF
 #endif /* !defined(SELECT_KQUEUE_CONTROL_METHODDEF) */
-/*[clinic end generated code: output=64516114287e894d input=a9049054013a1b77]*/
+/*[clinic end generated code: output=0ab0d1606aadb360 input=a9049054013a1b77]*/
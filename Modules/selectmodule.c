@@ -70,11 +70,23 @@ extern void bzero(void *, int);
 #  define POLLPRI 0
 #endif
 
+#ifdef HAVE_LINUX_IO_URING_H
+#  include <linux/io_uring.h>
+#  include <sys/mman.h>
+#  include <sys/socket.h>
+#  include <sys/syscall.h>
+   /* Linux 5.11 headers: IORING_ENTER_EXT_ARG is needed for timeouts */
+#  if defined(IORING_FEAT_EXT_ARG) && defined(__NR_io_uring_setup)
+#    define HAVE_IO_URING 1
+#  endif
+#endif
+
 typedef struct {
     PyObject *close;
     PyTypeObject *poll_Type;
     PyTypeObject *devpoll_Type;
     PyTypeObject *pyEpoll_Type;
+    PyTypeObject *io_uring_Type;
     PyTypeObject *kqueue_event_Type;
     PyTypeObject *kqueue_queue_Type;
 } _selectstate;
@@ -96,9 +108,10 @@ module select
 class select.poll "pollObject *" "_selectstate_by_type(type)->poll_Type"
 class select.devpoll "devpollObject *" "_selectstate_by_type(type)->devpoll_Type"
 class select.epoll "pyEpoll_Object *" "_selectstate_by_type(type)->pyEpoll_Type"
+class select.io_uring "pyIoUring_Object *" "_selectstate_by_type(type)->io_uring_Type"
 class select.kqueue "kqueue_queue_Object *" "_selectstate_by_type(type)->kqueue_queue_Type"
 [clinic start generated code]*/
-/*[clinic end generated code: output=da39a3ee5e6b4b0d input=8072de35824aa327]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=23d0f86b71a1f88e]*/
 
 /* list of Python objects and their file descriptor */
 typedef struct {
@@ -1693,6 +1706,927 @@ the maximum number of monitored events.");
 
 #endif /* HAVE_EPOLL */
 
+#ifdef HAVE_IO_URING
+/* **************************************************************************
+ *                      io_uring interface for Linux 5.11+
+ *
+ * The rings are set up with the raw system calls, liburing is not needed.
+ * Operations are queued on the submission ring by the prep methods and
+ * handed to the kernel by submit(), which also reaps the completion ring.
+ * The buffers of pending operations are kept alive, and kept exported so
+ * that they can't be resized, until their completion has been reaped.
+ */
+
+typedef struct {
+    PyObject_HEAD
+    int ring_fd;                        /* io_uring file descriptor */
+    unsigned int features;              /* IORING_FEAT_* flags */
+    unsigned int to_submit;             /* queued, not yet submitted SQEs */
+    /* submission ring */
+    void *sq_ring;
+    size_t sq_ring_size;
+    unsigned int *sq_head;
+    unsigned int *sq_tail;
+    unsigned int *sq_flags;
+    unsigned int sq_mask;
+    unsigned int sq_entries;
+    unsigned int *sq_array;
+    struct io_uring_sqe *sqes;
+    size_t sqes_size;
+    /* completion ring, may share its mapping with the submission ring */
+    void *cq_ring;
+    size_t cq_ring_size;
+    unsigned int *cq_head;
+    unsigned int *cq_tail;
+    unsigned int cq_mask;
+    struct io_uring_cqe *cqes;
+    /* user_data -> memoryview of the buffer of a pending operation */
+    PyObject *buffers;
+} pyIoUring_Object;
+
+static PyObject *
+pyiouring_err_closed(void)
+{
+    PyErr_SetString(PyExc_ValueError, "I/O operation on closed io_uring object");
+    return NULL;
+}
+
+static int
+pyiouring_enter(pyIoUring_Object *self, unsigned int to_submit,
+                unsigned int min_complete, unsigned int flags,
+                struct __kernel_timespec *ts)
+{
+    struct io_uring_getevents_arg arg;
+    int ret;
+
+    if (min_complete) {
+        flags |= IORING_ENTER_GETEVENTS;
+    }
+    memset(&arg, 0, sizeof(arg));
+    arg.ts = (uint64_t)(uintptr_t)ts;
+    flags |= IORING_ENTER_EXT_ARG;
+    ret = (int)syscall(__NR_io_uring_enter, self->ring_fd, to_submit,
+                       min_complete, flags, &arg, sizeof(arg));
+    return ret;
+}
+
+/* Reap all available completions into a list of
+   (user_data, result, flags) tuples.  If list is NULL, the completions
+   are discarded. */
+static int
+pyiouring_reap(pyIoUring_Object *self, PyObject *list)
+{
+    unsigned int head = *self->cq_head;
+    unsigned int tail = __atomic_load_n(self->cq_tail, __ATOMIC_ACQUIRE);
+    int rc = 0;
+
+    for (; head != tail; head++) {
+        struct io_uring_cqe *cqe = &self->cqes[head & self->cq_mask];
+        PyObject *key = PyLong_FromUnsignedLongLong(cqe->user_data);
+        if (key == NULL) {
+            rc = -1;
+            break;
+        }
+        if (PyDict_GET_SIZE(self->buffers)
+            && !(cqe->flags & IORING_CQE_F_MORE))
+        {
+            if (PyDict_DelItem(self->buffers, key) < 0) {
+                if (!PyErr_ExceptionMatches(PyExc_KeyError)) {
+                    Py_DECREF(key);
+                    rc = -1;
+                    break;
+                }
+                PyErr_Clear();
+            }
+        }
+        if (list != NULL) {
+            PyObject *item = Py_BuildValue("NiI", key, cqe->res, cqe->flags);
+            if (item == NULL) {
+                rc = -1;
+                break;
+            }
+            if (PyList_Append(list, item) < 0) {
+                Py_DECREF(item);
+                rc = -1;
+                break;
+            }
+            Py_DECREF(item);
+        }
+        else {
+            Py_DECREF(key);
+        }
+    }
+    /* Consumed entries are released even on error: the kernel can't
+       report them twice. */
+    __atomic_store_n(self->cq_head, head, __ATOMIC_RELEASE);
+    return rc;
+}
+
+static int
+pyiouring_internal_close(pyIoUring_Object *self)
+{
+    int save_errno = 0;
+    if (self->ring_fd < 0) {
+        return 0;
+    }
+
+    /* The kernel may still write into the buffers of pending operations:
+       cancel them and wait for their completion before releasing the
+       buffers. */
+    if (self->buffers != NULL && PyDict_GET_SIZE(self->buffers)) {
+        PyObject *exc = PyErr_GetRaisedException();
+        PyObject *keys = PyDict_Keys(self->buffers);
+        if (keys != NULL) {
+            for (Py_ssize_t i = 0; i < PyList_GET_SIZE(keys); i++) {
+                unsigned long long target =
+                    PyLong_AsUnsignedLongLong(PyList_GET_ITEM(keys, i));
+                unsigned int tail = *self->sq_tail;
+                if (tail - __atomic_load_n(self->sq_head, __ATOMIC_ACQUIRE)
+                    >= self->sq_entries)
+                {
+                    /* The SQ is full: submit it, reap the completions to
+                       make room in the CQ, and retry this operation. */
+                    int ret = pyiouring_enter(self, self->to_submit, 0, 0,
+                                              NULL);
+                    if (ret > 0) {
+                        self->to_submit -= Py_MIN((unsigned int)ret,
+                                                  self->to_submit);
+                    }
+                    if (pyiouring_reap(self, NULL) < 0) {
+                        PyErr_Clear();
+                    }
+                    if (ret > 0 || (ret < 0 && (errno == EINTR ||
+                                                errno == EAGAIN ||
+                                                errno == EBUSY)))
+                    {
+                        i--;
+                        continue;
+                    }
+                    /* No progress is possible: don't cancel the remaining
+                       operations. */
+                    break;
+                }
+                unsigned int index = tail & self->sq_mask;
+                struct io_uring_sqe *sqe = &self->sqes[index];
+                memset(sqe, 0, sizeof(*sqe));
+                sqe->opcode = IORING_OP_ASYNC_CANCEL;
+                sqe->fd = -1;
+                sqe->addr = target;
+                /* Not target: the completion of the cancellation must not
+                   be taken for the completion of the operation. */
+                sqe->user_data = 0;
+                self->sq_array[index] = index;
+                __atomic_store_n(self->sq_tail, tail + 1, __ATOMIC_RELEASE);
+                self->to_submit++;
+            }
+            Py_DECREF(keys);
+        }
+        while (PyDict_GET_SIZE(self->buffers)) {
+            int ret;
+            Py_BEGIN_ALLOW_THREADS
+            ret = pyiouring_enter(self, self->to_submit, 1, 0, NULL);
+            Py_END_ALLOW_THREADS
+            if (ret < 0 && errno != EINTR && errno != ETIME) {
+                break;
+            }
+            if (ret > 0) {
+                self->to_submit -= Py_MIN((unsigned int)ret, self->to_submit);
+            }
+            if (pyiouring_reap(self, NULL) < 0) {
+                PyErr_Clear();
+                break;
+            }
+        }
+        PyErr_Clear();
+        PyErr_SetRaisedException(exc);
+    }
+
+    if (self->cq_ring != NULL && self->cq_ring != self->sq_ring) {
+        munmap(self->cq_ring, self->cq_ring_size);
+    }
+    if (self->sq_ring != NULL) {
+        munmap(self->sq_ring, self->sq_ring_size);
+    }
+    if (self->sqes != NULL) {
+        munmap(self->sqes, self->sqes_size);
+    }
+    self->sq_ring = self->cq_ring = NULL;
+    self->sqes = NULL;
+
+    int fd = self->ring_fd;
+    self->ring_fd = -1;
+    Py_BEGIN_ALLOW_THREADS
+    if (close(fd) < 0)
+        save_errno = errno;
+    Py_END_ALLOW_THREADS
+    if (self->buffers != NULL) {
+        PyDict_Clear(self->buffers);
+    }
+    return save_errno;
+}
+
+static int
+pyiouring_setup(pyIoUring_Object *self, unsigned int entries)
+{
+    struct io_uring_params p;
+    void *ptr;
+
+    memset(&p, 0, sizeof(p));
+    Py_BEGIN_ALLOW_THREADS
+    self->ring_fd = (int)syscall(__NR_io_uring_setup, entries, &p);
+    Py_END_ALLOW_THREADS
+    if (self->ring_fd < 0) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+    if (_Py_set_inheritable(self->ring_fd, 0, NULL) < 0) {
+        return -1;
+    }
+    self->features = p.features;
+    if (!(p.features & IORING_FEAT_EXT_ARG)) {
+        /* Linux 5.11 is needed for timeouts on the completion wait. */
+        errno = ENOSYS;
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+
+    self->sq_ring_size = p.sq_off.array + p.sq_entries * sizeof(unsigned int);
+    self->cq_ring_size = p.cq_off.cqes
+                         + p.cq_entries * sizeof(struct io_uring_cqe);
+    if (p.features & IORING_FEAT_SINGLE_MMAP) {
+        self->sq_ring_size = self->cq_ring_size =
+            Py_MAX(self->sq_ring_size, self->cq_ring_size);
+    }
+    ptr = mmap(NULL, self->sq_ring_size, PROT_READ | PROT_WRITE,
+               MAP_SHARED | MAP_POPULATE, self->ring_fd, IORING_OFF_SQ_RING);
+    if (ptr == MAP_FAILED) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+    self->sq_ring = ptr;
+    if (p.features & IORING_FEAT_SINGLE_MMAP) {
+        self->cq_ring = ptr;
+    }
+    else {
+        ptr = mmap(NULL, self->cq_ring_size, PROT_READ | PROT_WRITE,
+                   MAP_SHARED | MAP_POPULATE, self->ring_fd,
+                   IORING_OFF_CQ_RING);
+        if (ptr == MAP_FAILED) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return -1;
+        }
+        self->cq_ring = ptr;
+    }
+    self->sqes_size = p.sq_entries * sizeof(struct io_uring_sqe);
+    ptr = mmap(NULL, self->sqes_size, PROT_READ | PROT_WRITE,
+               MAP_SHARED | MAP_POPULATE, self->ring_fd, IORING_OFF_SQES);
+    if (ptr == MAP_FAILED) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return -1;
+    }
+    self->sqes = ptr;
+
+    char *sq = self->sq_ring, *cq = self->cq_ring;
+    self->sq_head = (unsigned int *)(sq + p.sq_off.head);
+    self->sq_tail = (unsigned int *)(sq + p.sq_off.tail);
+    self->sq_flags = (unsigned int *)(sq + p.sq_off.flags);
+    self->sq_mask = *(unsigned int *)(sq + p.sq_off.ring_mask);
+    self->sq_entries = *(unsigned int *)(sq + p.sq_off.ring_entries);
+    self->sq_array = (unsigned int *)(sq + p.sq_off.array);
+    self->cq_head = (unsigned int *)(cq + p.cq_off.head);
+    self->cq_tail = (unsigned int *)(cq + p.cq_off.tail);
+    self->cq_mask = *(unsigned int *)(cq + p.cq_off.ring_mask);
+    self->cqes = (struct io_uring_cqe *)(cq + p.cq_off.cqes);
+    return 0;
+}
+
+static PyObject *
+newPyIoUring_Object(PyTypeObject *type, unsigned int entries)
+{
+    pyIoUring_Object *self;
+    assert(type != NULL);
+    allocfunc iouring_alloc = PyType_GetSlot(type, Py_tp_alloc);
+    assert(iouring_alloc != NULL);
+    self = (pyIoUring_Object *) iouring_alloc(type, 0);
+    if (self == NULL)
+        return NULL;
+
+    self->ring_fd = -1;
+    self->buffers = PyDict_New();
+    if (self->buffers == NULL || pyiouring_setup(self, entries) < 0) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+
+/*[clinic input]
+@classmethod
+select.io_uring.__new__
+
+    entries: unsigned_int(bitwise=False) = 256
+      The size of the submission queue.  It is rounded up to a power
+      of two; the completion queue is twice as large.
+
+Returns an io_uring object.
+
+Raise OSError if the kernel does not support io_uring, or is older than
+Linux 5.11.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_impl(PyTypeObject *type, unsigned int entries)
+/*[clinic end generated code: output=63020d63dc3bde5f input=68a61d8e389537ee]*/
+{
+    if (entries == 0) {
+        PyErr_SetString(PyExc_ValueError, "entries must be positive");
+        return NULL;
+    }
+    return newPyIoUring_Object(type, entries);
+}
+
+
+static void
+pyiouring_dealloc(pyIoUring_Object *self)
+{
+    PyTypeObject* type = Py_TYPE(self);
+    (void)pyiouring_internal_close(self);
+    Py_CLEAR(self->buffers);
+    freefunc iouring_free = PyType_GetSlot(type, Py_tp_free);
+    iouring_free((PyObject *)self);
+    Py_DECREF((PyObject *)type);
+}
+
+/*[clinic input]
+select.io_uring.close
+
+Close the io_uring file descriptor.
+
+Pending operations are cancelled first.  Further operations on the
+io_uring object will raise an exception.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_close_impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=ab34c3876bdadb71 input=cd740ec96c4ee4b9]*/
+{
+    errno = pyiouring_internal_close(self);
+    if (errno) {
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
+static PyObject*
+pyiouring_get_closed(pyIoUring_Object *self, void *Py_UNUSED(ignored))
+{
+    if (self->ring_fd < 0)
+        Py_RETURN_TRUE;
+    else
+        Py_RETURN_FALSE;
+}
+
+static PyObject*
+pyiouring_get_features(pyIoUring_Object *self, void *Py_UNUSED(ignored))
+{
+    return PyLong_FromUnsignedLong(self->features);
+}
+
+/*[clinic input]
+select.io_uring.fileno
+
+Return the io_uring file descriptor.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_fileno_impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=7915f2f83c9cd9ae input=387b7ad3eb89de90]*/
+{
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+    return PyLong_FromLong(self->ring_fd);
+}
+
+/* Return a zeroed submission queue entry, submitting the queued entries
+   first if the queue is full. */
+static struct io_uring_sqe *
+pyiouring_get_sqe(pyIoUring_Object *self)
+{
+    unsigned int tail, index;
+    struct io_uring_sqe *sqe;
+
+    if (self->ring_fd < 0) {
+        pyiouring_err_closed();
+        return NULL;
+    }
+    tail = *self->sq_tail;
+    if (tail - __atomic_load_n(self->sq_head, __ATOMIC_ACQUIRE)
+        >= self->sq_entries)
+    {
+        int ret = pyiouring_enter(self, self->to_submit, 0, 0, NULL);
+        if (ret < 0) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+        self->to_submit -= Py_MIN((unsigned int)ret, self->to_submit);
+        if (tail - __atomic_load_n(self->sq_head, __ATOMIC_ACQUIRE)
+            >= self->sq_entries)
+        {
+            errno = EBUSY;
+            PyErr_SetFromErrno(PyExc_BlockingIOError);
+            return NULL;
+        }
+    }
+    index = tail & self->sq_mask;
+    sqe = &self->sqes[index];
+    memset(sqe, 0, sizeof(*sqe));
+    self->sq_array[index] = index;
+    return sqe;
+}
+
+/* Make the entry returned by the last pyiouring_get_sqe() call visible
+   to the kernel. */
+static void
+pyiouring_push_sqe(pyIoUring_Object *self)
+{
+    __atomic_store_n(self->sq_tail, *self->sq_tail + 1, __ATOMIC_RELEASE);
+    self->to_submit++;
+}
+
+/* Prepare an operation on a buffer, which is kept until the completion
+   of the operation is reaped. */
+static PyObject *
+pyiouring_prep_buffer(pyIoUring_Object *self, int opcode, int fd,
+                      PyObject *buffer, int writable, unsigned int op_flags,
+                      unsigned long long offset,
+                      unsigned long long user_data)
+{
+    PyObject *key, *view;
+    Py_buffer *pybuf;
+    struct io_uring_sqe *sqe;
+    int rc;
+
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+
+    key = PyLong_FromUnsignedLongLong(user_data);
+    if (key == NULL) {
+        return NULL;
+    }
+    rc = PyDict_Contains(self->buffers, key);
+    if (rc) {
+        if (rc > 0) {
+            PyErr_Format(PyExc_ValueError,
+                         "user_data %llu is used by a pending operation",
+                         user_data);
+        }
+        Py_DECREF(key);
+        return NULL;
+    }
+    view = PyMemoryView_FromObject(buffer);
+    if (view == NULL) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    pybuf = PyMemoryView_GET_BUFFER(view);
+    if (writable && pybuf->readonly) {
+        PyErr_SetString(PyExc_TypeError, "buffer is read-only");
+        goto error;
+    }
+    if (!PyBuffer_IsContiguous(pybuf, 'C')) {
+        PyErr_SetString(PyExc_TypeError, "buffer is not contiguous");
+        goto error;
+    }
+    if ((size_t)pybuf->len > UINT_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "buffer is too large");
+        goto error;
+    }
+    sqe = pyiouring_get_sqe(self);
+    if (sqe == NULL) {
+        goto error;
+    }
+    if (PyDict_SetItem(self->buffers, key, view) < 0) {
+        goto error;
+    }
+    sqe->opcode = opcode;
+    sqe->fd = fd;
+    sqe->addr = (uint64_t)(uintptr_t)pybuf->buf;
+    sqe->len = (unsigned int)pybuf->len;
+    sqe->off = offset;
+    sqe->msg_flags = op_flags;
+    sqe->user_data = user_data;
+    pyiouring_push_sqe(self);
+    Py_DECREF(view);
+    Py_DECREF(key);
+    Py_RETURN_NONE;
+
+error:
+    Py_DECREF(view);
+    Py_DECREF(key);
+    return NULL;
+}
+
+/*[clinic input]
+select.io_uring.recv
+
+    fd: fildes
+    buffer: object
+    user_data: unsigned_long_long(bitwise=False)
+    flags: int = 0
+
+Queue a recv() of up to len(buffer) bytes into the writable buffer.
+
+The result of the operation is the number of bytes received.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_recv_impl(pyIoUring_Object *self, int fd, PyObject *buffer,
+                          unsigned long long user_data, int flags)
+/*[clinic end generated code: output=fe70817dcedf154f input=2713140eb9762cf1]*/
+{
+    return pyiouring_prep_buffer(self, IORING_OP_RECV, fd, buffer, 1,
+                                 (unsigned int)flags, 0, user_data);
+}
+
+/*[clinic input]
+select.io_uring.send
+
+    fd: fildes
+    data: object
+    user_data: unsigned_long_long(bitwise=False)
+    flags: int = 0
+
+Queue a send() of the bytes-like object data.
+
+The result of the operation is the number of bytes sent.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_send_impl(pyIoUring_Object *self, int fd, PyObject *data,
+                          unsigned long long user_data, int flags)
+/*[clinic end generated code: output=e97d6d5a1947e74a input=d4fdbca6fbb345c2]*/
+{
+    return pyiouring_prep_buffer(self, IORING_OP_SEND, fd, data, 0,
+                                 (unsigned int)flags, 0, user_data);
+}
+
+/*[clinic input]
+select.io_uring.read
+
+    fd: fildes
+    buffer: object
+    user_data: unsigned_long_long(bitwise=False)
+    offset: long_long = -1
+      The file offset to read at, or -1 to read at the current position
+      of the file.
+
+Queue a read of up to len(buffer) bytes into the writable buffer.
+
+The result of the operation is the number of bytes read.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_read_impl(pyIoUring_Object *self, int fd, PyObject *buffer,
+                          unsigned long long user_data, long long offset)
+/*[clinic end generated code: output=25a0bf98859792bd input=5f18a5e91a4a080c]*/
+{
+    return pyiouring_prep_buffer(self, IORING_OP_READ, fd, buffer, 1, 0,
+                                 (unsigned long long)offset, user_data);
+}
+
+/*[clinic input]
+select.io_uring.write
+
+    fd: fildes
+    data: object
+    user_data: unsigned_long_long(bitwise=False)
+    offset: long_long = -1
+      The file offset to write at, or -1 to write at the current position
+      of the file.
+
+Queue a write of the bytes-like object data.
+
+The result of the operation is the number of bytes written.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_write_impl(pyIoUring_Object *self, int fd, PyObject *data,
+                           unsigned long long user_data, long long offset)
+/*[clinic end generated code: output=0aa7d74564dcff5e input=b48c73dcac55ae26]*/
+{
+    return pyiouring_prep_buffer(self, IORING_OP_WRITE, fd, data, 0, 0,
+                                 (unsigned long long)offset, user_data);
+}
+
+/*[clinic input]
+select.io_uring.accept
+
+    fd: fildes
+    user_data: unsigned_long_long(bitwise=False)
+    flags: int = 0
+      Flags for accept4(); SOCK_CLOEXEC is always set.
+
+Queue an accept() on the listening socket fd.
+
+The result of the operation is the file descriptor of the new connection.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_accept_impl(pyIoUring_Object *self, int fd,
+                            unsigned long long user_data, int flags)
+/*[clinic end generated code: output=3e7652f9c4d56d4b input=0f99082a1025eade]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ACCEPT;
+    sqe->fd = fd;
+    sqe->accept_flags = (unsigned int)flags | SOCK_CLOEXEC;
+    sqe->user_data = user_data;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.poll_add
+
+    fd: fildes
+    eventmask: unsigned_short
+    user_data: unsigned_long_long(bitwise=False)
+
+Queue a one-shot wait for the POLL* events of eventmask on fd.
+
+The result of the operation is the mask of the events that occurred.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_poll_add_impl(pyIoUring_Object *self, int fd,
+                              unsigned short eventmask,
+                              unsigned long long user_data)
+/*[clinic end generated code: output=a6f09320e540a150 input=041925d6abd3b19f]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_POLL_ADD;
+    sqe->fd = fd;
+    sqe->poll32_events = eventmask;
+#if PY_BIG_ENDIAN
+    sqe->poll32_events = (sqe->poll32_events << 16)
+                         | (sqe->poll32_events >> 16);
+#endif
+    sqe->user_data = user_data;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.poll_remove
+
+    target: unsigned_long_long(bitwise=False)
+      The user_data of the poll_add() operation to remove.
+    user_data: unsigned_long_long(bitwise=False)
+
+Queue the removal of a pending poll_add() operation.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_poll_remove_impl(pyIoUring_Object *self,
+                                 unsigned long long target,
+                                 unsigned long long user_data)
+/*[clinic end generated code: output=17a7657f3ab00fc7 input=77fd21afc0182601]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_POLL_REMOVE;
+    sqe->fd = -1;
+    sqe->addr = target;
+    sqe->user_data = user_data;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.cancel
+
+    target: unsigned_long_long(bitwise=False)
+      The user_data of the operation to cancel.
+    user_data: unsigned_long_long(bitwise=False)
+
+Queue the cancellation of a pending operation.
+
+The cancelled operation completes with -ECANCELED.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_cancel_impl(pyIoUring_Object *self,
+                            unsigned long long target,
+                            unsigned long long user_data)
+/*[clinic end generated code: output=657a8b6e06956c79 input=6856b4590a294988]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_ASYNC_CANCEL;
+    sqe->fd = -1;
+    sqe->addr = target;
+    sqe->user_data = user_data;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.nop
+
+    user_data: unsigned_long_long(bitwise=False)
+
+Queue an operation that does nothing and completes with 0.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_nop_impl(pyIoUring_Object *self,
+                         unsigned long long user_data)
+/*[clinic end generated code: output=7f18acd6a0f5c1df input=506ec9e226bf9a99]*/
+{
+    struct io_uring_sqe *sqe = pyiouring_get_sqe(self);
+    if (sqe == NULL) {
+        return NULL;
+    }
+    sqe->opcode = IORING_OP_NOP;
+    sqe->fd = -1;
+    sqe->user_data = user_data;
+    pyiouring_push_sqe(self);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+select.io_uring.submit
+
+    wait_nr: unsigned_int(bitwise=False) = 0
+      The number of completions to wait for.
+    timeout as timeout_obj: object = None
+      The maximum time to wait in seconds (as float); None waits
+      indefinitely.
+
+Submit the queued operations and reap their completions.
+
+Returns the list of the available completions, as (user_data, result,
+flags) 3-tuples.  A negative result is a negated errno value.  The
+operations queued since the last call are handed to the kernel in a
+single system call.
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring_submit_impl(pyIoUring_Object *self, unsigned int wait_nr,
+                            PyObject *timeout_obj)
+/*[clinic end generated code: output=08c3efb2c21e538a input=352a117c94bcf014]*/
+{
+    PyObject *result;
+    _PyTime_t timeout = -1, deadline = 0;
+    struct __kernel_timespec ts, *pts = NULL;
+    int ret;
+
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+
+    if (timeout_obj != Py_None) {
+        if (_PyTime_FromSecondsObject(&timeout, timeout_obj,
+                                      _PyTime_ROUND_TIMEOUT) < 0) {
+            if (PyErr_ExceptionMatches(PyExc_TypeError)) {
+                PyErr_SetString(PyExc_TypeError,
+                                "timeout must be a number or None");
+            }
+            return NULL;
+        }
+        if (timeout < 0) {
+            timeout = 0;
+        }
+        deadline = _PyDeadline_Init(timeout);
+    }
+
+    /* Completions that are already available do not need a wait. */
+    if (wait_nr && *self->cq_head
+                   != __atomic_load_n(self->cq_tail, __ATOMIC_ACQUIRE)) {
+        wait_nr = 0;
+    }
+
+    while (self->to_submit || wait_nr) {
+        if (wait_nr && timeout >= 0) {
+            struct timespec tspec;
+            _PyTime_AsTimespec_clamp(timeout, &tspec);
+            ts.tv_sec = tspec.tv_sec;
+            ts.tv_nsec = tspec.tv_nsec;
+            pts = &ts;
+        }
+        if (wait_nr) {
+            Py_BEGIN_ALLOW_THREADS
+            ret = pyiouring_enter(self, self->to_submit, wait_nr, 0, pts);
+            Py_END_ALLOW_THREADS
+        }
+        else {
+            ret = pyiouring_enter(self, self->to_submit, 0, 0, NULL);
+        }
+        if (ret >= 0) {
+            self->to_submit -= Py_MIN((unsigned int)ret, self->to_submit);
+            break;
+        }
+        if (errno == ETIME) {
+            break;
+        }
+        if (errno == EBUSY || errno == EAGAIN) {
+            /* The completion queue is full: reap it first. */
+            break;
+        }
+        if (errno != EINTR) {
+            PyErr_SetFromErrno(PyExc_OSError);
+            return NULL;
+        }
+        /* io_uring_enter() was interrupted by a signal */
+        if (PyErr_CheckSignals())
+            return NULL;
+        if (timeout >= 0) {
+            timeout = _PyDeadline_Get(deadline);
+            if (timeout < 0) {
+                timeout = 0;
+            }
+        }
+    }
+
+    result = PyList_New(0);
+    if (result == NULL) {
+        return NULL;
+    }
+    while (1) {
+        if (pyiouring_reap(self, result) < 0) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        if (!(__atomic_load_n(self->sq_flags, __ATOMIC_ACQUIRE)
+              & IORING_SQ_CQ_OVERFLOW)) {
+            break;
+        }
+        /* The completion queue overflowed: have the kernel move the
+           completions it kept aside to the ring, which was just emptied. */
+        if (pyiouring_enter(self, 0, 0, IORING_ENTER_GETEVENTS, NULL) < 0
+            && errno != EINTR) {
+            break;
+        }
+    }
+    return result;
+}
+
+/*[clinic input]
+select.io_uring.__enter__
+
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring___enter___impl(pyIoUring_Object *self)
+/*[clinic end generated code: output=6453f8b2562a22d4 input=8edfa5fe3684ef9a]*/
+{
+    if (self->ring_fd < 0)
+        return pyiouring_err_closed();
+
+    return Py_NewRef(self);
+}
+
+/*[clinic input]
+select.io_uring.__exit__
+
+    exc_type:  object = None
+    exc_value: object = None
+    exc_tb:    object = None
+    /
+
+[clinic start generated code]*/
+
+static PyObject *
+select_io_uring___exit___impl(pyIoUring_Object *self, PyObject *exc_type,
+                              PyObject *exc_value, PyObject *exc_tb)
+/*[clinic end generated code: output=313376fb85210e74 input=1e269333b0d5d167]*/
+{
+    _selectstate *state = _selectstate_by_type(Py_TYPE(self));
+    return PyObject_CallMethodObjArgs((PyObject *)self, state->close, NULL);
+}
+
+static PyGetSetDef pyiouring_getsetlist[] = {
+    {"closed", (getter)pyiouring_get_closed, NULL,
+     "True if the io_uring object is closed"},
+    {"features", (getter)pyiouring_get_features, NULL,
+     "The IORING_FEAT_* flags reported by the kernel"},
+    {0},
+};
+
+#endif /* HAVE_IO_URING */
+
 #ifdef HAVE_KQUEUE
 /* **************************************************************************
  *                      kqueue interface for BSD
@@ -2344,6 +3278,46 @@ static PyType_Spec pyEpoll_Type_spec = {
 
 #endif /* HAVE_EPOLL */
 
+#ifdef HAVE_IO_URING
+
+static PyMethodDef pyiouring_methods[] = {
+    SELECT_IO_URING_CLOSE_METHODDEF
+    SELECT_IO_URING_FILENO_METHODDEF
+    SELECT_IO_URING_RECV_METHODDEF
+    SELECT_IO_URING_SEND_METHODDEF
+    SELECT_IO_URING_READ_METHODDEF
+    SELECT_IO_URING_WRITE_METHODDEF
+    SELECT_IO_URING_ACCEPT_METHODDEF
+    SELECT_IO_URING_POLL_ADD_METHODDEF
+    SELECT_IO_URING_POLL_REMOVE_METHODDEF
+    SELECT_IO_URING_CANCEL_METHODDEF
+    SELECT_IO_URING_NOP_METHODDEF
+    SELECT_IO_URING_SUBMIT_METHODDEF
+    SELECT_IO_URING___ENTER___METHODDEF
+    SELECT_IO_URING___EXIT___METHODDEF
+    {NULL,      NULL},
+};
+
+static PyType_Slot pyIoUring_Type_slots[] = {
+    {Py_tp_dealloc, pyiouring_dealloc},
+    {Py_tp_doc, (void*)select_io_uring__doc__},
+    {Py_tp_getattro, PyObject_GenericGetAttr},
+    {Py_tp_getset, pyiouring_getsetlist},
+    {Py_tp_methods, pyiouring_methods},
+    {Py_tp_new, select_io_uring},
+    {0, 0},
+};
+
+static PyType_Spec pyIoUring_Type_spec = {
+    "select.io_uring",
+    sizeof(pyIoUring_Object),
+    0,
+    Py_TPFLAGS_DEFAULT,
+    pyIoUring_Type_slots
+};
+
+#endif /* HAVE_IO_URING */
+
 #ifdef HAVE_KQUEUE
 
 static PyMethodDef kqueue_queue_methods[] = {
@@ -2404,6 +3378,7 @@ _select_traverse(PyObject *module, visitproc visit, void *arg)
     Py_VISIT(state->poll_Type);
     Py_VISIT(state->devpoll_Type);
     Py_VISIT(state->pyEpoll_Type);
+    Py_VISIT(state->io_uring_Type);
     Py_VISIT(state->kqueue_event_Type);
     Py_VISIT(state->kqueue_queue_Type);
     return 0;
@@ -2418,6 +3393,7 @@ _select_clear(PyObject *module)
     Py_CLEAR(state->poll_Type);
     Py_CLEAR(state->devpoll_Type);
     Py_CLEAR(state->pyEpoll_Type);
+    Py_CLEAR(state->io_uring_Type);
     Py_CLEAR(state->kqueue_event_Type);
     Py_CLEAR(state->kqueue_queue_Type);
     return 0;
@@ -2552,6 +3528,17 @@ _select_exec(PyObject *m)
 #endif
 #endif /* HAVE_EPOLL */
 
+#ifdef HAVE_IO_URING
+    state->io_uring_Type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        m, &pyIoUring_Type_spec, NULL);
+    if (state->io_uring_Type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(m, state->io_uring_Type) < 0) {
+        return -1;
+    }
+#endif /* HAVE_IO_URING */
+
 #ifdef HAVE_KQUEUE
     state->kqueue_event_Type = (PyTypeObject *)PyType_FromModuleAndSpec(
         m, &kqueue_event_Type_spec, NULL);
@@ -0,0 +1,101 @@
+"""Compare the heap and timing wheel schedulers of asyncio event loops.
+
+The workload mimics a server with many connections, each guarded by a
+timeout that is pushed back whenever the connection sees activity: the
+timeout handle is cancelled and a new one is scheduled.  A small number
+of timers is allowed to expire.
+
+Usage: python asyncio_timer_benchmark.py [-n TIMERS] [-r RESCHEDULES]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+
+def on_timeout(state, index):
+    state.expired += 1
+    state.handles[index] = None
+
+
+class State:
+    def __init__(self, count):
+        self.handles = [None] * count
+        self.expired = 0
+
+
+async def workload(timers, reschedules, batch, seed):
+    loop = asyncio.get_running_loop()
+    rng = random.Random(seed)
+    state = State(timers)
+
+    for i in range(timers):
+        state.handles[i] = loop.call_later(
+            rng.uniform(10, 60), on_timeout, state, i)
+
+    for done in range(0, reschedules, batch):
+        for _ in range(min(batch, reschedules - done)):
+            i = rng.randrange(timers)
+            handle = state.handles[i]
+            if handle is not None:
+                handle.cancel()
+            if rng.random() < 0.001:
+                delay = rng.uniform(0, 0.005)
+            else:
+                delay = rng.uniform(10, 60)
+            state.handles[i] = loop.call_later(delay, on_timeout, state, i)
+        # Let the loop run an iteration, as if I/O had been processed.
+        await asyncio.sleep(0)
+
+    # Let the short timers expire.
+    await asyncio.sleep(0.01)
+
+    for handle in state.handles:
+        if handle is not None:
+            handle.cancel()
+    return state.expired
+
+
+def bench(use_wheel, args):
+    loop = asyncio.new_event_loop()
+    try:
+        loop.set_timer_wheel(use_wheel)
+        t0 = time.perf_counter()
+        expired = loop.run_until_complete(
+            workload(args.timers, args.reschedules, args.batch, args.seed))
+        return time.perf_counter() - t0, expired
+    finally:
+        loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--timers', type=int, default=100_000,
+                        help='number of concurrent timers (default: %(default)s)')
+    parser.add_argument('-r', '--reschedules', type=int, default=500_000,
+                        help='number of cancel/reschedule operations '
+                             '(default: %(default)s)')
+    parser.add_argument('-b', '--batch', type=int, default=100,
+                        help='reschedules per loop iteration '
+                             '(default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='random seed (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs, the best one is reported '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    results = {}
+    for name, use_wheel in (('heap', False), ('wheel', True)):
+        runs = [bench(use_wheel, args) for _ in range(args.repeat)]
+        best, expired = min(runs)
+        results[name] = best
+        print(f'{name:>6}: {best:8.3f} s  '
+              f'({args.reschedules / best:,.0f} reschedules/s, '
+              f'{expired} expired)')
+    print(f'wheel/heap: {results["wheel"] / results["heap"]:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
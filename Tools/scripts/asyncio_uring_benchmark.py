@@ -0,0 +1,102 @@
+"""Compare the socket throughput of the epoll and io_uring event loops.
+
+Each connection is a socket pair: one task sends messages with
+loop.sock_sendall() while another one receives them with
+loop.sock_recv_into().  Many connections run concurrently, so that the
+io_uring loop can batch the operations of a loop iteration in a single
+system call.
+
+Usage: python asyncio_uring_benchmark.py [-c CONNECTIONS] [-m MESSAGES]
+"""
+
+import argparse
+import asyncio
+import selectors
+import socket
+import time
+
+
+async def sender(loop, sock, message, count):
+    for _ in range(count):
+        await loop.sock_sendall(sock, message)
+
+
+async def receiver(loop, sock, total):
+    buf = bytearray(256 * 1024)
+    received = 0
+    while received < total:
+        n = await loop.sock_recv_into(sock, buf)
+        if not n:
+            break
+        received += n
+    return received
+
+
+async def workload(connections, messages, size):
+    loop = asyncio.get_running_loop()
+    message = b'x' * size
+    socks = []
+    tasks = []
+    try:
+        for _ in range(connections):
+            a, b = socket.socketpair()
+            socks += (a, b)
+            a.setblocking(False)
+            b.setblocking(False)
+            tasks.append(loop.create_task(sender(loop, a, message, messages)))
+            tasks.append(loop.create_task(receiver(loop, b, messages * size)))
+        await asyncio.gather(*tasks)
+    finally:
+        for sock in socks:
+            sock.close()
+    return connections * messages * size
+
+
+def bench(loop_factory, args):
+    loop = loop_factory()
+    try:
+        t0 = time.perf_counter()
+        nbytes = loop.run_until_complete(
+            workload(args.connections, args.messages, args.size))
+        return time.perf_counter() - t0, nbytes
+    finally:
+        loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-c', '--connections', type=int, default=100,
+                        help='number of concurrent connections '
+                             '(default: %(default)s)')
+    parser.add_argument('-m', '--messages', type=int, default=1000,
+                        help='messages sent per connection '
+                             '(default: %(default)s)')
+    parser.add_argument('-s', '--size', type=int, default=4096,
+                        help='message size in bytes (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs, the best one is reported '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    uring_loop = asyncio.IoUringEventLoop()
+    io_uring = uring_loop._io_uring
+    uring_loop.close()
+    if not io_uring:
+        parser.exit(1, 'io_uring is not available\n')
+
+    loops = [
+        ('epoll', lambda: asyncio.SelectorEventLoop(selectors.EpollSelector())),
+        ('io_uring', asyncio.IoUringEventLoop),
+    ]
+    results = {}
+    for name, loop_factory in loops:
+        runs = [bench(loop_factory, args) for _ in range(args.repeat)]
+        best, nbytes = min(runs)
+        results[name] = best
+        print(f'{name:>8}: {best:8.3f} s  '
+              f'({nbytes / best / 2**20:,.1f} MiB/s)')
+    print(f'io_uring/epoll: {results["io_uring"] / results["epoll"]:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
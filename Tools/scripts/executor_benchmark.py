@@ -0,0 +1,78 @@
+"""Compare the throughput of ThreadPoolExecutor and
+WorkStealingThreadPoolExecutor.
+
+Each run submits small calls from several threads at once, which is
+where the single work queue of ThreadPoolExecutor is contended, and
+reports the number of calls completed per second for an increasing
+number of worker threads.
+
+Usage: python executor_benchmark.py [-n CALLS] [-s SUBMITTERS] [--batch]
+"""
+
+import argparse
+import hashlib
+import threading
+import time
+from concurrent.futures import (ThreadPoolExecutor,
+                                WorkStealingThreadPoolExecutor)
+
+
+DATA = b'x' * 4096
+
+
+def work():
+    # hashlib releases the GIL for large enough inputs only, so this is
+    # mostly overhead: exactly what the executors are compared on.
+    return hashlib.sha1(DATA).digest()
+
+
+def submitter(executor, count, batch):
+    if batch:
+        fs = executor.submit_many(lambda _: work(), range(count))
+    else:
+        fs = [executor.submit(work) for _ in range(count)]
+    for f in fs:
+        f.result()
+
+
+def bench(executor_type, workers, args):
+    calls = args.calls // args.submitters
+    with executor_type(workers) as executor:
+        # Start the worker threads.
+        for f in [executor.submit(time.sleep, 0.01) for _ in range(workers)]:
+            f.result()
+        threads = [threading.Thread(target=submitter,
+                                    args=(executor, calls, args.batch))
+                   for _ in range(args.submitters)]
+        t0 = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        dt = time.perf_counter() - t0
+    return calls * args.submitters / dt
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--calls', type=int, default=100_000,
+                        help='number of calls per run (default: %(default)s)')
+    parser.add_argument('-s', '--submitters', type=int, default=4,
+                        help='number of submitting threads '
+                             '(default: %(default)s)')
+    parser.add_argument('-w', '--workers', type=int, nargs='+',
+                        default=[1, 2, 4, 8, 16],
+                        help='worker thread counts (default: %(default)s)')
+    parser.add_argument('--batch', action='store_true',
+                        help='submit with submit_many() instead of submit()')
+    args = parser.parse_args()
+
+    print(f'{"workers":>8} {"ThreadPool":>14} {"WorkStealing":>14}  (calls/s)')
+    for workers in args.workers:
+        tpe = bench(ThreadPoolExecutor, workers, args)
+        ws = bench(WorkStealingThreadPoolExecutor, workers, args)
+        print(f'{workers:>8} {tpe:>14,.0f} {ws:>14,.0f}  {ws / tpe:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Compare the throughput of the multiprocessing queues.
+
+A child process puts small messages in the queue while the parent gets
+them, and the number of messages transferred per second is reported for
+Queue, SimpleQueue and SharedMemoryQueue, the latter both with pickled
+items and with struct records.
+
+Usage: python shm_queue_benchmark.py [-n MESSAGES] [--start-method METHOD]
+"""
+
+import argparse
+import multiprocessing
+import time
+
+
+def producer(q, count):
+    for i in range(count):
+        q.put((i, 1.5))
+    q.put((-1, 0.0))
+
+
+def bench(ctx, make_queue, count):
+    q = make_queue(ctx)
+    p = ctx.Process(target=producer, args=(q, count))
+    t0 = time.perf_counter()
+    p.start()
+    get = q.get
+    while get()[0] >= 0:
+        pass
+    dt = time.perf_counter() - t0
+    p.join()
+    if hasattr(q, 'unlink'):
+        q.close()
+        q.unlink()
+    return count / dt
+
+
+QUEUES = [
+    ('Queue', lambda ctx: ctx.Queue(1024)),
+    ('SimpleQueue', lambda ctx: ctx.SimpleQueue()),
+    ('SharedMemoryQueue', lambda ctx: ctx.SharedMemoryQueue(1024)),
+    ('SharedMemoryQueue(record)',
+     lambda ctx: ctx.SharedMemoryQueue(1024, record_format='qd')),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-n', '--messages', type=int, default=100_000,
+                        help='messages per run (default: %(default)s)')
+    parser.add_argument('--start-method',
+                        choices=multiprocessing.get_all_start_methods(),
+                        help='multiprocessing start method')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='number of runs, the best one is reported '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context(args.start_method)
+    for name, make_queue in QUEUES:
+        best = max(bench(ctx, make_queue, args.messages)
+                   for _ in range(args.repeat))
+        print(f'{name:>26}: {best:12,.0f} messages/s')
+
+
+if __name__ == '__main__':
+    main()